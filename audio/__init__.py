@@ -15,6 +15,10 @@ Usage:
     path = recorder.stop()
 """
 
+from .buffer import CaptureBuffer
+from .energy import EnergyTracker
+from .memory import InMemoryAudio
+from .resample import StreamResampler
 from .recording import (
     record_audio,
     AudioRecorder,
@@ -26,6 +30,10 @@ from .recording import (
 __all__ = [
     "record_audio",
     "AudioRecorder",
+    "CaptureBuffer",
+    "EnergyTracker",
+    "InMemoryAudio",
+    "StreamResampler",
     "WHISPER_SAMPLE_RATE",
     "WHISPER_CHANNELS",
     "WHISPER_BLOCKSIZE",
@@ -0,0 +1,199 @@
+"""Inkrementeller Energie-/VAD-Tracker für den Audio-Callback.
+
+Der Callback berechnet ohnehin pro Block einen RMS-Wert. Der Tracker führt
+daraus zusätzlich 20ms-Fenster-RMS (10ms Hop) mit, wie sie das Silence-Trimming
+braucht – ohne am Ende noch einmal über die gesamte Aufnahme zu rechnen.
+
+Für das Trimming wird der Threshold erst beim Stop festgelegt (abhängig von
+`max_rms`). Deshalb merkt sich der Tracker nicht ein festes erstes/letztes
+Sprach-Frame, sondern die Präfix-Maxima (Kandidaten für das erste Frame) und
+einen monotonen Stack der Suffix-Maxima (Kandidaten für das letzte Frame).
+Beide Listen bleiben winzig; `trim_bounds()` ist eine Binärsuche darin.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from config import VAD_THRESHOLD, WHISPER_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Pausen bis zu dieser Länge verbinden zwei Sprachsegmente
+DEFAULT_MIN_SILENCE_S = 0.3
+
+
+class EnergyTracker:
+    """Führt Block-RMS, Fenster-RMS und Sprachsegmente während der Aufnahme mit.
+
+    Args:
+        sample_rate: Sample-Rate der gefütterten Chunks
+        speech_threshold: Block-RMS, ab dem `had_speech` gesetzt wird
+        segment_threshold: Fenster-RMS, ab dem ein Frame als Sprache zählt
+            (Sprachanteil und Segmente)
+        min_silence_s: Kürzere Pausen trennen keine Segmente
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+        speech_threshold: float = VAD_THRESHOLD,
+        segment_threshold: float = VAD_THRESHOLD * 0.5,
+        min_silence_s: float = DEFAULT_MIN_SILENCE_S,
+    ):
+        self.sample_rate = sample_rate
+        self.speech_threshold = speech_threshold
+        self.segment_threshold = segment_threshold
+        self.hop = max(1, int(sample_rate * 0.01))  # 10ms
+        self.window = 2 * self.hop  # 20ms
+        self._min_silence_frames = max(1, int(min_silence_s * sample_rate) // self.hop)
+        self._lock = threading.Lock()
+
+        self.max_rms = 0.0
+        self.had_speech = False
+        self._samples = 0
+        self._frames = 0
+        # Angefangener Hop aus dem letzten Chunk (Quadratsumme, Sample-Anzahl)
+        self._partial_sum = 0.0
+        self._partial_count = 0
+        self._prev_hop: float | None = None
+        # Präfix-Maxima: RMS steigend mit dem Index
+        self._rising_idx: list[int] = []
+        self._rising_rms: list[float] = []
+        # Suffix-Maxima als monotoner Stack, RMS negiert (steigend für bisect)
+        self._falling_idx: list[int] = []
+        self._falling_neg: list[float] = []
+        # Sprachsegmente in Frames (abgeschlossen + offenes)
+        self._active_frames = 0
+        self._segments: list[tuple[int, int]] = []
+        self._seg_start: int | None = None
+        self._seg_last = 0
+
+    def feed(self, chunk: "np.ndarray") -> float:
+        """Verarbeitet einen Chunk (float32, mono oder `(frames, 1)`).
+
+        Returns:
+            RMS des gesamten Chunks (z.B. für die Pegelanzeige)
+        """
+        import numpy as np
+
+        samples = chunk[:, 0] if chunk.ndim > 1 else chunk
+        n = int(samples.shape[0])
+        if n == 0:
+            return 0.0
+        squares = np.square(samples, dtype=np.float64)
+        rms = float(np.sqrt(squares.mean()))
+
+        hop = self.hop
+        with self._lock:
+            if rms > self.max_rms:
+                self.max_rms = rms
+            if rms > self.speech_threshold:
+                self.had_speech = True
+
+            pos = 0
+            if self._partial_count:
+                take = min(hop - self._partial_count, n)
+                self._partial_sum += float(squares[:take].sum())
+                self._partial_count += take
+                pos = take
+                if self._partial_count == hop:
+                    self._push_hop(self._partial_sum)
+                    self._partial_sum = 0.0
+                    self._partial_count = 0
+
+            full = (n - pos) // hop
+            if full:
+                sums = squares[pos : pos + full * hop].reshape(full, hop).sum(axis=1)
+                for hop_sum in sums.tolist():
+                    self._push_hop(hop_sum)
+                pos += full * hop
+
+            if pos < n:
+                self._partial_sum += float(squares[pos:].sum())
+                self._partial_count += n - pos
+            self._samples += n
+        return rms
+
+    def _push_hop(self, hop_sum: float) -> None:
+        prev = self._prev_hop
+        self._prev_hop = hop_sum
+        if prev is not None:
+            self._push_frame(((prev + hop_sum) / self.window) ** 0.5)
+
+    def _push_frame(self, rms: float) -> None:
+        index = self._frames
+        self._frames += 1
+
+        if not self._rising_rms or rms > self._rising_rms[-1]:
+            self._rising_idx.append(index)
+            self._rising_rms.append(rms)
+
+        while self._falling_neg and -self._falling_neg[-1] <= rms:
+            self._falling_idx.pop()
+            self._falling_neg.pop()
+        self._falling_idx.append(index)
+        self._falling_neg.append(-rms)
+
+        if rms >= self.segment_threshold:
+            self._active_frames += 1
+            if self._seg_start is None:
+                self._seg_start = index
+            elif index - self._seg_last > self._min_silence_frames:
+                self._segments.append((self._seg_start, self._seg_last))
+                self._seg_start = index
+            self._seg_last = index
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @property
+    def frame_count(self) -> int:
+        return self._frames
+
+    @property
+    def speech_ratio(self) -> float:
+        """Anteil der Frames über `segment_threshold` (0.0–1.0)."""
+        with self._lock:
+            return self._active_frames / self._frames if self._frames else 0.0
+
+    @property
+    def speech_segments(self) -> list[tuple[float, float]]:
+        """Sprachsegmente als (Start, Ende) in Sekunden."""
+        with self._lock:
+            frames = list(self._segments)
+            if self._seg_start is not None:
+                frames.append((self._seg_start, self._seg_last))
+        return [
+            (
+                first * self.hop / self.sample_rate,
+                (last * self.hop + self.window) / self.sample_rate,
+            )
+            for first, last in frames
+        ]
+
+    def trim_bounds(self, threshold: float, pad_s: float = 0.15) -> tuple[int, int]:
+        """Sample-Bereich ohne Stille am Anfang/Ende.
+
+        Ein Frame zählt als aktiv, wenn sein RMS >= `threshold` ist (inklusive,
+        damit leise Auskling-Phoneme nicht abgeschnitten werden). Ohne aktive
+        Frames bleibt die Aufnahme vollständig erhalten.
+        """
+        with self._lock:
+            total = self._samples
+            if total <= self.window or not self._frames:
+                return 0, total
+            pos = bisect_left(self._rising_rms, threshold)
+            if pos == len(self._rising_rms):
+                return 0, total
+            first = self._rising_idx[pos]
+            last = self._falling_idx[bisect_right(self._falling_neg, -threshold) - 1]
+        pad = int(pad_s * self.sample_rate)
+        start = max(0, first * self.hop - pad)
+        end = min(total, last * self.hop + self.window + pad)
+        return start, end
+
+
+__all__ = ["EnergyTracker", "DEFAULT_MIN_SILENCE_S"]
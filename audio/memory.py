@@ -0,0 +1,236 @@
+"""In-Memory-Audio für Provider-Aufrufe ohne Temp-Datei.
+
+Die Daemons haben die Aufnahme bereits als float32-Array im RAM. Statt sie
+als Temp-WAV zu schreiben, die der Provider wieder öffnet (fsync-gebunden,
+auf verschlüsselten oder langsamen Laptop-Disks spürbar), wird sie einmal in
+einen Bytes-Container kodiert und direkt hochgeladen.
+
+Alle `TranscriptionProvider.transcribe()` akzeptieren neben einem Pfad auch
+ein `InMemoryAudio`; die CLI arbeitet weiterhin mit Dateipfaden.
+
+Vor dem Upload wählt `prepare_upload()` pro Provider einen Codec: FLAC ist
+verlustfrei und etwa halb so groß wie 16-bit-WAV, Opus (opt-in) ist
+verlustbehaftet, aber um eine Größenordnung kleiner.
+"""
+
+import io
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterator, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("pulsescribe.audio")
+
+# soundfile-Format → MIME-Type für Multipart-Uploads
+MIME_TYPES = {
+    "WAV": "audio/wav",
+    "FLAC": "audio/flac",
+    "OGG": "audio/ogg",
+}
+
+# Upload-Codec → (soundfile-Format, Subtype, Dateiendung)
+UPLOAD_CODECS = {
+    "wav": ("WAV", "PCM_16", "wav"),
+    "flac": ("FLAC", "PCM_16", "flac"),
+    "opus": ("OGG", "OPUS", "ogg"),
+}
+
+# Von der jeweiligen API akzeptierte Codecs, bevorzugter zuerst.
+# Opus ist verlustbehaftet und deshalb nie Default, nur per
+# PULSESCRIBE_UPLOAD_CODEC=opus.
+PROVIDER_UPLOAD_CODECS = {
+    "openai": ("flac", "wav", "opus"),
+    "groq": ("flac", "wav", "opus"),
+    "deepgram": ("flac", "wav", "opus"),
+}
+
+
+@dataclass(frozen=True)
+class InMemoryAudio:
+    """Kodierte Audiodaten plus Format-Metadaten.
+
+    Attributes:
+        data: Container-Bytes (z.B. WAV)
+        sample_rate: Sample-Rate der kodierten Daten
+        format: soundfile-Format (`WAV`, `FLAC`, `OGG`)
+        name: Dateiname für Multipart-Uploads (Endung bestimmt bei manchen APIs das Format)
+        samples: Optional das Original-Array (mono, float32) – erspart lokalen
+            Providern das Dekodieren
+    """
+
+    data: bytes
+    sample_rate: int
+    format: str = "WAV"
+    name: str = "audio.wav"
+    samples: "np.ndarray | None" = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_array(
+        cls,
+        samples: "np.ndarray",
+        sample_rate: int,
+        *,
+        codec: str = "wav",
+    ) -> "InMemoryAudio":
+        """Kodiert ein float32-Array (wie `sf.write`, nur in einen Puffer).
+
+        Scheitert der Codec (z.B. Opus bei 44.1 kHz), wird FLAC verwendet.
+        """
+        import soundfile as sf
+
+        fmt, subtype, ext = UPLOAD_CODECS[codec]
+        t0 = time.perf_counter()
+        buffer = io.BytesIO()
+        try:
+            sf.write(buffer, samples, sample_rate, format=fmt, subtype=subtype)
+        except Exception as e:
+            if codec == "flac":
+                raise
+            logger.warning(f"Upload-Codec {codec} fehlgeschlagen ({e}), nutze flac")
+            return cls.from_array(samples, sample_rate, codec="flac")
+        data = buffer.getvalue()
+        pcm_kb = samples.size * 2 // 1024
+        logger.debug(
+            f"Upload-Codec {codec}: {pcm_kb}KB PCM → {len(data) // 1024}KB "
+            f"in {(time.perf_counter() - t0) * 1000:.0f}ms"
+        )
+        return cls(
+            data=data,
+            sample_rate=sample_rate,
+            format=fmt,
+            name=f"audio.{ext}",
+            samples=samples,
+        )
+
+    @property
+    def codec(self) -> str:
+        return next(
+            (name for name, spec in UPLOAD_CODECS.items() if spec[0] == self.format),
+            self.format.lower(),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def mime_type(self) -> str:
+        return MIME_TYPES.get(self.format, "application/octet-stream")
+
+    def to_array(self, sample_rate: int | None = None) -> "np.ndarray":
+        """Mono-float32-Samples, optional linear auf `sample_rate` umgerechnet."""
+        import numpy as np
+
+        audio = self.samples
+        rate = self.sample_rate
+        if audio is None:
+            import soundfile as sf
+
+            audio, rate = sf.read(io.BytesIO(self.data), dtype="float32")
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if sample_rate is None or sample_rate == rate or not len(audio):
+            return audio
+        new_length = int(len(audio) * sample_rate / rate)
+        return np.interp(
+            np.linspace(0, len(audio) - 1, new_length),
+            np.arange(len(audio)),
+            audio,
+        ).astype(np.float32)
+
+
+AudioSource = Union[Path, InMemoryAudio]
+
+
+def upload_codec(provider: str) -> str:
+    """Codec für Uploads an `provider` (`PULSESCRIBE_UPLOAD_CODEC`, Default auto)."""
+    accepted = PROVIDER_UPLOAD_CODECS.get(provider, ("wav",))
+    requested = (os.getenv("PULSESCRIBE_UPLOAD_CODEC") or "auto").strip().lower()
+    if requested == "auto":
+        return accepted[0]
+    if requested not in accepted:
+        logger.warning(
+            f"Upload-Codec '{requested}' für {provider} nicht unterstützt, "
+            f"nutze {accepted[0]}"
+        )
+        return accepted[0]
+    return requested
+
+
+def prepare_upload(source: AudioSource, provider: str) -> AudioSource:
+    """Bringt Audio vor dem Upload in den Codec des Providers.
+
+    Bereits passend kodiertes Audio bleibt unverändert. WAV-Dateien (z.B. von
+    der CLI-Aufnahme) werden im Speicher umkodiert; andere Dateiformate gehen
+    unverändert hoch.
+    """
+    codec = upload_codec(provider)
+    if isinstance(source, InMemoryAudio):
+        if source.codec == codec or source.samples is None:
+            return source
+        return InMemoryAudio.from_array(source.samples, source.sample_rate, codec=codec)
+
+    path = Path(source)
+    if codec == "wav" or path.suffix.lower() != ".wav":
+        return path
+    try:
+        import soundfile as sf
+
+        samples, sample_rate = sf.read(str(path), dtype="float32")
+    except Exception as e:
+        logger.debug(f"Umkodieren von {path.name} übersprungen: {e}")
+        return path
+    return InMemoryAudio.from_array(samples, sample_rate, codec=codec)
+
+
+def audio_size(source: AudioSource) -> int:
+    """Größe in Bytes (für Logging)."""
+    if isinstance(source, InMemoryAudio):
+        return source.size
+    return Path(source).stat().st_size
+
+
+def audio_codec(source: AudioSource) -> str:
+    """Codec bzw. Dateiendung (für Logging)."""
+    if isinstance(source, InMemoryAudio):
+        return source.codec
+    return Path(source).suffix.lstrip(".").lower() or "?"
+
+
+def read_audio_bytes(source: AudioSource) -> bytes:
+    """Komplette Container-Bytes (für APIs, die einen Request-Body erwarten)."""
+    if isinstance(source, InMemoryAudio):
+        return source.data
+    return Path(source).read_bytes()
+
+
+@contextmanager
+def upload_file(source: AudioSource) -> Iterator[tuple[str, IO[bytes]]]:
+    """(Dateiname, File-Objekt) für Multipart-Uploads (OpenAI/Groq SDK)."""
+    if isinstance(source, InMemoryAudio):
+        yield source.name, io.BytesIO(source.data)
+        return
+    path = Path(source)
+    with path.open("rb") as audio_file:
+        yield path.name, audio_file
+
+
+__all__ = [
+    "AudioSource",
+    "InMemoryAudio",
+    "PROVIDER_UPLOAD_CODECS",
+    "UPLOAD_CODECS",
+    "audio_codec",
+    "audio_size",
+    "prepare_upload",
+    "read_audio_bytes",
+    "upload_codec",
+    "upload_file",
+]
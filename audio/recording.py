@@ -19,6 +19,8 @@ from config import (
 )
 from utils.logging import get_session_id
 
+from .buffer import CaptureBuffer
+
 logger = logging.getLogger("pulsescribe")
 
 
@@ -60,16 +62,14 @@ class AudioRecorder:
         self.channels = channels
         self.blocksize = blocksize
 
-        self._recorded_chunks: list = []
-        self._chunks_lock = threading.Lock()  # Thread-safety für Audio-Chunks
+        self._buffer = CaptureBuffer(sample_rate)
         self._stream = None
         self._recording_start: float = 0
         self._stop_event = threading.Event()
 
     def _audio_callback(self, indata, _frames, _time_info, _status):
-        """Callback: Sammelt Audio-Chunks während der Aufnahme."""
-        with self._chunks_lock:
-            self._recorded_chunks.append(indata.copy())
+        """Callback: Schreibt Audio direkt in den vorallokierten Puffer."""
+        self._buffer.append(indata)
 
     def start(self, play_ready_sound: bool = True) -> None:
         """Startet die Aufnahme.
@@ -79,8 +79,7 @@ class AudioRecorder:
         """
         import sounddevice as sd
 
-        with self._chunks_lock:
-            self._recorded_chunks = []
+        self._buffer = CaptureBuffer(self.sample_rate)
         self._stop_event.clear()
         self._recording_start = time.perf_counter()
 
@@ -110,7 +109,6 @@ class AudioRecorder:
         Raises:
             ValueError: Wenn keine Audiodaten aufgenommen wurden
         """
-        import numpy as np
         import soundfile as sf
 
         if self._stream:
@@ -125,12 +123,10 @@ class AudioRecorder:
 
         _play_sound("stop")
 
-        with self._chunks_lock:
-            if not self._recorded_chunks:
-                logger.error(f"[{get_session_id()}] Keine Audiodaten aufgenommen")
-                raise ValueError("Keine Audiodaten aufgenommen.")
-
-            audio_data = np.concatenate(self._recorded_chunks)
+        audio_data = self._buffer.view()
+        if not len(audio_data):
+            logger.error(f"[{get_session_id()}] Keine Audiodaten aufgenommen")
+            raise ValueError("Keine Audiodaten aufgenommen.")
 
         if output_path is None:
             output_path = Path(tempfile.gettempdir()) / TEMP_RECORDING_FILENAME
@@ -161,9 +157,9 @@ class AudioRecorder:
 
     @property
     def chunks(self) -> list:
-        """Gibt eine Kopie der bisher aufgenommenen Chunks zurück (thread-safe)."""
-        with self._chunks_lock:
-            return list(self._recorded_chunks)
+        """Gibt eine Kopie der bisher aufgenommenen Samples zurück (thread-safe)."""
+        audio = self._buffer.view()
+        return [audio.copy()] if len(audio) else []
 
 
 def record_audio() -> Path:
@@ -171,14 +167,13 @@ def record_audio() -> Path:
 
     Gibt Pfad zur temporären WAV-Datei zurück.
     """
-    import numpy as np
     import sounddevice as sd
     import soundfile as sf
 
-    recorded_chunks: list = []
+    buffer = CaptureBuffer(WHISPER_SAMPLE_RATE)
 
     def on_audio_chunk(indata, _frames, _time, _status):
-        recorded_chunks.append(indata.copy())
+        buffer.append(indata)
 
     _log("🎤 Drücke ENTER um die Aufnahme zu starten...")
     input()
@@ -196,10 +191,10 @@ def record_audio() -> Path:
     _log("✅ Aufnahme beendet.")
     _play_sound("stop")
 
-    if not recorded_chunks:
+    if not len(buffer):
         raise ValueError("Keine Audiodaten aufgenommen. Bitte länger aufnehmen.")
 
-    audio_data = np.concatenate(recorded_chunks)
+    audio_data = buffer.view()
     output_path = Path(tempfile.gettempdir()) / TEMP_RECORDING_FILENAME
     sf.write(output_path, audio_data, WHISPER_SAMPLE_RATE)
 
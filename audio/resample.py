@@ -0,0 +1,172 @@
+"""Streaming-Polyphasen-Resampler (z.B. 48 kHz → 16 kHz).
+
+Mikrofone laufen meist mit 48 kHz oder 44.1 kHz. Der Warm-Stream hat diese
+Chunks unverändert an Deepgram weitergereicht (dreifache Bandbreite), der
+REST-Pfad hat erst beim Stop die ganze Aufnahme auf einmal resampled.
+
+`StreamResampler` rechnet Chunk für Chunk: Faktor L/M (gekürzt), windowed-sinc
+Tiefpass (Kaiser-Fenster) in L Polyphasen zerlegt, pro Ausgabe-Sample genau
+ein Skalarprodukt über die Eingabe. Die letzten Eingabe-Samples bleiben als
+Filter-Historie über Chunk-Grenzen erhalten – gestückelt ergibt dasselbe wie
+am Stück. Die Filter-Verzögerung wird intern ausgeglichen; `flush()` liefert
+am Ende die noch ausstehenden Samples.
+"""
+
+from math import gcd
+from typing import TYPE_CHECKING
+
+from config import INT16_MAX, WHISPER_SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Nulldurchgänge des Sinc pro Seite (Filterlänge/Qualität)
+DEFAULT_ZERO_CROSSINGS = 16
+# Grenzfrequenz relativ zur Ziel-Nyquist-Frequenz (16 kHz → 7.2 kHz)
+DEFAULT_ROLLOFF = 0.9
+# Kaiser-β: ~80 dB Sperrdämpfung
+KAISER_BETA = 8.6
+# Blockgröße für resample() auf ganzen Aufnahmen
+_BLOCK_SAMPLES = 1 << 16
+
+
+class StreamResampler:
+    """Zustandsbehafteter Mono-Resampler für Audio-Chunks.
+
+    Args:
+        from_rate: Sample-Rate der Eingabe-Chunks
+        to_rate: Ziel-Sample-Rate
+        zero_crossings: Sinc-Nulldurchgänge pro Seite
+        rolloff: Grenzfrequenz relativ zur kleineren Nyquist-Frequenz
+    """
+
+    def __init__(
+        self,
+        from_rate: int,
+        to_rate: int = WHISPER_SAMPLE_RATE,
+        zero_crossings: int = DEFAULT_ZERO_CROSSINGS,
+        rolloff: float = DEFAULT_ROLLOFF,
+    ):
+        import numpy as np
+
+        self.from_rate = from_rate
+        self.to_rate = to_rate
+        divisor = gcd(from_rate, to_rate)
+        self.up = to_rate // divisor
+        self.down = from_rate // divisor
+
+        # Prototyp-Tiefpass auf der hochgetasteten Rate (L-fach, Gain L)
+        factor = max(self.up, self.down)
+        cutoff = rolloff / (2 * factor)
+        half = int(np.ceil(zero_crossings * factor / rolloff))
+        n = np.arange(-half, half + 1)
+        h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(n.size, KAISER_BETA)
+        h *= self.up
+
+        # Polyphasen: Koeffizient h[p + k*L] gehört zu Eingabe x[i - k].
+        # Umgedreht, damit ein aufsteigendes Eingabe-Fenster direkt passt.
+        taps = -(-h.size // self.up)
+        h = np.concatenate([h, np.zeros(taps * self.up - h.size)])
+        self._phases = np.ascontiguousarray(
+            h.reshape(taps, self.up).T[:, ::-1], dtype=np.float32
+        )
+        self._taps = taps
+        self._delay = half  # Filtermitte in hochgetasteten Samples
+        self._history = np.zeros(taps - 1, dtype=np.float32)
+        self._consumed = 0  # Eingabe-Samples insgesamt
+        self._produced = 0  # Ausgabe-Samples insgesamt
+
+    @property
+    def passthrough(self) -> bool:
+        return self.up == self.down
+
+    def process(self, samples: "np.ndarray") -> "np.ndarray":
+        """Resampled einen Chunk (float32, gleiche Skalierung wie die Eingabe)."""
+        import numpy as np
+
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if self.passthrough:
+            self._consumed += samples.size
+            self._produced += samples.size
+            return samples
+        return self._run(samples)
+
+    def flush(self) -> "np.ndarray":
+        """Liefert die durch die Filter-Verzögerung noch ausstehenden Samples."""
+        import numpy as np
+
+        target = -(-self._consumed * self.up // self.down)
+        if self.passthrough or self._produced >= target:
+            return np.zeros(0, dtype=np.float32)
+        consumed = self._consumed
+        padding = np.zeros(self._delay // self.up + 1, dtype=np.float32)
+        out = self._run(padding, limit=target)
+        self._consumed = consumed
+        return out
+
+    def process_int16(self, chunk: bytes) -> bytes:
+        """Wie `process()`, für int16-PCM-Bytes (Warm-Stream, Deepgram)."""
+        import numpy as np
+
+        if self.passthrough:
+            return chunk
+        return _to_int16(self._run(np.frombuffer(chunk, dtype=np.int16))).tobytes()
+
+    def flush_int16(self) -> bytes:
+        return _to_int16(self.flush()).tobytes()
+
+    def _run(self, samples: "np.ndarray", limit: int | None = None) -> "np.ndarray":
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        consumed_before = self._consumed
+        self._consumed += samples.size
+        window = np.concatenate([self._history, samples.astype(np.float32)])
+        if self._taps > 1:
+            self._history = window[-(self._taps - 1) :].copy()
+
+        # Ausgabe n liegt bei t = n*M + delay (hochgetastet) und braucht
+        # Eingabe i = t // L – nur berechnen, was schon vorliegt.
+        end = -(-(self._consumed * self.up - self._delay) // self.down)
+        if limit is not None:
+            end = min(end, limit)
+        if end <= self._produced:
+            return np.zeros(0, dtype=np.float32)
+
+        t = np.arange(self._produced, end, dtype=np.int64) * self.down + self._delay
+        starts = t // self.up - consumed_before
+        windows = sliding_window_view(window, self._taps)
+        if self.up == 1:
+            # Ganzzahliges Downsampling (48k → 16k): eine Phase, Fenster im Raster M
+            out = windows[starts[0] : starts[-1] + 1 : self.down] @ self._phases[0]
+        else:
+            out = np.einsum("nk,nk->n", windows[starts], self._phases[t % self.up])
+        self._produced = end
+        return out.astype(np.float32, copy=False)
+
+
+def _to_int16(samples: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    return np.clip(np.rint(samples), -INT16_MAX - 1, INT16_MAX).astype(np.int16)
+
+
+def resample(audio: "np.ndarray", from_rate: int, to_rate: int) -> "np.ndarray":
+    """Resampled eine komplette Aufnahme (float32, ceil(N·to/from) Samples)."""
+    import numpy as np
+
+    if len(audio) == 0:
+        return np.array([], dtype=np.float32)
+    if from_rate == to_rate:
+        return audio
+    resampler = StreamResampler(from_rate, to_rate)
+    # Blockweise: begrenzt die Fenster-Matrix (Ausgaben × Taps) im Speicher
+    parts = [
+        resampler.process(audio[start : start + _BLOCK_SAMPLES])
+        for start in range(0, len(audio), _BLOCK_SAMPLES)
+    ]
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+__all__ = ["StreamResampler", "resample"]
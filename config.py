@@ -22,6 +22,9 @@ WHISPER_BLOCKSIZE = 1024
 
 # Warmup-Dauer für lokale Modelle (MLX/Lightning Metal-Compilation, Whisper/Faster GPU-Init)
 PRELOAD_WARMUP_DURATION = 0.5
+# Realistische Äußerungslängen für das Hintergrund-Warmup nach dem Preload
+# (Kernel-Compilation und Allocator-Wachstum für typische Diktatlängen)
+LOCAL_WARMUP_BUCKETS = (1.0, 5.0, 15.0, 30.0)
 
 # Konstante für Audio-Konvertierung (float32 → int16)
 INT16_MAX = 32767
@@ -191,7 +194,7 @@ def get_input_device() -> tuple[int | None, int]:
 # Streaming-Konfiguration
 # =============================================================================
 
-INTERIM_THROTTLE_MS = 150  # Max. Update-Rate für Interim-File (Menübar pollt 200ms)
+INTERIM_THROTTLE_MS = 150  # Max. Update-Rate für Interim-File (Opt-in: PULSESCRIBE_INTERIM_FILE)
 FINALIZE_TIMEOUT = (
     5.0  # Warten auf finale Transkripte (erhöht für Windows/Netzwerk-Latenz)
 )
@@ -246,8 +249,17 @@ TRANSCRIBING_TIMEOUT = 45.0  # Sekunden (Deepgram + Refine sollten < 30s dauern)
 # Deepgram Streaming Timeouts
 AUDIO_QUEUE_POLL_INTERVAL = 0.1  # Sekunden zwischen Queue-Polls
 SEND_MEDIA_TIMEOUT = 5.0  # Max. Wartezeit für WebSocket send_media()
+SEND_COALESCE_MAX_MS = 250  # Max. Audio pro WebSocket-Frame beim Abbau eines Rückstaus
 FORWARDER_THREAD_JOIN_TIMEOUT = 0.5  # Timeout beim Beenden des Forwarder-Threads
 
+# Standby-WebSocket für Deepgram-Streaming (PULSESCRIBE_DEEPGRAM_STANDBY=false deaktiviert)
+# Der Daemon hält im Leerlauf einen verbundenen Socket bereit, den die nächste
+# Aufnahme ohne Handshake übernimmt.
+DEEPGRAM_STANDBY_KEEPALIVE = 4.0  # KeepAlive-Abstand (Deepgram schließt nach ~10s ohne Daten)
+DEEPGRAM_STANDBY_TTL = 300.0  # Standby-Socket spätestens danach erneuern
+DEEPGRAM_STANDBY_IDLE = 900.0  # So lange keine Aufnahme → Standby schließen
+DEEPGRAM_STANDBY_RETRY = 15.0  # Wartezeit nach fehlgeschlagenem Standby-Connect
+
 # Drain-Konfiguration: Leeren der Audio-Queue nach Aufnahme-Stop
 # Pre-Drain: Callback läuft noch, gibt sounddevice Zeit Buffer zu leeren
 PRE_DRAIN_DURATION = 0.1  # Pre-Drain Phase bevor Callback gestoppt wird (100ms)
@@ -255,6 +267,74 @@ DRAIN_POLL_INTERVAL = 0.01  # Timeout pro Queue.get() während Drain (10ms)
 DRAIN_MAX_DURATION = 0.2  # Maximale Drain-Dauer als Safety-Limit (200ms)
 DRAIN_EMPTY_THRESHOLD = 2  # Anzahl leerer Polls bevor Drain beendet wird
 
+# Lokales Pseudo-Streaming (PULSESCRIBE_LOCAL_STREAMING=true)
+# Während der Aufnahme wird periodisch das nicht committete Fenster dekodiert;
+# beim Stop bleibt nur der Rest seit dem letzten Commit übrig.
+LOCAL_STREAM_INTERVAL = _get_float_env(
+    "PULSESCRIBE_LOCAL_STREAMING_INTERVAL", 1.0
+)  # Sekunden zwischen Fenster-Decodes
+LOCAL_STREAM_WINDOW = _get_float_env(
+    "PULSESCRIBE_LOCAL_STREAMING_WINDOW", 15.0
+)  # Max. unkommittiertes Audio, danach Zwangs-Commit an leisester Stelle
+LOCAL_STREAM_MIN_AUDIO = 1.0  # Mindest-Fensterlänge für einen Decode (Sekunden)
+LOCAL_STREAM_PAUSE = 0.4  # Stille am Fensterende, ab der committet werden darf
+
+# Segment-Upload während der Aufnahme (PULSESCRIBE_SEGMENT_UPLOAD=true, REST-Provider)
+# Ab SEGMENT_UPLOAD_SECONDS wird an der nächsten Sprechpause geschnitten und das
+# Segment sofort hochgeladen; beim Stop ist nur noch das letzte Segment offen.
+SEGMENT_UPLOAD_SECONDS = _get_float_env(
+    "PULSESCRIBE_SEGMENT_UPLOAD_SECONDS", 20.0
+)  # Mindestlänge eines Segments
+SEGMENT_UPLOAD_INTERVAL = 0.25  # Sekunden zwischen Schnittpunkt-Prüfungen
+SEGMENT_UPLOAD_WORKERS = 3  # Parallele Segment-Uploads
+
+# Hedged Requests (PULSESCRIBE_HEDGE_PROVIDER=local|groq|openai|deepgram)
+# Antwortet der primäre REST-Provider nicht innerhalb seiner p95-Latenz, startet
+# dieselbe Aufnahme zusätzlich beim Sekundär-Provider; das erste Ergebnis gewinnt.
+HEDGE_PERCENTILE = 95.0  # Perzentil der Provider-Latenz als Hedge-Verzögerung
+HEDGE_MIN_SAMPLES = 8  # Darunter gilt HEDGE_DEFAULT_DELAY
+HEDGE_DEFAULT_DELAY = 4.0  # Sekunden, solange noch kein Histogramm vorliegt
+HEDGE_MIN_DELAY = 0.75  # Nie früher hedgen (vermeidet Doppel-Requests)
+HEDGE_WINDOW = 200  # Gemerkte Latenzen pro Provider und Längenklasse
+
+# Provider-Health / Circuit Breaker (PULSESCRIBE_CIRCUIT_BREAKER=false deaktiviert)
+# Fehler und zu langsame Antworten öffnen den Circuit; offene Provider werden
+# übersprungen und erst nach dem Cooldown mit einem einzelnen Request geprüft.
+HEALTH_WINDOW = 20  # Letzte Aufrufe für die Fehlerrate
+HEALTH_MIN_CALLS = 10  # Mindestanzahl Aufrufe, bevor die Fehlerrate zählt
+CIRCUIT_FAILURE_THRESHOLD = 3  # Fehler/Timeouts in Folge → open
+CIRCUIT_ERROR_RATE = 0.5  # Fehlerrate im Fenster → open
+CIRCUIT_SLOW_SECONDS = 6.0  # Antwort gilt als Fehlschlag ab 6s ...
+CIRCUIT_SLOW_RTF = 0.2  # ... plus 0.2s pro Sekunde Audio
+CIRCUIT_COOLDOWN = 60.0  # Sekunden bis zum ersten Probe-Request (half-open)
+CIRCUIT_MAX_COOLDOWN = 900.0  # Cooldown verdoppelt sich pro Fehlprobe bis hierhin
+HEALTH_SAVE_DELAY = 30.0  # Latenzen/Outcomes gesammelt schreiben (State-Wechsel sofort)
+
+# Gemeinsamer HTTP-Transport aller SDK-Clients (utils/http_client.py)
+HTTP_MAX_CONNECTIONS = 20  # Offene Verbindungen insgesamt (alle Hosts)
+HTTP_MAX_KEEPALIVE = 10  # Davon im Pool gehaltene Leerlauf-Verbindungen
+HTTP_KEEPALIVE_EXPIRY = 30.0  # Sekunden bis eine ungenutzte Verbindung schließt
+HTTP_CONNECT_TIMEOUT = 5.0  # TCP+TLS-Aufbau
+HTTP_READ_TIMEOUT = 60.0  # Lesen/Schreiben (lange Uploads, langsame Modelle)
+HTTP_POOL_TIMEOUT = 5.0  # Warten auf eine freie Pool-Verbindung
+HTTP_SWAP_GRACE = 90.0  # Alte Clients nach Key-Wechsel erst danach schließen
+# Request-Timeouts pro SDK (bisherige SDK-Defaults, Verbindungsaufbau HTTP_CONNECT_TIMEOUT)
+OPENAI_TIMEOUT = 600.0  # Uploads bis 25 MB, lange Transkriptionen
+GROQ_TIMEOUT = 60.0
+DEEPGRAM_TIMEOUT = 60.0
+
+# Verbindungs-Pre-Warming beim Hotkey-Down (PULSESCRIBE_PREWARM=false deaktiviert)
+PREWARM_TIMEOUT = 3.0  # Max. Dauer eines Warm-HEAD-Requests
+PREWARM_INTERVAL = 15.0  # Keepalive-HEAD während der Aufnahme (< HTTP_KEEPALIVE_EXPIRY)
+
+# Out-of-Process-Inferenz-Worker (python -m providers.local_worker)
+# Hält das lokale Modell über Daemon-Neustarts hinweg warm; nur localhost.
+LOCAL_WORKER_HOST = "127.0.0.1"
+LOCAL_WORKER_PORT = _get_bounded_int_env(
+    "PULSESCRIBE_LOCAL_WORKER_PORT", default=48731, min_value=1024, max_value=65535
+)
+LOCAL_WORKER_CONNECT_TIMEOUT = 0.25  # Sekunden für Ping/Verbindungsaufbau
+
 # LLM-Refine Timeout: Maximale Wartezeit für API-Calls
 # Verhindert "hängende" Requests bei Netzwerkproblemen
 LLM_REFINE_TIMEOUT = 30.0  # Sekunden (typische Refine-Calls: 2-5s)
@@ -309,6 +389,10 @@ LOG_FILE = LOG_DIR / "pulsescribe.log"
 
 VOCABULARY_FILE = USER_CONFIG_DIR / "vocabulary.json"
 PROMPTS_FILE = USER_CONFIG_DIR / "prompts.toml"
+LOCAL_PROFILE_FILE = USER_CONFIG_DIR / "local_profile.json"  # Kalibrierungs-Ergebnis
+LOCAL_WORKER_TOKEN_FILE = USER_CONFIG_DIR / "local_worker.token"  # Socket-Auth (0600)
+RESULT_CACHE_DIR = USER_CONFIG_DIR / "result_cache"  # Transkript-Cache (LRU)
+PROVIDER_HEALTH_FILE = USER_CONFIG_DIR / "provider_health.json"  # Latenzen + Circuit-State
 
 # Resource path helper import must happen after core constants to avoid circular imports
 # (utils imports config for IPC paths and config dir).
@@ -325,6 +409,7 @@ __all__ = [
     "WHISPER_BLOCKSIZE",
     "INT16_MAX",
     "PRELOAD_WARMUP_DURATION",
+    "LOCAL_WARMUP_BUCKETS",
     # Audio Analysis
     "VAD_THRESHOLD",
     "VISUAL_NOISE_GATE",
@@ -338,11 +423,52 @@ __all__ = [
     "LLM_REFINE_TIMEOUT",
     "AUDIO_QUEUE_POLL_INTERVAL",
     "SEND_MEDIA_TIMEOUT",
+    "SEND_COALESCE_MAX_MS",
+    "DEEPGRAM_STANDBY_KEEPALIVE",
+    "DEEPGRAM_STANDBY_TTL",
+    "DEEPGRAM_STANDBY_IDLE",
+    "DEEPGRAM_STANDBY_RETRY",
     "FORWARDER_THREAD_JOIN_TIMEOUT",
     "PRE_DRAIN_DURATION",
     "DRAIN_POLL_INTERVAL",
     "DRAIN_MAX_DURATION",
     "DRAIN_EMPTY_THRESHOLD",
+    "LOCAL_STREAM_INTERVAL",
+    "LOCAL_STREAM_WINDOW",
+    "LOCAL_STREAM_MIN_AUDIO",
+    "LOCAL_STREAM_PAUSE",
+    "SEGMENT_UPLOAD_SECONDS",
+    "SEGMENT_UPLOAD_INTERVAL",
+    "SEGMENT_UPLOAD_WORKERS",
+    "HEDGE_PERCENTILE",
+    "HEDGE_MIN_SAMPLES",
+    "HEDGE_DEFAULT_DELAY",
+    "HEDGE_MIN_DELAY",
+    "HEDGE_WINDOW",
+    "HTTP_MAX_CONNECTIONS",
+    "HTTP_MAX_KEEPALIVE",
+    "HTTP_KEEPALIVE_EXPIRY",
+    "HTTP_CONNECT_TIMEOUT",
+    "HTTP_READ_TIMEOUT",
+    "HTTP_POOL_TIMEOUT",
+    "HTTP_SWAP_GRACE",
+    "OPENAI_TIMEOUT",
+    "GROQ_TIMEOUT",
+    "DEEPGRAM_TIMEOUT",
+    "PREWARM_TIMEOUT",
+    "PREWARM_INTERVAL",
+    "HEALTH_WINDOW",
+    "HEALTH_MIN_CALLS",
+    "CIRCUIT_FAILURE_THRESHOLD",
+    "CIRCUIT_ERROR_RATE",
+    "CIRCUIT_SLOW_SECONDS",
+    "CIRCUIT_SLOW_RTF",
+    "CIRCUIT_COOLDOWN",
+    "CIRCUIT_MAX_COOLDOWN",
+    "HEALTH_SAVE_DELAY",
+    "LOCAL_WORKER_HOST",
+    "LOCAL_WORKER_PORT",
+    "LOCAL_WORKER_CONNECT_TIMEOUT",
     # Models
     "DEFAULT_API_MODEL",
     "DEFAULT_LOCAL_MODEL",
@@ -361,4 +487,8 @@ __all__ = [
     "LOG_FILE",
     "VOCABULARY_FILE",
     "PROMPTS_FILE",
+    "LOCAL_PROFILE_FILE",
+    "LOCAL_WORKER_TOKEN_FILE",
+    "RESULT_CACHE_DIR",
+    "PROVIDER_HEALTH_FILE",
 ]
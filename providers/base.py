@@ -3,8 +3,10 @@
 Alle Provider müssen dieses Interface implementieren.
 """
 
-from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from audio.memory import AudioSource
 
 
 @runtime_checkable
@@ -13,18 +15,21 @@ class TranscriptionProvider(Protocol):
 
     Jeder Provider muss mindestens transcribe() implementieren.
     Streaming-Provider implementieren zusätzlich transcribe_stream().
+    transcribe_async() ist die Coroutine-Variante für parallele Aufrufe in
+    einem Event-Loop (Cloud: native Async-Clients, lokal: Worker-Thread).
     """
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: "AudioSource",
         model: str | None = None,
         language: str | None = None,
     ) -> str:
         """Transkribiert eine Audio-Datei.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder `InMemoryAudio` (Daemons,
+                ohne Temp-Datei)
             model: Modell-Name (optional, nutzt Provider-Default)
             language: Sprachcode (z.B. 'de', 'en') oder None für Auto-Detection
 
@@ -37,6 +42,19 @@ class TranscriptionProvider(Protocol):
         """
         ...
 
+    async def transcribe_async(
+        self,
+        audio_path: "AudioSource",
+        model: str | None = None,
+        language: str | None = None,
+    ) -> str:
+        """Wie `transcribe()`, aber als Coroutine.
+
+        Viele Aufrufe können so in einem Event-Loop überlappen, ohne pro
+        Request einen Thread zu parken.
+        """
+        ...
+
     def supports_streaming(self) -> bool:
         """Gibt zurück ob der Provider Streaming unterstützt.
 
@@ -4,18 +4,30 @@ Nutzt Deepgram's REST API für Transkription.
 Für Streaming siehe deepgram_stream.py.
 """
 
+import asyncio
 import logging
 import os
-from pathlib import Path
+
+from audio.memory import (
+    AudioSource,
+    audio_codec,
+    audio_size,
+    prepare_upload,
+    read_audio_bytes,
+)
+from utils.http_client import on_http_swap, sdk_async_http_client, sdk_http_client
+from utils.prewarm import warm_client
 from utils.timing import timed_operation
 from utils.vocabulary import load_vocabulary
 
-from config import DEFAULT_DEEPGRAM_MODEL
+from config import DEEPGRAM_TIMEOUT, DEFAULT_DEEPGRAM_MODEL
 
 logger = logging.getLogger("pulsescribe.providers.deepgram")
 
 # Singleton Client
 _client = None
+# Async-Client mit dem HTTP-Client, auf dem er gebaut wurde (Loop-gebunden)
+_async_client: tuple | None = None
 
 
 def _get_client():
@@ -27,11 +39,45 @@ def _get_client():
         api_key = os.getenv("DEEPGRAM_API_KEY")
         if not api_key:
             raise ValueError("DEEPGRAM_API_KEY nicht gesetzt")
-        _client = DeepgramClient(api_key=api_key)
+        _client = DeepgramClient(
+            api_key=api_key,
+            httpx_client=sdk_http_client("deepgram"),
+            timeout=DEEPGRAM_TIMEOUT,
+        )
         logger.debug("Deepgram-Client initialisiert")
     return _client
 
 
+def _get_async_client():
+    """Gibt AsyncDeepgramClient für den laufenden Event-Loop zurück (Lazy Init)."""
+    global _async_client
+    http_client = sdk_async_http_client("deepgram")
+    if _async_client is None or _async_client[0] is not http_client:
+        from deepgram import AsyncDeepgramClient
+
+        api_key = os.getenv("DEEPGRAM_API_KEY")
+        if not api_key:
+            raise ValueError("DEEPGRAM_API_KEY nicht gesetzt")
+        _async_client = (
+            http_client,
+            AsyncDeepgramClient(
+                api_key=api_key, httpx_client=http_client, timeout=DEEPGRAM_TIMEOUT
+            ),
+        )
+        logger.debug("AsyncDeepgram-Client initialisiert")
+    return _async_client[1]
+
+
+def _reset_client() -> None:
+    """Verwirft die Clients (neue Keys/Transport nach Settings-Reload)."""
+    global _client, _async_client
+    _client = None
+    _async_client = None
+
+
+on_http_swap(_reset_client)
+
+
 
 
 class DeepgramProvider:
@@ -65,24 +111,55 @@ class DeepgramProvider:
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: AudioSource,
         model: str | None = None,
         language: str | None = None,
     ) -> str:
         """Transkribiert Audio über Deepgram REST API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder InMemoryAudio
             model: Modell (default: nova-3)
             language: Sprachcode oder None für Auto-Detection
 
         Returns:
             Transkribierter Text
         """
+        params = self._prepare(audio_path, model, language)
+        client = _get_client()
+
+        with timed_operation("Deepgram-Transkription", logger=logger, include_session=False):
+            response = client.listen.v1.media.transcribe_file(**params)
+
+        return self._result(response)
+
+    async def transcribe_async(
+        self,
+        audio_path: AudioSource,
+        model: str | None = None,
+        language: str | None = None,
+    ) -> str:
+        """Wie `transcribe()`, aber über den AsyncDeepgramClient.
+
+        Kodieren und Vocabulary-Laden laufen in einem Worker-Thread.
+        """
+        params = await asyncio.to_thread(self._prepare, audio_path, model, language)
+        client = _get_async_client()
+
+        with timed_operation("Deepgram-Transkription", logger=logger, include_session=False):
+            response = await client.listen.v1.media.transcribe_file(**params)
+
+        return self._result(response)
+
+    def _prepare(
+        self, audio_path: AudioSource, model: str | None, language: str | None
+    ) -> dict:
+        """Validiert, kodiert den Upload und baut die Request-Parameter."""
         self._validate()
 
         model = model or self.default_model
-        audio_kb = audio_path.stat().st_size // 1024
+        upload = prepare_upload(audio_path, self.name)
+        audio_kb = audio_size(upload) // 1024
 
         # Vocabulary laden
         MAX_KEYWORDS = 100
@@ -90,34 +167,28 @@ class DeepgramProvider:
         keywords = vocab.get("keywords", [])[:MAX_KEYWORDS]
 
         logger.info(
-            f"Deepgram: {model}, {audio_kb}KB, lang={language or 'auto'}, "
+            f"Deepgram: {model}, {audio_kb}KB {audio_codec(upload)}, "
+            f"lang={language or 'auto'}, "
             f"vocab={len(keywords)}"
         )
 
-        client = _get_client()
-
-        with audio_path.open("rb") as f:
-            audio_data = f.read()
-
+        params = {
+            "request": read_audio_bytes(upload),
+            "model": model,
+            "language": language,
+            "smart_format": True,
+            "punctuate": True,
+        }
         # Nova-3 nutzt 'keyterm', ältere Modelle nutzen 'keywords'
-        is_nova3 = model.startswith("nova-3")
-        vocab_params = {}
         if keywords:
-            if is_nova3:
-                vocab_params["keyterm"] = keywords
+            if model.startswith("nova-3"):
+                params["keyterm"] = keywords
             else:
-                vocab_params["keywords"] = keywords
-
-        with timed_operation("Deepgram-Transkription", logger=logger, include_session=False):
-            response = client.listen.v1.media.transcribe_file(
-                request=audio_data,
-                model=model,
-                language=language,
-                smart_format=True,
-                punctuate=True,
-                **vocab_params,
-            )
+                params["keywords"] = keywords
+        return params
 
+    @staticmethod
+    def _result(response) -> str:
         # Sichere Extraktion: Prüfe auf leere channels/alternatives
         channels = getattr(response.results, "channels", [])
         if not channels or not getattr(channels[0], "alternatives", []):
@@ -129,6 +200,15 @@ class DeepgramProvider:
 
         return result
 
+    def prewarm(self) -> float | None:
+        """Öffnet die TLS-Verbindung vorab (beim Hotkey-Down).
+
+        Returns:
+            Dauer des Warm-Requests in Sekunden oder None
+        """
+        self._validate()
+        return warm_client(_get_client(), "Deepgram")
+
     def supports_streaming(self) -> bool:
         """REST API unterstützt kein Streaming (siehe DeepgramStreamProvider)."""
         return False
@@ -0,0 +1,277 @@
+"""Vorab verbundene Standby-WebSocket für Deepgram-Streaming.
+
+Jede Aufnahme öffnet sonst eine neue WebSocket; Handshake samt TLS kostet
+300–600ms, die das Audio im Puffer überbrücken muss. `DeepgramStandby` hält im
+Leerlauf eine authentifizierte Verbindung mit KeepAlive-Nachrichten offen und
+übergibt sie der nächsten Aufnahme ohne Handshake. Danach wird im Hintergrund
+sofort die nächste Standby-Verbindung aufgebaut.
+
+Stream-Parameter (Modell, Sprache, Sample-Rate) stehen in der URL und sind nach
+dem Connect fix. Passt der Standby-Socket nicht zur Aufnahme (z.B. anderes
+Mikrofon), verbindet die Aufnahme wie bisher neu und der Standby folgt den
+neuen Parametern.
+
+WebSockets gehören zu dem Event-Loop, der sie geöffnet hat. Der Manager
+läuft deshalb auf einem `LoopThread` (im Daemon der gemeinsame Streaming-Loop);
+Aufnahmen mit Standby müssen in diesem Loop laufen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, TypeVar
+
+from config import (
+    DEEPGRAM_STANDBY_IDLE,
+    DEEPGRAM_STANDBY_KEEPALIVE,
+    DEEPGRAM_STANDBY_RETRY,
+    DEEPGRAM_STANDBY_TTL,
+    WHISPER_CHANNELS,
+)
+
+from utils.loop_thread import LoopThread
+
+from .deepgram_stream import _deepgram_ws_url, _open_deepgram_websocket
+
+if TYPE_CHECKING:
+    from deepgram.listen.v1.socket_client import AsyncV1SocketClient
+
+logger = logging.getLogger("pulsescribe.providers.deepgram_standby")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class StandbyKey:
+    """Stream-Parameter, die ein Standby-Socket erfüllen muss."""
+
+    model: str
+    language: str | None
+    sample_rate: int
+    channels: int = WHISPER_CHANNELS
+
+    @property
+    def url(self) -> str:
+        return _deepgram_ws_url(
+            model=self.model,
+            language=self.language,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+        )
+
+
+class DeepgramStandby:
+    """Hält eine verbundene Deepgram-WebSocket für die nächste Aufnahme bereit.
+
+    Args:
+        keepalive: Abstand der KeepAlive-Nachrichten (Sekunden)
+        ttl: Standby-Socket nach dieser Zeit erneuern
+        idle_timeout: Ohne Aufnahme so lange → Standby schließen
+        retry: Wartezeit nach fehlgeschlagenem Connect
+        api_key: Liefert den API-Key beim Connect (Default: DEEPGRAM_API_KEY)
+        loop_thread: Gemeinsamer Loop; ohne wird ein eigener gestartet
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive: float = DEEPGRAM_STANDBY_KEEPALIVE,
+        ttl: float = DEEPGRAM_STANDBY_TTL,
+        idle_timeout: float = DEEPGRAM_STANDBY_IDLE,
+        retry: float = DEEPGRAM_STANDBY_RETRY,
+        api_key: Callable[[], str | None] = lambda: os.getenv("DEEPGRAM_API_KEY"),
+        loop_thread: LoopThread | None = None,
+    ):
+        self._keepalive = keepalive
+        self._ttl = ttl
+        self._idle_timeout = idle_timeout
+        self._retry = retry
+        self._api_key = api_key
+
+        self._owns_loop = loop_thread is None
+        self._loop_thread = loop_thread or LoopThread("DeepgramStandby")
+
+        # Nur im Loop-Thread verändert
+        self._socket: Any = None
+        self._key: StandbyKey | None = None
+        self._opened_at = 0.0
+        self._task: asyncio.Task | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._last_activity = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------------------------------------------------------
+    # Thread-API (Daemon)
+    # -------------------------------------------------------------------------
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event-Loop, in dem Sessions mit Standby laufen müssen."""
+        return self._loop_thread.loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Führt `coro` im Loop des Managers aus und wartet auf das Ergebnis."""
+        return self._loop_thread.run(coro)
+
+    def prepare(self, key: StandbyKey) -> None:
+        """Baut (im Hintergrund) einen Standby-Socket für `key` auf."""
+        self._loop_thread.call_soon(self._maintain, key)
+
+    def discard(self) -> None:
+        """Schließt den Standby-Socket (z.B. Mode-Wechsel, neuer API-Key)."""
+        if self._loop_thread.running:
+            self._loop_thread.call_soon(self._drop)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Schließt den Standby-Socket (und den eigenen Loop-Thread)."""
+        if self._loop_thread.running:
+            try:
+                self._loop_thread.run(self._shutdown(), timeout)
+            except Exception as e:
+                logger.debug(f"Standby-Shutdown: {e}")
+        if self._owns_loop:
+            self._loop_thread.close(timeout)
+
+    # -------------------------------------------------------------------------
+    # Loop-API (deepgram_stream_core)
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def connection(
+        self, api_key: str, key: StandbyKey
+    ) -> AsyncIterator[AsyncV1SocketClient]:
+        """Übernimmt den Standby-Socket oder verbindet neu.
+
+        Nach der Aufnahme wird der Socket geschlossen und sofort ein neuer
+        Standby-Socket für dieselben Parameter aufgebaut.
+        """
+        from deepgram.listen.v1.socket_client import AsyncV1SocketClient
+
+        protocol = self._take(key)
+        if protocol is None:
+            self.misses += 1
+            protocol = await _open_deepgram_websocket(api_key, key.url)
+        else:
+            self.hits += 1
+        try:
+            yield AsyncV1SocketClient(websocket=protocol)
+        finally:
+            try:
+                await protocol.close()
+            finally:
+                self._maintain(key)
+
+    # -------------------------------------------------------------------------
+    # Intern (Loop-Thread)
+    # -------------------------------------------------------------------------
+
+    def _take(self, key: StandbyKey) -> Any:
+        """Gibt den Standby-Socket heraus, wenn er offen ist und zu `key` passt."""
+        self._last_activity = time.monotonic()
+        self._cancel_task()
+        protocol, self._socket = self._socket, None
+        if protocol is None:
+            logger.info("Deepgram-Standby: kein Socket bereit, verbinde neu")
+            return None
+        if self._key != key or not protocol.open:
+            reason = "andere Parameter" if self._key != key else "Verbindung verloren"
+            logger.info(f"Deepgram-Standby verworfen ({reason}), verbinde neu")
+            self._close_later(protocol)
+            return None
+        age = time.monotonic() - self._opened_at
+        logger.info(f"Deepgram-Standby übernommen (Socket {age:.0f}s alt)")
+        return protocol
+
+    def _maintain(self, key: StandbyKey) -> None:
+        self._last_activity = time.monotonic()
+        self._cancel_task()
+        self._task = asyncio.ensure_future(self._keep_standby(key))
+
+    def _cancel_task(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _close_later(self, protocol: Any) -> None:
+        task = asyncio.ensure_future(protocol.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _drop(self) -> None:
+        self._cancel_task()
+        protocol, self._socket = self._socket, None
+        if protocol is not None:
+            self._close_later(protocol)
+            logger.info("Deepgram-Standby geschlossen")
+
+    async def _shutdown(self) -> None:
+        task = self._task
+        self._drop()
+        # Eigene Connects/Closes abschließen (Loop kann geteilt sein)
+        pending = [t for t in (task, *self._closing) if t is not None]
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _keep_standby(self, key: StandbyKey) -> None:
+        """Verbindet für `key` und hält den Socket mit KeepAlive offen."""
+        from deepgram.listen.v1.socket_client import AsyncV1SocketClient
+
+        if self._socket is not None and self._key != key:
+            self._drop()
+
+        while True:
+            now = time.monotonic()
+            if now - self._last_activity >= self._idle_timeout:
+                logger.info(
+                    f"Deepgram-Standby: {self._idle_timeout:.0f}s ohne Aufnahme, schließe"
+                )
+                self._drop()
+                return
+
+            protocol = self._socket
+            if protocol is not None and (
+                not protocol.open or now - self._opened_at >= self._ttl
+            ):
+                self._socket = None
+                self._close_later(protocol)
+                protocol = None
+
+            if protocol is None:
+                api_key = self._api_key()
+                if not api_key:
+                    return
+                t0 = time.perf_counter()
+                try:
+                    protocol = await _open_deepgram_websocket(api_key, key.url)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"Deepgram-Standby-Connect fehlgeschlagen: {e}")
+                    await asyncio.sleep(self._retry)
+                    continue
+                self._socket, self._key = protocol, key
+                self._opened_at = time.monotonic()
+                logger.debug(
+                    f"Deepgram-Standby verbunden "
+                    f"({(time.perf_counter() - t0) * 1000:.0f}ms Handshake vorgezogen)"
+                )
+
+            try:
+                await AsyncV1SocketClient(websocket=protocol).send_keep_alive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Deepgram-Standby KeepAlive fehlgeschlagen: {e}")
+                self._socket = None
+                self._close_later(protocol)
+                continue
+            await asyncio.sleep(self._keepalive)
+
+
+__all__ = ["DeepgramStandby", "StandbyKey"]
@@ -42,26 +42,30 @@ from config import (
     FINALIZE_TIMEOUT,
     FORWARDER_THREAD_JOIN_TIMEOUT,
     INT16_MAX,
-    INTERIM_FILE,
-    INTERIM_THROTTLE_MS,
     PRE_DRAIN_DURATION,
+    SEND_COALESCE_MAX_MS,
     SEND_MEDIA_TIMEOUT,
     WHISPER_BLOCKSIZE,
     WHISPER_CHANNELS,
     WHISPER_SAMPLE_RATE,
     get_input_device,
 )
+from utils.interim import interim_channel
 from utils.logging import get_session_id
 from utils.timing import log_preview
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from audio.memory import InMemoryAudio
+
     import numpy as np
     import sounddevice as sd
     from deepgram.clients.listen.v1 import LiveResultResponse
     from deepgram.listen.v1.socket_client import AsyncV1SocketClient
 
+    from .deepgram_standby import DeepgramStandby
+
 logger = logging.getLogger("pulsescribe")
 
 
@@ -120,7 +124,6 @@ class StreamState:
     """
 
     final_transcripts: list[str] = field(default_factory=list)
-    last_interim_write: float = 0.0
     stream_error: Exception | None = None
     stop_event: asyncio.Event = field(default_factory=asyncio.Event)
     finalize_done: asyncio.Event = field(default_factory=asyncio.Event)
@@ -147,6 +150,36 @@ class BufferState:
     active: bool = True
 
 
+@dataclass
+class SendStats:
+    """Kennzahlen des Audio-Senders einer Session."""
+
+    chunks: int = 0
+    frames: int = 0
+    bytes_sent: int = 0
+    max_backlog: int = 0  # Chunks in der Queue (nach dem Holen eines Chunks)
+    catchups: list[float] = field(default_factory=list)  # Rückstau-Abbau (Sekunden)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def send_rate(self) -> float:
+        """Gesendete Bytes pro Sekunde seit Session-Start."""
+        elapsed = time.perf_counter() - self.started_at
+        return self.bytes_sent / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        text = (
+            f"Audio-Send: {self.chunks} Chunks in {self.frames} Frames, "
+            f"{self.send_rate / 1024:.1f} KB/s, max. Rückstau {self.max_backlog}"
+        )
+        if self.catchups:
+            text += (
+                f", aufgeholt {len(self.catchups)}× "
+                f"(max. {max(self.catchups) * 1000:.0f}ms)"
+            )
+        return text
+
+
 # =============================================================================
 # Sound Helper
 # =============================================================================
@@ -197,9 +230,7 @@ def _extract_transcript(result: LiveResultResponse | Any) -> str | None:
 # =============================================================================
 
 
-@asynccontextmanager
-async def _create_deepgram_connection(
-    api_key: str,
+def _deepgram_ws_url(
     *,
     model: str,
     language: str | None = None,
@@ -209,18 +240,9 @@ async def _create_deepgram_connection(
     encoding: str = "linear16",
     sample_rate: int = WHISPER_SAMPLE_RATE,
     channels: int = WHISPER_CHANNELS,
-) -> AsyncIterator[AsyncV1SocketClient]:
-    """Deepgram WebSocket mit kontrollierbarem close_timeout.
-
-    Das SDK leitet close_timeout nicht an websockets.connect() weiter,
-    was zu 5-10s Shutdown-Delays führt. Dieser Context Manager umgeht
-    das Problem durch direkte Nutzung der websockets Library.
-
-    Siehe docs/adr/001-deepgram-streaming-shutdown.md
-    """
+) -> str:
+    """WebSocket-URL mit allen Stream-Parametern (sind nach dem Connect fix)."""
     import httpx
-    from deepgram.listen.v1.socket_client import AsyncV1SocketClient
-    from websockets.legacy.client import connect as websockets_connect
 
     # Query-Parameter aufbauen
     params = httpx.QueryParams()
@@ -235,15 +257,58 @@ async def _create_deepgram_connection(
     params = params.add("sample_rate", str(sample_rate))
     params = params.add("channels", str(channels))
 
-    ws_url = f"{DEEPGRAM_WS_URL}?{params}"
-    headers = {"Authorization": f"Token {api_key}"}
+    return f"{DEEPGRAM_WS_URL}?{params}"
+
+
+async def _open_deepgram_websocket(api_key: str, ws_url: str) -> Any:
+    """Öffnet und authentifiziert die WebSocket (Handshake, ~300–600ms)."""
+    from websockets.legacy.client import connect as websockets_connect
 
-    async with websockets_connect(
+    return await websockets_connect(
         ws_url,
-        extra_headers=headers,
+        extra_headers={"Authorization": f"Token {api_key}"},
         close_timeout=DEEPGRAM_CLOSE_TIMEOUT,
-    ) as protocol:
+    )
+
+
+@asynccontextmanager
+async def _create_deepgram_connection(
+    api_key: str,
+    *,
+    model: str,
+    language: str | None = None,
+    smart_format: bool = True,
+    punctuate: bool = True,
+    interim_results: bool = True,
+    encoding: str = "linear16",
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    channels: int = WHISPER_CHANNELS,
+) -> AsyncIterator[AsyncV1SocketClient]:
+    """Deepgram WebSocket mit kontrollierbarem close_timeout.
+
+    Das SDK leitet close_timeout nicht an websockets.connect() weiter,
+    was zu 5-10s Shutdown-Delays führt. Dieser Context Manager umgeht
+    das Problem durch direkte Nutzung der websockets Library.
+
+    Siehe docs/adr/001-deepgram-streaming-shutdown.md
+    """
+    from deepgram.listen.v1.socket_client import AsyncV1SocketClient
+
+    ws_url = _deepgram_ws_url(
+        model=model,
+        language=language,
+        smart_format=smart_format,
+        punctuate=punctuate,
+        interim_results=interim_results,
+        encoding=encoding,
+        sample_rate=sample_rate,
+        channels=channels,
+    )
+    protocol = await _open_deepgram_websocket(api_key, ws_url)
+    try:
         yield AsyncV1SocketClient(websocket=protocol)
+    finally:
+        await protocol.close()
 
 
 # =============================================================================
@@ -429,20 +494,34 @@ def _init_warm_stream(
 
     Mikrofon läuft bereits, wir "armen" es nur zum Aufnehmen.
     Instant-Start ohne WASAPI Cold-Start-Delay.
+
+    Läuft das Gerät nicht mit 16 kHz (meist 48 kHz), resampled der Forwarder
+    die Chunks unterwegs – Deepgram bekommt nur die nötige Bandbreite.
     """
+    from audio.resample import StreamResampler
+
+    resampler = StreamResampler(warm_source.sample_rate, WHISPER_SAMPLE_RATE)
+    sample_rate = resampler.to_rate
     logger.info(
-        f"[{session_id}] Warm-Stream Mode: {warm_source.sample_rate}Hz, instant-start"
+        f"[{session_id}] Warm-Stream Mode: {warm_source.sample_rate}Hz"
+        + ("" if resampler.passthrough else f" → {sample_rate}Hz")
+        + ", instant-start"
     )
 
     # Arm the stream - ab jetzt werden Samples gesammelt
     warm_source.arm_event.set()
 
+    def forward(chunk: bytes) -> None:
+        chunk = resampler.process_int16(chunk)
+        if chunk:
+            loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+
     def _warm_stream_forwarder() -> None:
-        """Leitet Audio von sync Queue an async Queue weiter."""
+        """Leitet Audio von sync Queue an async Queue weiter (ggf. resampled)."""
         while not state.stop_event.is_set():
             try:
                 chunk = warm_source.audio_queue.get(timeout=AUDIO_QUEUE_POLL_INTERVAL)
-                loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+                forward(chunk)
             except queue.Empty:
                 continue
             except Exception as e:
@@ -457,7 +536,7 @@ def _init_warm_stream(
         while True:
             try:
                 chunk = warm_source.audio_queue.get_nowait()
-                loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+                forward(chunk)
                 immediate_drained += 1
             except (queue.Empty, RuntimeError):
                 break
@@ -473,7 +552,7 @@ def _init_warm_stream(
         while time.monotonic() < pre_drain_deadline:
             try:
                 chunk = warm_source.audio_queue.get(timeout=DRAIN_POLL_INTERVAL)
-                loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+                forward(chunk)
                 pre_drained += 1
             except queue.Empty:
                 continue
@@ -511,7 +590,7 @@ def _init_warm_stream(
                     break
                 try:
                     chunk = warm_source.audio_queue.get(timeout=DRAIN_POLL_INTERVAL)
-                    loop.call_soon_threadsafe(audio_queue.put_nowait, chunk)
+                    forward(chunk)
                     drained += 1
                     empty_count = 0  # Reset bei erfolgreichem Chunk
                 except queue.Empty:
@@ -528,6 +607,14 @@ def _init_warm_stream(
             if warm_source.drain_event is not None:
                 warm_source.drain_event.clear()
 
+        # Rest aus der Filter-Verzögerung des Resamplers (< 1ms Audio)
+        try:
+            tail = resampler.flush_int16()
+            if tail:
+                loop.call_soon_threadsafe(audio_queue.put_nowait, tail)
+        except RuntimeError:
+            pass
+
     forwarder_thread = threading.Thread(
         target=_warm_stream_forwarder, daemon=True, name="WarmStreamForwarder"
     )
@@ -536,7 +623,7 @@ def _init_warm_stream(
     _log_init_complete(session_id, stream_start, "Warm-Stream armed", play_ready)
 
     return AudioSourceResult(
-        sample_rate=warm_source.sample_rate,
+        sample_rate=sample_rate,
         mic_stream=None,
         buffer_state=None,
         forwarder_thread=forwarder_thread,
@@ -645,15 +732,9 @@ def _create_message_handler(
             state.final_transcripts.append(transcript)
             logger.info(f"[{session_id}] Final: {log_preview(transcript)}")
         else:
-            # Throttling: Max alle INTERIM_THROTTLE_MS schreiben
-            now = time.perf_counter()
-            if (now - state.last_interim_write) * 1000 >= INTERIM_THROTTLE_MS:
-                try:
-                    INTERIM_FILE.write_text(transcript)
-                    state.last_interim_write = now
-                    logger.debug(f"[{session_id}] Interim: {log_preview(transcript, 30)}")
-                except OSError as e:
-                    logger.warning(f"[{session_id}] Interim-Write fehlgeschlagen: {e}")
+            # Direkt an das Overlay (Datei nur noch als Opt-in, siehe utils.interim)
+            interim_channel.publish(transcript)
+            logger.debug(f"[{session_id}] Interim: {log_preview(transcript, 30)}")
 
     return on_message
 
@@ -764,6 +845,137 @@ def _cleanup_stop_mechanism(
                 logger.debug(f"Signal-Handler Cleanup fehlgeschlagen: {e}")
 
 
+# =============================================================================
+# Audio-Sender
+# =============================================================================
+
+
+def _coalesce_limit(sample_rate: int, channels: int = WHISPER_CHANNELS) -> int:
+    """Max. Frame-Größe in Bytes (int16) für SEND_COALESCE_MAX_MS Audio."""
+    return int(sample_rate * channels * 2 * SEND_COALESCE_MAX_MS / 1000)
+
+
+class _AudioSender:
+    """Sendet Audio-Chunks aus der Queue an Deepgram bis zum None-Sentinel.
+
+    Im Normalbetrieb liegt höchstens ein Chunk in der Queue und geht sofort
+    raus. Staut sich Audio (WebSocket-Hänger, Early-Buffer, CLI-Puffer), werden
+    wartende Chunks zu Frames bis `max_frame_bytes` zusammengefasst – der
+    Rückstau ist so nach wenigen Sends abgebaut statt Block für Block.
+
+    Gewartet wird direkt auf `audio_queue.get()`. Der Leerlauf-Abbruch nach
+    dem Stop-Signal (kein Sentinel) läuft über einen einzigen Wächter-Task
+    statt über ein Timeout pro Chunk.
+    """
+
+    def __init__(
+        self,
+        connection: AsyncV1SocketClient | Any,
+        audio_queue: asyncio.Queue[bytes | None],
+        state: StreamState,
+        session_id: str,
+        *,
+        max_frame_bytes: int,
+    ):
+        self._connection = connection
+        self._queue = audio_queue
+        self._state = state
+        self._session_id = session_id
+        self._max_frame_bytes = max_frame_bytes
+        self.stats = SendStats()
+        self._last_chunk_at = time.monotonic()
+        self._backlog_since: float | None = None
+        self._waiting = False
+        self._idle_abort = False
+
+    async def run(self) -> None:
+        guard = asyncio.ensure_future(self._idle_guard(asyncio.current_task()))
+        try:
+            # Auch nach Stop-Signal weiter senden, bis das None-Sentinel kommt.
+            # So werden bereits gepufferte Chunks nicht abgeschnitten.
+            await self._send_until_sentinel()
+        except asyncio.CancelledError:
+            if self._idle_abort:
+                logger.warning(
+                    f"[{self._session_id}] Audio-Send Abbruch ohne Sentinel "
+                    f"(idle >= {FINALIZE_TIMEOUT:.1f}s)"
+                )
+        except Exception as e:
+            logger.error(f"[{self._session_id}] Audio-Send Fehler: {e}")
+            self._state.stream_error = e
+            self._state.stop_event.set()
+        finally:
+            guard.cancel()
+            self._end_backlog()
+            logger.info(f"[{self._session_id}] {self.stats.summary()}")
+
+    async def _send_until_sentinel(self) -> None:
+        while True:
+            if self._queue.empty():
+                self._end_backlog()
+                self._waiting = True
+                try:
+                    chunk = await self._queue.get()
+                finally:
+                    self._waiting = False
+            else:
+                chunk = self._queue.get_nowait()
+            if chunk is None:
+                return
+            self._last_chunk_at = time.monotonic()
+
+            frame, sentinel = self._coalesce(chunk)
+            # Timeout für send_media um Hänger zu vermeiden
+            await asyncio.wait_for(
+                self._connection.send_media(frame), timeout=SEND_MEDIA_TIMEOUT
+            )
+            self.stats.frames += 1
+            self.stats.bytes_sent += len(frame)
+            if sentinel:
+                return
+
+    def _coalesce(self, chunk: bytes) -> tuple[bytes, bool]:
+        """Hängt wartende Chunks an `chunk` an (bis `max_frame_bytes`).
+
+        Returns:
+            (Frame, Sentinel erreicht)
+        """
+        backlog = self._queue.qsize()
+        if backlog:
+            self.stats.max_backlog = max(self.stats.max_backlog, backlog)
+            if self._backlog_since is None:
+                self._backlog_since = time.perf_counter()
+
+        parts = [chunk]
+        size = len(chunk)
+        sentinel = False
+        while size < self._max_frame_bytes and not self._queue.empty():
+            queued = self._queue.get_nowait()
+            if queued is None:
+                sentinel = True
+                break
+            parts.append(queued)
+            size += len(queued)
+        self.stats.chunks += len(parts)
+        return (chunk if len(parts) == 1 else b"".join(parts)), sentinel
+
+    def _end_backlog(self) -> None:
+        if self._backlog_since is not None:
+            self.stats.catchups.append(time.perf_counter() - self._backlog_since)
+            self._backlog_since = None
+
+    async def _idle_guard(self, sender: asyncio.Task | None) -> None:
+        """Bricht das Warten ab, wenn nach dem Stop kein Audio/Sentinel mehr kommt."""
+        await self._state.stop_event.wait()
+        while True:
+            idle = time.monotonic() - self._last_chunk_at
+            if idle >= FINALIZE_TIMEOUT and self._waiting and sender is not None:
+                self._idle_abort = True
+                sender.cancel()
+                return
+            await asyncio.sleep(max(FINALIZE_TIMEOUT - idle, AUDIO_QUEUE_POLL_INTERVAL))
+
+
 # =============================================================================
 # Streaming Core
 # =============================================================================
@@ -863,6 +1075,7 @@ async def deepgram_stream_core(
     external_stop_event: threading.Event | None = None,
     audio_level_callback: Callable[[float], None] | None = None,
     warm_stream_source: WarmStreamSource | None = None,
+    standby: DeepgramStandby | None = None,
 ) -> str:
     """Gemeinsamer Streaming-Core für Deepgram (SDK v5.3).
 
@@ -874,6 +1087,8 @@ async def deepgram_stream_core(
         external_stop_event: threading.Event zum externen Stoppen (statt SIGUSR1)
         audio_level_callback: Callback für Audio-Level Updates
         warm_stream_source: Externes WarmStreamSource für instant-start (Windows)
+        standby: Standby-Manager mit vorab verbundener WebSocket; der Core muss
+            dann im Loop des Managers laufen (`standby.run(...)`)
 
     Drei Modi:
     - CLI (early_buffer=None): Buffering während WebSocket-Connect
@@ -953,14 +1168,23 @@ async def deepgram_stream_core(
             audio_level_callback=audio_level_callback,
         )
 
-    try:
-        async with _create_deepgram_connection(
+    if standby is not None:
+        from .deepgram_standby import StandbyKey
+
+        connect = standby.connection(
+            api_key, StandbyKey(model, language, audio_result.sample_rate)
+        )
+    else:
+        connect = _create_deepgram_connection(
             api_key,
             model=model,
             language=language,
             sample_rate=audio_result.sample_rate,
             channels=WHISPER_CHANNELS,
-        ) as connection:
+        )
+
+    try:
+        async with connect as connection:
             # Event-Handler registrieren
             connection.on(
                 EventType.MESSAGE, _create_message_handler(state, session_id)
@@ -989,42 +1213,13 @@ async def deepgram_stream_core(
                 logger.info(f"[{session_id}] WebSocket verbunden nach {ws_time:.0f}ms")
 
             # Async Tasks für bidirektionale Kommunikation
-            async def send_audio() -> None:
-                """Sendet Audio-Chunks an Deepgram bis Sentinel."""
-                last_chunk_at = time.monotonic()
-                try:
-                    # Auch nach Stop-Signal weiter senden, bis das None-Sentinel kommt.
-                    # So werden bereits gepufferte Chunks nicht abgeschnitten.
-                    while True:
-                        try:
-                            chunk = await asyncio.wait_for(
-                                audio_queue.get(), timeout=AUDIO_QUEUE_POLL_INTERVAL
-                            )
-                            if chunk is None:
-                                break
-                            last_chunk_at = time.monotonic()
-                            # Timeout für send_media um Hänger zu vermeiden
-                            await asyncio.wait_for(
-                                connection.send_media(chunk), timeout=SEND_MEDIA_TIMEOUT
-                            )
-                        except asyncio.TimeoutError:
-                            # Fallback: Wenn kein Sentinel kommt, nach kurzer Leerlaufzeit beenden.
-                            if (
-                                state.stop_event.is_set()
-                                and time.monotonic() - last_chunk_at >= FINALIZE_TIMEOUT
-                            ):
-                                logger.warning(
-                                    f"[{session_id}] Audio-Send Abbruch ohne Sentinel "
-                                    f"(idle >= {FINALIZE_TIMEOUT:.1f}s)"
-                                )
-                                break
-                            continue
-                except asyncio.CancelledError:
-                    pass
-                except Exception as e:
-                    logger.error(f"[{session_id}] Audio-Send Fehler: {e}")
-                    state.stream_error = e
-                    state.stop_event.set()
+            sender = _AudioSender(
+                connection,
+                audio_queue,
+                state,
+                session_id,
+                max_frame_bytes=_coalesce_limit(audio_result.sample_rate),
+            )
 
             async def listen_for_messages() -> None:
                 """Empfängt Transkripte von Deepgram."""
@@ -1035,15 +1230,15 @@ async def deepgram_stream_core(
                 except Exception as e:
                     logger.debug(f"[{session_id}] Listener beendet: {e}")
 
-            send_task = asyncio.create_task(send_audio())
+            send_task = asyncio.create_task(sender.run())
             listen_task = asyncio.create_task(listen_for_messages())
 
             # Warten auf Stop
             await state.stop_event.wait()
             logger.info(f"[{session_id}] Stop-Signal empfangen")
 
-            # Interim-Datei sofort löschen
-            INTERIM_FILE.unlink(missing_ok=True)
+            # Interim-Text sofort zurücksetzen
+            interim_channel.clear()
 
             # === AUDIO-SOURCE BEENDEN (vor Graceful Shutdown) ===
             # Wichtig: Audio-Quellen müssen BEVOR das None-Sentinel gesendet wird
@@ -1146,7 +1341,7 @@ class DeepgramStreamProvider:
 
     def transcribe(
         self,
-        audio_path: Path | str,
+        audio_path: "Path | str | InMemoryAudio",
         model: str | None = None,
         language: str | None = None,
     ) -> str:
@@ -1155,7 +1350,7 @@ class DeepgramStreamProvider:
         Für Datei-Transkription nutze den regulären DeepgramProvider.
 
         Args:
-            audio_path: Pfad zur Audio-Datei (Path oder str)
+            audio_path: Pfad zur Audio-Datei (Path oder str) oder InMemoryAudio
             model: Deepgram-Modell (optional)
             language: Sprachcode (optional)
 
@@ -1164,10 +1359,36 @@ class DeepgramStreamProvider:
         """
         from pathlib import Path as PathLib
 
+        from audio.memory import InMemoryAudio
+
         from .deepgram import DeepgramProvider
 
-        path = audio_path if isinstance(audio_path, PathLib) else PathLib(audio_path)
-        return DeepgramProvider().transcribe(path, model, language)
+        source = (
+            audio_path
+            if isinstance(audio_path, (PathLib, InMemoryAudio))
+            else PathLib(audio_path)
+        )
+        return DeepgramProvider().transcribe(source, model, language)
+
+    async def transcribe_async(
+        self,
+        audio_path: "Path | str | InMemoryAudio",
+        model: str | None = None,
+        language: str | None = None,
+    ) -> str:
+        """Async-Variante von `transcribe()` (REST, nicht Streaming)."""
+        from pathlib import Path as PathLib
+
+        from audio.memory import InMemoryAudio
+
+        from .deepgram import DeepgramProvider
+
+        source = (
+            audio_path
+            if isinstance(audio_path, (PathLib, InMemoryAudio))
+            else PathLib(audio_path)
+        )
+        return await DeepgramProvider().transcribe_async(source, model, language)
 
     def transcribe_stream(
         self,
@@ -3,17 +3,34 @@
 Nutzt Groq's LPU-Chips für extrem schnelle Whisper-Inferenz (~300x Echtzeit).
 """
 
+import asyncio
 import logging
 import os
-from pathlib import Path
+
+from audio.memory import (
+    AudioSource,
+    audio_codec,
+    audio_size,
+    prepare_upload,
+    upload_file,
+)
+from utils.http_client import (
+    on_http_swap,
+    sdk_async_http_client,
+    sdk_http_client,
+    sdk_timeout,
+)
+from utils.prewarm import warm_client
 from utils.timing import timed_operation
 
-from config import DEFAULT_GROQ_MODEL
+from config import DEFAULT_GROQ_MODEL, GROQ_TIMEOUT
 
 logger = logging.getLogger("pulsescribe.providers.groq")
 
 # Singleton Client
 _client = None
+# Async-Client mit dem HTTP-Client, auf dem er gebaut wurde (Loop-gebunden)
+_async_client: tuple | None = None
 
 
 def _get_client():
@@ -25,11 +42,47 @@ def _get_client():
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY nicht gesetzt")
-        _client = Groq(api_key=api_key)
+        _client = Groq(
+            api_key=api_key,
+            http_client=sdk_http_client("groq"),
+            timeout=sdk_timeout("groq", GROQ_TIMEOUT),
+        )
         logger.debug("Groq-Client initialisiert")
     return _client
 
 
+def _get_async_client():
+    """Gibt AsyncGroq-Client für den laufenden Event-Loop zurück (Lazy Init)."""
+    global _async_client
+    http_client = sdk_async_http_client("groq")
+    if _async_client is None or _async_client[0] is not http_client:
+        from groq import AsyncGroq
+
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY nicht gesetzt")
+        _async_client = (
+            http_client,
+            AsyncGroq(
+                api_key=api_key,
+                http_client=http_client,
+                timeout=sdk_timeout("groq", GROQ_TIMEOUT),
+            ),
+        )
+        logger.debug("AsyncGroq-Client initialisiert")
+    return _async_client[1]
+
+
+def _reset_client() -> None:
+    """Verwirft die Clients (neue Keys/Transport nach Settings-Reload)."""
+    global _client, _async_client
+    _client = None
+    _async_client = None
+
+
+on_http_swap(_reset_client)
+
+
 class GroqProvider:
     """Groq Whisper Provider.
 
@@ -60,42 +113,88 @@ class GroqProvider:
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: AudioSource,
         model: str | None = None,
         language: str | None = None,
+        prompt: str | None = None,
     ) -> str:
         """Transkribiert Audio über Groq API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder InMemoryAudio
             model: Modell (default: whisper-large-v3)
             language: Sprachcode oder None für Auto-Detection
+            prompt: Optionaler Kontext (Vokabular, vorheriger Text)
 
         Returns:
             Transkribierter Text
         """
-        self._validate()
+        upload, params = self._prepare(audio_path, model, language, prompt)
+        client = _get_client()
 
-        model = model or self.default_model
-        audio_kb = audio_path.stat().st_size // 1024
+        with timed_operation("Groq-Transkription", logger=logger, include_session=False):
+            # File-Handle statt .read() – spart Speicher bei großen Dateien
+            with upload_file(upload) as audio_file:
+                response = client.audio.transcriptions.create(file=audio_file, **params)
 
-        logger.info(f"Groq: {model}, {audio_kb}KB, lang={language or 'auto'}")
+        return self._result(response)
 
-        client = _get_client()
+    async def transcribe_async(
+        self,
+        audio_path: AudioSource,
+        model: str | None = None,
+        language: str | None = None,
+        prompt: str | None = None,
+    ) -> str:
+        """Wie `transcribe()`, aber über den AsyncGroq-Client.
+
+        Das Kodieren des Uploads läuft in einem Worker-Thread.
+        """
+        upload, params = await asyncio.to_thread(
+            self._prepare, audio_path, model, language, prompt
+        )
+        client = _get_async_client()
 
         with timed_operation("Groq-Transkription", logger=logger, include_session=False):
-            with audio_path.open("rb") as audio_file:
-                params = {
-                    # File-Handle statt .read() – spart Speicher bei großen Dateien
-                    "file": (audio_path.name, audio_file),
-                    "model": model,
-                    "response_format": "text",
-                    "temperature": 0.0,  # Konsistente Ergebnisse ohne Kreativität
-                }
-                if language:
-                    params["language"] = language
-                response = client.audio.transcriptions.create(**params)
+            with upload_file(upload) as audio_file:
+                response = await client.audio.transcriptions.create(
+                    file=audio_file, **params
+                )
+
+        return self._result(response)
+
+    def _prepare(
+        self,
+        audio_path: AudioSource,
+        model: str | None,
+        language: str | None,
+        prompt: str | None,
+    ) -> tuple[AudioSource, dict]:
+        """Validiert, kodiert den Upload und baut die Request-Parameter."""
+        self._validate()
 
+        model = model or self.default_model
+        upload = prepare_upload(audio_path, self.name)
+        audio_kb = audio_size(upload) // 1024
+
+        logger.info(
+            f"Groq: {model}, {audio_kb}KB {audio_codec(upload)}, "
+            f"lang={language or 'auto'}"
+        )
+
+        params = {
+            "model": model,
+            "response_format": "text",
+            "temperature": 0.0,  # Konsistente Ergebnisse ohne Kreativität
+        }
+        if language:
+            params["language"] = language
+        if prompt:
+            params["prompt"] = prompt
+        return upload, params
+
+    @staticmethod
+    def _result(response) -> str:
         # Groq gibt bei response_format="text" String zurück
         if isinstance(response, str):
             result = response
@@ -108,6 +207,15 @@ class GroqProvider:
 
         return result
 
+    def prewarm(self) -> float | None:
+        """Öffnet die TLS-Verbindung vorab (beim Hotkey-Down).
+
+        Returns:
+            Dauer des Warm-Requests in Sekunden oder None
+        """
+        self._validate()
+        return warm_client(_get_client(), "Groq")
+
     def supports_streaming(self) -> bool:
         """Groq API unterstützt kein Streaming."""
         return False
@@ -0,0 +1,387 @@
+"""Provider-Health-Registry mit Latenz-Perzentilen und Circuit Breaker.
+
+Pro Modus (`groq`, `openai`, `deepgram`, ...) merkt sich die Registry:
+
+- Latenzen erfolgreicher Aufrufe (`LatencyHistogram`, nach Audiolänge gruppiert)
+- Erfolg/Fehlschlag der letzten `HEALTH_WINDOW` Aufrufe (Fehlerrate)
+- einen Circuit-State `closed` → `open` → `half_open` → `closed`
+
+Als Fehlschlag zählt auch eine Antwort, die länger als
+`CIRCUIT_SLOW_SECONDS + CIRCUIT_SLOW_RTF * Audiolänge` gebraucht hat. Nach
+`CIRCUIT_FAILURE_THRESHOLD` Fehlschlägen in Folge (oder einer Fehlerrate ab
+`CIRCUIT_ERROR_RATE`) öffnet der Circuit: der Provider wird übersprungen und die
+Daemons gehen direkt in den Fallback. Nach dem Cooldown lässt `allow()` genau
+einen Probe-Request durch; scheitert er, verdoppelt sich der Cooldown.
+
+Der Zustand liegt in `~/.pulsescribe/provider_health.json`, damit ein bekannt
+kaputter Provider nach einem Daemon-Neustart nicht gleich beim ersten Diktat
+wieder angefragt wird. Circuit-Wechsel werden sofort geschrieben; Latenzen und
+Outcomes gesammelt nach `HEALTH_SAVE_DELAY` bzw. beim Beenden (`flush()`), damit
+kein Provider-Aufruf auf einen Datei-Write wartet.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from config import (
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_ERROR_RATE,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_COOLDOWN,
+    CIRCUIT_SLOW_RTF,
+    CIRCUIT_SLOW_SECONDS,
+    HEALTH_MIN_CALLS,
+    HEALTH_SAVE_DELAY,
+    HEALTH_WINDOW,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_WINDOW,
+    PROVIDER_HEALTH_FILE,
+)
+from utils.env import get_env_bool_default
+
+logger = logging.getLogger("pulsescribe.providers.health")
+
+T = TypeVar("T")
+
+HEALTH_VERSION = 1
+
+# Obergrenzen der Längenklassen (Sekunden Audio)
+DURATION_BUCKETS = (5.0, 15.0, 45.0)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Provider wird übersprungen, weil sein Circuit offen ist."""
+
+    def __init__(self, mode: str):
+        super().__init__(f"Circuit für {mode} offen")
+        self.mode = mode
+
+
+class LatencyHistogram:
+    """Rollierende Latenzen eines Providers, nach Audiolänge gruppiert.
+
+    Args:
+        window: Gemerkte Latenzen pro Längenklasse
+        min_samples: Mindestanzahl für ein Perzentil
+    """
+
+    def __init__(self, window: int = HEDGE_WINDOW, min_samples: int = HEDGE_MIN_SAMPLES):
+        self._min_samples = min_samples
+        self._buckets = [deque(maxlen=window) for _ in range(len(DURATION_BUCKETS) + 1)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(b) for b in self._buckets)
+
+    def record(self, latency_s: float, audio_s: float = 0.0) -> None:
+        with self._lock:
+            self._buckets[bisect_left(DURATION_BUCKETS, audio_s)].append(latency_s)
+
+    def percentile(self, q: float, audio_s: float = 0.0) -> float | None:
+        """q-Perzentil (0–100) der passenden Längenklasse.
+
+        Hat die Klasse zu wenig Werte, zählen alle Klassen; sonst None.
+        """
+        with self._lock:
+            values = list(self._buckets[bisect_left(DURATION_BUCKETS, audio_s)])
+            if len(values) < self._min_samples:
+                values = [v for bucket in self._buckets for v in bucket]
+        if len(values) < self._min_samples:
+            return None
+        values.sort()
+        index = min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))
+        return values[index]
+
+    def to_list(self) -> list[list[float]]:
+        with self._lock:
+            return [[round(v, 4) for v in bucket] for bucket in self._buckets]
+
+    def load(self, buckets: list) -> None:
+        with self._lock:
+            for target, values in zip(self._buckets, buckets):
+                target.extend(float(v) for v in values)
+
+
+class ProviderHealth:
+    """Health-Zustand eines Providers (nicht thread-safe, Registry sperrt)."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.latencies = LatencyHistogram()
+        self.outcomes: deque[bool] = deque(maxlen=HEALTH_WINDOW)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.open_until = 0.0  # Wall-Clock (überlebt Neustarts)
+        self.cooldown = CIRCUIT_COOLDOWN
+        # Start des laufenden Probe-Requests (0 = keiner); verwaiste Probes
+        # (Aufrufer hat nie gemeldet) geben nach einem Cooldown wieder frei
+        self.probe_started = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def allow(self, now: float) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and now >= self.open_until:
+            self.state = HALF_OPEN
+            self.probe_started = 0.0
+        if self.state == HALF_OPEN and now - self.probe_started >= CIRCUIT_COOLDOWN:
+            self.probe_started = now
+            logger.info(f"Circuit {self.mode}: half-open, Probe-Request")
+            return True
+        return False
+
+    def record(self, ok: bool, now: float) -> None:
+        self.outcomes.append(ok)
+        if ok:
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                logger.info(f"Circuit {self.mode}: closed (Probe erfolgreich)")
+                self.state = CLOSED
+                self.cooldown = CIRCUIT_COOLDOWN
+                self.outcomes.clear()
+            self.probe_started = 0.0
+            return
+
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, CIRCUIT_MAX_COOLDOWN)
+            self._open(now)
+        elif self.state == CLOSED and (
+            self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD
+            or (
+                len(self.outcomes) >= HEALTH_MIN_CALLS
+                and self.error_rate >= CIRCUIT_ERROR_RATE
+            )
+        ):
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.open_until = now + self.cooldown
+        self.probe_started = 0.0
+        logger.warning(
+            f"Circuit {self.mode}: open für {self.cooldown:.0f}s "
+            f"({self.consecutive_failures} Fehlschläge in Folge, "
+            f"Fehlerrate {self.error_rate:.0%})"
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "state": OPEN if self.state == HALF_OPEN else self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "open_until": self.open_until,
+            "cooldown": self.cooldown,
+            "outcomes": [int(ok) for ok in self.outcomes],
+            "latencies": self.latencies.to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, mode: str, data: dict) -> "ProviderHealth":
+        health = cls(mode)
+        state = data.get("state")
+        health.state = state if state in (CLOSED, OPEN) else CLOSED
+        health.consecutive_failures = int(data.get("consecutive_failures", 0))
+        health.open_until = float(data.get("open_until", 0.0))
+        health.cooldown = float(data.get("cooldown", CIRCUIT_COOLDOWN))
+        health.outcomes.extend(bool(ok) for ok in data.get("outcomes", []))
+        health.latencies.load(data.get("latencies", []))
+        return health
+
+
+def is_slow(latency_s: float, audio_s: float) -> bool:
+    """Zählt eine erfolgreiche, aber zu langsame Antwort als Fehlschlag."""
+    return latency_s > CIRCUIT_SLOW_SECONDS + CIRCUIT_SLOW_RTF * audio_s
+
+
+class HealthRegistry:
+    """Health-Zustand aller Provider, persistiert als JSON.
+
+    Args:
+        path: JSON-Datei (Default: `PROVIDER_HEALTH_FILE`)
+        clock: Wall-Clock (Tests)
+        save_delay: Sekunden, die Änderungen ohne Circuit-Wechsel gesammelt werden
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+        save_delay: float = HEALTH_SAVE_DELAY,
+    ):
+        self.path = path or PROVIDER_HEALTH_FILE
+        self._clock = clock
+        self._save_delay = save_delay
+        self._lock = threading.Lock()
+        self._providers: dict[str, ProviderHealth] = {}
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+        self._load()
+
+    def get(self, mode: str) -> ProviderHealth:
+        with self._lock:
+            return self._get(mode)
+
+    def _get(self, mode: str) -> ProviderHealth:
+        health = self._providers.get(mode)
+        if health is None:
+            health = self._providers[mode] = ProviderHealth(mode)
+        return health
+
+    def allow(self, mode: str) -> bool:
+        """False, solange der Circuit von `mode` offen ist.
+
+        Im half-open-State ist der erste Aufruf nach dem Cooldown der Probe.
+        """
+        if not get_env_bool_default("PULSESCRIBE_CIRCUIT_BREAKER", True):
+            return True
+        with self._lock:
+            return self._get(mode).allow(self._clock())
+
+    def record_success(self, mode: str, latency_s: float, audio_s: float = 0.0) -> None:
+        with self._lock:
+            health = self._get(mode)
+            state = health.state
+            health.latencies.record(latency_s, audio_s)
+            slow = is_slow(latency_s, audio_s)
+            if slow:
+                logger.info(
+                    f"Provider {mode}: langsame Antwort ({latency_s:.2f}s "
+                    f"für {audio_s:.1f}s Audio)"
+                )
+            health.record(not slow, self._clock())
+            changed = health.state != state
+        self._persist(changed)
+
+    def record_failure(self, mode: str, error: BaseException | None = None) -> None:
+        with self._lock:
+            health = self._get(mode)
+            state = health.state
+            health.record(False, self._clock())
+            changed = health.state != state
+        logger.debug(f"Provider {mode}: Fehlschlag registriert ({error})")
+        self._persist(changed)
+
+    def check(self, mode: str) -> None:
+        """Wirft `CircuitOpenError`, wenn `mode` übersprungen werden soll."""
+        if not self.allow(mode):
+            raise CircuitOpenError(mode)
+
+    def call(self, mode: str, fn: Callable[[], T], *, audio_s: float = 0.0) -> T:
+        """Führt `fn` aus und schreibt Latenz bzw. Fehlschlag für `mode` mit."""
+        t0 = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            self.record_failure(mode, e)
+            raise
+        self.record_success(mode, time.perf_counter() - t0, audio_s)
+        return result
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Provider-Health nicht lesbar: {e}")
+            return
+        if data.get("version") != HEALTH_VERSION:
+            return
+        for mode, entry in data.get("providers", {}).items():
+            try:
+                self._providers[mode] = ProviderHealth.from_dict(mode, entry)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Provider-Health für {mode} verworfen: {e}")
+
+    def _persist(self, state_changed: bool) -> None:
+        """Circuit-Wechsel sofort schreiben, sonst gesammelt per Timer."""
+        if state_changed:
+            self.save()
+            return
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self._save_delay, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Schreibt ausstehende Änderungen (Timer, Beenden)."""
+        with self._lock:
+            dirty = self._dirty
+        if dirty:
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            self._dirty = False
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            data = {
+                "version": HEALTH_VERSION,
+                "providers": {m: h.to_dict() for m, h in self._providers.items()},
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Provider-Health nicht beschreibbar: {e}")
+
+
+_registry: HealthRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> HealthRegistry:
+    """Prozessweite Registry (lazy, lädt den gespeicherten Zustand)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HealthRegistry()
+            atexit.register(_registry.flush)
+        return _registry
+
+
+def flush_registry() -> None:
+    """Schreibt ausstehende Health-Daten (Daemon-Shutdown; legt keine Registry an)."""
+    with _registry_lock:
+        registry = _registry
+    if registry is not None:
+        registry.flush()
+
+
+__all__ = [
+    "CLOSED",
+    "CircuitOpenError",
+    "DURATION_BUCKETS",
+    "HALF_OPEN",
+    "HealthRegistry",
+    "LatencyHistogram",
+    "OPEN",
+    "ProviderHealth",
+    "flush_registry",
+    "get_registry",
+    "is_slow",
+]
@@ -0,0 +1,147 @@
+"""Hedged Requests über Transkriptions-Provider.
+
+Bisher springt der lokale Fallback erst an, wenn der Cloud-Provider eine
+Exception wirft – im schlimmsten Fall nach dem vollen SDK-Timeout. Mit Hedging
+startet dieselbe Aufnahme zusätzlich beim Sekundär-Provider, sobald der primäre
+länger braucht als seine übliche p95-Latenz. Das erste erfolgreiche Ergebnis
+gewinnt, der Verlierer wird verworfen.
+
+Die Hedge-Verzögerung kommt aus den Latenz-Histogrammen der Provider-Health-
+Registry, in die jeder Aufruf einfließt (auch ohne aktives Hedging und auch der
+Verlierer eines Hedges). Latenzen werden nach Audiolänge gruppiert, damit eine
+lange Aufnahme nicht am Maßstab kurzer Diktate gemessen wird.
+
+Laufende SDK-Aufrufe lassen sich nicht abbrechen: der Verlierer läuft in seinem
+Daemon-Thread zu Ende, sein Ergebnis wird ignoriert.
+"""
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Callable
+
+from config import HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY, HEDGE_PERCENTILE
+
+from .health import LatencyHistogram, get_registry
+
+logger = logging.getLogger("pulsescribe.providers.hedging")
+
+@dataclass
+class HedgeStats:
+    """Zähler für Hedge-Rate und Win-Rate (prozessweit)."""
+
+    requests: int = 0
+    hedged: int = 0
+    secondary_wins: int = 0
+
+    def summary(self) -> str:
+        hedge_rate = self.hedged / self.requests if self.requests else 0.0
+        win_rate = self.secondary_wins / self.hedged if self.hedged else 0.0
+        return (
+            f"Hedge-Rate {self.hedged}/{self.requests} ({hedge_rate:.0%}), "
+            f"Sekundär gewinnt {self.secondary_wins}/{self.hedged} ({win_rate:.0%})"
+        )
+
+
+stats = HedgeStats()
+
+
+def get_histogram(provider: str) -> LatencyHistogram:
+    """Latenz-Histogramm für `provider` aus der Health-Registry."""
+    return get_registry().get(provider).latencies
+
+
+def hedge_delay(provider: str, audio_s: float = 0.0) -> float:
+    """Wartezeit bis zum Hedge: p95-Latenz von `provider`, sonst Default."""
+    p95 = get_histogram(provider).percentile(HEDGE_PERCENTILE, audio_s)
+    if p95 is None:
+        return HEDGE_DEFAULT_DELAY
+    return max(HEDGE_MIN_DELAY, p95)
+
+
+def _spawn(provider: str, fn: Callable[[], str], audio_s: float) -> Future:
+    """Führt `fn` in einem Daemon-Thread aus und schreibt Latenz/Fehler mit."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _run() -> None:
+        try:
+            result = get_registry().call(provider, fn, audio_s=audio_s)
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        future.set_result(result)
+
+    threading.Thread(target=_run, daemon=True, name=f"Hedge-{provider}").start()
+    return future
+
+
+def hedged_transcribe(
+    primary: tuple[str, Callable[[], str]],
+    secondary: tuple[str, Callable[[], str]] | None = None,
+    *,
+    audio_s: float = 0.0,
+    delay: float | None = None,
+) -> tuple[str, str]:
+    """Transkribiert über `primary`, bei Verzögerung zusätzlich über `secondary`.
+
+    Args:
+        primary: (Provider-Name, Aufruf)
+        secondary: (Provider-Name, Aufruf) oder None für kein Hedging – die
+            Latenz wird trotzdem in der Health-Registry mitgeschrieben
+        audio_s: Audiolänge (Längenklasse im Histogramm)
+        delay: Feste Hedge-Verzögerung statt p95 (Tests)
+
+    Returns:
+        (Transkript, Name des gewinnenden Providers)
+
+    Raises:
+        Exception: Fehler des primären Providers, wenn beide scheitern
+    """
+    primary_name, primary_fn = primary
+    if secondary is None:
+        return get_registry().call(primary_name, primary_fn, audio_s=audio_s), primary_name
+
+    secondary_name, secondary_fn = secondary
+    if delay is None:
+        delay = hedge_delay(primary_name, audio_s)
+
+    stats.requests += 1
+    primary_future = _spawn(primary_name, primary_fn, audio_s)
+    done, _ = wait([primary_future], timeout=delay)
+    if done and primary_future.exception() is None:
+        logger.debug(f"Hedge: {primary_name} innerhalb {delay:.2f}s | {stats.summary()}")
+        return primary_future.result(), primary_name
+
+    stats.hedged += 1
+    reason = "Fehler" if done else f"keine Antwort nach {delay:.2f}s"
+    logger.info(f"Hedge: {primary_name} {reason} → starte {secondary_name}")
+    names = {primary_future: primary_name}
+    secondary_future = _spawn(secondary_name, secondary_fn, audio_s)
+    names[secondary_future] = secondary_name
+
+    pending = {secondary_future} if done else {primary_future, secondary_future}
+    while pending:
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            if future.exception() is not None:
+                logger.warning(f"Hedge: {names[future]} fehlgeschlagen: {future.exception()}")
+                continue
+            winner = names[future]
+            if winner == secondary_name:
+                stats.secondary_wins += 1
+            logger.info(f"Hedge: {winner} gewinnt | {stats.summary()}")
+            return future.result(), winner
+
+    logger.info(f"Hedge: beide Provider fehlgeschlagen | {stats.summary()}")
+    raise primary_future.exception()  # type: ignore[misc]
+
+
+__all__ = [
+    "HedgeStats",
+    "get_histogram",
+    "hedge_delay",
+    "hedged_transcribe",
+    "stats",
+]
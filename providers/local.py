@@ -7,6 +7,7 @@ Standardmäßig nutzt er openai-whisper (PyTorch). Optional kann über
 `PULSESCRIBE_LOCAL_BACKEND=lightning` (lightning-whisper-mlx, ~4x schneller) genutzt werden.
 """
 
+import asyncio
 import logging
 import os
 import platform
@@ -16,19 +17,28 @@ import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Generator
+from typing import TYPE_CHECKING, Any, Callable, Generator
 
 from config import (
     DEFAULT_LOCAL_MODEL,
+    LOCAL_WARMUP_BUCKETS,
     PRELOAD_WARMUP_DURATION,
     USER_CONFIG_DIR,
+    VAD_THRESHOLD,
     WHISPER_SAMPLE_RATE,
 )
-from utils.env import get_env_bool, get_env_int
+from utils.env import get_env_bool, get_env_bool_default, get_env_int
 from utils.logging import log
 from utils.timing import timed_operation
 from utils.vocabulary import load_vocabulary
 
+from .local_cache import ModelCache
+
+if TYPE_CHECKING:
+    from audio.memory import AudioSource
+
+    from .local_stream import LocalStreamingSession
+
 logger = logging.getLogger("pulsescribe.providers.local")
 
 # Command for missing cuDNN libraries
@@ -41,6 +51,167 @@ CPU_COMPUTE_TYPE = "int8"
 # 120s allows for first-time model downloads (~1.5GB for medium)
 CUDA_MODEL_LOAD_TIMEOUT = 120
 
+# Max. Chunk-Länge für Batched Long-Form (Whisper-Kontextfenster)
+BATCH_CHUNK_S = 30.0
+
+# Tier-Routing: Clips bis zu dieser Länge gehen an PULSESCRIBE_LOCAL_SHORT_MODEL
+DEFAULT_SHORT_MAX_SECONDS = 4.0
+
+# Obergrenze für PULSESCRIBE_LOCAL_REPLICAS (jedes Replikat hält ein eigenes Modell)
+MAX_REPLICAS = 16
+# Ab dieser Wartezeit auf ein freies Replikat wird auf INFO geloggt
+REPLICA_WAIT_LOG_THRESHOLD = 0.05
+
+# Bucket-Warmup: leises Rauschen statt Stille, damit Encoder/Decoder wirklich laufen
+# (liegt deutlich unter VAD_THRESHOLD)
+WARMUP_NOISE_LEVEL = 0.003
+
+
+class _DecodeCancelled(Exception):
+    """Hintergrund-Decode abgebrochen (Replikat für echte Anfragen freigegeben)."""
+
+
+class _ReplicaPool:
+    """Scheduler für N Modell-Replikate.
+
+    Jede Anfrage bekommt ein freies Replikat; sind alle belegt, wird gewartet.
+    Freie Replikate werden als Stack verwaltet, damit bei geringer Last immer
+    dasselbe (warme) Replikat genutzt wird und weitere erst bei echter
+    Parallelität geladen werden.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._cond = threading.Condition()
+        self._idle = list(range(size - 1, -1, -1))
+        self._waiting = 0
+        self._requests = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._wait_last = 0.0
+
+    @contextmanager
+    def acquire(self) -> Generator[int, None, None]:
+        t0 = time.perf_counter()
+        with self._cond:
+            self._waiting += 1
+            try:
+                while not self._idle:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            index = self._idle.pop()
+            wait = time.perf_counter() - t0
+            self._requests += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._wait_last = wait
+            queue_depth = self._waiting
+        if wait >= REPLICA_WAIT_LOG_THRESHOLD:
+            logger.info(
+                f"Replikat {index} nach {wait * 1000:.0f}ms Wartezeit "
+                f"(queue={queue_depth})"
+            )
+        try:
+            yield index
+        finally:
+            with self._cond:
+                self._idle.append(index)
+                self._cond.notify()
+
+    @contextmanager
+    def acquire_spare(self) -> Generator[int | None, None, None]:
+        """Reserviert ein Replikat für Hintergrundarbeit, ohne zu warten.
+
+        Liefert None, solange Anfragen warten oder kein Replikat übrig bliebe –
+        bei mehreren Replikaten muss danach noch eines frei sein. Zählt nicht in
+        die Wartezeit-Statistik.
+        """
+        reserve = 1 if self.size > 1 else 0
+        with self._cond:
+            if self._waiting or len(self._idle) <= reserve:
+                index = None
+            else:
+                index = self._idle.pop()
+        if index is None:
+            yield None
+            return
+        try:
+            yield index
+        finally:
+            with self._cond:
+                self._idle.append(index)
+                self._cond.notify()
+
+    def stats(self) -> dict[str, float | int]:
+        """Queue-Tiefe, Auslastung und Wartezeiten (Sekunden)."""
+        with self._cond:
+            return {
+                "replicas": self.size,
+                "busy": self.size - len(self._idle),
+                "queue_depth": self._waiting,
+                "requests": self._requests,
+                "wait_avg": (
+                    self._wait_total / self._requests if self._requests else 0.0
+                ),
+                "wait_max": self._wait_max,
+                "wait_last": self._wait_last,
+            }
+
+
+def _frame_rms(audio, frame: int):
+    """RMS pro nicht-überlappendem Frame (letzter Teil-Frame wird ignoriert)."""
+    import numpy as np
+
+    n_frames = audio.shape[0] // frame
+    if n_frames <= 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[: n_frames * frame].reshape(n_frames, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def _split_at_silence(
+    audio,
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+    max_chunk_s: float = BATCH_CHUNK_S,
+    threshold: float | None = None,
+) -> list[dict[str, int]]:
+    """Schneidet Audio an Pausen in Chunks von max. `max_chunk_s` Sekunden.
+
+    Geschnitten wird jeweils an der leisesten Stelle der zweiten Chunk-Hälfte
+    (gleiche RMS-Frames wie beim Silence-Trimming). Chunks ohne Sprache werden
+    verworfen, die Reihenfolge bleibt erhalten.
+
+    Returns:
+        Liste von {"start": sample, "end": sample} (faster-whisper clip_timestamps).
+    """
+    total = int(audio.shape[0])
+    frame = max(1, int(sample_rate * 0.02))
+    rms = _frame_rms(audio, frame)
+    if rms.size == 0:
+        return [{"start": 0, "end": total}] if total else []
+
+    if threshold is None:
+        # Relativ zum Peak, damit leise Aufnahmen nicht komplett verworfen werden
+        threshold = min(VAD_THRESHOLD * 0.5, float(rms.max()) * 0.1)
+
+    max_frames = max(2, int(max_chunk_s * sample_rate) // frame)
+    n = int(rms.size)
+    clips: list[dict[str, int]] = []
+    start = 0
+    while start < n:
+        if n - start <= max_frames:
+            end = n
+        else:
+            half = start + max_frames // 2
+            end = half + int(rms[half : start + max_frames].argmin())
+        if float(rms[start:end].max()) > threshold:
+            clips.append(
+                {"start": start * frame, "end": total if end >= n else end * frame}
+            )
+        start = end
+    return clips
+
 
 def _get_warmup_language() -> str:
     """Gibt die Warmup-Sprache zurueck (fuer Metal-Compilation bei MLX/Lightning).
@@ -51,6 +222,21 @@ def _get_warmup_language() -> str:
     return "en" if lang.strip().lower() == "auto" else lang
 
 
+def _lower_thread_priority() -> None:
+    """Senkt die Priorität des aktuellen Threads (best effort, nur Linux).
+
+    Unter Linux sind Threads eigene Tasks und haben eine eigene Nice-Stufe;
+    macOS/Windows bieten das über `os` nicht an – dort bleibt es beim
+    Abbruch per `cancel_warmup()`.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+    except (AttributeError, OSError):
+        pass
+
+
 def _register_nvidia_dll_directories() -> None:
     """Register NVIDIA DLL directories for Windows.
 
@@ -251,14 +437,22 @@ class LocalProvider:
     default_model = DEFAULT_LOCAL_MODEL
 
     def __init__(self) -> None:
-        self._model_cache: dict = {}
+        self._model_cache = ModelCache()
+        self._cache_limits: tuple[int, int, int] | None = None
+        self._profile: dict | None = None
         self._device: str | None = None
         self._fp16_override: bool | None = None
         self._fast_mode: bool | None = None
         self._backend: str | None = None
         self._compute_type: str | None = None
         self._load_lock = threading.Lock()
-        self._transcribe_lock = threading.Lock()
+        self._pool: _ReplicaPool | None = None
+        # (Backend, angefragte Replikate) der letzten Ignoriert-Warnung
+        self._replica_warning: tuple[str, int] | None = None
+        self._replica_state = threading.local()
+        self._warmup_thread: threading.Thread | None = None
+        self._warmup_cancel = threading.Event()
+        self._warmup_stats: dict[float, dict[str, float]] = {}
 
     def invalidate_runtime_config(self) -> None:
         """Invalidiert ENV-basierte Runtime-Konfiguration ohne Model-Cache zu löschen.
@@ -273,6 +467,33 @@ class LocalProvider:
         self._fp16_override = None
         self._fast_mode = None
         self._compute_type = None
+        self._cache_limits = None
+        self._profile = None
+
+    def _load_machine_profile(self) -> dict:
+        """Lädt das Kalibrierungsprofil (leer wenn deaktiviert/ungültig).
+
+        Das Profil gilt nur für das Backend, mit dem kalibriert wurde;
+        `PULSESCRIBE_LOCAL_PROFILE=false` deaktiviert es.
+        """
+        if not get_env_bool_default("PULSESCRIBE_LOCAL_PROFILE", True):
+            return {}
+        from .local_profile import load_profile
+
+        profile = load_profile() or {}
+        if profile and profile.get("backend") != self._backend:
+            logger.debug(
+                f"Lokales Profil für Backend '{profile.get('backend')}' "
+                f"passt nicht zu '{self._backend}' – ignoriert"
+            )
+            return {}
+        if profile:
+            log(
+                f"Lokales Profil aktiv: compute={profile.get('compute_type')}, "
+                f"threads={profile.get('cpu_threads')}, fast={profile.get('fast')} "
+                f"(RTF {profile.get('rtf')})"
+            )
+        return profile
 
     def _ensure_runtime_config(self) -> None:
         if self._backend is None:
@@ -313,24 +534,125 @@ class LocalProvider:
         if self._fp16_override is None:
             self._fp16_override = get_env_bool("PULSESCRIBE_FP16")
 
+        if self._profile is None:
+            # Kalibriertes Maschinenprofil als Default; ENV hat immer Vorrang
+            self._profile = self._load_machine_profile()
+
         if self._fast_mode is None:
             fast_env = get_env_bool("PULSESCRIBE_LOCAL_FAST")
-            if fast_env is None:
+            if fast_env is not None:
+                self._fast_mode = fast_env
+            elif "fast" in self._profile:
+                self._fast_mode = bool(self._profile["fast"])
+            else:
                 # Default to fast decoding on faster-whisper unless user opts out.
                 self._fast_mode = self._backend == "faster"
-            else:
-                self._fast_mode = fast_env
 
         if self._compute_type is None:
             compute_env = os.getenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE")
             if compute_env:
                 self._compute_type = compute_env.strip()
+            elif self._profile.get("compute_type"):
+                self._compute_type = str(self._profile["compute_type"])
+
+        if self._cache_limits is None:
+            # 0 = unbegrenzt bzw. nie entladen (bisheriges Verhalten)
+            self._cache_limits = (
+                max(0, get_env_int("PULSESCRIBE_LOCAL_RAM_BUDGET_MB") or 0),
+                max(0, get_env_int("PULSESCRIBE_LOCAL_VRAM_BUDGET_MB") or 0),
+                max(0, get_env_int("PULSESCRIBE_LOCAL_IDLE_UNLOAD_MIN") or 0),
+            )
+            ram_mb, vram_mb, idle_min = self._cache_limits
+            self._model_cache.configure(
+                ram_budget_mb=ram_mb,
+                vram_budget_mb=vram_mb,
+                idle_unload_s=idle_min * 60.0,
+            )
+
+        replicas = self._resolve_replica_count()
+        if self._pool is None or self._pool.size != replicas:
+            # Laufende Anfragen geben ihr Replikat an den alten Pool zurück
+            if self._pool is not None:
+                log(f"Lokale Modell-Replikate: {self._pool.size} → {replicas}")
+            self._pool = _ReplicaPool(replicas)
+
+    def _resolve_replica_count(self) -> int:
+        """Anzahl Modell-Replikate aus PULSESCRIBE_LOCAL_REPLICAS (Default: 1).
+
+        mlx/lightning teilen sich eine Metal-GPU (lightning wechselt zudem das
+        Arbeitsverzeichnis) → dort immer genau ein Replikat.
+        """
+        replicas = get_env_int("PULSESCRIBE_LOCAL_REPLICAS") or 1
+        replicas = max(1, min(replicas, MAX_REPLICAS))
+        if replicas > 1 and self._backend in ("mlx", "lightning"):
+            # Läuft bei jedem _acquire_replica → nur bei Änderung warnen
+            if self._replica_warning != (self._backend, replicas):
+                self._replica_warning = (self._backend, replicas)
+                logger.warning(
+                    f"PULSESCRIBE_LOCAL_REPLICAS wird ignoriert ({self._backend} "
+                    "backend nutzt eine gemeinsame Metal-GPU)."
+                )
+            return 1
+        return replicas
+
+    @contextmanager
+    def _acquire_replica(
+        self, cancel: threading.Event | None = None
+    ) -> Generator[int, None, None]:
+        """Reserviert ein freies Replikat für den aktuellen Thread.
+
+        Mit `cancel` (Hintergrund-Warmup) nur ein übriges Replikat, siehe
+        `_ReplicaPool.acquire_spare()`; sonst `_DecodeCancelled`.
+        """
+        self._ensure_runtime_config()
+        assert self._pool is not None
+        pool_acquire = self._pool.acquire if cancel is None else self._pool.acquire_spare
+        with pool_acquire() as index:
+            if index is None:
+                raise _DecodeCancelled("kein freies Replikat")
+            self._replica_state.index = index
+            self._replica_state.cancel = cancel
+            try:
+                yield index
+            finally:
+                self._replica_state.index = 0
+                self._replica_state.cancel = None
+
+    def _replica_suffix(self) -> str:
+        """Cache-Key-Suffix des aktuellen Replikats (Replikat 0 ohne Suffix)."""
+        index = getattr(self._replica_state, "index", 0)
+        return f":r{index}" if index else ""
+
+    def _cpu_threads_share(self) -> int:
+        """CPU-Threads pro Replikat (ENV > Profil, sonst alle Kerne).
+
+        Bei einem Replikat bleibt 0 (= CTranslate2-Auto) erhalten.
+        """
+        cpu_threads = get_env_int("PULSESCRIBE_LOCAL_CPU_THREADS")
+        if cpu_threads is None and self._profile:
+            cpu_threads = self._profile.get("cpu_threads")
+        cpu_threads = cpu_threads or 0
+        replicas = self._pool.size if self._pool is not None else 1
+        if replicas <= 1:
+            return cpu_threads
+        total = cpu_threads or os.cpu_count() or 1
+        return max(1, total // replicas)
+
+    def get_pool_stats(self) -> dict[str, float | int]:
+        """Scheduler-Metriken: Replikate, Queue-Tiefe, Wartezeiten."""
+        self._ensure_runtime_config()
+        assert self._pool is not None
+        return self._pool.stats()
 
     def _map_faster_model_name(self, model_name: str) -> str:
         """Mappt openai-whisper Namen auf faster-whisper Konventionen."""
         mapping = {
             "turbo": "large-v3-turbo",
             "large": "large-v3",
+            # Englisch-only (distilliert), gleiche Aliase wie bei mlx
+            "large-en": "distil-large-v3",
+            "medium-en": "distil-medium.en",
+            "small-en": "distil-small.en",
         }
         return mapping.get(model_name, model_name)
 
@@ -399,9 +721,10 @@ class LocalProvider:
 
         self._ensure_runtime_config()
 
-        cache_key = f"whisper:{model_name}:{self._device}"
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
+        cache_key = f"whisper:{model_name}:{self._device}{self._replica_suffix()}"
+        cached = self._model_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
 
         with self._load_lock:
             # Double-check nach Lock (Race vermeiden)
@@ -456,7 +779,7 @@ class LocalProvider:
                         f"Whisper Load auf {self._device} fehlgeschlagen, fallback CPU: {e}"
                     )
                     self._device = "cpu"
-                    cache_key = f"whisper:{model_name}:cpu"
+                    cache_key = f"whisper:{model_name}:cpu{self._replica_suffix()}"
                     if cache_key not in self._model_cache:
                         self._model_cache[cache_key] = whisper.load_model(
                             model_name, device="cpu"
@@ -481,14 +804,17 @@ class LocalProvider:
         device = "cuda" if self._device == "cuda" else "cpu"
         compute_type = self._compute_type or ("float16" if device == "cuda" else CPU_COMPUTE_TYPE)
 
-        cpu_threads = get_env_int("PULSESCRIBE_LOCAL_CPU_THREADS") or 0
+        cpu_threads = self._cpu_threads_share()
         num_workers = get_env_int("PULSESCRIBE_LOCAL_NUM_WORKERS") or 1
+        replica = self._replica_suffix()
 
         cache_key = (
             f"faster:{faster_name}:{device}:{compute_type}:{cpu_threads}:{num_workers}"
+            f"{replica}"
         )
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
+        cached = self._model_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
 
         with self._load_lock:
             if cache_key in self._model_cache:
@@ -547,6 +873,7 @@ class LocalProvider:
                     cpu_compute = CPU_COMPUTE_TYPE
                     cpu_cache_key = (
                         f"faster:{faster_name}:cpu:{cpu_compute}:{cpu_threads}:{num_workers}"
+                        f"{replica}"
                     )
                     log(
                         f"Lade faster-whisper Modell '{faster_name}' "
@@ -578,8 +905,9 @@ class LocalProvider:
         quant = None if quant_env in ("", "none", "false") else quant_env
 
         cache_key = f"lightning:{lightning_name}:{batch_size}:{quant}"
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
+        cached = self._model_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
 
         with self._load_lock:
             if cache_key in self._model_cache:
@@ -640,6 +968,11 @@ class LocalProvider:
             vad_env = get_env_bool("PULSESCRIBE_LOCAL_VAD_FILTER")
             if vad_env:
                 options["vad_filter"] = True
+
+            # Batched Long-Form: an Pausen schneiden, Chunks als Batch dekodieren
+            batch_size = get_env_int("PULSESCRIBE_LOCAL_BATCH_SIZE")
+            if batch_size is not None and batch_size > 1:
+                options["batch_size"] = batch_size
         elif self._backend == "mlx":
             # mlx-whisper nutzt fp16 per Default; Override via PULSESCRIBE_FP16 möglich.
             if self._fp16_override is not None:
@@ -695,7 +1028,9 @@ class LocalProvider:
         """Gibt aktuelle Runtime-Konfiguration zurück (nach preload/transcribe).
 
         Returns:
-            Dict mit backend, device, compute_type (compute_type nur bei faster-whisper).
+            Dict mit backend, device, compute_type (compute_type nur bei faster-whisper),
+            replicas (nur bei mehr als einem Modell-Replikat) und Modell-Cache-
+            Statistik (cache_hits, cache_misses, cache_evictions, cache_resident_mb).
         """
         self._ensure_runtime_config()
         info: dict[str, str | None] = {
@@ -708,16 +1043,150 @@ class LocalProvider:
             info["compute_type"] = self._compute_type or (
                 "float16" if device == "cuda" else CPU_COMPUTE_TYPE
             )
+        if self._pool is not None and self._pool.size > 1:
+            info["replicas"] = str(self._pool.size)
+        cache = self._model_cache.stats()
+        info["cache_models"] = str(cache["models"])
+        info["cache_hits"] = str(cache["hits"])
+        info["cache_misses"] = str(cache["misses"])
+        info["cache_cold_misses"] = str(cache["cold_misses"])
+        info["cache_evictions"] = str(cache["evictions"])
+        resident = cache["resident_ram_bytes"] + cache["resident_vram_bytes"]
+        info["cache_resident_mb"] = f"{resident / (1024 * 1024):.0f}"
+        if cache["resident_vram_bytes"]:
+            info["cache_resident_vram_mb"] = (
+                f"{cache['resident_vram_bytes'] / (1024 * 1024):.0f}"
+            )
+        if self._warmup_stats:
+            # Bucket: first/steady in Sekunden
+            info["warmup"] = ", ".join(
+                f"{seconds:g}s={t['first']:.2f}/{t['steady']:.2f}"
+                for seconds, t in sorted(self._warmup_stats.items())
+            )
         return info
 
+    def _short_max_seconds(self) -> float:
+        """Schwelle für das Short-Tier (PULSESCRIBE_LOCAL_SHORT_MAX_SECONDS)."""
+        raw = os.getenv("PULSESCRIBE_LOCAL_SHORT_MAX_SECONDS")
+        if raw:
+            try:
+                return float(raw.strip())
+            except ValueError:
+                logger.warning(f"Ungültiger PULSESCRIBE_LOCAL_SHORT_MAX_SECONDS: {raw}")
+        return DEFAULT_SHORT_MAX_SECONDS
+
+    def _tier_models(self, main_model: str) -> dict[str, str]:
+        """Konfigurierte Modell-Tiers (main immer, short/en optional)."""
+        tiers = {"main": main_model}
+        short_model = (os.getenv("PULSESCRIBE_LOCAL_SHORT_MODEL") or "").strip()
+        if short_model:
+            tiers["short"] = short_model
+        en_model = (os.getenv("PULSESCRIBE_LOCAL_EN_MODEL") or "").strip()
+        if en_model:
+            tiers["en"] = en_model
+        return tiers
+
+    def _route_model(
+        self, model_name: str, language: str | None, audio_duration: float | None
+    ) -> tuple[str, str]:
+        """Wählt das Modell-Tier anhand von Audiolänge und Sprache.
+
+        Reihenfolge: short (kurze Clips) > en (Sprache explizit Englisch) > main.
+        Ohne konfigurierte Tiers bleibt es immer beim Hauptmodell.
+
+        Returns:
+            (tier, model_name)
+        """
+        tiers = self._tier_models(model_name)
+        if (
+            "short" in tiers
+            and audio_duration is not None
+            and audio_duration <= self._short_max_seconds()
+        ):
+            return "short", tiers["short"]
+        if "en" in tiers and (language or "").strip().lower() in ("en", "english"):
+            return "en", tiers["en"]
+        return "main", model_name
+
+    def _log_routing(
+        self,
+        tiers: dict[str, str],
+        tier: str,
+        model_name: str,
+        audio_duration: float | None,
+        elapsed: float,
+    ) -> None:
+        """Loggt Tier + RTF (nur wenn Routing konfiguriert ist)."""
+        if len(tiers) <= 1:
+            return
+        if audio_duration:
+            rtf = elapsed / audio_duration
+            logger.info(
+                f"Local-Routing: tier={tier}, model={model_name}, "
+                f"audio={audio_duration:.2f}s, time={elapsed:.2f}s, rtf={rtf:.2f}x"
+            )
+        else:
+            logger.info(
+                f"Local-Routing: tier={tier}, model={model_name}, time={elapsed:.2f}s"
+            )
+
+    def _transcribe_routed(
+        self,
+        audio,
+        model: str | None,
+        language: str | None,
+        audio_duration: float | None,
+    ) -> str:
+        """Gemeinsamer Pfad für transcribe()/transcribe_audio() inkl. Tier-Routing."""
+        # Echte Anfragen haben Vorrang vor dem Hintergrund-Warmup
+        self._warmup_cancel.set()
+        main_model = self._resolve_model_name(model)
+        tier, model_name = self._route_model(main_model, language, audio_duration)
+        self._log_transcription_start(model_name, language)
+        options = self._build_options(language)
+        t0 = time.perf_counter()
+        with timed_operation("Local-Transkription", logger=logger, include_session=False):
+            text = self._decode(audio, model_name, options)
+        self._log_routing(
+            self._tier_models(main_model),
+            tier,
+            model_name,
+            audio_duration,
+            time.perf_counter() - t0,
+        )
+        return text
+
     def preload(self, model: str | None = None) -> None:
-        """Lädt ein Modell vorab in den Cache."""
-        model_name = self._resolve_model_name(model)
+        """Lädt das Modell (und alle konfigurierten Tiers) vorab in den Cache."""
+        main_model = self._resolve_model_name(model)
+        seen: set[str] = set()
+        for tier, model_name in self._tier_models(main_model).items():
+            if model_name in seen:
+                continue
+            seen.add(model_name)
+            if tier != "main":
+                logger.info(f"Preload Tier '{tier}': {model_name}")
+            self._preload_model(model_name)
+
+    def _preload_model(self, model_name: str) -> None:
+        """Lädt ein einzelnes Modell vorab (inkl. Metal-Warmup bei mlx/lightning)."""
         self._ensure_runtime_config()
-        if self._backend == "faster":
-            self._get_faster_model(model_name)
+        if self._backend in ("faster", "whisper"):
+            # Alle Replikate laden, damit parallele Anfragen nicht kalt starten
+            loader = (
+                self._get_faster_model
+                if self._backend == "faster"
+                else self._get_whisper_model
+            )
+            assert self._pool is not None
+            for index in range(self._pool.size):
+                self._replica_state.index = index
+                try:
+                    loader(model_name)
+                finally:
+                    self._replica_state.index = 0
         elif self._backend == "mlx":
-            with self._transcribe_lock:
+            with self._acquire_replica():
                 import numpy as np
 
                 t0 = time.perf_counter()
@@ -750,7 +1219,7 @@ class LocalProvider:
                     f"MLX preload complete: warmup={t_warmup:.2f}s (model loaded & compiled)"
                 )
         elif self._backend == "lightning":
-            with self._transcribe_lock:
+            with self._acquire_replica():
                 import numpy as np
 
                 t0 = time.perf_counter()
@@ -768,8 +1237,109 @@ class LocalProvider:
                 logger.debug(
                     f"Lightning preload complete: load={t_load:.2f}s, warmup={t_warmup:.2f}s"
                 )
-        else:
-            self._get_whisper_model(model_name)
+
+    def _warmup_buckets(self) -> tuple[float, ...]:
+        """Bucket-Längen aus PULSESCRIBE_LOCAL_WARMUP_BUCKETS.
+
+        `auto` (Default) wärmt nur auf GPU/Metal auf – dort kosten Kernel-
+        Compilation und Allocator-Wachstum beim ersten Diktat spürbar Zeit,
+        auf der CPU würde ein 30-s-Bucket dagegen selbst Sekunden blockieren.
+        Eine Liste (`1,5,15`) gilt für jedes Device, `false`/`off` schaltet ab.
+        """
+        raw = (os.getenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS") or "auto").strip().lower()
+        if raw in ("0", "false", "off", "no", "none"):
+            return ()
+        if raw == "auto":
+            self._ensure_runtime_config()
+            on_gpu = self._backend in ("mlx", "lightning") or self._device in (
+                "cuda",
+                "mps",
+            )
+            return LOCAL_WARMUP_BUCKETS if on_gpu else ()
+        try:
+            buckets = sorted({float(part) for part in raw.split(",") if part.strip()})
+        except ValueError:
+            logger.warning(f"Ungültiger PULSESCRIBE_LOCAL_WARMUP_BUCKETS: {raw}")
+            return ()
+        return tuple(b for b in buckets if 0 < b <= 60)
+
+    def start_bucket_warmup(
+        self, model: str | None = None, language: str | None = None
+    ) -> bool:
+        """Wärmt realistische Äußerungslängen im Hintergrund auf.
+
+        Pro Bucket laufen zwei Decodes (first-call und steady-state Latenz,
+        siehe `get_warmup_stats()`). Der Thread läuft mit niedriger Priorität,
+        nimmt nur ein Replikat, auf das keine Anfrage wartet (bei mehreren muss
+        eines frei bleiben), und bricht ab, sobald `cancel_warmup()` aufgerufen
+        wird. faster-whisper prüft das nach jedem Segment und gibt das Replikat
+        sofort frei; die übrigen Backends nach dem laufenden Decode.
+
+        Returns:
+            True wenn ein Warmup gestartet wurde
+        """
+        buckets = self._warmup_buckets()
+        if not buckets:
+            return False
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            return False
+        self._warmup_cancel = threading.Event()
+        self._warmup_thread = threading.Thread(
+            target=self._run_bucket_warmup,
+            args=(self._resolve_model_name(model), language, buckets, self._warmup_cancel),
+            daemon=True,
+            name="LocalBucketWarmup",
+        )
+        self._warmup_thread.start()
+        return True
+
+    def cancel_warmup(self) -> None:
+        """Bricht ein laufendes Bucket-Warmup ab (z.B. bei Aufnahmestart)."""
+        self._warmup_cancel.set()
+
+    def get_warmup_stats(self) -> dict[float, dict[str, float]]:
+        """Latenzen je Bucket: {Sekunden: {"first": s, "steady": s}}."""
+        return {k: dict(v) for k, v in self._warmup_stats.items()}
+
+    def _run_bucket_warmup(
+        self,
+        model_name: str,
+        language: str | None,
+        buckets: tuple[float, ...],
+        cancel: threading.Event,
+    ) -> None:
+        import numpy as np
+
+        _lower_thread_priority()
+        options = dict(self._build_options(language or _get_warmup_language()))
+        # VAD würde das Rauschen komplett verwerfen
+        options.pop("vad_filter", None)
+        rng = np.random.default_rng(0)
+        for seconds in buckets:
+            audio = (
+                rng.standard_normal(int(seconds * WHISPER_SAMPLE_RATE))
+                * WARMUP_NOISE_LEVEL
+            ).astype(np.float32)
+            timings: list[float] = []
+            for _ in range(2):
+                if cancel.is_set():
+                    logger.debug(f"Bucket-Warmup abgebrochen vor {seconds:g}s")
+                    return
+                t0 = time.perf_counter()
+                try:
+                    self._decode(audio, model_name, options, cancel=cancel)
+                except _DecodeCancelled as e:
+                    logger.debug(f"Bucket-Warmup abgebrochen bei {seconds:g}s: {e}")
+                    return
+                except Exception as e:
+                    logger.debug(f"Bucket-Warmup fehlgeschlagen ({seconds:g}s): {e}")
+                    return
+                timings.append(time.perf_counter() - t0)
+            self._warmup_stats[seconds] = {"first": timings[0], "steady": timings[1]}
+            logger.info(
+                f"Warmup-Bucket {seconds:g}s: first={timings[0]:.2f}s, "
+                f"steady={timings[1]:.2f}s"
+            )
 
     def _log_transcription_start(self, model_name: str, language: str | None) -> None:
         """Loggt Transkriptions-Start mit Provider/Backend/Modell/Device/Compute-Type."""
@@ -792,20 +1362,35 @@ class LocalProvider:
         language: str | None = None,
     ) -> str:
         """Transkribiert ein Audio-Array lokal (ohne Dateischreibzugriff)."""
-        model_name = self._resolve_model_name(model)
-        self._log_transcription_start(model_name, language)
-        options = self._build_options(language)
-        with timed_operation("Local-Transkription", logger=logger, include_session=False):
-            with self._transcribe_lock:
-                if self._backend == "faster":
-                    return self._transcribe_faster(audio, model_name, options)
-                if self._backend == "mlx":
-                    return self._transcribe_mlx(audio, model_name, options)
-                if self._backend == "lightning":
-                    return self._transcribe_lightning(audio, model_name, options)
-                whisper_model = self._get_whisper_model(model_name)
-                result = whisper_model.transcribe(audio, **options)
-                return result["text"]
+        audio_duration = (
+            len(audio) / WHISPER_SAMPLE_RATE if hasattr(audio, "__len__") else None
+        )
+        return self._transcribe_routed(audio, model, language, audio_duration)
+
+    def _decode(
+        self,
+        audio,
+        model_name: str,
+        options: dict,
+        cancel: threading.Event | None = None,
+    ) -> str:
+        """Dispatcht Audio (Array oder Pfad) an das aktive Backend.
+
+        Jede Anfrage läuft auf einem freien Replikat (`_acquire_replica`);
+        wird auch von `LocalStreamingSession` für Fenster-Decodes genutzt.
+        `cancel` markiert Hintergrund-Decodes (Warmup), die `_DecodeCancelled`
+        werfen, sobald das Event gesetzt ist.
+        """
+        with self._acquire_replica(cancel):
+            if self._backend == "faster":
+                return self._transcribe_faster(audio, model_name, options)
+            if self._backend == "mlx":
+                return self._transcribe_mlx(audio, model_name, options)
+            if self._backend == "lightning":
+                return self._transcribe_lightning(audio, model_name, options)
+            whisper_model = self._get_whisper_model(model_name)
+            result = whisper_model.transcribe(audio, **options)
+            return result["text"]
 
     def _transcribe_faster(self, audio, model_name: str, options: dict) -> str:
         model = self._get_faster_model(model_name)
@@ -815,9 +1400,18 @@ class LocalProvider:
         if isinstance(temp, tuple):
             faster_opts["temperature"] = float(temp[0])
 
+        batch_size = faster_opts.pop("batch_size", None)
+
+        def _run(m, opts: dict) -> str:
+            if batch_size:
+                return self._transcribe_faster_batched(m, audio, opts, batch_size)
+            segments, _info = m.transcribe(audio, **opts)
+            return self._join_segments(segments)
+
         try:
-            segments, _info = model.transcribe(audio, **faster_opts)
-            return "".join(seg.text for seg in segments)
+            return _run(model, faster_opts)
+        except _DecodeCancelled:
+            raise
         except Exception as e:
             error_msg = str(e).lower()
             if faster_opts.get("vad_filter") and "silero_vad_v6.onnx" in error_msg:
@@ -828,8 +1422,7 @@ class LocalProvider:
                 retry_opts = dict(faster_opts)
                 retry_opts["vad_filter"] = False
                 try:
-                    segments, _info = model.transcribe(audio, **retry_opts)
-                    return "".join(seg.text for seg in segments)
+                    return _run(model, retry_opts)
                 except Exception as retry_error:
                     faster_opts = retry_opts
                     e = retry_error
@@ -849,10 +1442,70 @@ class LocalProvider:
                     del self._model_cache[k]
                 # Neu laden mit CPU und erneut versuchen
                 model = self._get_faster_model(model_name)
-                segments, _info = model.transcribe(audio, **faster_opts)
-                return "".join(seg.text for seg in segments)
+                return _run(model, faster_opts)
             raise
 
+    def _join_segments(self, segments) -> str:
+        """Sammelt faster-whisper-Segmente; Hintergrund-Decodes prüfen dabei `cancel`.
+
+        Der Generator decodiert erst beim Weiterlesen – ein Abbruch gibt das
+        Replikat nach dem aktuellen Segment frei.
+        """
+        cancel = getattr(self._replica_state, "cancel", None)
+        parts = []
+        for seg in segments:
+            parts.append(seg.text)
+            if cancel is not None and cancel.is_set():
+                raise _DecodeCancelled("abgebrochen")
+        return "".join(parts)
+
+    def _transcribe_faster_batched(
+        self, model, audio, options: dict, batch_size: int
+    ) -> str:
+        """Batched Long-Form via faster-whisper BatchedInferencePipeline.
+
+        Ohne `vad_filter` wird RMS-basiert an Pausen geschnitten
+        (`_split_at_silence`), mit `vad_filter` segmentiert Silero-VAD in der
+        Pipeline. Segmente kommen in Chunk-Reihenfolge zurück. Bei nur einem
+        Chunk bringt Batching nichts → sequenzieller Pfad.
+        """
+        import numpy as np
+        from faster_whisper import BatchedInferencePipeline, decode_audio
+
+        if isinstance(audio, str):
+            audio = decode_audio(audio, sampling_rate=WHISPER_SAMPLE_RATE)
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        audio_duration = audio.shape[0] / WHISPER_SAMPLE_RATE
+
+        batched_opts = dict(options)
+        if batched_opts.get("vad_filter"):
+            n_chunks = "vad"
+        else:
+            clips = _split_at_silence(audio, WHISPER_SAMPLE_RATE)
+            if not clips:
+                return ""
+            if len(clips) == 1 and audio_duration <= BATCH_CHUNK_S:
+                segments, _info = model.transcribe(audio, **options)
+                return self._join_segments(segments)
+            batched_opts["clip_timestamps"] = clips
+            batched_opts["vad_filter"] = False
+            n_chunks = str(len(clips))
+
+        t0 = time.perf_counter()
+        pipeline = BatchedInferencePipeline(model=model)
+        segments, _info = pipeline.transcribe(
+            audio, batch_size=batch_size, **batched_opts
+        )
+        text = self._join_segments(segments)
+        t_transcribe = time.perf_counter() - t0
+
+        rtf = t_transcribe / audio_duration if audio_duration > 0 else 0
+        logger.info(
+            f"Faster batched: audio={audio_duration:.2f}s, chunks={n_chunks}, "
+            f"batch_size={batch_size}, transcribe={t_transcribe:.2f}s (RTF={rtf:.2f}x)"
+        )
+        return text
+
     def _transcribe_mlx(self, audio, model_name: str, options: dict) -> str:
         """Transkription via mlx-whisper (Apple Silicon / Metal)."""
         t0 = time.perf_counter()
@@ -960,38 +1613,99 @@ class LocalProvider:
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: "AudioSource",
         model: str | None = None,
         language: str | None = None,
+        *,
+        use_cache: bool = True,
     ) -> str:
         """Transkribiert Audio lokal (whisper/faster/mlx/lightning).
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder InMemoryAudio (ohne Cache)
             model: Modell-Name (default: turbo)
             language: Sprachcode oder None für Auto-Detection
+            use_cache: Ergebnis-Cache (utils/result_cache.py) nutzen
 
         Returns:
             Transkribierter Text
         """
-        model_name = self._resolve_model_name(model)
-        self._log_transcription_start(model_name, language)
-        options = self._build_options(language)
-        with timed_operation("Local-Transkription", logger=logger, include_session=False):
-            with self._transcribe_lock:
-                if self._backend == "faster":
-                    return self._transcribe_faster(str(audio_path), model_name, options)
-                if self._backend == "mlx":
-                    return self._transcribe_mlx(str(audio_path), model_name, options)
-                if self._backend == "lightning":
-                    return self._transcribe_lightning(str(audio_path), model_name, options)
-                whisper_model = self._get_whisper_model(model_name)
-                result = whisper_model.transcribe(str(audio_path), **options)
-                return result["text"]
+        from audio.memory import InMemoryAudio
+        from utils.result_cache import cached_transcribe
+
+        if isinstance(audio_path, InMemoryAudio):
+            return self.transcribe_audio(
+                audio_path.to_array(WHISPER_SAMPLE_RATE), model, language
+            )
+
+        audio_duration = None
+        try:
+            import soundfile as sf
+
+            audio_duration = float(sf.info(str(audio_path)).duration)
+        except Exception:
+            # Dauer unbekannt (Format/soundfile fehlt) → Hauptmodell
+            pass
+
+        self._ensure_runtime_config()
+        # Cache-Key mit dem tatsächlich gerouteten Modell und Backend
+        _tier, routed = self._route_model(
+            self._resolve_model_name(model), language, audio_duration
+        )
+        return cached_transcribe(
+            Path(audio_path),
+            lambda: self._transcribe_routed(
+                str(audio_path), model, language, audio_duration
+            ),
+            mode="local",
+            model=f"{self._backend}:{routed}",
+            language=language,
+            use_cache=use_cache,
+        )
+
+    async def transcribe_async(
+        self,
+        audio_path: "AudioSource",
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        """Wie `transcribe()`, in einem Worker-Thread (Inferenz ist CPU/GPU-gebunden).
+
+        Parallele Aufrufe serialisieren sich an den Modell-Locks bzw. verteilen
+        sich auf die Replikas (`PULSESCRIBE_LOCAL_REPLICAS`).
+        """
+        return await asyncio.to_thread(
+            self.transcribe, audio_path, model, language, use_cache=use_cache
+        )
 
     def supports_streaming(self) -> bool:
-        """Lokales Whisper unterstützt kein Streaming."""
-        return False
+        """Pseudo-Streaming (inkrementelles Decoding) ist opt-in.
+
+        Aktiv via `PULSESCRIBE_LOCAL_STREAMING=true`; siehe
+        `create_stream_session()`.
+        """
+        return get_env_bool_default("PULSESCRIBE_LOCAL_STREAMING", False)
+
+    def create_stream_session(
+        self,
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        on_interim: Callable[[str], None] | None = None,
+    ) -> "LocalStreamingSession":
+        """Erstellt eine Pseudo-Streaming-Session für eine Aufnahme.
+
+        Die Session dekodiert während der Aufnahme ein rollierendes Fenster,
+        committet stabile Hypothesen und dekodiert beim Stop nur noch den
+        nicht committeten Rest.
+        """
+        from .local_stream import LocalStreamingSession
+
+        return LocalStreamingSession(
+            self, model=model, language=language, on_interim=on_interim
+        )
 
 
 __all__ = ["LocalProvider"]
@@ -0,0 +1,333 @@
+"""Speicherbudgetierter LRU-Cache für lokale Whisper-Modelle.
+
+Ohne Budget bleibt jedes einmal geladene Modell (turbo, large-v3, distil, …)
+bis zum Prozessende resident – auch nach einem Settings-Wechsel. `ModelCache`
+begrenzt RAM und VRAM getrennt, entlädt Modelle nach einer Idle-Zeit und
+zählt Hits, Misses und Evictions für `LocalProvider.get_runtime_info()`.
+
+Schneller Reload-Pfad: faster-whisper-Modelle auf CUDA werden bei VRAM-Druck
+nicht verworfen, sondern per CTranslate2 `unload_model(to_cpu=True)` in den RAM
+geparkt und beim nächsten Zugriff in Sekundenbruchteilen zurückgeladen.
+"""
+
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+# Parameterzahlen für Größenschätzung, wenn das Modell sie nicht selbst liefert
+# (faster-whisper/CTranslate2, lightning). Reihenfolge: spezifisch vor generisch.
+_MODEL_PARAMS: tuple[tuple[str, int], ...] = (
+    ("turbo", 809_000_000),
+    ("distil-large", 756_000_000),
+    ("distil-medium", 394_000_000),
+    ("distil-small", 166_000_000),
+    ("large", 1_550_000_000),
+    ("medium", 769_000_000),
+    ("small", 244_000_000),
+    ("base", 74_000_000),
+    ("tiny", 39_000_000),
+)
+_DEFAULT_PARAMS = 809_000_000
+
+_MB = 1024 * 1024
+
+
+def _bytes_per_param(key: str) -> float:
+    """Grobe Bytes/Parameter aus Compute-Type bzw. Quantisierung im Cache-Key."""
+    lowered = key.lower()
+    if "4bit" in lowered:
+        return 0.5
+    if "int8" in lowered or "8bit" in lowered:
+        return 1.0
+    if "float32" in lowered or lowered.startswith("whisper:"):
+        return 4.0
+    return 2.0
+
+
+def estimate_model_bytes(model: Any, key: str) -> int:
+    """Schätzt den Speicherbedarf eines Modells.
+
+    PyTorch-Modelle (openai-whisper) werden exakt über ihre Parameter
+    vermessen, für alle anderen wird aus Modellname und Compute-Type
+    im Cache-Key geschätzt.
+    """
+    parameters = getattr(model, "parameters", None)
+    if callable(parameters):
+        try:
+            return int(sum(p.numel() * p.element_size() for p in parameters()))
+        except Exception:
+            pass
+    name = key.split(":")[1] if ":" in key else key
+    params = next((n for tag, n in _MODEL_PARAMS if tag in name), _DEFAULT_PARAMS)
+    return int(params * _bytes_per_param(key))
+
+
+def _is_vram_key(key: str) -> bool:
+    return ":cuda" in key
+
+
+def _park(model: Any) -> bool:
+    """Verschiebt ein CTranslate2-Modell vom GPU- in den CPU-Speicher."""
+    unload = getattr(getattr(model, "model", None), "unload_model", None)
+    if not callable(unload):
+        return False
+    try:
+        unload(to_cpu=True)
+        return True
+    except Exception as e:
+        logger.debug(f"Modell-Parken fehlgeschlagen: {e}")
+        return False
+
+
+def _unpark(model: Any) -> None:
+    model.model.load_model()
+
+
+class _Entry:
+    __slots__ = ("model", "size", "last_used")
+
+    def __init__(self, model: Any, size: int) -> None:
+        self.model = model
+        self.size = size
+        self.last_used = time.monotonic()
+
+
+class ModelCache:
+    """LRU-Modell-Cache mit RAM-/VRAM-Budget und Idle-Unload.
+
+    Dict-kompatibel (`in`, `[]`, `del`, Iteration über Keys), damit die
+    Loader in `LocalProvider` unverändert bleiben. `lookup()` ist der
+    gezählte Zugriff (Hit/Miss); `in` und `[]` zählen nicht.
+
+    Budgets/Idle-Zeit von 0 bedeuten "unbegrenzt"/"nie entladen".
+    """
+
+    def __init__(
+        self,
+        *,
+        ram_budget_mb: int = 0,
+        vram_budget_mb: int = 0,
+        idle_unload_s: float = 0.0,
+    ) -> None:
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._parked: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._evicted_at: dict[str, float] = {}
+        self.ram_budget = ram_budget_mb * _MB
+        self.vram_budget = vram_budget_mb * _MB
+        self.idle_unload_s = idle_unload_s
+        self.hits = 0
+        self.misses = 0
+        self.cold_misses = 0
+        self.evictions = 0
+        self.warm_reloads = 0
+        self._sweeper: threading.Thread | None = None
+
+    def configure(
+        self, *, ram_budget_mb: int, vram_budget_mb: int, idle_unload_s: float
+    ) -> None:
+        """Übernimmt neue Limits (Settings-Reload) und setzt sie sofort durch."""
+        with self._lock:
+            self.ram_budget = ram_budget_mb * _MB
+            self.vram_budget = vram_budget_mb * _MB
+            self.idle_unload_s = idle_unload_s
+            self._enforce_budget(keep=None)
+        self.unload_idle()
+        self._ensure_sweeper()
+
+    # ------------------------------------------------------------------ #
+    # Dict-Protokoll
+    # ------------------------------------------------------------------ #
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._parked
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._restore_parked(key)
+                if entry is None:
+                    raise KeyError(key)
+            entry.last_used = time.monotonic()
+            self._entries.move_to_end(key)
+            return entry.model
+
+    def __setitem__(self, key: str, model: Any) -> None:
+        size = estimate_model_bytes(model, key)
+        with self._lock:
+            self._parked.pop(key, None)
+            self._entries[key] = _Entry(model, size)
+            self._entries.move_to_end(key)
+            self._evicted_at.pop(key, None)
+            logger.debug(f"Modell-Cache: '{key}' resident ({size / _MB:.0f} MB)")
+            self._enforce_budget(keep=key)
+        self._ensure_sweeper()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+            elif key in self._parked:
+                del self._parked[key]
+            else:
+                raise KeyError(key)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries) + list(self._parked))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) + len(self._parked)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._parked.clear()
+
+    # ------------------------------------------------------------------ #
+    # Gezählter Zugriff, Eviction
+    # ------------------------------------------------------------------ #
+
+    def lookup(self, key: str) -> Any | None:
+        """Cache-Zugriff mit Hit/Miss-Statistik und Cold-Cache-Report."""
+        with self._lock:
+            # Scheitert das Zurückladen, ist der Eintrag verworfen → Miss
+            if key in self._entries or self._restore_parked(key) is not None:
+                self.hits += 1
+                return self[key]
+            self.misses += 1
+            evicted_at = self._evicted_at.get(key)
+            if evicted_at is not None:
+                self.cold_misses += 1
+                logger.info(
+                    f"Cold Cache: '{key}' wurde vor {time.monotonic() - evicted_at:.0f}s "
+                    "entladen – Modell wird neu geladen"
+                )
+            return None
+
+    def unload_idle(self) -> int:
+        """Entlädt alle Modelle, die länger als `idle_unload_s` unbenutzt sind."""
+        if self.idle_unload_s <= 0:
+            return 0
+        cutoff = time.monotonic() - self.idle_unload_s
+        with self._lock:
+            stale = [
+                k
+                for store in (self._entries, self._parked)
+                for k, e in store.items()
+                if e.last_used < cutoff
+            ]
+            for key in stale:
+                self._drop(key, reason="idle")
+        if stale:
+            gc.collect()
+        return len(stale)
+
+    def _restore_parked(self, key: str) -> "_Entry | None":
+        entry = self._parked.get(key)
+        if entry is None:
+            return None
+        t0 = time.perf_counter()
+        try:
+            _unpark(entry.model)
+        except Exception as e:
+            logger.warning(f"Modell-Cache: '{key}' nicht zurück auf GPU: {e}")
+            self._drop(key, reason="Unpark fehlgeschlagen")
+            return None
+        del self._parked[key]
+        self.warm_reloads += 1
+        logger.info(
+            f"Modell-Cache: '{key}' aus RAM zurück auf GPU "
+            f"({(time.perf_counter() - t0) * 1000:.0f}ms)"
+        )
+        self._entries[key] = entry
+        self._enforce_budget(keep=key)
+        return entry
+
+    def _resident(self, vram: bool) -> int:
+        total = sum(e.size for k, e in self._entries.items() if _is_vram_key(k) == vram)
+        if not vram:
+            total += sum(e.size for e in self._parked.values())
+        return total
+
+    def _enforce_budget(self, keep: str | None) -> None:
+        """Evicted LRU-Einträge bis beide Budgets eingehalten sind."""
+        for vram, budget in ((True, self.vram_budget), (False, self.ram_budget)):
+            if budget <= 0:
+                continue
+            while self._resident(vram) > budget:
+                victim = self._lru_victim(vram, keep)
+                if victim is None:
+                    break
+                if vram and _park(self._entries[victim].model):
+                    entry = self._entries.pop(victim)
+                    self._parked[victim] = entry
+                    self.evictions += 1
+                    logger.info(
+                        f"Modell-Cache: '{victim}' in RAM geparkt (VRAM-Budget)"
+                    )
+                else:
+                    self._drop(victim, reason="budget")
+
+    def _lru_victim(self, vram: bool, keep: str | None) -> str | None:
+        if not vram:
+            for key in self._parked:
+                return key
+        for key in self._entries:
+            if key != keep and _is_vram_key(key) == vram:
+                return key
+        return None
+
+    def _drop(self, key: str, *, reason: str) -> None:
+        entry = self._entries.pop(key, None) or self._parked.pop(key, None)
+        if entry is None:
+            return
+        self.evictions += 1
+        self._evicted_at[key] = time.monotonic()
+        logger.info(
+            f"Modell-Cache: '{key}' entladen ({reason}, {entry.size / _MB:.0f} MB)"
+        )
+
+    def _ensure_sweeper(self) -> None:
+        """Startet den Idle-Sweeper-Thread (einmalig, nur mit Idle-Timeout)."""
+        if self.idle_unload_s <= 0 or self._sweeper is not None:
+            return
+        self._sweeper = threading.Thread(
+            target=self._sweep_loop, daemon=True, name="ModelCacheSweeper"
+        )
+        self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while True:
+            interval = self.idle_unload_s / 4 if self.idle_unload_s > 0 else 60.0
+            time.sleep(max(1.0, min(60.0, interval)))
+            try:
+                self.unload_idle()
+            except Exception as e:
+                logger.debug(f"Idle-Unload fehlgeschlagen: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Hits, Misses, Evictions und residente Bytes (RAM/VRAM)."""
+        with self._lock:
+            return {
+                "models": len(self._entries),
+                "parked": len(self._parked),
+                "hits": self.hits,
+                "misses": self.misses,
+                "cold_misses": self.cold_misses,
+                "evictions": self.evictions,
+                "warm_reloads": self.warm_reloads,
+                "resident_ram_bytes": self._resident(vram=False),
+                "resident_vram_bytes": self._resident(vram=True),
+            }
+
+
+__all__ = ["ModelCache", "estimate_model_bytes"]
@@ -0,0 +1,354 @@
+"""Kalibrierung und persistentes Maschinenprofil für lokales Whisper.
+
+`calibrate()` transkribiert einen Referenz-Clip unter mehreren
+Konfigurationen (Compute-Type, CPU-Threads, Fast-Mode), misst RTF und
+Peak-RSS und speichert die schnellste Konfiguration, deren Wortfehlerrate
+gegenüber der genauesten Konfiguration im Limit bleibt, nach
+`~/.pulsescribe/local_profile.json`.
+
+`LocalProvider._ensure_runtime_config()` lädt dieses Profil als Default –
+explizit gesetzte ENV-Variablen haben immer Vorrang.
+"""
+
+import json
+import logging
+import os
+import platform
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Generator
+
+from config import LOCAL_PROFILE_FILE, WHISPER_SAMPLE_RATE
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+PROFILE_VERSION = 1
+# Max. Wortfehlerrate gegenüber der Referenz-Konfiguration
+DEFAULT_MAX_WER = 0.05
+# RSS-Sampling-Intervall während eines Kalibrierungslaufs
+RSS_SAMPLE_INTERVAL = 0.02
+
+# ENV-Keys, die während der Kalibrierung pro Konfiguration gesetzt werden.
+# Tier-Modelle leeren, sonst misst ein kurzer/englischer Clip das Tier-Modell.
+_CALIBRATION_ENV = (
+    "PULSESCRIBE_LOCAL_COMPUTE_TYPE",
+    "PULSESCRIBE_LOCAL_CPU_THREADS",
+    "PULSESCRIBE_LOCAL_FAST",
+    "PULSESCRIBE_LOCAL_PROFILE",
+    "PULSESCRIBE_LOCAL_REPLICAS",
+    "PULSESCRIBE_LOCAL_SHORT_MODEL",
+    "PULSESCRIBE_LOCAL_EN_MODEL",
+)
+
+
+# =============================================================================
+# Profil laden/speichern
+# =============================================================================
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    """Merkmale, an die ein Profil gebunden ist (anderer Rechner → ungültig)."""
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count() or 0,
+    }
+
+
+def load_profile(path: Path = LOCAL_PROFILE_FILE) -> dict[str, Any] | None:
+    """Lädt das Profil, falls vorhanden und für diese Maschine gültig."""
+    try:
+        profile = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Lokales Profil unlesbar ({path}): {e}")
+        return None
+    if not isinstance(profile, dict) or profile.get("version") != PROFILE_VERSION:
+        return None
+    if profile.get("machine") != machine_fingerprint():
+        logger.info("Lokales Profil stammt von anderer Maschine – ignoriert")
+        return None
+    return profile
+
+
+def save_profile(profile: dict[str, Any], path: Path = LOCAL_PROFILE_FILE) -> None:
+    """Speichert das Profil atomar (tmp + replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(profile, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+# =============================================================================
+# Messhelfer
+# =============================================================================
+
+
+def _current_rss() -> int:
+    """Aktuelles Resident Set Size des Prozesses in Bytes (0 wenn unbekannt)."""
+    try:
+        import psutil  # type: ignore[import-not-found]
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        # macOS: Bytes, Linux: KB – nur Peak verfügbar, besser als nichts
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if platform.system() == "Darwin" else peak * 1024)
+    except Exception:
+        return 0
+
+
+class _PeakRssSampler:
+    """Sampelt RSS in einem Hintergrund-Thread und merkt sich das Maximum."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL) -> None:
+        self.peak = _current_rss()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.peak = max(self.peak, _current_rss())
+
+    def __enter__(self) -> "_PeakRssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss())
+
+
+def _normalize_words(text: str) -> list[str]:
+    return re.sub(r"[^\w\s]", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Wortfehlerrate (Levenshtein auf Wortebene, normalisiert)."""
+    ref = _normalize_words(reference)
+    hyp = _normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1] / len(ref)
+
+
+@contextmanager
+def _temp_env(values: dict[str, str]) -> Generator[None, None, None]:
+    saved = {k: os.environ.get(k) for k in _CALIBRATION_ENV}
+    try:
+        for key in _CALIBRATION_ENV:
+            os.environ.pop(key, None)
+        os.environ.update(values)
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _load_reference_audio(audio_path: Path):
+    """Liest den Referenz-Clip als float32 mono @ 16 kHz."""
+    import numpy as np
+    import soundfile as sf
+
+    audio, sr = sf.read(str(audio_path), dtype="float32", always_2d=True)
+    audio = audio.mean(axis=1)
+    if sr != WHISPER_SAMPLE_RATE:
+        n_out = int(round(audio.shape[0] * WHISPER_SAMPLE_RATE / sr))
+        audio = np.interp(
+            np.linspace(0, audio.shape[0] - 1, n_out),
+            np.arange(audio.shape[0]),
+            audio,
+        ).astype(np.float32)
+    return audio
+
+
+# =============================================================================
+# Kalibrierung
+# =============================================================================
+
+
+def candidate_configs(backend: str, device: str) -> list[dict[str, Any]]:
+    """Konfigurations-Raster; das erste Element ist die genaueste (Referenz)."""
+    cpu_count = os.cpu_count() or 1
+    if backend != "faster":
+        # Compute-Type/Threads sind faster-whisper-spezifisch
+        return [{"fast": False}, {"fast": True}]
+
+    if device == "cuda":
+        compute_types = ["float32", "float16", "int8_float16", "int8"]
+        threads = [0]
+    else:
+        # CTranslate2 hat auf CPU keine float16-Kernels
+        compute_types = ["float32", "int8_float32", "int8"]
+        threads = sorted({max(1, cpu_count // 4), max(1, cpu_count // 2), cpu_count})
+
+    configs = [
+        {"compute_type": ct, "cpu_threads": th, "fast": fast}
+        for ct in compute_types
+        for th in sorted(threads, reverse=True)
+        for fast in (False, True)
+    ]
+    return configs
+
+
+def _config_env(config: dict[str, Any]) -> dict[str, str]:
+    env = {
+        "PULSESCRIBE_LOCAL_PROFILE": "false",
+        "PULSESCRIBE_LOCAL_REPLICAS": "1",
+        "PULSESCRIBE_LOCAL_FAST": "true" if config.get("fast") else "false",
+    }
+    if config.get("compute_type"):
+        env["PULSESCRIBE_LOCAL_COMPUTE_TYPE"] = str(config["compute_type"])
+    if config.get("cpu_threads") is not None:
+        env["PULSESCRIBE_LOCAL_CPU_THREADS"] = str(config["cpu_threads"])
+    return env
+
+
+def _run_config(
+    audio, model: str | None, language: str | None, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Misst eine Konfiguration mit frischem Provider (Load + Warmup + Messlauf)."""
+    from .local import LocalProvider
+
+    duration = audio.shape[0] / WHISPER_SAMPLE_RATE
+    with _temp_env(_config_env(config)), _PeakRssSampler() as rss:
+        provider = LocalProvider()
+        t0 = time.perf_counter()
+        provider.preload(model)
+        t_load = time.perf_counter() - t0
+        # Erster Decode enthält Lazy-Init/JIT → nicht in RTF einrechnen
+        provider.transcribe_audio(audio, model=model, language=language)
+        t1 = time.perf_counter()
+        text = provider.transcribe_audio(audio, model=model, language=language)
+        t_decode = time.perf_counter() - t1
+    del provider
+    return {
+        **config,
+        "text": text,
+        "rtf": t_decode / duration if duration > 0 else 0.0,
+        "load_s": t_load,
+        "peak_rss_mb": rss.peak / (1024 * 1024),
+    }
+
+
+def calibrate(
+    audio_path: Path,
+    model: str | None = None,
+    language: str | None = None,
+    *,
+    max_wer: float = DEFAULT_MAX_WER,
+    save: bool = True,
+) -> dict[str, Any]:
+    """Kalibriert das lokale Backend auf dieser Maschine.
+
+    Args:
+        audio_path: Referenz-Clip (Sprache, idealerweise 10-30 s)
+        model: Modell (default: PULSESCRIBE_LOCAL_MODEL bzw. turbo)
+        language: Sprache des Clips
+        max_wer: Max. Wortfehlerrate gegenüber der genauesten Konfiguration
+        save: Profil nach LOCAL_PROFILE_FILE schreiben
+
+    Returns:
+        Das Profil (inkl. aller Messergebnisse unter "results").
+    """
+    import gc
+
+    from .local import LocalProvider
+
+    audio = _load_reference_audio(audio_path)
+    with _temp_env({"PULSESCRIBE_LOCAL_PROFILE": "false"}):
+        probe = LocalProvider()
+        probe._ensure_runtime_config()
+        backend, device = probe._backend or "whisper", probe._device or "cpu"
+        model_name = probe._resolve_model_name(model)
+
+    configs = candidate_configs(backend, device)
+    logger.info(
+        f"Kalibrierung: backend={backend}, device={device}, model={model_name}, "
+        f"clip={audio.shape[0] / WHISPER_SAMPLE_RATE:.1f}s, {len(configs)} Konfigurationen"
+    )
+
+    results: list[dict[str, Any]] = []
+    reference_text: str | None = None
+    for config in configs:
+        try:
+            result = _run_config(audio, model_name, language, config)
+        except Exception as e:
+            logger.warning(f"Kalibrierung: {config} fehlgeschlagen: {e}")
+            continue
+        finally:
+            gc.collect()
+        if reference_text is None:
+            reference_text = result["text"]
+        result["wer"] = word_error_rate(reference_text, result["text"])
+        results.append(result)
+        logger.info(
+            f"Kalibrierung: {config} → rtf={result['rtf']:.3f}x, "
+            f"wer={result['wer']:.3f}, peak_rss={result['peak_rss_mb']:.0f}MB"
+        )
+
+    eligible = [r for r in results if r["wer"] <= max_wer]
+    if not eligible:
+        raise RuntimeError("Kalibrierung: keine Konfiguration erfolgreich")
+    best = min(eligible, key=lambda r: r["rtf"])
+
+    profile: dict[str, Any] = {
+        "version": PROFILE_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_fingerprint(),
+        "backend": backend,
+        "device": device,
+        "model": model_name,
+        "fast": bool(best.get("fast")),
+        "rtf": round(best["rtf"], 4),
+        "peak_rss_mb": round(best["peak_rss_mb"], 1),
+        "wer": round(best["wer"], 4),
+        "max_wer": max_wer,
+        "results": [
+            {k: (round(v, 4) if isinstance(v, float) else v) for k, v in r.items() if k != "text"}
+            for r in results
+        ],
+    }
+    if best.get("compute_type"):
+        profile["compute_type"] = best["compute_type"]
+    if best.get("cpu_threads") is not None:
+        profile["cpu_threads"] = best["cpu_threads"]
+
+    if save:
+        save_profile(profile)
+        logger.info(f"Lokales Profil gespeichert: {LOCAL_PROFILE_FILE}")
+    return profile
+
+
+__all__ = [
+    "calibrate",
+    "candidate_configs",
+    "load_profile",
+    "save_profile",
+    "word_error_rate",
+]
@@ -0,0 +1,284 @@
+"""Pseudo-Streaming für lokales Whisper.
+
+Whisper ist ein Batch-Modell: ohne Streaming startet die Dekodierung erst nach
+dem Hotkey-Release, und die Wartezeit wächst linear mit der Diktatlänge.
+`LocalStreamingSession` dekodiert deshalb schon während der Aufnahme ein
+rollierendes Fenster (alles seit dem letzten Commit) und committet stabile
+Hypothesen nach einer LocalAgreement-2-Policy:
+
+- Zwei aufeinanderfolgende Hypothesen stimmen vollständig überein UND das
+  Fenster endet in einer Sprechpause → Text committen, Fenster nach vorne
+  schieben.
+- Wird das Fenster länger als `LOCAL_STREAM_WINDOW`, wird an der leisesten
+  Stelle geschnitten und der Teil davor committet (begrenzt die Stop-Latenz
+  auch ohne Pausen).
+
+Beim Stop wird nur noch der unkommittierte Rest dekodiert – die Latenz ist damit
+durch die Fenstergröße begrenzt statt durch die Länge der Aufnahme.
+
+Die Chunks landen in einem wachsenden `CaptureBuffer`; jeder Schritt liest nur
+eine View darauf, statt die ganze Aufnahme neu zusammenzukopieren.
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from audio.buffer import CaptureBuffer
+from config import (
+    LOCAL_STREAM_INTERVAL,
+    LOCAL_STREAM_MIN_AUDIO,
+    LOCAL_STREAM_PAUSE,
+    LOCAL_STREAM_WINDOW,
+    VAD_THRESHOLD,
+    WHISPER_SAMPLE_RATE,
+)
+
+from .local import _frame_rms
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .local import LocalProvider
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+# RMS-Frames für Pausen- und Schnittpunkt-Erkennung
+FRAME_S = 0.02
+# Künstliche End-Stille für den finalen Decode (stabilisiert letzte Wörter)
+TAIL_PAD_S = 0.2
+
+
+def _agreed_prefix(previous: list[str], current: list[str]) -> int:
+    """Länge des gemeinsamen Wort-Präfixes zweier Hypothesen."""
+    n = 0
+    for a, b in zip(previous, current):
+        if a != b:
+            break
+        n += 1
+    return n
+
+
+class LocalStreamingSession:
+    """Inkrementelles Decoding einer laufenden Aufnahme.
+
+    Thread-Modell: `feed()` wird aus dem Audio-Callback aufgerufen (nur
+    `CaptureBuffer.append`), Decodes laufen in einem eigenen Worker-Thread.
+    `finish()` stoppt den Worker und liefert den vollständigen Text.
+    """
+
+    def __init__(
+        self,
+        provider: "LocalProvider",
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        on_interim: Callable[[str], None] | None = None,
+        interval_s: float = LOCAL_STREAM_INTERVAL,
+        window_s: float = LOCAL_STREAM_WINDOW,
+        min_audio_s: float = LOCAL_STREAM_MIN_AUDIO,
+        pause_s: float = LOCAL_STREAM_PAUSE,
+        silence_threshold: float = VAD_THRESHOLD * 0.5,
+        sample_rate: int = WHISPER_SAMPLE_RATE,
+    ) -> None:
+        self._provider = provider
+        self._model_name = provider._resolve_model_name(model)
+        self._language = language
+        self._on_interim = on_interim
+        self._interval_s = max(0.05, interval_s)
+        self._window = int(max(min_audio_s * 2, window_s) * sample_rate)
+        self._min_samples = int(min_audio_s * sample_rate)
+        self._pause_samples = int(pause_s * sample_rate)
+        self._frame = max(1, int(FRAME_S * sample_rate))
+        self._silence_threshold = silence_threshold
+        self._sample_rate = sample_rate
+
+        self._options: dict | None = None
+        self._buffer = CaptureBuffer(sample_rate)
+        self._offset = 0  # Sample-Index bis zu dem committet ist
+        self._committed: list[str] = []
+        self._prev_words: list[str] = []
+        self._last_interim = ""
+        self._decodes = 0
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._finished = False
+
+    # ------------------------------------------------------------------ #
+    # Öffentliche API
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Startet den Decode-Worker."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="LocalStreamWorker"
+        )
+        self._thread.start()
+
+    def feed(self, chunk) -> None:
+        """Hängt einen Audio-Chunk (float32, mono) an. Callback-sicher."""
+        self._buffer.append(chunk)
+
+    @property
+    def committed_text(self) -> str:
+        return " ".join(self._committed).strip()
+
+    @property
+    def committed_seconds(self) -> float:
+        return self._offset / self._sample_rate
+
+    def finish(self) -> str:
+        """Stoppt den Worker und dekodiert nur den unkommittierten Rest.
+
+        Returns:
+            Vollständiges Transkript (committete Teile + Rest).
+        """
+        import numpy as np
+
+        self._join_worker()
+        if self._finished:
+            return self.committed_text
+        self._finished = True
+
+        audio = self._snapshot()
+        tail = audio[self._offset :]
+        tail_s = tail.shape[0] / self._sample_rate
+        t0 = time.perf_counter()
+        if tail.shape[0] > 0 and self._has_speech(tail):
+            pad = np.zeros(int(TAIL_PAD_S * self._sample_rate), dtype=np.float32)
+            text = self._decode(np.concatenate([tail, pad]))
+            if text:
+                self._committed.append(text)
+        t_tail = time.perf_counter() - t0
+
+        logger.info(
+            f"Local-Streaming: committed={self.committed_seconds:.2f}s, "
+            f"tail={tail_s:.2f}s, tail_decode={t_tail:.2f}s, "
+            f"window_decodes={self._decodes}"
+        )
+        return self.committed_text
+
+    def cancel(self) -> None:
+        """Beendet die Session ohne finalen Decode (idempotent)."""
+        self._join_worker()
+        self._finished = True
+
+    # ------------------------------------------------------------------ #
+    # Worker
+    # ------------------------------------------------------------------ #
+
+    def _join_worker(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            # Ein laufender Fenster-Decode wird zu Ende gerechnet (max. ein Fenster)
+            thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            try:
+                self.step()
+            except Exception as e:
+                # Interims sind Best-Effort – finish() dekodiert dann einfach mehr
+                logger.warning(f"Local-Streaming Fenster-Decode fehlgeschlagen: {e}")
+                return
+
+    def step(self) -> None:
+        """Ein Decode-/Commit-Schritt (vom Worker periodisch aufgerufen)."""
+        audio = self._snapshot()
+        end = audio.shape[0]
+        tail = audio[self._offset : end]
+        if tail.shape[0] < self._min_samples or not self._has_speech(tail):
+            return
+
+        if tail.shape[0] > self._window:
+            self._force_commit(tail)
+            return
+
+        text = self._decode(tail)
+        if self._stop.is_set():
+            # Stop kam während des Decodes – Rest übernimmt finish()
+            return
+        words = text.split()
+        agreed = _agreed_prefix(self._prev_words, words)
+        logger.debug(
+            f"Local-Streaming: window={tail.shape[0] / self._sample_rate:.2f}s, "
+            f"words={len(words)}, agreed={agreed}"
+        )
+
+        stable = agreed == len(words) == len(self._prev_words)
+        if words and stable and self._ends_in_pause(tail):
+            self._commit(text, end)
+            self._publish_interim("")
+        else:
+            self._prev_words = words
+            self._publish_interim(" ".join(words))
+
+    def _force_commit(self, tail: "np.ndarray") -> None:
+        """Schneidet ein zu langes Fenster an der leisesten Stelle."""
+        rms = _frame_rms(tail, self._frame)
+        # Schnitt in der zweiten Fensterhälfte, damit Commits nicht zu klein werden
+        start = len(rms) // 2
+        if start >= len(rms):
+            return
+        cut_frame = start + int(rms[start:].argmin())
+        cut = cut_frame * self._frame + self._frame // 2
+        text = self._decode(tail[:cut])
+        if self._stop.is_set():
+            return
+        logger.debug(
+            f"Local-Streaming: Zwangs-Commit nach {cut / self._sample_rate:.2f}s "
+            f"(rms={float(rms[cut_frame]):.4f})"
+        )
+        self._commit(text, self._offset + cut)
+        self._publish_interim("")
+
+    def _commit(self, text: str, new_offset: int) -> None:
+        text = text.strip()
+        if text:
+            self._committed.append(text)
+        self._offset = new_offset
+        self._prev_words = []
+
+    # ------------------------------------------------------------------ #
+    # Helfer
+    # ------------------------------------------------------------------ #
+
+    def _snapshot(self) -> "np.ndarray":
+        """Zero-Copy-View auf alle bisher eingespeisten Samples."""
+        return self._buffer.view()
+
+    def _decode(self, audio: "np.ndarray") -> str:
+        if self._options is None:
+            self._options = self._provider._build_options(self._language)
+        self._decodes += 1
+        return str(self._provider._decode(audio, self._model_name, self._options)).strip()
+
+    def _has_speech(self, audio: "np.ndarray") -> bool:
+        rms = _frame_rms(audio, self._frame)
+        return bool(rms.size) and float(rms.max()) > self._silence_threshold
+
+    def _ends_in_pause(self, audio: "np.ndarray") -> bool:
+        if audio.shape[0] < self._pause_samples:
+            return False
+        rms = _frame_rms(audio[-self._pause_samples :], self._frame)
+        return bool(rms.size) and float(rms.max()) <= self._silence_threshold
+
+    def _publish_interim(self, tentative: str) -> None:
+        if self._on_interim is None:
+            return
+        text = " ".join(p for p in (self.committed_text, tentative) if p)
+        if not text or text == self._last_interim:
+            return
+        self._last_interim = text
+        try:
+            self._on_interim(text)
+        except Exception as e:
+            logger.debug(f"Interim-Callback fehlgeschlagen: {e}")
+
+
+__all__ = ["LocalStreamingSession"]
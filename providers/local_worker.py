@@ -0,0 +1,642 @@
+"""Out-of-Process-Inferenz-Worker für lokales Whisper.
+
+Im Daemon-Prozess lädt jeder Neustart (oder Crash) mehrere GB Gewichte neu, und
+lange Decodes konkurrieren mit dem UI-Thread um den GIL. Der Worker ist ein
+eigener, langlebiger Prozess, der `LocalProvider` hält:
+
+    python -m providers.local_worker --model turbo
+
+Protokoll: TCP auf 127.0.0.1, eine JSON-Zeile pro Request und Response.
+
+    {"op": "ping"}                          → {"ok": true, "ready": true, ...}
+    {"op": "preload", "model": ...}         → {"ok": true}
+    {"op": "transcribe", "shm": name, "samples": n, "model": ..., "language": ...}
+    {"op": "transcribe_file", "path": ..., "model": ..., "language": ...}
+                                            → {"ok": true, "text": "..."}
+    {"op": "info"}                          → {"ok": true, "info": {...}}
+    {"op": "reload"}                        → {"ok": true}
+
+Jeder Request trägt das Token aus `LOCAL_WORKER_TOKEN_FILE` (0600), das der
+Server beim Start schreibt – andere lokale Benutzer können den Port zwar
+erreichen, aber keine Dateien transkribieren lassen.
+
+Audio wird nicht serialisiert: Der Client legt ein `SharedMemory`-Segment an,
+schreibt die float32-Samples hinein und schickt nur dessen Namen. Der Daemon
+verbindet sich über `connect_worker()` nur, wenn bereits ein warmer Worker
+läuft; fällt der Worker später weg, transkribiert `WorkerProvider` wieder im
+eigenen Prozess.
+
+Ein Daemon mit prozesslokalem Modell stellt dieses per `share_provider()` unter
+demselben Protokoll bereit, damit `transcribe.py --mode local` das warme Modell
+mitbenutzen kann. Requests für ein anderes Modell lehnt der Worker ab
+(`ModelMismatchError`) – der Aufrufer lädt es dann selbst.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from config import (
+    DEFAULT_LOCAL_MODEL,
+    LOCAL_WORKER_CONNECT_TIMEOUT,
+    LOCAL_WORKER_HOST,
+    LOCAL_WORKER_PORT,
+    LOCAL_WORKER_TOKEN_FILE,
+    WHISPER_SAMPLE_RATE,
+)
+from utils.env import get_env_bool_default
+
+if TYPE_CHECKING:
+    from audio.memory import AudioSource
+
+    from .local import LocalProvider
+
+logger = logging.getLogger("pulsescribe.providers.local")
+
+PROTOCOL_VERSION = 1
+
+
+class WorkerError(RuntimeError):
+    """Vom Worker gemeldeter Fehler (Worker erreichbar, Request fehlgeschlagen)."""
+
+
+class ModelMismatchError(WorkerError):
+    """Angefragtes Modell ist nicht das, das der Worker warm hält."""
+
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    """Öffnet ein vom Client angelegtes Segment, ohne es zu übernehmen.
+
+    Vor Python 3.13 registriert auch der öffnende Prozess das Segment beim
+    Resource-Tracker, der es beim Prozessende (bzw. mit Warnung) entfernt –
+    das Segment gehört aber dem Client.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except Exception:
+            pass
+    return shm
+
+
+# --------------------------------------------------------------------------- #
+# Server
+# --------------------------------------------------------------------------- #
+
+
+def _write_private(path: Path, text: str) -> None:
+    """Schreibt `text` atomar in eine Datei, die von Anfang an 0600 ist.
+
+    chmod nach write_text ließe das Token kurz (bei chmod-Fehler dauerhaft)
+    mit Umask-Rechten lesbar. Windows ignoriert den Modus.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        worker: "LocalWorker" = self.server.worker  # type: ignore[attr-defined]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = worker.handle(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    # Unter Windows erlaubt SO_REUSEADDR einem zweiten Prozess, denselben Port
+    # zu binden (und das Token zu überschreiben) – dort exklusiv binden.
+    allow_reuse_address = sys.platform != "win32"
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        if sys.platform == "win32":
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1  # type: ignore[attr-defined]
+            )
+        super().server_bind()
+
+
+class LocalWorker:
+    """Hält einen `LocalProvider` und beantwortet Socket-Requests.
+
+    Requests laufen je Verbindung in eigenen Threads; Parallelität regelt
+    der Replikat-Pool des Providers (`PULSESCRIBE_LOCAL_REPLICAS`).
+    """
+
+    def __init__(
+        self,
+        provider: "LocalProvider",
+        model: str | None = None,
+        *,
+        token_file: Path = LOCAL_WORKER_TOKEN_FILE,
+    ) -> None:
+        self._provider = provider
+        self._model = model
+        self._token_file = token_file
+        self._token = secrets.token_hex(16)
+        self._ready = threading.Event()
+        self._started = time.time()
+        self._requests = 0
+        self._server: _Server | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def mark_ready(self, model: str | None = None) -> None:
+        """Meldet einen extern vorgeladenen Provider als warm."""
+        if model is not None:
+            self._model = model
+        self._ready.set()
+
+    def preload(self) -> None:
+        """Lädt das Modell vor; erst danach meldet `ping` den Worker als warm."""
+        t0 = time.perf_counter()
+        try:
+            self._provider.preload(self._model)
+        except Exception as e:
+            logger.warning(f"Worker-Preload fehlgeschlagen: {e}")
+            return
+        self._ready.set()
+        logger.info(f"Worker bereit ({time.perf_counter() - t0:.2f}s Preload)")
+
+    def start(self, host: str = LOCAL_WORKER_HOST, port: int = LOCAL_WORKER_PORT) -> int:
+        """Startet den Server im Hintergrund und gibt den gebundenen Port zurück."""
+        self._server = _Server((host, port), _Handler)
+        self._server.worker = self  # type: ignore[attr-defined]
+        # Token erst nach erfolgreichem Bind schreiben (sonst überschreibt ein
+        # zweiter Worker das Token des laufenden)
+        _write_private(self._token_file, self._token)
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True, name="LocalWorkerServer"
+        ).start()
+        return self._server.server_address[1]
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def served_model(self) -> str | None:
+        """Das warm gehaltene Modell (ohne explizites Modell: Provider-Default)."""
+        if self._model:
+            return self._model
+        resolve = getattr(self._provider, "_resolve_model_name", None)
+        name = resolve(None) if callable(resolve) else None
+        return name if isinstance(name, str) else None
+
+    def handle(self, request: dict) -> dict:
+        if not secrets.compare_digest(str(request.get("token", "")), self._token):
+            return {"ok": False, "error": "Nicht autorisiert"}
+        op = request.get("op")
+        if op in ("transcribe", "transcribe_file", "preload"):
+            # Fremde Modelle nicht nachladen: das kostet GBs im Daemon-Prozess,
+            # der Aufrufer lädt es besser selbst.
+            requested, served = request.get("model"), self.served_model
+            if requested and served and requested != served:
+                return {
+                    "ok": False,
+                    "mismatch": True,
+                    "error": f"Modell {requested} nicht geladen (Worker: {served})",
+                }
+        if op == "ping":
+            return {
+                "ok": True,
+                "ready": self.ready,
+                "pid": os.getpid(),
+                "version": PROTOCOL_VERSION,
+                "model": self.served_model,
+                "uptime": round(time.time() - self._started, 1),
+                "requests": self._requests,
+            }
+        if op == "transcribe":
+            return {"ok": True, "text": self._transcribe_shm(request)}
+        if op == "transcribe_file":
+            self._requests += 1
+            text = self._provider.transcribe(
+                Path(request["path"]),
+                model=request.get("model") or self._model,
+                language=request.get("language"),
+                use_cache=bool(request.get("cache", True)),
+            )
+            return {"ok": True, "text": text}
+        if op == "preload":
+            self._provider.preload(request.get("model") or self._model)
+            return {"ok": True}
+        if op == "info":
+            return {"ok": True, "info": self._provider.get_runtime_info()}
+        if op == "reload":
+            from utils.env import load_environment
+
+            load_environment(override_existing=True)
+            self._provider.invalidate_runtime_config()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unbekannte Operation: {op}"}
+
+    def _transcribe_shm(self, request: dict) -> str:
+        import numpy as np
+
+        self._requests += 1
+        samples = int(request["samples"])
+        shm = _attach_shm(request["shm"])
+        try:
+            view = np.ndarray((samples,), dtype=np.float32, buffer=shm.buf)
+            # Eigene Kopie: Backends dürfen das Array über den Request hinaus
+            # referenzieren, das Segment gibt der Client nach der Antwort frei.
+            audio = view.copy()
+            del view
+        finally:
+            shm.close()
+        return self._provider.transcribe_audio(
+            audio,
+            model=request.get("model") or self._model,
+            language=request.get("language"),
+        )
+
+
+# --------------------------------------------------------------------------- #
+# Client
+# --------------------------------------------------------------------------- #
+
+
+class LocalWorkerClient:
+    """Socket-Client für `LocalWorker` (eine Verbindung pro Request)."""
+
+    def __init__(
+        self,
+        host: str = LOCAL_WORKER_HOST,
+        port: int = LOCAL_WORKER_PORT,
+        connect_timeout: float = LOCAL_WORKER_CONNECT_TIMEOUT,
+        token_file: Path = LOCAL_WORKER_TOKEN_FILE,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self._connect_timeout = connect_timeout
+        self._token_file = token_file
+
+    def _token(self) -> str:
+        # Bei jedem Request neu lesen: ein neu gestarteter Worker hat ein neues Token
+        try:
+            return self._token_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return ""
+
+    def request(self, payload: dict, timeout: float | None = None) -> dict:
+        """Sendet einen Request; OSError bei nicht erreichbarem Worker.
+
+        Raises:
+            WorkerError: Wenn der Worker den Request mit Fehler beantwortet
+        """
+        with socket.create_connection(
+            (self.host, self.port), timeout=self._connect_timeout
+        ) as sock:
+            sock.settimeout(timeout)
+            message = {**payload, "token": self._token()}
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise ConnectionResetError("Worker hat die Verbindung geschlossen")
+        response = json.loads(line)
+        if not response.get("ok"):
+            error = response.get("error") or "Unbekannter Worker-Fehler"
+            if response.get("mismatch"):
+                raise ModelMismatchError(error)
+            raise WorkerError(error)
+        return response
+
+    def ping(self) -> dict | None:
+        """Status des Workers oder None, wenn keiner antwortet."""
+        try:
+            return self.request({"op": "ping"}, timeout=self._connect_timeout)
+        except (OSError, ValueError, WorkerError):
+            return None
+
+    def transcribe_audio(
+        self, audio, model: str | None = None, language: str | None = None
+    ) -> str:
+        """Übergibt float32-Audio per Shared Memory und wartet auf den Text."""
+        import numpy as np
+
+        data = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+        try:
+            np.ndarray(data.shape, dtype=np.float32, buffer=shm.buf)[:] = data
+            response = self.request(
+                {
+                    "op": "transcribe",
+                    "shm": shm.name,
+                    "samples": int(data.shape[0]),
+                    "model": model,
+                    "language": language,
+                }
+            )
+        finally:
+            shm.close()
+            shm.unlink()
+        return str(response.get("text", ""))
+
+    def transcribe_file(
+        self,
+        audio_path: Path,
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        response = self.request(
+            {
+                "op": "transcribe_file",
+                "path": str(Path(audio_path).resolve()),
+                "model": model,
+                "language": language,
+                "cache": use_cache,
+            }
+        )
+        return str(response.get("text", ""))
+
+
+class WorkerProvider:
+    """Provider-Ersatz für `local`, der an einen laufenden Worker delegiert.
+
+    Ist der Worker nicht (mehr) erreichbar, fällt er transparent auf einen
+    prozesslokalen `LocalProvider` zurück.
+    """
+
+    name = "local"
+    default_model = DEFAULT_LOCAL_MODEL
+    backend = None
+
+    def __init__(self, client: LocalWorkerClient) -> None:
+        self._client = client
+        self._fallback: "LocalProvider | None" = None
+        self._fallback_lock = threading.Lock()
+
+    def _local(self) -> "LocalProvider":
+        with self._fallback_lock:
+            if self._fallback is None:
+                from .local import LocalProvider
+
+                self._fallback = LocalProvider()
+            return self._fallback
+
+    def _worker_lost(self, e: Exception) -> None:
+        if isinstance(e, ModelMismatchError):
+            logger.info(f"{e} – lade im Prozess")
+            return
+        logger.warning(f"Inferenz-Worker nicht erreichbar ({e}), transkribiere im Prozess")
+
+    def transcribe(
+        self,
+        audio_path: "AudioSource",
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        from audio.memory import InMemoryAudio
+
+        if isinstance(audio_path, InMemoryAudio):
+            return self.transcribe_audio(
+                audio_path.to_array(WHISPER_SAMPLE_RATE), model, language
+            )
+        try:
+            return self._client.transcribe_file(
+                audio_path, model=model, language=language, use_cache=use_cache
+            )
+        except (OSError, ModelMismatchError) as e:
+            self._worker_lost(e)
+        return self._local().transcribe(
+            audio_path, model=model, language=language, use_cache=use_cache
+        )
+
+    async def transcribe_async(
+        self,
+        audio_path: "AudioSource",
+        model: str | None = None,
+        language: str | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        return await asyncio.to_thread(
+            self.transcribe, audio_path, model, language, use_cache=use_cache
+        )
+
+    def transcribe_audio(
+        self, audio, model: str | None = None, language: str | None = None
+    ) -> str:
+        try:
+            return self._client.transcribe_audio(audio, model=model, language=language)
+        except (OSError, ModelMismatchError) as e:
+            self._worker_lost(e)
+        return self._local().transcribe_audio(audio, model=model, language=language)
+
+    def preload(self, model: str | None = None) -> None:
+        try:
+            self._client.request({"op": "preload", "model": model})
+        except (OSError, ModelMismatchError) as e:
+            self._worker_lost(e)
+            self._local().preload(model)
+
+    def get_runtime_info(self) -> dict[str, Any]:
+        try:
+            info = dict(self._client.request({"op": "info"}).get("info") or {})
+        except (OSError, WorkerError):
+            return self._local().get_runtime_info()
+        info["worker"] = f"{self._client.host}:{self._client.port}"
+        return info
+
+    def invalidate_runtime_config(self) -> None:
+        """Settings-Reload an den Worker weiterreichen (liest dieselbe .env)."""
+        try:
+            self._client.request({"op": "reload"}, timeout=5.0)
+        except (OSError, WorkerError) as e:
+            logger.debug(f"Worker-Reload fehlgeschlagen: {e}")
+        if self._fallback is not None:
+            self._fallback.invalidate_runtime_config()
+
+    def supports_streaming(self) -> bool:
+        # Pseudo-Streaming braucht Fenster-Decodes im eigenen Prozess
+        return False
+
+
+def connect_worker(client: LocalWorkerClient | None = None) -> WorkerProvider | None:
+    """Liefert einen `WorkerProvider`, wenn ein warmer Worker antwortet.
+
+    Abschaltbar über `PULSESCRIBE_LOCAL_WORKER=false`.
+    """
+    if not get_env_bool_default("PULSESCRIBE_LOCAL_WORKER", True):
+        return None
+    client = client or LocalWorkerClient()
+    status = client.ping()
+    if not status or not status.get("ready"):
+        return None
+    if status.get("version") != PROTOCOL_VERSION:
+        logger.warning(
+            f"Inferenz-Worker mit Protokoll {status.get('version')} ignoriert "
+            f"(erwartet {PROTOCOL_VERSION})"
+        )
+        return None
+    logger.info(
+        f"Nutze warmen Inferenz-Worker (pid={status.get('pid')}, "
+        f"model={status.get('model')}, port={client.port})"
+    )
+    return WorkerProvider(client)
+
+
+def share_provider(
+    provider: Any, model: str | None, worker: LocalWorker | None = None
+) -> LocalWorker | None:
+    """Stellt das warme Modell eines Daemons per Socket bereit.
+
+    Wird nach jedem erfolgreichen Preload aufgerufen; ein bereits laufender
+    `worker` übernimmt nur das neue Default-Modell. Ist der Port belegt (z.B.
+    durch einen eigenständigen Worker), bleibt es bei `None`.
+    """
+    from .local import LocalProvider
+
+    if not isinstance(provider, LocalProvider):
+        # WorkerProvider: das Modell liegt bereits in einem Worker
+        return worker
+    if worker is not None:
+        worker.mark_ready(model)
+        return worker
+    if not get_env_bool_default("PULSESCRIBE_LOCAL_WORKER", True):
+        return None
+    shared = LocalWorker(provider, model)
+    try:
+        port = shared.start()
+    except OSError as e:
+        logger.debug(f"Modell-Freigabe nicht möglich (Port belegt?): {e}")
+        return None
+    shared.mark_ready()
+    logger.info(f"Lokales Modell für CLI freigegeben ({LOCAL_WORKER_HOST}:{port})")
+    return shared
+
+
+def transcribe_via_worker(
+    audio_path: Path,
+    model: str | None = None,
+    language: str | None = None,
+    client: LocalWorkerClient | None = None,
+    *,
+    use_cache: bool = True,
+) -> str | None:
+    """Transkribiert über einen laufenden Daemon/Worker, sonst None.
+
+    None bedeutet "niemand antwortet warm" – der Aufrufer lädt dann selbst.
+    """
+    if not get_env_bool_default("PULSESCRIBE_LOCAL_WORKER", True):
+        return None
+    client = client or LocalWorkerClient()
+    status = client.ping()
+    if not status or not status.get("ready"):
+        return None
+    if model and status.get("model") and model != status["model"]:
+        # Anderes Modell: nicht im Daemon nachladen lassen, selbst laden
+        logger.info(
+            f"Worker hält {status['model']} warm, angefragt {model} – lade lokal"
+        )
+        return None
+    t0 = time.perf_counter()
+    try:
+        text = client.transcribe_file(
+            audio_path, model=model, language=language, use_cache=use_cache
+        )
+    except (OSError, WorkerError) as e:
+        logger.warning(f"Transkription über Worker fehlgeschlagen ({e}), lade lokal")
+        return None
+    logger.info(
+        f"Transkription über warmen Worker (pid={status.get('pid')}): "
+        f"{time.perf_counter() - t0:.2f}s"
+    )
+    return text
+
+
+# --------------------------------------------------------------------------- #
+# Entry Point
+# --------------------------------------------------------------------------- #
+
+
+def main(
+    model: str | None = None,
+    port: int = LOCAL_WORKER_PORT,
+    debug: bool = False,
+) -> None:
+    """Startet den Worker im Vordergrund (bis Ctrl+C).
+
+    Ohne --model wird PULSESCRIBE_LOCAL_MODEL bzw. der Default geladen.
+    """
+    from utils.env import load_environment
+    from utils.logging import setup_logging
+
+    from .local import LocalProvider
+
+    load_environment()
+    setup_logging(debug=debug)
+
+    worker = LocalWorker(
+        LocalProvider(), model or os.getenv("PULSESCRIBE_LOCAL_MODEL") or None
+    )
+    try:
+        bound = worker.start(port=port)
+    except OSError as e:
+        print(f"Port {port} nicht verfügbar: {e}", file=sys.stderr)
+        raise SystemExit(1) from None
+    logger.info(f"Inferenz-Worker lauscht auf {LOCAL_WORKER_HOST}:{bound}")
+    worker.preload()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+
+
+__all__ = [
+    "LocalWorker",
+    "LocalWorkerClient",
+    "ModelMismatchError",
+    "WorkerError",
+    "WorkerProvider",
+    "connect_worker",
+    "share_provider",
+    "transcribe_via_worker",
+]
+
+
+if __name__ == "__main__":
+    import typer
+
+    typer.run(main)
@@ -3,17 +3,34 @@
 Nutzt die OpenAI Transcription API mit gpt-4o-transcribe oder whisper-1.
 """
 
+import asyncio
 import logging
 import os
-from pathlib import Path
+
+from audio.memory import (
+    AudioSource,
+    audio_codec,
+    audio_size,
+    prepare_upload,
+    upload_file,
+)
+from utils.http_client import (
+    on_http_swap,
+    sdk_async_http_client,
+    sdk_http_client,
+    sdk_timeout,
+)
+from utils.prewarm import warm_client
 from utils.timing import timed_operation
 
-from config import DEFAULT_API_MODEL
+from config import DEFAULT_API_MODEL, OPENAI_TIMEOUT
 
 logger = logging.getLogger("pulsescribe.providers.openai")
 
 # Singleton Client
 _client = None
+# Async-Client mit dem HTTP-Client, auf dem er gebaut wurde (Loop-gebunden)
+_async_client: tuple | None = None
 
 
 def _get_client():
@@ -21,11 +38,42 @@ def _get_client():
     global _client
     if _client is None:
         from openai import OpenAI
-        _client = OpenAI()
+        _client = OpenAI(
+            http_client=sdk_http_client("openai"),
+            timeout=sdk_timeout("openai", OPENAI_TIMEOUT),
+        )
         logger.debug("OpenAI-Client initialisiert")
     return _client
 
 
+def _get_async_client():
+    """Gibt AsyncOpenAI-Client für den laufenden Event-Loop zurück (Lazy Init)."""
+    global _async_client
+    http_client = sdk_async_http_client("openai")
+    if _async_client is None or _async_client[0] is not http_client:
+        from openai import AsyncOpenAI
+
+        _async_client = (
+            http_client,
+            AsyncOpenAI(
+                http_client=http_client,
+                timeout=sdk_timeout("openai", OPENAI_TIMEOUT),
+            ),
+        )
+        logger.debug("AsyncOpenAI-Client initialisiert")
+    return _async_client[1]
+
+
+def _reset_client() -> None:
+    """Verwirft die Clients (neue Keys/Transport nach Settings-Reload)."""
+    global _client, _async_client
+    _client = None
+    _async_client = None
+
+
+on_http_swap(_reset_client)
+
+
 class OpenAIProvider:
     """OpenAI Whisper API Provider.
 
@@ -55,42 +103,90 @@ class OpenAIProvider:
 
     def transcribe(
         self,
-        audio_path: Path,
+        audio_path: AudioSource,
         model: str | None = None,
         language: str | None = None,
         response_format: str = "text",
+        prompt: str | None = None,
     ) -> str:
         """Transkribiert Audio über die OpenAI API.
 
         Args:
-            audio_path: Pfad zur Audio-Datei
+            audio_path: Pfad zur Audio-Datei oder InMemoryAudio
             model: Modell (default: gpt-4o-transcribe)
             language: Sprachcode oder None für Auto-Detection
             response_format: Output-Format (text, json, srt, vtt)
+            prompt: Optionaler Kontext (Vokabular, vorheriger Text)
 
         Returns:
             Transkribierter Text
         """
-        self._validate()
+        upload, params = self._prepare(
+            audio_path, model, language, response_format, prompt
+        )
+        client = _get_client()
 
-        model = model or self.default_model
-        audio_kb = audio_path.stat().st_size // 1024
+        with timed_operation("OpenAI-Transkription", logger=logger, include_session=False):
+            with upload_file(upload) as audio_file:
+                response = client.audio.transcriptions.create(file=audio_file, **params)
 
-        logger.info(f"OpenAI: {model}, {audio_kb}KB, lang={language or 'auto'}")
+        return self._result(response, response_format)
 
-        client = _get_client()
+    async def transcribe_async(
+        self,
+        audio_path: AudioSource,
+        model: str | None = None,
+        language: str | None = None,
+        response_format: str = "text",
+        prompt: str | None = None,
+    ) -> str:
+        """Wie `transcribe()`, aber über den AsyncOpenAI-Client.
+
+        Das Kodieren des Uploads läuft in einem Worker-Thread, damit parallele
+        Aufrufe den Event-Loop nicht blockieren.
+        """
+        upload, params = await asyncio.to_thread(
+            self._prepare, audio_path, model, language, response_format, prompt
+        )
+        client = _get_async_client()
 
         with timed_operation("OpenAI-Transkription", logger=logger, include_session=False):
-            with audio_path.open("rb") as audio_file:
-                params = {
-                    "model": model,
-                    "file": audio_file,
-                    "response_format": response_format,
-                }
-                if language:
-                    params["language"] = language
-                response = client.audio.transcriptions.create(**params)
+            with upload_file(upload) as audio_file:
+                response = await client.audio.transcriptions.create(
+                    file=audio_file, **params
+                )
+
+        return self._result(response, response_format)
 
+    def _prepare(
+        self,
+        audio_path: AudioSource,
+        model: str | None,
+        language: str | None,
+        response_format: str,
+        prompt: str | None,
+    ) -> tuple[AudioSource, dict]:
+        """Validiert, kodiert den Upload und baut die Request-Parameter."""
+        self._validate()
+
+        model = model or self.default_model
+        upload = prepare_upload(audio_path, self.name)
+        audio_kb = audio_size(upload) // 1024
+
+        logger.info(
+            f"OpenAI: {model}, {audio_kb}KB {audio_codec(upload)}, "
+            f"lang={language or 'auto'}"
+        )
+
+        params = {"model": model, "response_format": response_format}
+        if language:
+            params["language"] = language
+        if prompt:
+            params["prompt"] = prompt
+        return upload, params
+
+    @staticmethod
+    def _result(response, response_format: str) -> str:
         # API gibt bei format="text" String zurück, sonst Objekt
         if response_format == "text":
             result = response
@@ -101,6 +197,15 @@ class OpenAIProvider:
 
         return result
 
+    def prewarm(self) -> float | None:
+        """Öffnet die TLS-Verbindung vorab (beim Hotkey-Down).
+
+        Returns:
+            Dauer des Warm-Requests in Sekunden oder None
+        """
+        self._validate()
+        return warm_client(_get_client(), "OpenAI")
+
     def supports_streaming(self) -> bool:
         """OpenAI API unterstützt kein Streaming."""
         return False
@@ -0,0 +1,304 @@
+"""Segment-Upload während der Aufnahme für REST-Provider.
+
+Bei Groq, OpenAI und Deepgram REST geht ohne Streaming erst beim Stop etwas
+über die Leitung – Upload und Server-Decode der gesamten Aufnahme liegen im
+kritischen Pfad. `SegmentedUploadSession` schneidet die laufende Aufnahme
+deshalb an natürlichen Sprechpausen, sobald ein Segment `segment_s` Sekunden
+erreicht hat, und lädt jedes fertige Segment sofort auf einem Worker-Pool hoch.
+
+Beim Stop ist nur noch das letzte Segment offen. Die Ergebnisse werden in
+Aufnahme-Reihenfolge zusammengesetzt; doppelte Wörter an Segmentgrenzen
+werden entfernt. OpenAI und Groq bekommen als Prompt das Vokabular und – falls
+schon fertig – das Ende des vorherigen Segments.
+
+Audio und Pausen kommen aus `CaptureBuffer` und `EnergyTracker` der Aufnahme,
+die Session hält selbst keine Kopie.
+"""
+
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from config import (
+    SEGMENT_UPLOAD_INTERVAL,
+    SEGMENT_UPLOAD_SECONDS,
+    SEGMENT_UPLOAD_WORKERS,
+)
+from utils.vocabulary import load_vocabulary
+
+from .health import get_registry
+
+if TYPE_CHECKING:
+    from audio.buffer import CaptureBuffer
+    from audio.energy import EnergyTracker
+
+    from .base import TranscriptionProvider
+
+logger = logging.getLogger("pulsescribe.providers.segment_upload")
+
+# Modi, für die der Segment-Upload greift (REST, kein Streaming)
+SEGMENT_UPLOAD_MODES = ("openai", "groq", "deepgram")
+# Provider mit Whisper-Prompt (Deepgram nutzt Vokabular bereits als keyterm)
+PROMPT_MODES = ("openai", "groq")
+
+# Stille vor dem ersten Sprachsegment, die mitgeschickt wird
+LEAD_PAD_S = 0.25
+# Whisper-Prompts sind auf ~224 Tokens begrenzt
+MAX_PROMPT_CHARS = 600
+PREVIOUS_TEXT_CHARS = 200
+# Max. Wortanzahl, die an einer Segmentgrenze doppelt sein kann
+MAX_BOUNDARY_OVERLAP = 8
+
+_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _normalize(word: str) -> str:
+    return _WORD_RE.sub("", word).lower()
+
+
+def merge_boundary(previous: str, current: str) -> str:
+    """Hängt `current` an `previous` an, ohne doppelte Wörter an der Grenze.
+
+    Gesucht wird die längste Wortfolge (max. `MAX_BOUNDARY_OVERLAP`), mit der
+    `previous` endet und `current` beginnt – Groß-/Kleinschreibung und
+    Satzzeichen werden ignoriert.
+    """
+    prev_words = previous.split()
+    words = current.split()
+    if not prev_words:
+        return " ".join(words)
+    limit = min(MAX_BOUNDARY_OVERLAP, len(prev_words), len(words))
+    for k in range(limit, 0, -1):
+        tail = [_normalize(w) for w in prev_words[-k:]]
+        head = [_normalize(w) for w in words[:k]]
+        if tail == head and any(tail):
+            words = words[k:]
+            break
+    return " ".join(prev_words + words)
+
+
+def stitch(texts: list[str]) -> str:
+    """Setzt Segment-Transkripte in Reihenfolge zusammen."""
+    result = ""
+    for text in texts:
+        text = text.strip()
+        if text:
+            result = merge_boundary(result, text)
+    return result
+
+
+def build_prompt(keywords: list[str], previous_text: str = "") -> str | None:
+    """Whisper-Prompt aus Vokabular und dem Ende des vorherigen Segments."""
+    vocab = ", ".join(keywords)[: MAX_PROMPT_CHARS - PREVIOUS_TEXT_CHARS]
+    tail = previous_text.strip()[-PREVIOUS_TEXT_CHARS:]
+    prompt = " ".join(p for p in (vocab, tail) if p)
+    return prompt or None
+
+
+class SegmentedUploadSession:
+    """Schneidet eine laufende Aufnahme an Pausen und lädt Segmente parallel hoch.
+
+    Thread-Modell: Ein Watcher-Thread prüft alle `interval_s` Sekunden, ob ein
+    Schnittpunkt vorliegt; Uploads laufen auf einem `ThreadPoolExecutor`.
+    `finish()` lädt das letzte Segment hoch und wartet auf alle Ergebnisse.
+    """
+
+    def __init__(
+        self,
+        provider: "TranscriptionProvider",
+        capture: "CaptureBuffer",
+        energy: "EnergyTracker",
+        *,
+        mode: str,
+        model: str | None = None,
+        language: str | None = None,
+        segment_s: float = SEGMENT_UPLOAD_SECONDS,
+        interval_s: float = SEGMENT_UPLOAD_INTERVAL,
+        max_workers: int = SEGMENT_UPLOAD_WORKERS,
+    ) -> None:
+        self._provider = provider
+        self._capture = capture
+        self._energy = energy
+        self._mode = mode
+        self._model = model
+        self._language = language
+        self._sample_rate = capture.sample_rate
+        self._segment_samples = int(max(1.0, segment_s) * self._sample_rate)
+        self._interval_s = max(0.05, interval_s)
+        self._keywords: list[str] | None = None
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="SegmentUpload"
+        )
+        self._futures: list[Future] = []
+        self._cursor: int | None = None  # Start des nächsten Segments (Sample)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._finished = False
+
+    # ------------------------------------------------------------------ #
+    # Öffentliche API
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Startet den Watcher-Thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="SegmentUploadWatcher"
+        )
+        self._thread.start()
+
+    @property
+    def segments_sent(self) -> int:
+        return len(self._futures)
+
+    def step(self) -> None:
+        """Schneidet ein Segment ab, falls eine passende Pause vorliegt."""
+        with self._lock:
+            if self._finished:
+                return
+            start = self._segment_start()
+            if start is None:
+                return
+            cut = self._find_cut(start)
+            if cut is None:
+                return
+            self._submit(start, cut)
+            self._cursor = cut
+
+    def finish(self, start: int = 0, end: int | None = None) -> str:
+        """Lädt den Rest hoch, wartet auf alle Segmente und setzt sie zusammen.
+
+        Args:
+            start: Erstes Sample der getrimmten Aufnahme
+            end: Letztes Sample (exklusiv) der getrimmten Aufnahme
+
+        Raises:
+            Exception: Erster Fehler eines Segment-Uploads (Aufrufer kann
+                dann die ganze Aufnahme anders transkribieren)
+        """
+        self._join_watcher()
+        with self._lock:
+            self._finished = True
+            end = len(self._capture) if end is None else end
+            rest_start = max(start, self._cursor or 0)
+            if end > rest_start:
+                self._submit(rest_start, end)
+            futures = list(self._futures)
+
+        t0 = time.perf_counter()
+        try:
+            texts = [str(f.result()) for f in futures]
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(
+            f"Segment-Upload: {len(futures)} Segmente, "
+            f"Warten beim Stop={time.perf_counter() - t0:.2f}s"
+        )
+        return stitch(texts)
+
+    def cancel(self) -> None:
+        """Beendet die Session ohne Ergebnis (idempotent)."""
+        self._join_watcher()
+        with self._lock:
+            self._finished = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------ #
+    # Intern
+    # ------------------------------------------------------------------ #
+
+    def _join_watcher(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            try:
+                self.step()
+            except Exception as e:
+                # Best-Effort: finish() lädt dann einfach ein größeres Restsegment hoch
+                logger.warning(f"Segment-Upload: Schnitt fehlgeschlagen: {e}")
+                return
+
+    def _segment_start(self) -> int | None:
+        """Start des offenen Segments; vor der ersten Sprache noch keiner."""
+        if self._cursor is not None:
+            return self._cursor
+        segments = self._energy.speech_segments
+        if not segments:
+            return None
+        return max(0, int((segments[0][0] - LEAD_PAD_S) * self._sample_rate))
+
+    def _find_cut(self, start: int) -> int | None:
+        """Mitte der ersten Sprechpause nach `segment_s` Sekunden."""
+        earliest = start + self._segment_samples
+        segments = self._energy.speech_segments
+        for (_, pause_start), (pause_end, _) in zip(segments, segments[1:]):
+            cut = int((pause_start + pause_end) / 2 * self._sample_rate)
+            if cut >= earliest:
+                return cut
+        return None
+
+    def _submit(self, start: int, end: int) -> None:
+        # View bleibt gültig, auch wenn der CaptureBuffer weiter wächst
+        audio = self._capture.view()[start:end]
+        index = len(self._futures)
+        previous = self._futures[-1] if self._futures else None
+        logger.debug(
+            f"Segment-Upload: Segment {index} "
+            f"({start / self._sample_rate:.2f}s–{end / self._sample_rate:.2f}s)"
+        )
+        self._futures.append(
+            self._executor.submit(self._transcribe, index, audio, previous)
+        )
+
+    def _transcribe(self, index: int, audio, previous: Future | None) -> str:
+        from audio.memory import InMemoryAudio, upload_codec
+
+        kwargs = {}
+        if self._mode in PROMPT_MODES:
+            previous_text = ""
+            if previous is not None and previous.done() and not previous.exception():
+                previous_text = str(previous.result())
+            prompt = build_prompt(self._vocabulary(), previous_text)
+            if prompt:
+                kwargs["prompt"] = prompt
+
+        upload = InMemoryAudio.from_array(
+            audio, self._sample_rate, codec=upload_codec(self._mode)
+        )
+        t0 = time.perf_counter()
+        text = get_registry().call(
+            self._mode,
+            lambda: self._provider.transcribe(
+                upload, model=self._model, language=self._language, **kwargs
+            ),
+            audio_s=len(audio) / self._sample_rate,
+        )
+        logger.debug(
+            f"Segment-Upload: Segment {index} fertig nach "
+            f"{time.perf_counter() - t0:.2f}s"
+        )
+        return text or ""
+
+    def _vocabulary(self) -> list[str]:
+        if self._keywords is None:
+            self._keywords = list(load_vocabulary().get("keywords", []))
+        return self._keywords
+
+
+__all__ = [
+    "SEGMENT_UPLOAD_MODES",
+    "SegmentedUploadSession",
+    "build_prompt",
+    "merge_boundary",
+    "stitch",
+]
@@ -24,7 +24,6 @@ import logging
 import os
 import queue
 import sys
-import tempfile
 import threading
 import time
 import weakref
@@ -52,7 +51,7 @@ def emergency_log(msg: str):
 emergency_log("=== Booting PulseScribe Daemon ===")
 
 try:
-    from config import INTERIM_FILE, VAD_THRESHOLD, WHISPER_SAMPLE_RATE
+    from config import VAD_THRESHOLD, WHISPER_SAMPLE_RATE
     from config import TRANSCRIBING_TIMEOUT, PRELOAD_WARMUP_DURATION
     from utils import setup_logging, show_error_alert
     from config import DEFAULT_DEEPGRAM_MODEL, DEFAULT_LOCAL_MODEL
@@ -67,6 +66,8 @@ try:
     from whisper_platform import get_sound_player
     from utils.state import AppState, DaemonMessage, MessageType
     from utils.hold_state import HoldHotkeyState
+    from utils.interim import interim_channel
+    from utils.loop_thread import LoopThread
     from utils import parse_hotkey, paste_transcript
     from utils.permissions import (
         check_microphone_permission,
@@ -164,10 +165,9 @@ class PulseScribeDaemon:
         # Result-Queue für Transkripte
         self._result_queue: queue.Queue[DaemonMessage | Exception] = queue.Queue()
 
-        # NSTimer für Result-Polling und Interim-Polling
+        # NSTimer für Result-Polling; Interims kommen per Callback (utils.interim)
         self._result_timer = None
-        self._interim_timer = None
-        self._last_interim_mtime = 0.0
+        self._interim_unsubscribe = None
         # Watchdog-Timer: Verhindert hängendes Overlay bei Worker-Problemen
         self._transcribing_watchdog = None
 
@@ -179,6 +179,10 @@ class PulseScribeDaemon:
 
         # Provider-Cache: vermeidet Re-Init (z.B. lokales Modell laden)
         self._provider_cache: dict[str, object] = {}
+        # Persistenter Event-Loop für Streaming-Sessions und Standby-Socket
+        self._loop_thread = LoopThread("StreamingLoop")
+        # Vorab verbundene Deepgram-WebSocket (lazy, nur im Deepgram-Streaming)
+        self._deepgram_standby = None
         # Effective mode for the current recording run (may differ after fallbacks).
         self._run_mode: str | None = None
         # Test dictation run (in-app, no auto-paste)
@@ -201,6 +205,7 @@ class PulseScribeDaemon:
         self._pending_hotkey_reconfigure = False
         # Preload-Status für lokales Modell (für Performance-Debugging)
         self._local_preload_complete = threading.Event()
+        self._local_share = None  # LocalWorker: warmes Modell für CLI-Clients
 
     # =============================================================================
     # Thread-safe State Properties
@@ -403,7 +408,13 @@ class PulseScribeDaemon:
         """Gibt gecachten Provider zurück oder erstellt ihn."""
         provider = self._provider_cache.get(mode)
         if provider is None:
-            provider = get_provider(mode)
+            if mode == "local":
+                # Warmer Out-of-Process-Worker spart Modell-Load und GIL-Konkurrenz
+                from providers.local_worker import connect_worker
+
+                provider = connect_worker()
+            if provider is None:
+                provider = get_provider(mode)
             self._provider_cache[mode] = provider
         return provider
 
@@ -449,42 +460,6 @@ class PulseScribeDaemon:
                 backend = "whisper"
         return backend or None
 
-    @staticmethod
-    def _trim_silence(
-        data,
-        threshold: float,
-        sample_rate: int,
-        pad_s: float = 0.15,
-    ):
-        """Schneidet Stille am Anfang/Ende ab (RMS über kurze Fenster)."""
-        import numpy as np
-
-        mono = data.squeeze()
-        if mono.ndim != 1:
-            mono = mono.reshape(-1)
-        window = int(sample_rate * 0.02)  # 20ms
-        hop = int(sample_rate * 0.01)  # 10ms
-        if mono.shape[0] <= window:
-            return mono.astype(np.float32, copy=False)
-        frame_count = (mono.shape[0] - window) // hop + 1
-        if frame_count <= 0:
-            return mono.astype(np.float32, copy=False)
-        strides = (mono.strides[0] * hop, mono.strides[0])
-        frames = np.lib.stride_tricks.as_strided(
-            mono, shape=(frame_count, window), strides=strides
-        )
-        rms = np.sqrt(np.mean(frames**2, axis=1))
-        # Für Trimming ist ein "inklusive" Threshold sinnvoller, um leise
-        # Auskling-Phoneme nicht abzuschneiden (>= statt >).
-        active = rms >= threshold
-        if not np.any(active):
-            return mono.astype(np.float32, copy=False)
-        first = int(np.argmax(active))
-        last = int(len(active) - np.argmax(active[::-1]) - 1)
-        start = max(0, first * hop - int(pad_s * sample_rate))
-        end = min(mono.shape[0], last * hop + window + int(pad_s * sample_rate))
-        return mono[start:end].astype(np.float32, copy=False)
-
     def _preload_local_model_async(self) -> None:
         """Lädt lokales Modell im Hintergrund vor (reduziert erste Latenz)."""
         if self.mode != "local":
@@ -513,6 +488,8 @@ class PulseScribeDaemon:
                     runtime_info = f", Device: {device_str}"
                     if compute:
                         runtime_info += f", Compute: {compute}"
+                    if info.get("replicas"):
+                        runtime_info += f", Replicas: {info['replicas']}"
                 logger.info(f"Lokales Modell vorab geladen ({t_preload:.2f}s{runtime_info})")
                 warmup_flag = get_env_bool("PULSESCRIBE_LOCAL_WARMUP")
                 backend = getattr(provider, "backend", None) or getattr(
@@ -539,7 +516,11 @@ class PulseScribeDaemon:
                         logger.debug("Lokales Modell warmup abgeschlossen")
                     except Exception as e:
                         logger.debug(f"Lokales Modell warmup fehlgeschlagen: {e}")
+                self._share_local_model(provider)
                 self._local_preload_complete.set()
+                # Realistische Längen nachwärmen; bricht bei Aufnahmestart ab
+                if hasattr(provider, "start_bucket_warmup"):
+                    provider.start_bucket_warmup(self.model, self.language)  # type: ignore[attr-defined]
                 # Zurück zu IDLE nach erfolgreichem Preload
                 self._update_state(AppState.IDLE)
                 # Auditive Rückmeldung: User kann jetzt mit minimaler Latenz aufnehmen
@@ -552,6 +533,15 @@ class PulseScribeDaemon:
 
         threading.Thread(target=_preload, daemon=True, name="LocalPreload").start()
 
+    def _share_local_model(self, provider) -> None:
+        """Gibt das warme Modell per Socket für `transcribe.py --mode local` frei."""
+        try:
+            from providers.local_worker import share_provider
+
+            self._local_share = share_provider(provider, self.model, self._local_share)
+        except Exception as e:
+            logger.debug(f"Modell-Freigabe fehlgeschlagen: {e}")
+
     def _update_state(self, state: AppState, text: str | None = None) -> None:
         """Aktualisiert State und benachrichtigt UI-Controller.
 
@@ -1237,8 +1227,13 @@ class PulseScribeDaemon:
         self._recording = True
         self._update_state(AppState.LISTENING)
 
-        # Interim-Datei löschen, um veralteten Text zu vermeiden
-        INTERIM_FILE.unlink(missing_ok=True)
+        # Bucket-Warmup darf die echte Aufnahme nie verzögern
+        local_provider = self._provider_cache.get("local")
+        if local_provider is not None and hasattr(local_provider, "cancel_warmup"):
+            local_provider.cancel_warmup()
+
+        # Interim zurücksetzen, um veralteten Text zu vermeiden
+        interim_channel.clear()
 
         # Neues Stop-Event für diese Aufnahme
         self._stop_event = threading.Event()
@@ -1249,6 +1244,11 @@ class PulseScribeDaemon:
         use_streaming = effective_mode == "deepgram" and get_env_bool_default(
             "PULSESCRIBE_STREAMING", True
         )
+        # Lokales Pseudo-Streaming läuft im RecordingWorker, liefert aber
+        # Interims über denselben Kanal wie Deepgram.
+        use_local_streaming = effective_mode == "local" and get_env_bool_default(
+            "PULSESCRIBE_LOCAL_STREAMING", False
+        )
         self._run_mode = effective_mode
 
         if use_streaming:
@@ -1268,51 +1268,88 @@ class PulseScribeDaemon:
         )
         self._worker_thread.start()
 
-        # Interim-Polling starten (nur bei Streaming sinnvoll, aber schadet nicht)
-        if use_streaming:
-            self._start_interim_polling()
+        # TLS-Verbindungen während der Aufnahme aufbauen statt danach
+        self._start_connection_prewarm(effective_mode, use_streaming)
+
+        # Interim-Updates abonnieren (nur bei Streaming)
+        if use_streaming or use_local_streaming:
+            self._start_interim_updates()
 
         # Result-Polling sofort starten für Audio-Levels und VAD
         self._start_result_polling()
 
-    def _start_interim_polling(self) -> None:
-        """Startet NSTimer für Interim-Text-Polling.
+    def _start_connection_prewarm(self, mode: str, use_streaming: bool) -> None:
+        """Wärmt Transkriptions- und Refine-Verbindung im Hintergrund vor.
 
-        Verwendet weakref um Circular References zu vermeiden:
-        NSTimer → Block → self → NSTimer würde Memory-Leak verursachen.
+        Hält sie warm, bis der Worker (inkl. Refine) fertig ist.
         """
-        from Foundation import NSTimer  # type: ignore[import-not-found]
+        if not get_env_bool_default("PULSESCRIBE_PREWARM", True):
+            return
+        worker = self._worker_thread
+        if worker is None:
+            return
+
+        from utils.prewarm import keep_warm
 
-        self._last_interim_mtime = 0.0
+        targets = []
+        if mode in ("openai", "groq", "deepgram") and not use_streaming:
+
+            def _warm_provider():
+                provider = self._get_provider(mode)
+                if hasattr(provider, "prewarm"):
+                    return provider.prewarm()
+                return None
+
+            targets.append((mode, _warm_provider))
+        if self.refine:
+
+            def _warm_refine():
+                from refine.llm import prewarm_refine_client
+
+                return prewarm_refine_client(self.refine_provider)
+
+            targets.append(("refine", _warm_refine))
+        if targets:
+            keep_warm(targets, until=lambda: not worker.is_alive())
+
+    def _start_interim_updates(self) -> None:
+        """Abonniert Interim-Texte aus dem Stream und zeigt sie sofort an.
+
+        Der Callback läuft im Stream-Thread; die Anzeige wird per
+        NSOperationQueue auf den Main-Thread gebracht. Liegt dort schon ein
+        neuerer Stand vor, wird das ältere Update übersprungen.
+        """
+        from Foundation import NSOperationQueue  # type: ignore[import-not-found]
+
+        self._stop_interim_updates()
+        interim_channel.reset_latency()
         weak_self = weakref.ref(self)
 
-        def poll_interim(_timer) -> None:
-            daemon = weak_self()
-            if daemon is None:
+        def on_interim(update) -> None:
+            if not update.text:
                 return
-            if daemon._current_state != AppState.RECORDING:
-                return
-            try:
-                mtime = INTERIM_FILE.stat().st_mtime
-                if mtime > daemon._last_interim_mtime:
-                    daemon._last_interim_mtime = mtime
-                    interim_text = INTERIM_FILE.read_text().strip()
-                    if interim_text:
-                        daemon._update_state(AppState.RECORDING, interim_text)
-            except FileNotFoundError:
-                pass
-            except OSError:
-                pass
 
-        self._interim_timer = NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-            0.2, True, poll_interim
-        )
+            def show() -> None:
+                daemon = weak_self()
+                if daemon is None or daemon._current_state != AppState.RECORDING:
+                    return
+                if interim_channel.latest().seq != update.seq:
+                    return
+                daemon._do_ui_update(AppState.RECORDING, update.text)
+                interim_channel.record_display(update)
+
+            NSOperationQueue.mainQueue().addOperationWithBlock_(show)
 
-    def _stop_interim_polling(self) -> None:
-        """Stoppt Interim-Polling."""
-        if self._interim_timer:
-            self._interim_timer.invalidate()
-            self._interim_timer = None
+        self._interim_unsubscribe = interim_channel.subscribe(on_interim)
+
+    def _stop_interim_updates(self) -> None:
+        """Beendet das Interim-Abo und loggt die gemessene Anzeige-Latenz."""
+        if self._interim_unsubscribe:
+            self._interim_unsubscribe()
+            self._interim_unsubscribe = None
+            summary = interim_channel.latency_summary()
+            if summary:
+                logger.info(summary)
 
     def _on_audio_level(self, level: float) -> None:
         """Callback für Audio-Level aus dem Worker-Thread."""
@@ -1329,72 +1366,158 @@ class PulseScribeDaemon:
 
         Läuft in eigenem Thread, weil Deepgram async ist,
         aber der Main-Thread für QuickMacHotKey und UI frei bleiben muss.
+        Die Session selbst läuft im persistenten Streaming-Loop
+        (`self._loop_thread`); der Worker wartet nur auf ihr Ergebnis.
 
         Lifecycle: Start → Mikrofon → Stream → Stop-Event → Finalize → Result
 
         Garantiert: Sendet IMMER entweder TRANSCRIPT_RESULT oder Exception.
         """
-        import asyncio
-
         logger.debug("StreamingWorker gestartet")
-        transcript = ""
 
         try:
-            # Deepgram nutzt eigene Modellnamen (nova-3, etc.)
-            # self.model ist für lokale Modelle (turbo, large-v3)
-            model = DEFAULT_DEEPGRAM_MODEL
+            transcript = self._loop_thread.run(
+                self._streaming_session(submitted_at=time.perf_counter())
+            )
+            logger.debug("Sende TRANSCRIPT_RESULT")
+            self._result_queue.put(
+                DaemonMessage(type=MessageType.TRANSCRIPT_RESULT, payload=transcript)
+            )
+        except Exception as e:
+            logger.exception(f"Streaming-Worker Fehler: {e}")
+            emergency_log(f"StreamingWorker Exception: {type(e).__name__}: {e}")
+            self._result_queue.put(e)
+
+    async def _streaming_session(self, submitted_at: float) -> str:
+        """Deepgram-Stream und Refine einer Aufnahme (im Streaming-Loop).
+
+        Loop, Standby-Socket und async HTTP-Clients bleiben zwischen den
+        Aufnahmen bestehen; pro Session bleibt nur die Übergabe an den Loop.
+        """
+        import asyncio
+
+        setup_ms = (time.perf_counter() - submitted_at) * 1000
+        logger.info(f"Streaming-Session: Loop-Übergabe {setup_ms:.2f}ms")
+
+        # Deepgram nutzt eigene Modellnamen (nova-3, etc.)
+        # self.model ist für lokale Modelle (turbo, large-v3)
+        model = DEFAULT_DEEPGRAM_MODEL
+        logger.debug(f"Starte deepgram_stream_core (model={model})")
+        transcript = await deepgram_stream_core(
+            model=model,
+            language=self.language,
+            play_ready=True,
+            external_stop_event=self._stop_event,
+            audio_level_callback=self._on_audio_level,
+            standby=self._deepgram_standby if self._standby_enabled() else None,
+        )
+        logger.debug(f"deepgram_stream_core abgeschlossen: {len(transcript)} Zeichen")
+
+        # LLM-Nachbearbeitung (optional)
+        if self.refine and transcript:
+            self._result_queue.put(
+                DaemonMessage(type=MessageType.STATUS_UPDATE, payload=AppState.REFINING)
+            )
+            from refine.llm import maybe_refine_transcript
+
+            # Sync-SDK-Call: im Executor, damit der Loop frei bleibt
+            transcript = await asyncio.to_thread(
+                maybe_refine_transcript,
+                transcript,
+                refine=True,
+                refine_model=self.refine_model,
+                refine_provider=self.refine_provider,
+                context=self.context,
+            )
+        return transcript
+
+    def _standby_enabled(self) -> bool:
+        """Standby-WebSocket nur für Deepgram-Streaming mit API-Key."""
+        return (
+            self.mode == "deepgram"
+            and get_env_bool_default("PULSESCRIBE_STREAMING", True)
+            and get_env_bool_default("PULSESCRIBE_DEEPGRAM_STANDBY", True)
+            and bool(os.getenv("DEEPGRAM_API_KEY"))
+        )
+
+    def _refresh_deepgram_standby(self) -> None:
+        """Baut die Standby-WebSocket für die nächste Aufnahme auf (oder schließt sie).
+
+        Nach Settings-Reload neu aufrufen: Modell, Sprache oder Key können sich
+        geändert haben.
+        """
+        standby = self._deepgram_standby
+        if not self._standby_enabled():
+            if standby is not None:
+                standby.discard()
+            return
+        if standby is None:
+            from providers.deepgram_standby import DeepgramStandby
 
-            # Eigener Event-Loop, da wir nicht im Main-Thread sind
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            standby = self._deepgram_standby = DeepgramStandby(
+                loop_thread=self._loop_thread
+            )
+        else:
+            # Alter Socket kann noch den alten Key oder die alte Sprache tragen
+            standby.discard()
+
+        language = self.language
+
+        def _prepare() -> None:
+            from config import get_input_device
+            from providers.deepgram_standby import StandbyKey
 
             try:
-                logger.debug(f"Starte deepgram_stream_core (model={model})")
-                transcript = loop.run_until_complete(
-                    deepgram_stream_core(
-                        model=model,
-                        language=self.language,
-                        play_ready=True,
-                        external_stop_event=self._stop_event,
-                        audio_level_callback=self._on_audio_level,
-                    )
-                )
-                logger.debug(
-                    f"deepgram_stream_core abgeschlossen: {len(transcript)} Zeichen"
-                )
+                # Sample-Rate des Mikrofons steht in der URL
+                _device, sample_rate = get_input_device()
+            except Exception as e:
+                logger.debug(f"Deepgram-Standby: Eingabegerät unbekannt ({e})")
+                return
+            standby.prepare(
+                StandbyKey(DEFAULT_DEEPGRAM_MODEL, language, sample_rate)
+            )
 
-                # LLM-Nachbearbeitung (optional)
-                if self.refine and transcript:
-                    self._result_queue.put(
-                        DaemonMessage(
-                            type=MessageType.STATUS_UPDATE, payload=AppState.REFINING
-                        )
-                    )
-                    from refine.llm import maybe_refine_transcript
-
-                    transcript = maybe_refine_transcript(
-                        transcript,
-                        refine=True,
-                        refine_model=self.refine_model,
-                        refine_provider=self.refine_provider,
-                        context=self.context,
-                    )
+        threading.Thread(
+            target=_prepare, daemon=True, name="DeepgramStandbyPrepare"
+        ).start()
 
-                logger.debug("Sende TRANSCRIPT_RESULT")
-                self._result_queue.put(
-                    DaemonMessage(
-                        type=MessageType.TRANSCRIPT_RESULT, payload=transcript
-                    )
-                )
+    def _hedge_target(self, mode: str, audio_data, upload):
+        """Sekundär-Provider für Hedged Requests (PULSESCRIBE_HEDGE_PROVIDER).
 
-            finally:
-                loop.close()
-                logger.debug("Event-Loop geschlossen")
+        Returns:
+            (Provider-Name, Aufruf) oder None, wenn Hedging aus ist
+        """
+        target = (os.getenv("PULSESCRIBE_HEDGE_PROVIDER") or "").strip().lower()
+        if not target or target in ("off", "none", "false") or target == mode:
+            return None
+        if target == "local":
+            # Nur warmes Modell: ein Kaltstart wäre langsamer als jeder Cloud-Call
+            if not self._local_preload_complete.is_set():
+                logger.debug("Hedge übersprungen: lokales Modell nicht geladen")
+                return None
+            provider = self._get_provider("local")
+            if not hasattr(provider, "transcribe_audio"):
+                return None
+            return (
+                "local",
+                lambda: provider.transcribe_audio(  # type: ignore[attr-defined]
+                    audio_data, model=None, language=self.language
+                ),
+            )
+        from providers.health import get_registry
 
-        except Exception as e:
-            logger.exception(f"Streaming-Worker Fehler: {e}")
-            emergency_log(f"StreamingWorker Exception: {type(e).__name__}: {e}")
-            self._result_queue.put(e)
+        if not get_registry().allow(target):
+            logger.debug(f"Hedge übersprungen: Circuit für {target} offen")
+            return None
+        try:
+            provider = self._get_provider(target)
+        except ValueError as e:
+            logger.warning(f"Hedge-Provider '{target}' ungültig: {e}")
+            return None
+        return (
+            target,
+            lambda: provider.transcribe(upload, model=None, language=self.language),
+        )
 
     def _recording_worker(self) -> None:
         """
@@ -1407,28 +1530,70 @@ class PulseScribeDaemon:
         """
         import numpy as np
         import sounddevice as sd
-        import soundfile as sf
+
+        from audio.buffer import CaptureBuffer
+        from audio.energy import EnergyTracker
+        from audio.memory import InMemoryAudio, upload_codec
+        from providers.health import get_registry
+        from providers.hedging import hedged_transcribe
 
         logger.debug("RecordingWorker gestartet")
-        recorded_chunks = []
-        max_rms = 0.0
-        had_speech = False
+        # Vorallokiert: der Callback schreibt ohne Allokation, am Ende Zero-Copy-View
+        capture = CaptureBuffer(WHISPER_SAMPLE_RATE)
+        # Fenster-RMS laufend mitführen: Trimming beim Stop ist nur noch ein Lookup
+        energy = EnergyTracker(WHISPER_SAMPLE_RATE, speech_threshold=VAD_THRESHOLD)
         player = get_sound_player()
+        stream_session = None
+        segment_session = None
 
         try:
+            # Lokales Pseudo-Streaming: dekodiert schon während der Aufnahme
+            if (self._run_mode or self.mode) == "local" and get_env_bool_default(
+                "PULSESCRIBE_LOCAL_STREAMING", False
+            ):
+                local_provider = self._get_provider("local")
+                if hasattr(local_provider, "create_stream_session"):
+                    stream_session = local_provider.create_stream_session(  # type: ignore[attr-defined]
+                        model=self.model,
+                        language=self.language,
+                        on_interim=interim_channel.publish,
+                    )
+                    stream_session.start()
+                    logger.info("Lokales Pseudo-Streaming aktiv")
+
+            # REST-Provider: Segmente an Sprechpausen schon während der Aufnahme hochladen
+            from providers.segment_upload import (
+                SEGMENT_UPLOAD_MODES,
+                SegmentedUploadSession,
+            )
+
+            segment_mode = self._run_mode or self.mode
+            if (
+                segment_mode in SEGMENT_UPLOAD_MODES
+                and get_env_bool_default("PULSESCRIBE_SEGMENT_UPLOAD", False)
+                and get_registry().allow(segment_mode)
+            ):
+                segment_session = SegmentedUploadSession(
+                    self._get_provider(segment_mode),
+                    capture,
+                    energy,
+                    mode=segment_mode,
+                    language=self.language,
+                )
+                segment_session.start()
+                logger.info("Segment-Upload aktiv")
+
             # Ready-Sound
             player.play("ready")
 
             # Aufnahme-Loop
             def callback(indata, frames, time, status):
-                nonlocal max_rms, had_speech
-                recorded_chunks.append(indata.copy())
+                # View in den Puffer – bleibt gültig, auch wenn der Puffer wächst
+                chunk = capture.append(indata)
+                if stream_session is not None:
+                    stream_session.feed(chunk)
                 # RMS Berechnung und Queueing
-                rms = float(np.sqrt(np.mean(indata**2)))
-                if rms > max_rms:
-                    max_rms = rms
-                if rms > VAD_THRESHOLD:
-                    had_speech = True
+                rms = energy.feed(chunk)
                 try:
                     self._result_queue.put_nowait(
                         DaemonMessage(type=MessageType.AUDIO_LEVEL, payload=rms)
@@ -1479,14 +1644,15 @@ class PulseScribeDaemon:
             player.play("stop")
 
             # Speichern
-            if not recorded_chunks:
+            if not len(capture):
                 logger.warning("Keine Audiodaten aufgenommen")
                 # Leeres Ergebnis signalisieren, damit Result-Polling sauber endet.
                 self._result_queue.put(
                     DaemonMessage(type=MessageType.TRANSCRIPT_RESULT, payload="")
                 )
                 return
-            if not had_speech:
+            max_rms = energy.max_rms
+            if not energy.had_speech:
                 logger.info(
                     f"Keine Sprache erkannt (max_rms={max_rms:.4f}) – Transkription übersprungen"
                 )
@@ -1495,11 +1661,12 @@ class PulseScribeDaemon:
                 )
                 return
 
-            audio_data = np.concatenate(recorded_chunks)
+            audio_data = capture.view()
 
             # Silence-Trimming (reduziert Zeit/Kosten bei allen Providern)
             raw_duration = 0.0
             audio_duration = 0.0
+            start, end = 0, len(capture)
             if hasattr(audio_data, "shape"):
                 raw_duration = float(audio_data.shape[0]) / WHISPER_SAMPLE_RATE
                 # Wichtig: VAD_THRESHOLD ist fürs Triggern optimiert und kann am Ende
@@ -1508,17 +1675,17 @@ class PulseScribeDaemon:
                 trim_threshold = VAD_THRESHOLD * 0.5
                 if max_rms > 0:
                     trim_threshold = min(trim_threshold, max_rms * 0.03)
-                trimmed_audio = self._trim_silence(
-                    audio_data,
-                    trim_threshold,
-                    WHISPER_SAMPLE_RATE,
-                    pad_s=0.25,
-                )
+                start, end = energy.trim_bounds(trim_threshold, pad_s=0.25)
+                trimmed_audio = audio_data[start:end]
                 trimmed_duration = float(trimmed_audio.shape[0]) / WHISPER_SAMPLE_RATE
                 if trimmed_duration < raw_duration - 0.05:
                     logger.info(
                         f"Trimmed silence: raw={raw_duration:.2f}s -> trimmed={trimmed_duration:.2f}s"
                     )
+                logger.debug(
+                    f"Sprachanteil: {energy.speech_ratio:.0%}, "
+                    f"{len(energy.speech_segments)} Segmente"
+                )
 
                 audio_duration = trimmed_duration
                 audio_data = trimmed_audio
@@ -1535,136 +1702,156 @@ class PulseScribeDaemon:
                         )
                         audio_duration += tail_s
 
-            # Temp-File erstellen
-            fd, temp_path = tempfile.mkstemp(suffix=".wav")
-            os.close(fd)
+            # Update State: Transcribing
+            # (via Queue nicht direkt möglich, aber _stop_recording setzt es im Main-Thread)
 
-            try:
-                # Update State: Transcribing
-                # (via Queue nicht direkt möglich, aber _stop_recording setzt es im Main-Thread)
-
-                # Transkribieren via Provider
-                mode_for_run = (
-                    self._run_mode
-                    or self.mode
-                    or os.getenv("PULSESCRIBE_MODE", "deepgram")
-                )
-                provider = self._get_provider(mode_for_run)
+            # Transkribieren via Provider
+            mode_for_run = (
+                self._run_mode
+                or self.mode
+                or os.getenv("PULSESCRIBE_MODE", "deepgram")
+            )
+            provider = self._get_provider(mode_for_run)
 
-                # Preload-Status für local mode loggen (Performance-Debugging)
-                if mode_for_run == "local":
-                    preload_ready = self._local_preload_complete.is_set()
-                    logger.debug(
-                        f"Local transcribe start: preload_ready={preload_ready}"
+            # Preload-Status für local mode loggen (Performance-Debugging)
+            if mode_for_run == "local":
+                preload_ready = self._local_preload_complete.is_set()
+                logger.debug(
+                    f"Local transcribe start: preload_ready={preload_ready}"
+                )
+                if not preload_ready:
+                    logger.warning(
+                        "Transkription startet BEVOR Preload fertig ist - "
+                        "dies kann zu erhöhter Latenz führen!"
                     )
-                    if not preload_ready:
-                        logger.warning(
-                            "Transkription startet BEVOR Preload fertig ist - "
-                            "dies kann zu erhöhter Latenz führen!"
-                        )
-                        # On-demand Loading: Zeige LOADING statt TRANSCRIBING
-                        model_name = self.model or "turbo"
-                        self._result_queue.put(
-                            DaemonMessage(
-                                type=MessageType.STATUS_UPDATE,
-                                payload=(AppState.LOADING, f"Loading {model_name}..."),
-                            )
+                    # On-demand Loading: Zeige LOADING statt TRANSCRIBING
+                    model_name = self.model or "turbo"
+                    self._result_queue.put(
+                        DaemonMessage(
+                            type=MessageType.STATUS_UPDATE,
+                            payload=(AppState.LOADING, f"Loading {model_name}..."),
                         )
+                    )
 
-                t0 = time.perf_counter()
-                try:
-                    # self.model ist für lokale Modelle (turbo, large-v3, etc.)
-                    # Andere Provider haben eigene Defaults und sollten None bekommen
-                    model_for_provider = self.model if mode_for_run == "local" else None
-
-                    if mode_for_run == "local" and hasattr(
-                        provider, "transcribe_audio"
-                    ):
+            t0 = time.perf_counter()
+            try:
+                # self.model ist für lokale Modelle (turbo, large-v3, etc.)
+                # Andere Provider haben eigene Defaults und sollten None bekommen
+                model_for_provider = self.model if mode_for_run == "local" else None
+
+                if stream_session is not None:
+                    # Nur der unkommittierte Rest wird noch dekodiert
+                    transcript = stream_session.finish()
+                elif segment_session is not None and mode_for_run == segment_mode:
+                    # Frühere Segmente laufen bereits, nur der Rest wird hochgeladen
+                    transcript = segment_session.finish(start, end)
+                elif mode_for_run == "local" and hasattr(
+                    provider, "transcribe_audio"
+                ):
+                    transcript = provider.transcribe_audio(  # type: ignore[attr-defined]
+                        audio_data, model=model_for_provider, language=self.language
+                    )
+                else:
+                    # Offener Circuit: Provider überspringen, direkt in den Fallback
+                    get_registry().check(mode_for_run)
+                    # Kein Temp-WAV: Upload direkt aus dem Speicher, im Codec des Providers
+                    upload = InMemoryAudio.from_array(
+                        audio_data,
+                        WHISPER_SAMPLE_RATE,
+                        codec=upload_codec(mode_for_run),
+                    )
+                    primary_provider = provider
+                    transcript, winner = hedged_transcribe(
+                        (
+                            mode_for_run,
+                            lambda: primary_provider.transcribe(
+                                upload,
+                                model=model_for_provider,
+                                language=self.language,
+                            ),
+                        ),
+                        self._hedge_target(mode_for_run, audio_data, upload),
+                        audio_s=audio_duration,
+                    )
+                    if winner != mode_for_run:
+                        mode_for_run = winner
+                        provider = self._get_provider(winner)
+            except Exception as e:
+                # Best-effort fallback to local transcription for non-streaming modes
+                # (e.g. missing API keys, provider downtime).
+                if mode_for_run != "local":
+                    logger.warning(
+                        f"Provider '{mode_for_run}' fehlgeschlagen ({e}). Fallback auf local..."
+                    )
+                    provider = self._get_provider("local")
+                    if hasattr(provider, "transcribe_audio"):
                         transcript = provider.transcribe_audio(  # type: ignore[attr-defined]
-                            audio_data, model=model_for_provider, language=self.language
-                        )
-                    else:
-                        sf.write(temp_path, audio_data, WHISPER_SAMPLE_RATE)
-                        transcript = provider.transcribe(
-                            Path(temp_path),
-                            model=model_for_provider,
+                            audio_data,
+                            # Don't pass provider-specific model names (e.g. 'nova-3').
+                            model=None,
                             language=self.language,
                         )
-                except Exception as e:
-                    # Best-effort fallback to local transcription for non-streaming modes
-                    # (e.g. missing API keys, provider downtime).
-                    if mode_for_run != "local":
-                        logger.warning(
-                            f"Provider '{mode_for_run}' fehlgeschlagen ({e}). Fallback auf local..."
-                        )
-                        provider = self._get_provider("local")
-                        if hasattr(provider, "transcribe_audio"):
-                            transcript = provider.transcribe_audio(  # type: ignore[attr-defined]
-                                audio_data,
-                                # Don't pass provider-specific model names (e.g. 'nova-3').
-                                model=None,
-                                language=self.language,
-                            )
-                            mode_for_run = "local"
-                        else:
-                            raise
+                        mode_for_run = "local"
                     else:
                         raise
-                t_transcribe = time.perf_counter() - t0
-                if audio_duration > 0:
-                    rtf = t_transcribe / audio_duration
-                    self._last_rtf = rtf  # Speichern für Overlay-Anzeige
-                    model_name = self._model_name_for_logging(
-                        provider, mode_override=mode_for_run
-                    )
-                    backend_name = self._local_backend_for_logging(
-                        provider, mode_override=mode_for_run
-                    )
-                    backend_info = f", backend={backend_name}" if backend_name else ""
-                    logger.info(
-                        f"Transcription performance: mode={mode_for_run}{backend_info}, "
-                        f"model={model_name}, "
-                        f"audio={audio_duration:.2f}s, time={t_transcribe:.2f}s, rtf={rtf:.2f}x"
-                    )
                 else:
-                    self._last_rtf = None  # Kein RTF berechnet
-                    logger.info(
-                        f"Transcription performance: mode={mode_for_run}, "
-                        f"time={t_transcribe:.2f}s (audio duration unknown)"
-                    )
-
-                # LLM-Nachbearbeitung (optional)
-                if self.refine and transcript:
-                    self._result_queue.put(
-                        DaemonMessage(
-                            type=MessageType.STATUS_UPDATE, payload=AppState.REFINING
-                        )
-                    )
-                    from refine.llm import maybe_refine_transcript
-
-                    transcript = maybe_refine_transcript(
-                        transcript,
-                        refine=True,
-                        refine_model=self.refine_model,
-                        refine_provider=self.refine_provider,
-                        context=self.context,
-                    )
+                    raise
+            t_transcribe = time.perf_counter() - t0
+            if audio_duration > 0:
+                rtf = t_transcribe / audio_duration
+                self._last_rtf = rtf  # Speichern für Overlay-Anzeige
+                model_name = self._model_name_for_logging(
+                    provider, mode_override=mode_for_run
+                )
+                backend_name = self._local_backend_for_logging(
+                    provider, mode_override=mode_for_run
+                )
+                backend_info = f", backend={backend_name}" if backend_name else ""
+                logger.info(
+                    f"Transcription performance: mode={mode_for_run}{backend_info}, "
+                    f"model={model_name}, "
+                    f"audio={audio_duration:.2f}s, time={t_transcribe:.2f}s, rtf={rtf:.2f}x"
+                )
+            else:
+                self._last_rtf = None  # Kein RTF berechnet
+                logger.info(
+                    f"Transcription performance: mode={mode_for_run}, "
+                    f"time={t_transcribe:.2f}s (audio duration unknown)"
+                )
 
-                logger.debug("Sende TRANSCRIPT_RESULT")
+            # LLM-Nachbearbeitung (optional)
+            if self.refine and transcript:
                 self._result_queue.put(
                     DaemonMessage(
-                        type=MessageType.TRANSCRIPT_RESULT, payload=transcript
+                        type=MessageType.STATUS_UPDATE, payload=AppState.REFINING
                     )
                 )
+                from refine.llm import maybe_refine_transcript
+
+                transcript = maybe_refine_transcript(
+                    transcript,
+                    refine=True,
+                    refine_model=self.refine_model,
+                    refine_provider=self.refine_provider,
+                    context=self.context,
+                )
 
-            finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            logger.debug("Sende TRANSCRIPT_RESULT")
+            self._result_queue.put(
+                DaemonMessage(
+                    type=MessageType.TRANSCRIPT_RESULT, payload=transcript
+                )
+            )
 
         except Exception as e:
             logger.exception(f"Recording-Worker Fehler: {e}")
             emergency_log(f"RecordingWorker Exception: {type(e).__name__}: {e}")
             self._result_queue.put(e)
+        finally:
+            if stream_session is not None:
+                stream_session.cancel()
+            if segment_session is not None:
+                segment_session.cancel()
 
     def _stop_recording(self) -> None:
         """Stoppt Aufnahme (non-blocking) und lässt Worker im Hintergrund auslaufen."""
@@ -1673,7 +1860,7 @@ class PulseScribeDaemon:
 
         logger.info("Stop-Event setzen...")
 
-        self._stop_interim_polling()
+        self._stop_interim_updates()
 
         # Signal an Worker: Beende Deepgram-Stream sauber
         if self._stop_event:
@@ -1902,7 +2089,7 @@ class PulseScribeDaemon:
         Verhindert Memory-Leaks bei Local Whisper (~500MB RAM).
         """
         # Timer stoppen
-        self._stop_interim_polling()
+        self._stop_interim_updates()
         self._stop_result_polling()
         self._stop_transcribing_watchdog()
 
@@ -1916,6 +2103,16 @@ class PulseScribeDaemon:
         self._provider_cache.clear()
         logger.debug("Provider-Cache geleert")
 
+        if self._deepgram_standby is not None:
+            self._deepgram_standby.close()
+            self._deepgram_standby = None
+        self._loop_thread.close()
+
+        # Gesammelte Provider-Latenzen sichern (terminate_ umgeht atexit)
+        from providers.health import flush_registry
+
+        flush_registry()
+
     def _paste_result(self, transcript: str) -> None:
         """Fügt Transkript via Auto-Paste ein."""
         success = paste_transcript(transcript)
@@ -2059,8 +2256,11 @@ class PulseScribeDaemon:
     def _reload_settings(self) -> None:
         """Lädt Settings aus .env neu und wendet sie an."""
         from config import DEFAULT_REFINE_MODEL
+        from utils.http_client import credentials_signature, swap_http_clients
         from utils.preferences import read_env_file
 
+        old_credentials = credentials_signature()
+
         # .env neu laden (override=True um Änderungen zu übernehmen)
         load_environment(override_existing=True)
         env_values = read_env_file()
@@ -2094,7 +2294,27 @@ class PulseScribeDaemon:
             "PULSESCRIBE_LOCAL_NUM_WORKERS",
             "PULSESCRIBE_LOCAL_WITHOUT_TIMESTAMPS",
             "PULSESCRIBE_LOCAL_VAD_FILTER",
+            "PULSESCRIBE_LOCAL_BATCH_SIZE",
+            "PULSESCRIBE_LOCAL_REPLICAS",
+            "PULSESCRIBE_LOCAL_RAM_BUDGET_MB",
+            "PULSESCRIBE_LOCAL_VRAM_BUDGET_MB",
+            "PULSESCRIBE_LOCAL_IDLE_UNLOAD_MIN",
+            "PULSESCRIBE_LOCAL_SHORT_MODEL",
+            "PULSESCRIBE_LOCAL_SHORT_MAX_SECONDS",
+            "PULSESCRIBE_LOCAL_EN_MODEL",
+            "PULSESCRIBE_LOCAL_PROFILE",
+            "PULSESCRIBE_LOCAL_WORKER",
             "PULSESCRIBE_LOCAL_WARMUP",
+            "PULSESCRIBE_LOCAL_WARMUP_BUCKETS",
+            "PULSESCRIBE_LOCAL_STREAMING",
+            # Cloud upload options
+            "PULSESCRIBE_UPLOAD_CODEC",
+            "PULSESCRIBE_SEGMENT_UPLOAD",
+            "PULSESCRIBE_HEDGE_PROVIDER",
+            "PULSESCRIBE_CIRCUIT_BREAKER",
+            "PULSESCRIBE_PREWARM",
+            "PULSESCRIBE_DEEPGRAM_STANDBY",
+            "PULSESCRIBE_INTERIM_FILE",
             # Optional keys that can be removed in UI to reset to default.
             "PULSESCRIBE_REFINE_MODEL",
         ):
@@ -2104,6 +2324,10 @@ class PulseScribeDaemon:
             else:
                 os.environ[key] = value
 
+        # SDK-Clients haben Keys und Proxy beim Erstellen übernommen
+        if credentials_signature() != old_credentials:
+            swap_http_clients()
+
         # Hotkeys übernehmen (apply immediately; legacy values kept unless explicitly set)
         self.toggle_hotkey = (
             env_values.get("PULSESCRIBE_TOGGLE_HOTKEY") or ""
@@ -2183,6 +2407,7 @@ class PulseScribeDaemon:
 
         # Falls lokal aktiviert, Modell im Hintergrund vorladen
         self._preload_local_model_async()
+        self._refresh_deepgram_standby()
 
     def _is_hotkey_reconfigure_busy(self) -> bool:
         """True if it's unsafe to unregister/re-register hotkeys right now."""
@@ -2545,6 +2770,8 @@ class PulseScribeDaemon:
 
         # Lokales Modell vorab laden (falls aktiv)
         self._preload_local_model_async()
+        # Deepgram-WebSocket vorab verbinden (falls Streaming aktiv)
+        self._refresh_deepgram_standby()
 
         # Hotkeys registrieren (zentral, auch für Runtime-Reconfigure)
         self._reconfigure_hotkeys(show_alerts=True)
@@ -56,9 +56,10 @@ logger = get_logger()
 # Imports nach Logging-Setup
 from utils.state import AppState
 from utils.hold_state import HoldHotkeyState
+from utils.interim import interim_channel
 from utils.hotkey import paste_transcript
 from whisper_platform import get_clipboard, get_sound_player
-from config import INTERIM_FILE, get_input_device, WARM_STREAM_QUEUE_SIZE
+from config import get_input_device, WARM_STREAM_QUEUE_SIZE
 from providers import get_provider
 
 # Lazy imports für optionale Features
@@ -129,40 +130,6 @@ _DEFAULT_HOLD_HOTKEY = "ctrl+win"
 _SHUTDOWN_TIMEOUT_SEC = 0.1
 
 
-def _resample_audio(audio, from_rate: int, to_rate: int):
-    """Resampled Audio-Array von from_rate auf to_rate.
-
-    Verwendet scipy.signal.resample wenn verfügbar, sonst lineare Interpolation.
-    Für Downsampling (z.B. 48kHz → 16kHz) ist die Qualität ausreichend für Sprache.
-    """
-    import numpy as np
-
-    # Edge-Case: Leeres Audio (z.B. VAD trimmt alles)
-    if len(audio) == 0:
-        return np.array([], dtype=np.float32)
-
-    if from_rate == to_rate:
-        return audio
-
-    # Ziel-Länge berechnen
-    new_length = int(len(audio) * to_rate / from_rate)
-
-    # Versuch 1: scipy (beste Qualität, Anti-Aliasing)
-    try:
-        from scipy.signal import resample
-
-        return resample(audio, new_length).astype(np.float32)
-    except ImportError:
-        pass
-
-    # Fallback: numpy lineare Interpolation (ausreichend für Sprache)
-    return np.interp(
-        np.linspace(0, len(audio) - 1, new_length),
-        np.arange(len(audio)),
-        audio,
-    ).astype(np.float32)
-
-
 def _load_tray_dependencies():
     """Lädt pystray und Pillow (lazy)."""
     global pystray, PIL_Image, PIL_ImageDraw
@@ -238,6 +205,7 @@ class PulseScribeWindows:
         self._recording_stop_event = threading.Event()  # Recording stoppen
         self._prewarm_complete = threading.Event()  # Pre-Warm abgeschlossen
         self._overlay = None
+        self._interim_unsubscribe = None  # Abo auf utils.interim (Overlay-Interims)
         self._settings_process = None  # Subprocess für Settings-Fenster
         self._onboarding_process = None  # Subprocess für Onboarding-Wizard
         self._ipc_server = None  # IPC-Server für Wizard-Kommunikation
@@ -248,8 +216,8 @@ class PulseScribeWindows:
         self._transcribing_timeout = 30.0  # Sekunden
         self._transcribing_watchdog: threading.Timer | None = None
 
-        # Audio buffer für REST-Modus
-        self._audio_buffer = []
+        # Audio buffer für REST-Modus (CaptureBuffer, wird pro Aufnahme angelegt)
+        self._audio_buffer = None
         self._audio_sample_rate = 16000  # Default, wird in _recording_loop aktualisiert
         self._audio_lock = threading.Lock()
 
@@ -269,6 +237,7 @@ class PulseScribeWindows:
 
         # Provider-Cache (wichtig für LocalProvider - cached Modelle intern)
         self._provider_cache: dict[str, object] = {}
+        self._local_share = None  # LocalWorker: warmes Modell für CLI-Clients
 
         # Settings-Reload (FileWatcher + Polling-Fallback)
         self._env_observer = None
@@ -487,7 +456,13 @@ class PulseScribeWindows:
         """
         if mode in _STATEFUL_PROVIDERS:
             if mode not in self._provider_cache:
-                self._provider_cache[mode] = get_provider(mode)
+                provider = None
+                if mode == "local":
+                    # Warmer Out-of-Process-Worker spart Modell-Load und GIL-Konkurrenz
+                    from providers.local_worker import connect_worker
+
+                    provider = connect_worker()
+                self._provider_cache[mode] = provider or get_provider(mode)
             return self._provider_cache[mode]
         # Stateless Provider: kein Caching nötig (API-Calls)
         return get_provider(mode)
@@ -635,6 +610,11 @@ class PulseScribeWindows:
         # Recording-Stop-Event zurücksetzen
         self._recording_stop_event.clear()
 
+        # Bucket-Warmup darf die echte Aufnahme nie verzögern
+        local_provider = self._provider_cache.get("local")
+        if local_provider is not None and hasattr(local_provider, "cancel_warmup"):
+            local_provider.cancel_warmup()
+
         if self.streaming:
             # Prüfe ob Warm-Stream verfügbar (instant-start)
             if self._warm_stream is not None:
@@ -731,21 +711,30 @@ class PulseScribeWindows:
             import sounddevice as sd
             import numpy as np
 
+            from audio.buffer import CaptureBuffer
+            from audio.resample import StreamResampler
+            from config import WHISPER_SAMPLE_RATE
+
             channels = 1
             chunk_duration = 0.1  # 100ms chunks
 
             # Device und native Sample Rate ermitteln
             input_device, actual_sample_rate = get_input_device()
 
+            # Unterwegs auf 16kHz resamplen statt beim Stop die ganze Aufnahme
+            resampler = StreamResampler(actual_sample_rate, WHISPER_SAMPLE_RATE)
             with self._audio_lock:
-                self._audio_buffer = []
-                self._audio_sample_rate = actual_sample_rate  # Für _transcribe_rest
+                self._audio_buffer = CaptureBuffer(WHISPER_SAMPLE_RATE)
+                self._audio_sample_rate = WHISPER_SAMPLE_RATE  # Für _transcribe_rest
 
             def audio_callback(indata, frames, time_info, status):
                 if status:
                     logger.warning(f"Audio-Status: {status}")
+                samples = resampler.process(indata[:, 0])
                 with self._audio_lock:
-                    self._audio_buffer.append(indata.copy())
+                    # None nach Join-Timeout: _transcribe_rest hat übernommen
+                    if self._audio_buffer is not None:
+                        self._audio_buffer.append(samples)
 
                 # Audio-Level für Overlay (AGC im Overlay normalisiert automatisch)
                 if self._overlay:
@@ -769,6 +758,10 @@ class PulseScribeWindows:
                 while not self._recording_stop_event.is_set():
                     time.sleep(0.05)
 
+            with self._audio_lock:
+                if self._audio_buffer is not None:
+                    self._audio_buffer.append(resampler.flush())
+
         except ImportError:
             logger.error("sounddevice nicht installiert")
             self._set_state(AppState.ERROR)
@@ -789,15 +782,28 @@ class PulseScribeWindows:
         Sammelt Audio in Buffer für spätere REST-Transkription.
         """
         import numpy as np
-        from config import INT16_MAX
+
+        from audio.buffer import CaptureBuffer
+        from audio.resample import StreamResampler
+        from config import WHISPER_SAMPLE_RATE
 
         logger.debug("Recording-Loop (Warm) gestartet")
 
+        # Chunks unterwegs auf 16kHz resamplen (wie der Streaming-Forwarder)
+        resampler = StreamResampler(self._warm_stream_sample_rate, WHISPER_SAMPLE_RATE)
+
+        def append_chunk(chunk: bytes) -> None:
+            # int16 -> float32 beim Schreiben
+            audio_int16 = np.frombuffer(resampler.process_int16(chunk), dtype=np.int16)
+            with self._audio_lock:
+                if self._audio_buffer is not None:
+                    self._audio_buffer.append(audio_int16)
+
         try:
             # Buffer vorbereiten
             with self._audio_lock:
-                self._audio_buffer = []
-                self._audio_sample_rate = self._warm_stream_sample_rate
+                self._audio_buffer = CaptureBuffer(WHISPER_SAMPLE_RATE)
+                self._audio_sample_rate = WHISPER_SAMPLE_RATE
 
             # Warm-Stream armen
             self._warm_stream_armed.set()
@@ -809,13 +815,7 @@ class PulseScribeWindows:
                 try:
                     # Audio-Chunk aus Queue holen (mit Timeout für Stop-Check)
                     chunk = self._warm_stream_queue.get(timeout=0.1)
-
-                    # Chunk zu Buffer hinzufügen (int16 -> float32 für Kompatibilität)
-                    audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-                    audio_float32 = audio_int16.astype(np.float32) / INT16_MAX
-
-                    with self._audio_lock:
-                        self._audio_buffer.append(audio_float32)
+                    append_chunk(chunk)
 
                 except queue.Empty:
                     continue
@@ -827,10 +827,7 @@ class PulseScribeWindows:
             while True:
                 try:
                     chunk = self._warm_stream_queue.get_nowait()
-                    audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-                    audio_float32 = audio_int16.astype(np.float32) / INT16_MAX
-                    with self._audio_lock:
-                        self._audio_buffer.append(audio_float32)
+                    append_chunk(chunk)
                     immediate_drained += 1
                 except queue.Empty:
                     break
@@ -862,10 +859,7 @@ class PulseScribeWindows:
                 while empty_count < 2 and time.monotonic() < drain_deadline:
                     try:
                         chunk = self._warm_stream_queue.get(timeout=0.01)
-                        audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-                        audio_float32 = audio_int16.astype(np.float32) / INT16_MAX
-                        with self._audio_lock:
-                            self._audio_buffer.append(audio_float32)
+                        append_chunk(chunk)
                         drained += 1
                         empty_count = 0
                     except queue.Empty:
@@ -873,6 +867,10 @@ class PulseScribeWindows:
 
                 if drained > 0:
                     logger.debug(f"REST-Mode Drain: {drained} Rest-Chunks gesammelt")
+                tail = np.frombuffer(resampler.flush_int16(), dtype=np.int16)
+                with self._audio_lock:
+                    if self._audio_buffer is not None:
+                        self._audio_buffer.append(tail)
             finally:
                 # KRITISCH: drain_event MUSS gelöscht werden, sonst sammelt Callback ewig
                 self._warm_stream_draining.clear()
@@ -1042,31 +1040,49 @@ class PulseScribeWindows:
             time.sleep(1.0)
             self._set_state(AppState.IDLE)
 
+    def _local_fallback_available(self) -> bool:
+        """True, wenn ein lokales Backend für In-Memory-Transkription existiert."""
+        try:
+            return hasattr(self._get_provider("local"), "transcribe_audio")
+        except ValueError:
+            # Slim-Build ohne lokale Backends
+            return False
+
     def _transcribe_rest(self):
         """Transkribiert aufgenommenes Audio via REST API."""
         try:
             import numpy as np
 
-            # Audio-Buffer zusammenfügen
+            from providers.health import get_registry
+
+            # Audio-Buffer übernehmen (Zero-Copy-View statt np.concatenate)
             with self._audio_lock:
-                if not self._audio_buffer:
+                if self._audio_buffer is None or not len(self._audio_buffer):
                     logger.warning("Kein Audio aufgenommen")
                     self._set_state(AppState.IDLE)
                     return
 
-                audio_data = np.concatenate(self._audio_buffer)
+                audio_data = self._audio_buffer.view()
                 sample_rate = self._audio_sample_rate
-                self._audio_buffer = []
+                self._audio_buffer = None
 
             duration = len(audio_data) / sample_rate
             logger.info(f"Transkribiere {duration:.1f}s Audio ({sample_rate}Hz)...")
 
             # Konfiguration holen (zentralisiert für alle Modi)
             model, language = self._get_transcription_config()
-            provider = self._get_provider(self.mode)
+            mode = self.mode
+            if mode != "local" and not get_registry().allow(mode):
+                # Offener Circuit: Provider überspringen, direkt lokal transkribieren
+                if self._local_fallback_available():
+                    logger.warning(f"Circuit für {mode} offen – Fallback auf local")
+                    mode, model = "local", None
+                else:
+                    logger.info(f"Circuit für {mode} offen, aber kein lokaler Fallback")
+            provider = self._get_provider(mode)
 
             # Local-Mode: In-Memory Transkription (kein WAV schreiben)
-            if self.mode == "local" and hasattr(provider, "transcribe_audio"):
+            if mode == "local" and hasattr(provider, "transcribe_audio"):
                 from config import WHISPER_SAMPLE_RATE
 
                 # Tail-Padding (verhindert abgeschnittene letzte Wörter bei Whisper)
@@ -1077,9 +1093,9 @@ class PulseScribeWindows:
 
                 # Resampling auf 16kHz (Whisper erwartet WHISPER_SAMPLE_RATE)
                 if sample_rate != WHISPER_SAMPLE_RATE:
-                    audio_data = _resample_audio(
-                        audio_data, sample_rate, WHISPER_SAMPLE_RATE
-                    )
+                    from audio.resample import resample
+
+                    audio_data = resample(audio_data, sample_rate, WHISPER_SAMPLE_RATE)
                     logger.debug(
                         f"Audio resampled: {sample_rate}Hz → {WHISPER_SAMPLE_RATE}Hz"
                     )
@@ -1088,22 +1104,21 @@ class PulseScribeWindows:
                     audio_data, model=model, language=language
                 )
             else:
-                # Andere Provider: WAV-Datei schreiben
-                import soundfile as sf
-                import tempfile
-                from pathlib import Path
-
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                    temp_path = Path(f.name)
+                # Andere Provider: im Speicher kodieren (kein Temp-File)
+                from audio.memory import InMemoryAudio, upload_codec
 
-                try:
-                    sf.write(temp_path, audio_data, sample_rate)
-                    transcript = provider.transcribe(
-                        audio_path=temp_path, model=model, language=language
-                    )
-                finally:
-                    if temp_path.exists():
-                        temp_path.unlink()
+                upload = InMemoryAudio.from_array(
+                    audio_data, sample_rate, codec=upload_codec(mode)
+                )
+                transcript = get_registry().call(
+                    mode,
+                    lambda: provider.transcribe(
+                        audio_path=upload,
+                        model=model,
+                        language=language,
+                    ),
+                    audio_s=duration,
+                )
 
             if transcript:
                 # LLM-Nachbearbeitung (optional)
@@ -1422,6 +1437,11 @@ class PulseScribeWindows:
         # Warm-Stream stoppen
         self._stop_warm_stream()
 
+        # Gesammelte Provider-Latenzen sichern
+        from providers.health import flush_registry
+
+        flush_registry()
+
         # Settings-Fenster beenden (falls offen)
         if self._settings_process and self._settings_process.poll() is None:
             try:
@@ -1599,10 +1619,18 @@ class PulseScribeWindows:
         """
         logger.info("Settings neu laden...")
 
+        from utils.http_client import credentials_signature, swap_http_clients
+
+        old_credentials = credentials_signature()
+
         # WICHTIG: os.environ aktualisieren, damit alle Module die neuen Werte sehen
         # (z.B. refine/llm.py verwendet os.getenv() direkt)
         load_environment(override_existing=True)
 
+        # SDK-Clients haben Keys und Proxy beim Erstellen übernommen
+        if credentials_signature() != old_credentials:
+            swap_http_clients()
+
         # .env auch als Dict lesen für explizite Instanzvariablen
         from utils.preferences import read_env_file
 
@@ -1681,6 +1709,22 @@ class PulseScribeWindows:
 
         logger.info("Settings erfolgreich neu geladen")
 
+    def _on_local_model_ready(self, provider, model: str | None) -> None:
+        """Gibt das warme Modell frei und startet das Bucket-Warmup.
+
+        Freigabe per Socket für `transcribe.py --mode local`; das Warmup
+        bricht bei Aufnahmestart ab (siehe _start_recording).
+        """
+        try:
+            from providers.local_worker import share_provider
+
+            self._local_share = share_provider(provider, model, self._local_share)
+        except Exception as e:
+            logger.debug(f"Modell-Freigabe fehlgeschlagen: {e}")
+        if hasattr(provider, "start_bucket_warmup"):
+            _, language = self._get_transcription_config()
+            provider.start_bucket_warmup(model, language)
+
     def _preload_local_model(self):
         """Lädt Local-Model vor nach Settings-Änderung."""
         set_loading = False
@@ -1693,6 +1737,7 @@ class PulseScribeWindows:
             if hasattr(provider, "preload"):
                 logger.info(f"Preloading local model '{model}'...")
                 provider.preload(model=model)
+                self._on_local_model_ready(provider, model)
         except Exception as e:
             logger.warning(f"Local-Model Preload fehlgeschlagen: {e}")
         finally:
@@ -1835,14 +1880,22 @@ class PulseScribeWindows:
             return
 
         try:
-            # Overlay mit INTERIM_FILE für Interim-Text Polling
-            self._overlay = WindowsOverlayController(interim_file=INTERIM_FILE)
+            # Interim-Texte kommen per Callback aus dem Stream (kein File-Polling)
+            self._overlay = WindowsOverlayController()
             threading.Thread(target=self._overlay.run, daemon=True).start()
+            if self._interim_unsubscribe is None:
+                self._interim_unsubscribe = interim_channel.subscribe(self._on_interim)
             logger.info("Overlay gestartet")
         except Exception as e:
             logger.warning(f"Overlay konnte nicht gestartet werden: {e}")
             self._overlay = None
 
+    def _on_interim(self, update) -> None:
+        """Reicht Interim-Texte an das Overlay weiter (thread-safe API)."""
+        overlay = self._overlay
+        if overlay and update.text:
+            overlay.update_interim_text(update.text)
+
     def _prewarm_imports(self):
         """Lädt teure Imports und erkennt Audio-Device im Hintergrund.
 
@@ -1920,6 +1973,7 @@ class PulseScribeWindows:
                         self._overlay.update_state("LOADING", f"Loading {model}...")
                     if hasattr(provider, "preload"):
                         provider.preload(model=model)
+                        self._on_local_model_ready(provider, model)
                     preload_ms = (time.perf_counter() - preload_start) * 1000
                     # Runtime-Info für Logging (Device, Compute-Type)
                     runtime_info = ""
@@ -1930,6 +1984,8 @@ class PulseScribeWindows:
                         runtime_info = f", Device: {device}"
                         if compute:
                             runtime_info += f", Compute: {compute}"
+                        if info.get("replicas"):
+                            runtime_info += f", Replicas: {info['replicas']}"
                     logger.info(
                         f"Local-Modell '{model}' vorab geladen ({preload_ms:.0f}ms{runtime_info})"
                     )
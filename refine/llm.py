@@ -13,6 +13,7 @@ from .context import detect_context
 from utils.timing import log_preview
 from utils.logging import get_session_id
 from utils.env import get_env_bool_default
+from utils.http_client import on_http_swap, sdk_http_client, sdk_timeout
 
 # Zentrale Konfiguration importieren
 from config import (
@@ -20,6 +21,8 @@ from config import (
     DEFAULT_GEMINI_REFINE_MODEL,
     OPENROUTER_BASE_URL,
     LLM_REFINE_TIMEOUT,
+    GROQ_TIMEOUT,
+    OPENAI_TIMEOUT,
 )
 
 logger = logging.getLogger("pulsescribe")
@@ -43,7 +46,11 @@ def _get_groq_client():
                 api_key = os.getenv("GROQ_API_KEY")
                 if not api_key:
                     raise ValueError("GROQ_API_KEY nicht gesetzt")
-                _groq_client = Groq(api_key=api_key)
+                _groq_client = Groq(
+                    api_key=api_key,
+                    http_client=sdk_http_client("groq"),
+                    timeout=sdk_timeout("groq", GROQ_TIMEOUT),
+                )
                 logger.debug(f"[{get_session_id()}] Groq-Client initialisiert")
     return _groq_client
 
@@ -56,7 +63,11 @@ def _get_openai_client():
             if _openai_client is None:  # Double-check nach Lock
                 from openai import OpenAI
 
-                _openai_client = OpenAI()  # Nutzt OPENAI_API_KEY automatisch
+                # Nutzt OPENAI_API_KEY automatisch
+                _openai_client = OpenAI(
+                    http_client=sdk_http_client("openai"),
+                    timeout=sdk_timeout("openai", OPENAI_TIMEOUT),
+                )
                 logger.debug(f"[{get_session_id()}] OpenAI-Client initialisiert")
     return _openai_client
 
@@ -73,7 +84,10 @@ def _get_openrouter_client():
                 if not api_key:
                     raise ValueError("OPENROUTER_API_KEY nicht gesetzt")
                 _openrouter_client = OpenAI(
-                    base_url=OPENROUTER_BASE_URL, api_key=api_key
+                    base_url=OPENROUTER_BASE_URL,
+                    api_key=api_key,
+                    http_client=sdk_http_client("openai"),
+                    timeout=sdk_timeout("openai", OPENAI_TIMEOUT),
                 )
                 logger.debug(f"[{get_session_id()}] OpenRouter-Client initialisiert")
     return _openrouter_client
@@ -98,6 +112,23 @@ def _get_gemini_client():
     return _gemini_client
 
 
+def _reset_clients() -> None:
+    """Verwirft alle Client-Singletons (neue Keys/Transport nach Settings-Reload).
+
+    Gemini nutzt keinen gemeinsamen HTTP-Client, wird für neue Keys aber
+    ebenfalls neu erstellt.
+    """
+    global _groq_client, _openai_client, _openrouter_client, _gemini_client
+    with _client_lock:
+        _groq_client = None
+        _openai_client = None
+        _openrouter_client = None
+        _gemini_client = None
+
+
+on_http_swap(_reset_clients)
+
+
 def _get_refine_client(provider: str):
     """Gibt gecachten Client für Nachbearbeitung zurück (OpenAI, OpenRouter, Groq oder Gemini)."""
     if provider == "groq":
@@ -109,6 +140,26 @@ def _get_refine_client(provider: str):
     return _get_openai_client()
 
 
+def prewarm_refine_client(provider: str | None = None) -> float | None:
+    """Öffnet die Verbindung zum Refine-Provider vorab (beim Hotkey-Down).
+
+    Gemini nutzt keinen httpx-Pool und wird übersprungen.
+
+    Returns:
+        Dauer des Warm-Requests in Sekunden oder None
+    """
+    from utils.prewarm import warm_client
+
+    effective_provider = (
+        provider or os.getenv("PULSESCRIBE_REFINE_PROVIDER", "groq")
+    ).lower()
+    if effective_provider == "gemini":
+        return None
+    return warm_client(
+        _get_refine_client(effective_provider), f"Refine {effective_provider}"
+    )
+
+
 def _extract_message_content(content) -> str:
     """Extrahiert Text aus OpenAI/OpenRouter Message-Content (String, Liste oder None)."""
     if content is None:
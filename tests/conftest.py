@@ -113,6 +113,25 @@ def reset_caches(monkeypatch):
     monkeypatch.setattr(refine.context, "_custom_app_contexts_cache", None)
 
 
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path, monkeypatch):
+    """Leitet den Ergebnis-Cache in ein Temp-Verzeichnis um (kein ~/.pulsescribe)."""
+    import utils.result_cache
+
+    monkeypatch.setattr(utils.result_cache, "RESULT_CACHE_DIR", tmp_path / "result_cache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_provider_health(tmp_path, monkeypatch):
+    """Frische Provider-Health-Registry im Temp-Verzeichnis (kein ~/.pulsescribe)."""
+    import providers.health
+
+    monkeypatch.setattr(
+        providers.health, "PROVIDER_HEALTH_FILE", tmp_path / "provider_health.json"
+    )
+    monkeypatch.setattr(providers.health, "_registry", None)
+
+
 @pytest.fixture
 def clean_env(monkeypatch):
     """Entfernt alle PULSESCRIBE_* Umgebungsvariablen für saubere Tests.
@@ -0,0 +1,207 @@
+"""Tests für transcribe_async() gegen einen lokalen Mock-HTTP-Server.
+
+Enthält einen kleinen Benchmark: 50 parallele Requests in einem Event-Loop
+gegenüber denselben Requests nacheinander (`pytest -s` zeigt die Zeiten).
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+import utils.http_client as http_client
+
+pytest.importorskip("httpx")
+
+CONCURRENT_REQUESTS = 50
+SERVER_DELAY = 0.05  # Simulierte Inferenzzeit pro Request
+
+DEEPGRAM_RESPONSE = {
+    "metadata": {
+        "request_id": "r",
+        "sha256": "s",
+        "created": "2026-01-01T00:00:00Z",
+        "duration": 1.0,
+        "channels": 1,
+        "models": ["nova-3"],
+        "model_info": {},
+    },
+    "results": {"channels": [{"alternatives": [{"transcript": "hallo deepgram"}]}]},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+        time.sleep(SERVER_DELAY)
+        with self.server.lock:
+            self.server.active -= 1
+
+        if self.path.startswith("/v1/listen"):
+            body, content_type = json.dumps(DEEPGRAM_RESPONSE).encode(), "application/json"
+        else:
+            body, content_type = b"hallo welt", "text/plain"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # listen()-Backlog für 50 gleichzeitige Verbindungen
+
+
+@pytest.fixture
+def mock_server():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.active = server.peak = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    # Kein .wav → prepare_upload() lädt die Datei unverändert hoch
+    path = tmp_path / "aufnahme.mp3"
+    path.write_bytes(b"\x00" * 2048)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(monkeypatch):
+    monkeypatch.setattr(http_client, "_clients", {})
+    monkeypatch.setattr(http_client, "_async_clients", {})
+    monkeypatch.setattr(http_client, "stats", http_client.PoolStats())
+
+
+@pytest.fixture
+def openai_provider(mock_server, monkeypatch):
+    pytest.importorskip("openai")
+    import providers.openai
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"{mock_server[1]}/v1")
+    monkeypatch.setattr(providers.openai, "_client", None)
+    monkeypatch.setattr(providers.openai, "_async_client", None)
+    return providers.openai.OpenAIProvider()
+
+
+class TestTranscribeAsync:
+    """Native Async-Clients und Thread-Offload für lokal."""
+
+    def test_openai(self, openai_provider, audio_file):
+        result = asyncio.run(openai_provider.transcribe_async(audio_file, language="de"))
+        assert result == "hallo welt"
+
+    def test_groq(self, mock_server, monkeypatch, audio_file):
+        pytest.importorskip("groq")
+        import providers.groq
+
+        monkeypatch.setenv("GROQ_API_KEY", "test")
+        monkeypatch.setenv("GROQ_BASE_URL", mock_server[1])
+        monkeypatch.setattr(providers.groq, "_async_client", None)
+
+        provider = providers.groq.GroqProvider()
+        assert asyncio.run(provider.transcribe_async(audio_file)) == "hallo welt"
+
+    def test_deepgram(self, mock_server, monkeypatch, audio_file):
+        deepgram = pytest.importorskip("deepgram")
+        import providers.deepgram
+
+        base = mock_server[1]
+        environment = deepgram.DeepgramClientEnvironment(
+            base=base, production=base, agent=base, agent_rest=base
+        )
+        monkeypatch.setattr(
+            deepgram,
+            "AsyncDeepgramClient",
+            functools.partial(deepgram.AsyncDeepgramClient, environment=environment),
+        )
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "test")
+        monkeypatch.setattr(providers.deepgram, "_async_client", None)
+
+        provider = providers.deepgram.DeepgramProvider()
+        assert asyncio.run(provider.transcribe_async(audio_file)) == "hallo deepgram"
+
+    def test_local_runs_in_worker_thread(self, audio_file):
+        from providers.local import LocalProvider
+
+        provider = LocalProvider()
+        threads = []
+
+        def _transcribe(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return "lokal"
+
+        provider.transcribe = Mock(side_effect=_transcribe)
+        assert asyncio.run(provider.transcribe_async(audio_file, language="de")) == "lokal"
+        assert threads[0] is not threading.main_thread()
+        provider.transcribe.assert_called_once_with(
+            audio_file, None, "de", use_cache=True
+        )
+
+    def test_client_follows_event_loop(self, openai_provider, audio_file):
+        import providers.openai
+
+        clients = []
+
+        async def _run():
+            await openai_provider.transcribe_async(audio_file)
+            clients.append(providers.openai._get_async_client())
+
+        asyncio.run(_run())
+        asyncio.run(_run())
+        # Zweiter Loop → neuer HTTP-Client (Verbindungen gehören zum alten Loop)
+        assert clients[0] is not clients[1]
+
+
+class TestConcurrentBenchmark:
+    """50 parallele Requests in einem Event-Loop statt 50 geparkter Threads."""
+
+    def test_concurrent_requests_overlap(self, openai_provider, mock_server, audio_file):
+        server, _ = mock_server
+
+        async def _concurrent():
+            return await asyncio.gather(
+                *(
+                    openai_provider.transcribe_async(audio_file)
+                    for _ in range(CONCURRENT_REQUESTS)
+                )
+            )
+
+        t0 = time.perf_counter()
+        results = asyncio.run(_concurrent())
+        concurrent_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(CONCURRENT_REQUESTS):
+            openai_provider.transcribe(audio_file)
+        sequential_s = time.perf_counter() - t0
+
+        print(
+            f"\n{CONCURRENT_REQUESTS} Requests à {SERVER_DELAY * 1000:.0f}ms: "
+            f"async parallel {concurrent_s:.2f}s, sequentiell {sequential_s:.2f}s, "
+            f"max. {server.peak} gleichzeitig, {http_client.stats.summary()}"
+        )
+        assert results == ["hallo welt"] * CONCURRENT_REQUESTS
+        assert server.peak > 1
+        assert concurrent_s < sequential_s / 2
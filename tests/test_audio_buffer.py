@@ -0,0 +1,78 @@
+"""Tests für den vorallokierten Aufnahmepuffer."""
+
+import numpy as np
+
+from audio.buffer import CaptureBuffer
+
+
+class TestCaptureBuffer:
+    """Tests für CaptureBuffer."""
+
+    def test_appends_sounddevice_chunks_as_mono(self):
+        buffer = CaptureBuffer(sample_rate=16000, initial_seconds=1.0)
+        first = np.full((512, 1), 0.25, dtype=np.float32)
+        second = np.full((256, 1), -0.5, dtype=np.float32)
+
+        buffer.append(first)
+        buffer.append(second)
+
+        audio = buffer.view()
+        assert audio.shape == (768,)
+        assert audio.dtype == np.float32
+        assert np.all(audio[:512] == 0.25)
+        assert np.all(audio[512:] == -0.5)
+        assert buffer.duration == 768 / 16000
+
+    def test_view_is_zero_copy(self):
+        buffer = CaptureBuffer(sample_rate=16000, initial_seconds=1.0)
+        buffer.append(np.ones(100, dtype=np.float32))
+        assert np.shares_memory(buffer.view(), buffer._data)
+
+    def test_grows_geometrically_and_keeps_earlier_views(self):
+        buffer = CaptureBuffer(sample_rate=100, initial_seconds=1.0)
+        chunk_view = buffer.append(np.arange(80, dtype=np.float32))
+        buffer.append(np.arange(80, 200, dtype=np.float32))
+
+        assert buffer.capacity == 200
+        np.testing.assert_array_equal(buffer.view(), np.arange(200, dtype=np.float32))
+        # View aus append() zeigt weiter auf die ursprünglichen Samples
+        np.testing.assert_array_equal(chunk_view, np.arange(80, dtype=np.float32))
+
+    def test_int16_is_scaled_on_write(self):
+        buffer = CaptureBuffer(sample_rate=16000, initial_seconds=1.0)
+        buffer.append(np.array([0, 16384, -32767], dtype=np.int16))
+        np.testing.assert_allclose(buffer.view(), [0.0, 16384 / 32767, -1.0], rtol=1e-6)
+
+    def test_stereo_int16_is_downmixed_and_scaled(self):
+        buffer = CaptureBuffer(sample_rate=16000, initial_seconds=1.0)
+        chunk = np.array([[32767, 32767], [16384, 0], [-32767, 32767]], dtype=np.int16)
+        returned = buffer.append(chunk)
+
+        assert returned.dtype == np.float32
+        np.testing.assert_allclose(
+            buffer.view(), [1.0, 8192 / 32767, 0.0], rtol=1e-6, atol=1e-7
+        )
+
+    def test_empty_buffer(self):
+        buffer = CaptureBuffer()
+        assert len(buffer) == 0
+        assert buffer.view().shape == (0,)
+
+
+class TestAudioRecorderBuffer:
+    """AudioRecorder schreibt über CaptureBuffer statt Chunk-Liste."""
+
+    def test_stop_writes_buffered_audio(self, tmp_path, monkeypatch):
+        import soundfile as sf
+        from audio.recording import AudioRecorder
+
+        monkeypatch.setattr("audio.recording._play_sound", lambda name: None)
+        recorder = AudioRecorder()
+        recorder._buffer.append(np.full((1600, 1), 0.1, dtype=np.float32))
+
+        path = recorder.stop(tmp_path / "out.wav")
+
+        audio, sample_rate = sf.read(path, dtype="float32")
+        assert sample_rate == 16000
+        assert audio.shape == (1600,)
+        assert len(recorder.chunks) == 1
@@ -0,0 +1,106 @@
+"""Tests für den inkrementellen Energie-/VAD-Tracker."""
+
+import numpy as np
+import pytest
+
+from audio.energy import EnergyTracker
+
+SR = 16000
+
+
+def _reference_bounds(audio, threshold, pad_s):
+    """Bisheriges Trimming: strided 20ms-Fenster über die ganze Aufnahme."""
+    window, hop = int(SR * 0.02), int(SR * 0.01)
+    if audio.shape[0] <= window:
+        return 0, audio.shape[0]
+    count = (audio.shape[0] - window) // hop + 1
+    frames = np.lib.stride_tricks.as_strided(
+        audio, shape=(count, window), strides=(audio.strides[0] * hop, audio.strides[0])
+    )
+    active = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1)) >= threshold
+    if not np.any(active):
+        return 0, audio.shape[0]
+    first = int(np.argmax(active))
+    last = int(len(active) - np.argmax(active[::-1]) - 1)
+    pad = int(pad_s * SR)
+    return max(0, first * hop - pad), min(audio.shape[0], last * hop + window + pad)
+
+
+def _feed(tracker, audio, block=512):
+    for offset in range(0, audio.shape[0], block):
+        tracker.feed(audio[offset : offset + block].reshape(-1, 1))
+
+
+def _speech(seconds, level=0.2):
+    t = np.arange(int(SR * seconds)) / SR
+    return (np.sin(2 * np.pi * 220 * t) * level).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(SR * seconds), dtype=np.float32)
+
+
+class TestEnergyTracker:
+    """Tests für EnergyTracker."""
+
+    @pytest.mark.parametrize("block", [100, 160, 512, 1333])
+    @pytest.mark.parametrize("threshold", [0.001, 0.0075, 0.05])
+    def test_trim_bounds_match_full_scan(self, block, threshold):
+        rng = np.random.default_rng(7)
+        audio = np.concatenate(
+            [
+                rng.normal(0, 0.002, int(SR * 0.7)),
+                _speech(0.8, 0.1),
+                rng.normal(0, 0.004, int(SR * 0.3)),
+                _speech(0.4, 0.03),
+                rng.normal(0, 0.001, int(SR * 0.5) + 77),
+            ]
+        ).astype(np.float32)
+
+        tracker = EnergyTracker(SR)
+        _feed(tracker, audio, block)
+
+        assert tracker.samples == audio.shape[0]
+        assert tracker.trim_bounds(threshold, pad_s=0.25) == _reference_bounds(
+            audio, threshold, 0.25
+        )
+
+    def test_block_rms_drives_max_rms_and_had_speech(self):
+        tracker = EnergyTracker(SR, speech_threshold=0.05)
+        rms = tracker.feed(np.full((400, 1), 0.01, dtype=np.float32))
+        assert rms == pytest.approx(0.01)
+        assert not tracker.had_speech
+
+        tracker.feed(np.full((400, 1), 0.1, dtype=np.float32))
+        assert tracker.had_speech
+        assert tracker.max_rms == pytest.approx(0.1)
+
+    def test_silence_keeps_everything(self):
+        tracker = EnergyTracker(SR)
+        _feed(tracker, _silence(1.0))
+        assert tracker.trim_bounds(0.001) == (0, SR)
+        assert tracker.speech_ratio == 0.0
+        assert tracker.speech_segments == []
+
+    def test_speech_ratio_and_segments(self):
+        tracker = EnergyTracker(SR, min_silence_s=0.3)
+        audio = np.concatenate(
+            [
+                _silence(0.5),
+                _speech(1.0),
+                _silence(0.1),  # kurze Pause → gleiches Segment
+                _speech(0.5),
+                _silence(1.0),
+                _speech(0.5),
+                _silence(0.5),
+            ]
+        )
+        _feed(tracker, audio)
+
+        segments = tracker.speech_segments
+        assert len(segments) == 2
+        assert segments[0][0] == pytest.approx(0.5, abs=0.03)
+        assert segments[0][1] == pytest.approx(2.1, abs=0.03)
+        assert segments[1][0] == pytest.approx(3.1, abs=0.03)
+        assert segments[1][1] == pytest.approx(3.6, abs=0.03)
+        assert tracker.speech_ratio == pytest.approx(2.0 / 4.1, abs=0.02)
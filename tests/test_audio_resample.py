@@ -0,0 +1,158 @@
+"""Tests für den Streaming-Resampler.
+
+Enthält eine Bandbreiten-/CPU-Messung für den Warm-Stream (48 kHz → 16 kHz,
+64ms-Chunks) gegenüber dem bisherigen Resampling der ganzen Aufnahme beim Stop
+(`pytest -s` zeigt die Zahlen).
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from audio.resample import StreamResampler, resample
+
+
+def _tone(freq: float, rate: int, seconds: float, amplitude: float = 10000.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _rms_db(samples: np.ndarray, reference: float) -> float:
+    return 20 * np.log10(np.sqrt(np.mean(samples**2)) / reference)
+
+
+class TestStreamResampler:
+    """Qualität, Länge und Zustand über Chunk-Grenzen."""
+
+    @pytest.mark.parametrize("rate", [48000, 44100, 32000, 22050, 8000])
+    def test_tone_preserved_with_exact_length(self, rate):
+        audio = _tone(440, rate, 1.0)
+        out = resample(audio, rate, 16000)
+
+        assert out.dtype == np.float32
+        assert len(out) == -(-len(audio) * 16000 // rate)
+        expected = _tone(440, 16000, len(out) / 16000)
+        # Ränder (Filter-Einschwingen) ausgenommen
+        assert np.abs(out - expected)[100:-100].max() < 10000 * 1e-3
+
+    def test_chunked_equals_whole(self):
+        audio = _tone(1000, 44100, 1.0) + _tone(3100, 44100, 1.0, 3000.0)
+        whole = resample(audio, 44100, 16000)
+
+        resampler = StreamResampler(44100)
+        rng = np.random.default_rng(0)
+        parts, pos = [], 0
+        while pos < len(audio):
+            size = int(rng.integers(1, 2000))
+            parts.append(resampler.process(audio[pos : pos + size]))
+            pos += size
+        parts.append(resampler.flush())
+
+        np.testing.assert_array_equal(np.concatenate(parts), whole)
+
+    def test_aliasing_suppressed(self):
+        # 12 kHz liegt über der 8 kHz-Nyquist-Grenze und würde auf 4 kHz falten
+        out = resample(_tone(12000, 48000, 1.0), 48000, 16000)
+        assert _rms_db(out[100:-100], 10000 / np.sqrt(2)) < -60
+
+    def test_int16_bytes(self):
+        resampler = StreamResampler(48000)
+        chunk = _tone(440, 48000, 0.064).astype(np.int16).tobytes()
+        out = resampler.process_int16(chunk) + resampler.flush_int16()
+        assert len(out) == len(chunk) // 3
+
+    def test_passthrough(self):
+        resampler = StreamResampler(16000)
+        chunk = b"\x01\x02" * 512
+        assert resampler.passthrough
+        assert resampler.process_int16(chunk) is chunk
+        assert resampler.flush_int16() == b""
+        assert resample(np.zeros(0, dtype=np.float32), 48000, 16000).size == 0
+
+
+class TestWarmStreamForwarder:
+    """Der Forwarder liefert 16 kHz an Deepgram."""
+
+    def test_forwarder_resamples_to_16k(self):
+        from providers.deepgram_stream import (
+            StreamState,
+            WarmStreamSource,
+            _init_warm_stream,
+        )
+
+        chunk = _tone(440, 48000, 0.064).astype(np.int16).tobytes()
+        chunks = 10
+
+        async def _run():
+            source = WarmStreamSource(
+                audio_queue=queue.Queue(),
+                sample_rate=48000,
+                arm_event=threading.Event(),
+                stream=None,
+                drain_event=threading.Event(),
+            )
+            for _ in range(chunks):
+                source.audio_queue.put_nowait(chunk)
+            state = StreamState()
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            result = _init_warm_stream(
+                source,
+                state,
+                asyncio.get_running_loop(),
+                audio_queue,
+                "test",
+                play_ready=False,
+                stream_start=time.perf_counter(),
+            )
+            await asyncio.sleep(0.05)
+            state.stop_event.set()
+            await asyncio.to_thread(result.forwarder_thread.join, 5.0)
+            await asyncio.sleep(0)
+            received = []
+            while not audio_queue.empty():
+                received.append(audio_queue.get_nowait())
+            return result, b"".join(received)
+
+        result, forwarded = asyncio.run(_run())
+        assert result.sample_rate == 16000
+        assert len(forwarded) == chunks * len(chunk) // 3
+
+
+class TestBandwidthAndCpu:
+    """Warm-Stream: Bytes an Deepgram und CPU-Zeit pro Audio-Sekunde."""
+
+    def test_streaming_resample_cost(self):
+        rate, seconds = 48000, 30.0
+        chunk_samples = int(rate * 0.064)
+        rng = np.random.default_rng(1)
+        audio = (rng.standard_normal(int(rate * seconds)) * 3000).astype(np.int16)
+        chunks = [
+            audio[i : i + chunk_samples].tobytes()
+            for i in range(0, len(audio), chunk_samples)
+        ]
+
+        resampler = StreamResampler(rate)
+        t0 = time.process_time()
+        sent = sum(len(resampler.process_int16(c)) for c in chunks)
+        stream_cpu = time.process_time() - t0
+
+        t0 = time.process_time()
+        resample(audio.astype(np.float32), rate, 16000)
+        whole_cpu = time.process_time() - t0
+
+        before_kbs = len(audio) * 2 / seconds / 1024
+        after_kbs = sent / seconds / 1024
+        per_chunk_ms = stream_cpu / len(chunks) * 1000
+        print(
+            f"\nWarm-Stream {rate}Hz → 16kHz: {before_kbs:.0f} KB/s → "
+            f"{after_kbs:.0f} KB/s an Deepgram; CPU {stream_cpu * 1000:.0f}ms "
+            f"für {seconds:.0f}s Audio ({stream_cpu / seconds * 100:.2f}% eines "
+            f"Kerns, {per_chunk_ms:.2f}ms pro 64ms-Chunk); ganze Aufnahme beim "
+            f"Stop: {whole_cpu * 1000:.0f}ms"
+        )
+        assert after_kbs == pytest.approx(before_kbs / 3, rel=0.01)
+        assert per_chunk_ms < 64 / 10
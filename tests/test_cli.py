@@ -157,3 +157,64 @@ class TestCLI:
         assert "Audio transkribieren" in output
         assert "--mode" in output
         assert "--record" in output
+
+    def test_calibrate_flag_runs_calibration(self, clean_env, tmp_path):
+        """--calibrate kalibriert statt zu transkribieren."""
+        clip = tmp_path / "ref.wav"
+        clip.write_bytes(b"RIFF")
+        profile = {
+            "fast": True,
+            "rtf": 0.12,
+            "compute_type": "int8",
+            "cpu_threads": 4,
+            "results": [
+                {"compute_type": "int8", "cpu_threads": 4, "fast": True,
+                 "rtf": 0.12, "wer": 0.0, "peak_rss_mb": 512.0},
+            ],
+        }
+        with (
+            patch("providers.local_profile.calibrate", return_value=profile) as mock_cal,
+            patch("transcribe.transcribe") as mock_transcribe,
+        ):
+            result = runner.invoke(app, [str(clip), "--calibrate", "--language", "de"])
+
+        assert result.exit_code == 0
+        mock_cal.assert_called_once()
+        assert mock_cal.call_args.kwargs["language"] == "de"
+        mock_transcribe.assert_not_called()
+        assert "compute_type=int8" in result.output
+
+    def test_local_mode_uses_warm_daemon(self, clean_env, tmp_path):
+        """--mode local fragt zuerst einen laufenden Daemon/Worker an."""
+        clip = tmp_path / "clip.wav"
+        clip.write_bytes(b"RIFF")
+        with (
+            patch(
+                "providers.local_worker.transcribe_via_worker", return_value="vom Daemon"
+            ) as mock_worker,
+            patch("transcribe.transcribe") as mock_transcribe,
+        ):
+            result = runner.invoke(app, [str(clip), "--mode", "local"])
+
+        assert result.exit_code == 0
+        assert "vom Daemon" in result.output
+        mock_worker.assert_called_once()
+        mock_transcribe.assert_not_called()
+
+    def test_local_mode_falls_back_without_daemon(self, clean_env, tmp_path):
+        """Antwortet niemand (oder --no-daemon), wird im Prozess geladen."""
+        clip = tmp_path / "clip.wav"
+        clip.write_bytes(b"RIFF")
+        with (
+            patch(
+                "providers.local_worker.transcribe_via_worker", return_value=None
+            ) as mock_worker,
+            patch("transcribe.transcribe", return_value="lokal") as mock_transcribe,
+        ):
+            result = runner.invoke(app, [str(clip), "--mode", "local"])
+            assert "lokal" in result.output
+            mock_transcribe.assert_called_once()
+
+            mock_worker.reset_mock()
+            runner.invoke(app, [str(clip), "--mode", "local", "--no-daemon"])
+            mock_worker.assert_not_called()
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
+from audio.memory import InMemoryAudio
 from pulsescribe_daemon import PulseScribeDaemon, app
 from utils.state import AppState, DaemonMessage, MessageType
 
@@ -18,8 +19,7 @@ class TestDaemonMode(unittest.TestCase):
         """Test that OpenAI mode starts recording worker, not streaming."""
         daemon = PulseScribeDaemon(mode="openai")
 
-        # Unlink INTERIM_FILE mock? It's a Path object in the module.
-        with patch("pulsescribe_daemon.INTERIM_FILE"):
+        with patch.object(daemon, "_start_connection_prewarm") as mock_prewarm:
             daemon._start_recording()
 
         # Check that thread was started with _recording_worker
@@ -28,16 +28,33 @@ class TestDaemonMode(unittest.TestCase):
         self.assertEqual(kwargs["target"], daemon._recording_worker)
         self.assertEqual(kwargs["name"], "RecordingWorker")
         self.assertTrue(daemon._recording)
+        mock_prewarm.assert_called_once_with("openai", False)
+
+    def test_connection_prewarm_targets(self):
+        """Hotkey-Down wärmt REST-Provider und Refine vor, solange der Worker läuft."""
+        daemon = PulseScribeDaemon(mode="groq", refine=True)
+        daemon._worker_thread = MagicMock()
+
+        with (
+            patch.dict(os.environ, {"PULSESCRIBE_PREWARM": "true"}),
+            patch("utils.prewarm.keep_warm") as mock_keep_warm,
+        ):
+            daemon._start_connection_prewarm("groq", False)
+            daemon._start_connection_prewarm("deepgram", True)
+
+        labels = [
+            [label for label, _ in call.args[0]]
+            for call in mock_keep_warm.call_args_list
+        ]
+        # Deepgram-Streaming nutzt WebSocket: nur Refine vorwärmen
+        self.assertEqual(labels, [["groq", "refine"], ["refine"]])
 
     @patch("pulsescribe_daemon.threading.Thread")
     def test_start_recording_deepgram_streaming(self, mock_thread_cls):
         """Test that Deepgram mode (streaming enabled) starts streaming worker."""
         daemon = PulseScribeDaemon(mode="deepgram")
 
-        with (
-            patch.dict(os.environ, {"PULSESCRIBE_STREAMING": "true"}),
-            patch("pulsescribe_daemon.INTERIM_FILE"),
-        ):
+        with patch.dict(os.environ, {"PULSESCRIBE_STREAMING": "true"}):
             daemon._start_recording()
 
         mock_thread_cls.assert_called_once()
@@ -45,6 +62,35 @@ class TestDaemonMode(unittest.TestCase):
         self.assertEqual(kwargs["target"], daemon._streaming_worker)
         self.assertEqual(kwargs["name"], "StreamingWorker")
 
+    def test_streaming_sessions_share_persistent_loop(self):
+        """Jede Aufnahme läuft im selben Streaming-Loop statt in einem neuen."""
+        import asyncio
+
+        daemon = PulseScribeDaemon(mode="deepgram")
+        loops = []
+
+        async def fake_core(**kwargs):
+            loops.append(asyncio.get_running_loop())
+            return "hallo"
+
+        try:
+            with (
+                patch.dict(os.environ, {"PULSESCRIBE_DEEPGRAM_STANDBY": "false"}),
+                patch("pulsescribe_daemon.deepgram_stream_core", fake_core),
+            ):
+                daemon._streaming_worker()
+                daemon._streaming_worker()
+        finally:
+            daemon._loop_thread.close()
+
+        self.assertEqual(len(loops), 2)
+        self.assertIs(loops[0], loops[1])
+        results = [daemon._result_queue.get_nowait() for _ in range(2)]
+        self.assertEqual(
+            [(r.type, r.payload) for r in results],
+            [(MessageType.TRANSCRIPT_RESULT, "hallo")] * 2,
+        )
+
     @patch("pulsescribe_daemon.threading.Thread")
     def test_start_recording_deepgram_no_streaming(self, mock_thread_cls):
         """Test that Deepgram mode (streaming disabled) starts recording worker."""
@@ -52,7 +98,7 @@ class TestDaemonMode(unittest.TestCase):
 
         with (
             patch.dict(os.environ, {"PULSESCRIBE_STREAMING": "false"}),
-            patch("pulsescribe_daemon.INTERIM_FILE"),
+            patch.object(daemon, "_start_connection_prewarm"),
         ):
             daemon._start_recording()
 
@@ -74,8 +120,7 @@ class TestDaemonMode(unittest.TestCase):
             if "PULSESCRIBE_STREAMING" in os.environ:
                 del os.environ["PULSESCRIBE_STREAMING"]
 
-            with patch("pulsescribe_daemon.INTERIM_FILE"):
-                daemon._start_recording()
+            daemon._start_recording()
 
         mock_thread_cls.assert_called_once()
         args, kwargs = mock_thread_cls.call_args
@@ -140,16 +185,11 @@ class TestDaemonMode(unittest.TestCase):
 
         # Mocking items used inside _recording_worker
         mock_sd = MagicMock()
-        mock_sf = MagicMock()
-        mock_np = MagicMock()
 
         # Mock context manager for InputStream
         mock_stream = MagicMock()
         mock_sd.InputStream.return_value.__enter__.return_value = mock_stream
 
-        # Setup numpy to return concatenatable result
-        mock_np.concatenate.return_value = b"fake_audio_data"
-
         # Stop event handling: let the loop run once then stop
         def side_effect_sleep(*args):
             # Capture callback and call it
@@ -158,10 +198,10 @@ class TestDaemonMode(unittest.TestCase):
                 kw = call_args[1]
                 callback = kw.get("callback")
                 if callback:
-                    # Call with dummy data
+                    # Call with dummy data (laut genug für had_speech)
                     import numpy as np
 
-                    callback(np.zeros((100, 1), dtype="float32"), 100, None, None)
+                    callback(np.full((100, 1), 0.5, dtype="float32"), 100, None, None)
 
             daemon._stop_event.set()
 
@@ -174,17 +214,7 @@ class TestDaemonMode(unittest.TestCase):
         mock_get_player = MagicMock(return_value=mock_player)
 
         with (
-            patch.dict(
-                sys.modules,
-                {"sounddevice": mock_sd, "soundfile": mock_sf, "numpy": mock_np},
-            ),
-            patch(
-                "pulsescribe_daemon.tempfile.mkstemp",
-                return_value=(123, "/tmp/fake.wav"),
-            ),
-            patch("pulsescribe_daemon.os.close"),
-            patch("pulsescribe_daemon.os.unlink"),
-            patch("pulsescribe_daemon.os.path.exists", return_value=True),
+            patch.dict(sys.modules, {"sounddevice": mock_sd}),
             patch("pulsescribe_daemon.get_provider", mock_get_provider),
             patch("pulsescribe_daemon.get_sound_player", mock_get_player),
         ):
@@ -198,9 +228,12 @@ class TestDaemonMode(unittest.TestCase):
             mock_get_provider.assert_called_with("openai")
             mock_provider.transcribe.assert_called_once()
             call_args = mock_provider.transcribe.call_args
-            self.assertEqual(
-                str(call_args[0][0]), "/tmp/fake.wav"
-            )  # First arg is audio_path
+            # Kein Temp-WAV: Provider bekommt kodiertes Audio aus dem Speicher
+            audio = call_args[0][0]
+            self.assertIsInstance(audio, InMemoryAudio)
+            self.assertEqual(audio.sample_rate, 16000)
+            self.assertEqual(audio.codec, "flac")
+            self.assertTrue(audio.data.startswith(b"fLaC"))
             self.assertEqual(call_args[1]["model"], None)  # Default
             self.assertEqual(call_args[1]["language"], "de")
 
@@ -215,7 +248,6 @@ class TestDaemonMode(unittest.TestCase):
 
         mock_sd = MagicMock()
         mock_sf = MagicMock()
-        mock_np = MagicMock()
 
         # Mock context manager for InputStream (kein Callback wird aufgerufen)
         mock_stream = MagicMock()
@@ -227,7 +259,7 @@ class TestDaemonMode(unittest.TestCase):
         with (
             patch.dict(
                 sys.modules,
-                {"sounddevice": mock_sd, "soundfile": mock_sf, "numpy": mock_np},
+                {"sounddevice": mock_sd, "soundfile": mock_sf},
             ),
             patch("pulsescribe_daemon.get_sound_player", mock_get_player),
         ):
@@ -257,7 +289,6 @@ class TestDaemonMode(unittest.TestCase):
 
         mock_sd = MagicMock()
         mock_sf = MagicMock()
-        mock_np = MagicMock()
 
         mock_stream = MagicMock()
         mock_sd.InputStream.return_value.__enter__.return_value = mock_stream
@@ -267,7 +298,9 @@ class TestDaemonMode(unittest.TestCase):
             if call_args:
                 callback = call_args[1].get("callback")
                 if callback:
-                    callback(MagicMock(), 100, None, None)
+                    import numpy as np
+
+                    callback(np.zeros((100, 1), dtype="float32"), 100, None, None)
             daemon._stop_event.set()
 
         mock_sd.sleep.side_effect = side_effect_sleep
@@ -279,7 +312,7 @@ class TestDaemonMode(unittest.TestCase):
         with (
             patch.dict(
                 sys.modules,
-                {"sounddevice": mock_sd, "soundfile": mock_sf, "numpy": mock_np},
+                {"sounddevice": mock_sd, "soundfile": mock_sf},
             ),
             patch("pulsescribe_daemon.get_provider", mock_get_provider),
             patch("pulsescribe_daemon.get_sound_player", mock_get_player),
@@ -349,13 +382,6 @@ class TestDaemonMode(unittest.TestCase):
                 "pulsescribe_daemon.get_sound_player",
                 MagicMock(return_value=mock_player),
             ),
-            patch(
-                "pulsescribe_daemon.tempfile.mkstemp",
-                return_value=(123, "/tmp/fake.wav"),
-            ),
-            patch("pulsescribe_daemon.os.close"),
-            patch("pulsescribe_daemon.os.path.exists", return_value=True),
-            patch("pulsescribe_daemon.os.unlink"),
         ):
             daemon._recording_worker()
 
@@ -0,0 +1,209 @@
+"""Tests für den Audio-Sender im Deepgram-Streaming.
+
+Enthält eine Aufhol-Messung gegen einen lokalen WebSocket-Server: nach einem
+künstlichen Hänger baut der Sender den Rückstau mit und ohne Frame-Bündelung ab
+(`pytest -s` zeigt die Zeiten).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+import providers.deepgram_stream as deepgram_stream
+from providers.deepgram_stream import StreamState, _AudioSender, _coalesce_limit
+
+CHUNK = b"\x01\x00" * 1024  # Ein PortAudio-Block (1024 Samples int16)
+CHUNK_INTERVAL = 0.016  # Zeitraffer: 64ms-Blöcke alle 16ms
+STALL = 0.4  # WebSocket-Hänger beim ersten Send
+SEND_LATENCY = 0.01  # Kosten pro WebSocket-Frame
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.frames: list[bytes] = []
+
+    async def send_media(self, data: bytes) -> None:
+        self.frames.append(data)
+
+
+def _sender(connection, audio_queue, max_frame_bytes=_coalesce_limit(16000)):
+    return _AudioSender(
+        connection, audio_queue, StreamState(), "test", max_frame_bytes=max_frame_bytes
+    )
+
+
+class TestCoalescing:
+    """Bündelung nur bei Rückstau."""
+
+    def test_realtime_chunks_sent_individually(self):
+        async def _run():
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            connection = _FakeConnection()
+            sender = _sender(connection, audio_queue)
+            task = asyncio.create_task(sender.run())
+            for _ in range(5):
+                audio_queue.put_nowait(CHUNK)
+                await asyncio.sleep(0.005)
+            audio_queue.put_nowait(None)
+            await task
+            return connection, sender
+
+        connection, sender = asyncio.run(_run())
+        assert connection.frames == [CHUNK] * 5
+        assert sender.stats.frames == sender.stats.chunks == 5
+        assert sender.stats.max_backlog == 0
+
+    def test_backlog_coalesced_up_to_limit(self):
+        limit = 4 * len(CHUNK)
+
+        async def _run():
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            chunks = [bytes([i]) * len(CHUNK) for i in range(10)]
+            for chunk in chunks:
+                audio_queue.put_nowait(chunk)
+            audio_queue.put_nowait(None)
+            connection = _FakeConnection()
+            sender = _sender(connection, audio_queue, max_frame_bytes=limit)
+            await sender.run()
+            return chunks, connection, sender
+
+        chunks, connection, sender = asyncio.run(_run())
+        assert b"".join(connection.frames) == b"".join(chunks)
+        assert [len(f) // len(CHUNK) for f in connection.frames] == [4, 4, 2]
+        assert sender.stats.chunks == 10
+        assert sender.stats.frames == 3
+        assert sender.stats.max_backlog == 10
+        assert len(sender.stats.catchups) == 1
+
+    def test_idle_abort_without_sentinel(self, monkeypatch):
+        monkeypatch.setattr(deepgram_stream, "FINALIZE_TIMEOUT", 0.1)
+
+        async def _run():
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            audio_queue.put_nowait(CHUNK)
+            sender = _sender(_FakeConnection(), audio_queue)
+            task = asyncio.create_task(sender.run())
+            await asyncio.sleep(0.01)
+            sender._state.stop_event.set()
+            await asyncio.wait_for(task, timeout=2.0)
+            return sender
+
+        sender = asyncio.run(_run())
+        assert sender._idle_abort
+        assert sender.stats.frames == 1
+
+    def test_send_error_stops_stream(self):
+        class _Broken:
+            async def send_media(self, data):
+                raise ConnectionError("weg")
+
+        async def _run():
+            audio_queue: asyncio.Queue = asyncio.Queue()
+            audio_queue.put_nowait(CHUNK)
+            sender = _sender(_Broken(), audio_queue)
+            await sender.run()
+            return sender
+
+        sender = asyncio.run(_run())
+        assert isinstance(sender._state.stream_error, ConnectionError)
+        assert sender._state.stop_event.is_set()
+
+
+class _Server:
+    """WebSocket-Stand-in, das nur empfangene Bytes zählt."""
+
+    def __init__(self):
+        self.received = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def _handler(self, websocket):
+        async for message in websocket:
+            if isinstance(message, bytes):
+                self.received += len(message)
+
+    async def _start(self):
+        from websockets.asyncio.server import serve
+
+        self.server = await serve(self._handler, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    def start(self) -> int:
+        self.thread.start()
+        return asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self) -> None:
+        async def _stop():
+            self.server.close()
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(_stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(2)
+
+
+@pytest.fixture
+def ws_server(monkeypatch):
+    pytest.importorskip("deepgram")
+    pytest.importorskip("websockets")
+    server = _Server()
+    port = server.start()
+    monkeypatch.setattr(
+        deepgram_stream, "DEEPGRAM_WS_URL", f"ws://127.0.0.1:{port}/v1/listen"
+    )
+    yield server
+    server.stop()
+
+
+class _SlowLink:
+    """Echte WebSocket mit injizierter Latenz: Hänger + Kosten pro Frame."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._stall = STALL
+
+    async def send_media(self, data: bytes) -> None:
+        if self._stall:
+            stall, self._stall = self._stall, 0.0
+            await asyncio.sleep(stall)
+        await asyncio.sleep(SEND_LATENCY)
+        await self._connection.send_media(data)
+
+
+async def _stream(max_frame_bytes: int, chunks: int = 60) -> _AudioSender:
+    async with deepgram_stream._create_deepgram_connection(
+        "test", model="nova-3", sample_rate=16000
+    ) as connection:
+        audio_queue: asyncio.Queue = asyncio.Queue()
+        sender = _sender(_SlowLink(connection), audio_queue, max_frame_bytes)
+        task = asyncio.create_task(sender.run())
+        for _ in range(chunks):
+            audio_queue.put_nowait(CHUNK)
+            await asyncio.sleep(CHUNK_INTERVAL)
+        audio_queue.put_nowait(None)
+        await task
+        return sender
+
+
+class TestCatchUp:
+    """Rückstau-Abbau nach einem WebSocket-Hänger."""
+
+    def test_coalescing_catches_up_faster(self, ws_server):
+        single = asyncio.run(_stream(max_frame_bytes=0))
+        received_single = ws_server.received
+        coalesced = asyncio.run(_stream(max_frame_bytes=_coalesce_limit(16000)))
+
+        single_ms = max(single.stats.catchups) * 1000
+        coalesced_ms = max(coalesced.stats.catchups) * 1000
+        print(
+            f"\nAufholen nach {STALL * 1000:.0f}ms Hänger "
+            f"({SEND_LATENCY * 1000:.0f}ms pro Frame): "
+            f"Chunk-weise {single_ms:.0f}ms ({single.stats.frames} Frames), "
+            f"gebündelt {coalesced_ms:.0f}ms ({coalesced.stats.frames} Frames, "
+            f"max. Rückstau {coalesced.stats.max_backlog})"
+        )
+        assert received_single == 60 * len(CHUNK)
+        assert ws_server.received == 2 * 60 * len(CHUNK)
+        assert coalesced.stats.frames < single.stats.frames
+        assert coalesced_ms < single_ms / 3
@@ -0,0 +1,230 @@
+"""Tests für die Standby-WebSocket gegen einen lokalen WebSocket-Server."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("deepgram")
+pytest.importorskip("websockets")
+
+import providers.deepgram_stream as deepgram_stream
+from providers.deepgram_standby import DeepgramStandby, StandbyKey
+
+KEY = StandbyKey("nova-3", "de", 16000)
+
+RESULTS = {
+    "type": "Results",
+    "channel_index": [0, 1],
+    "duration": 1.0,
+    "start": 0.0,
+    "is_final": True,
+    "speech_final": True,
+    "from_finalize": True,
+    "channel": {
+        "alternatives": [{"transcript": "hallo standby", "confidence": 1.0, "words": []}]
+    },
+    "metadata": {
+        "request_id": "r",
+        "model_info": {"name": "nova-3", "version": "1", "arch": "nova"},
+        "model_uuid": "u",
+    },
+}
+
+
+class _StandIn:
+    """Deepgram-Stand-in: zählt Verbindungen und KeepAlives, beantwortet Finalize."""
+
+    def __init__(self, handshake_delay: float = 0.0):
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self.keepalives = 0
+        self.paths: list[str] = []
+        self.media_bytes = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    async def _handler(self, websocket):
+        self.connections += 1
+        self.paths.append(websocket.request.path)
+        async for message in websocket:
+            if isinstance(message, bytes):
+                self.media_bytes += len(message)
+                continue
+            kind = json.loads(message).get("type")
+            if kind == "KeepAlive":
+                self.keepalives += 1
+            elif kind == "Finalize":
+                await websocket.send(json.dumps(RESULTS))
+            elif kind == "CloseStream":
+                await websocket.close()
+
+    async def _process_request(self, connection, request):
+        # Simulierter TLS-/Auth-Handshake
+        await asyncio.sleep(self.handshake_delay)
+
+    async def _start(self):
+        from websockets.asyncio.server import serve
+
+        self.server = await serve(
+            self._handler, "127.0.0.1", 0, process_request=self._process_request
+        )
+        return self.server.sockets[0].getsockname()[1]
+
+    def start(self) -> int:
+        self.thread.start()
+        return asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    def stop(self) -> None:
+        async def _stop():
+            self.server.close()
+            await self.server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(_stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(2)
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    server = _StandIn(handshake_delay=0.2)
+    port = server.start()
+    monkeypatch.setattr(
+        deepgram_stream, "DEEPGRAM_WS_URL", f"ws://127.0.0.1:{port}/v1/listen"
+    )
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test")
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def standby():
+    manager = DeepgramStandby(keepalive=0.05, ttl=60.0, idle_timeout=60.0, retry=0.05)
+    yield manager
+    manager.close()
+
+
+def _wait_for(condition, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Bedingung nicht erfüllt")
+        time.sleep(0.01)
+
+
+def _ready(standby: DeepgramStandby):
+    return lambda: standby._socket is not None
+
+
+async def _session(standby: DeepgramStandby, key: StandbyKey = KEY) -> float:
+    """Öffnet eine Session und gibt die Wartezeit bis zur Verbindung zurück."""
+    t0 = time.perf_counter()
+    async with standby.connection("test", key) as connection:
+        elapsed = time.perf_counter() - t0
+        await connection.send_media(b"\x00" * 320)
+    return elapsed
+
+
+class TestStandby:
+    """Übergabe, Nachschub und KeepAlive."""
+
+    def test_session_reuses_standby_and_replenishes(self, stand_in, standby):
+        standby.prepare(KEY)
+        _wait_for(_ready(standby))
+        assert stand_in.connections == 1
+
+        elapsed = standby.run(_session(standby))
+        assert elapsed < stand_in.handshake_delay
+        assert standby.hits == 1 and standby.misses == 0
+        assert "sample_rate=16000" in stand_in.paths[0]
+        assert "language=de" in stand_in.paths[0]
+
+        # Nach der Session steht sofort ein neuer Standby bereit
+        _wait_for(_ready(standby))
+        assert stand_in.connections == 2
+        assert standby.run(_session(standby)) < stand_in.handshake_delay
+        assert standby.hits == 2
+
+    def test_keepalive_sent_while_idle(self, stand_in, standby):
+        standby.prepare(KEY)
+        _wait_for(lambda: stand_in.keepalives >= 3)
+        assert stand_in.connections == 1
+
+    def test_mismatched_key_connects_fresh(self, stand_in, standby):
+        standby.prepare(KEY)
+        _wait_for(_ready(standby))
+
+        other = StandbyKey("nova-3", "de", 48000)
+        elapsed = standby.run(_session(standby, other))
+        assert elapsed >= stand_in.handshake_delay
+        assert standby.misses == 1
+        # Standby folgt den Parametern der letzten Aufnahme
+        _wait_for(lambda: standby._socket is not None and standby._key == other)
+
+    def test_without_standby_connects_fresh(self, stand_in, standby):
+        elapsed = standby.run(_session(standby))
+        assert elapsed >= stand_in.handshake_delay
+        assert standby.misses == 1
+
+    def test_lost_standby_falls_back(self, stand_in, standby):
+        standby.prepare(KEY)
+        _wait_for(_ready(standby))
+        standby.run(standby._socket.close())
+
+        assert standby.run(_session(standby)) >= stand_in.handshake_delay
+        assert standby.misses == 1
+
+    def test_idle_timeout_closes_standby(self, stand_in):
+        standby = DeepgramStandby(keepalive=0.05, idle_timeout=0.3, retry=0.05)
+        try:
+            standby.prepare(KEY)
+            _wait_for(_ready(standby))
+            _wait_for(lambda: standby._socket is None)
+            assert standby._task is None or standby._task.done()
+        finally:
+            standby.close()
+
+    def test_unreachable_server_retries(self, monkeypatch, standby):
+        monkeypatch.setattr(
+            deepgram_stream, "DEEPGRAM_WS_URL", "ws://127.0.0.1:9/v1/listen"
+        )
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "test")
+        standby.prepare(KEY)
+        time.sleep(0.2)
+        assert standby._socket is None
+        assert not standby._task.done()
+
+
+class TestStreamCore:
+    """deepgram_stream_core über den Standby-Manager."""
+
+    def test_core_uses_standby(self, stand_in, standby, monkeypatch):
+        # _graceful_shutdown sendet Finalize/CloseStream über diese Typen
+        pytest.importorskip("deepgram.extensions.types.sockets")
+        mic = Mock(active=False)
+        monkeypatch.setattr(
+            deepgram_stream, "_create_mic_stream", lambda *args: (mic, 16000)
+        )
+        monkeypatch.setattr(deepgram_stream, "PRE_DRAIN_DURATION", 0.0)
+        standby.prepare(StandbyKey("nova-3", None, 16000))
+        _wait_for(_ready(standby))
+
+        stop = threading.Event()
+        stop.set()
+        transcript = standby.run(
+            deepgram_stream.deepgram_stream_core(
+                "nova-3",
+                None,
+                early_buffer=[b"\x00" * 640] * 3,
+                play_ready=False,
+                external_stop_event=stop,
+                standby=standby,
+            )
+        )
+
+        assert transcript == "hallo standby"
+        assert standby.hits == 1
+        assert stand_in.media_bytes == 3 * 640
@@ -0,0 +1,124 @@
+"""Tests für Hedged Requests und Provider-Latenz-Histogramme."""
+
+import threading
+import time
+
+import pytest
+
+import providers.hedging as hedging
+from config import HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY, HEDGE_MIN_SAMPLES
+from providers.health import LatencyHistogram, get_registry
+from providers.hedging import hedge_delay, hedged_transcribe
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stats(monkeypatch):
+    monkeypatch.setattr(hedging, "stats", hedging.HedgeStats())
+
+
+def _slow(result, seconds, started=None):
+    def _call():
+        if started is not None:
+            started.set()
+        time.sleep(seconds)
+        return result
+
+    return _call
+
+
+def _fail(message="boom"):
+    def _call():
+        raise RuntimeError(message)
+
+    return _call
+
+
+class TestLatencyHistogram:
+    """Tests für LatencyHistogram."""
+
+    def test_percentile_needs_min_samples(self):
+        histogram = LatencyHistogram(min_samples=3)
+        histogram.record(1.0)
+        histogram.record(2.0)
+        assert histogram.percentile(95) is None
+        histogram.record(3.0)
+        assert histogram.percentile(95) == 3.0
+        assert histogram.percentile(50) == 2.0
+
+    def test_uses_duration_bucket_when_filled(self):
+        histogram = LatencyHistogram(min_samples=2)
+        for _ in range(2):
+            histogram.record(0.5, audio_s=3.0)
+            histogram.record(4.0, audio_s=60.0)
+        assert histogram.percentile(95, audio_s=2.0) == 0.5
+        assert histogram.percentile(95, audio_s=90.0) == 4.0
+        # Leere Klasse → alle Werte
+        assert histogram.percentile(95, audio_s=10.0) == 4.0
+
+    def test_window_keeps_recent_latencies(self):
+        histogram = LatencyHistogram(window=3, min_samples=1)
+        for latency in (9.0, 1.0, 1.0, 1.0):
+            histogram.record(latency)
+        assert len(histogram) == 3
+        assert histogram.percentile(95) == 1.0
+
+    def test_hedge_delay_defaults_without_history(self):
+        assert hedge_delay("groq") == HEDGE_DEFAULT_DELAY
+        for _ in range(HEDGE_MIN_SAMPLES):
+            hedging.get_histogram("groq").record(0.1)
+        assert hedge_delay("groq") == HEDGE_MIN_DELAY
+
+
+class TestHedgedTranscribe:
+    """Tests für hedged_transcribe."""
+
+    def test_without_secondary_records_latency(self):
+        assert hedged_transcribe(("groq", lambda: "hallo")) == ("hallo", "groq")
+        assert len(hedging.get_histogram("groq")) == 1
+        assert hedging.stats.requests == 0
+
+    def test_fast_primary_does_not_hedge(self):
+        secondary_started = threading.Event()
+        result = hedged_transcribe(
+            ("groq", lambda: "primär"),
+            ("local", _slow("sekundär", 0.0, secondary_started)),
+            delay=1.0,
+        )
+        assert result == ("primär", "groq")
+        assert not secondary_started.is_set()
+        assert hedging.stats.hedged == 0
+
+    def test_slow_primary_loses_to_secondary(self):
+        result = hedged_transcribe(
+            ("openai", _slow("primär", 1.0)),
+            ("local", _slow("sekundär", 0.0)),
+            delay=0.05,
+        )
+        assert result == ("sekundär", "local")
+        assert hedging.stats.hedged == 1
+        assert hedging.stats.secondary_wins == 1
+
+    def test_primary_can_still_win_after_hedge(self):
+        result = hedged_transcribe(
+            ("openai", _slow("primär", 0.1)),
+            ("local", _slow("sekundär", 1.0)),
+            delay=0.05,
+        )
+        assert result == ("primär", "openai")
+        assert hedging.stats.hedged == 1
+        assert hedging.stats.secondary_wins == 0
+
+    def test_primary_error_hedges_immediately(self):
+        t0 = time.perf_counter()
+        result = hedged_transcribe(
+            ("groq", _fail()), ("local", lambda: "sekundär"), delay=5.0
+        )
+        assert result == ("sekundär", "local")
+        assert time.perf_counter() - t0 < 1.0
+
+    def test_both_failing_raises_primary_error(self):
+        with pytest.raises(RuntimeError, match="primary"):
+            hedged_transcribe(
+                ("groq", _fail("primary")), ("local", _fail("secondary")), delay=0.01
+            )
+        assert get_registry().get("groq").consecutive_failures == 1
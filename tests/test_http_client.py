@@ -0,0 +1,212 @@
+"""Tests für den gemeinsamen HTTP-Transport der SDK-Clients."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import utils.http_client as http_client
+from config import (
+    DEEPGRAM_TIMEOUT,
+    GROQ_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_READ_TIMEOUT,
+    OPENAI_TIMEOUT,
+)
+from utils.http_client import (
+    credentials_signature,
+    get_http_client,
+    sdk_http_client,
+    swap_http_clients,
+)
+
+httpx = pytest.importorskip("httpx")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.connections = 0
+    server.paths = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients(monkeypatch):
+    monkeypatch.setattr(http_client, "_clients", {})
+    monkeypatch.setattr(http_client, "stats", http_client.PoolStats())
+
+
+class TestSharedClient:
+    """Ein Pool für alle SDK-Clients derselben httpx-Variante."""
+
+    def test_settings(self):
+        client = get_http_client()
+        assert client is get_http_client("httpx")
+        assert client.timeout.connect == HTTP_CONNECT_TIMEOUT
+        assert client.timeout.read == HTTP_READ_TIMEOUT
+        pool = client._transport._transport._pool
+        assert pool._max_connections == HTTP_MAX_CONNECTIONS
+        assert pool._keepalive_expiry == HTTP_KEEPALIVE_EXPIRY
+
+    def test_stats_count_pool_hits(self, http_server):
+        server, url = http_server
+        client = get_http_client()
+        for _ in range(3):
+            assert client.get(url).text == "ok"
+
+        assert server.connections == 1
+        assert http_client.stats.requests == 3
+        assert http_client.stats.connects == 1
+        assert http_client.stats.hit_ratio == pytest.approx(2 / 3)
+        assert "2/3" in http_client.stats.summary()
+
+    def test_sdk_clients_share_pool(self, monkeypatch):
+        groq = pytest.importorskip("groq")
+        openai = pytest.importorskip("openai")
+        import providers.groq
+        import refine.llm
+
+        monkeypatch.setenv("GROQ_API_KEY", "x")
+        monkeypatch.setattr(providers.groq, "_client", None)
+        monkeypatch.setattr(refine.llm, "_groq_client", None)
+
+        shared = sdk_http_client("groq")
+        assert isinstance(shared, httpx.Client)
+        assert providers.groq._get_client()._client is shared
+        assert refine.llm._get_groq_client()._client is shared
+        assert isinstance(providers.groq._get_client(), groq.Groq)
+
+        # OpenAI erwartet ggf. den Client seines httpx-Forks
+        client = openai.OpenAI(api_key="x", http_client=sdk_http_client("openai"))
+        assert client._client is sdk_http_client("openai")
+
+    def test_sdk_clients_keep_their_timeouts(self, monkeypatch):
+        pytest.importorskip("groq")
+        pytest.importorskip("openai")
+        pytest.importorskip("deepgram")
+        import providers.deepgram
+        import providers.groq
+        import providers.openai
+        import refine.llm
+
+        monkeypatch.setenv("GROQ_API_KEY", "x")
+        monkeypatch.setenv("OPENAI_API_KEY", "x")
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "x")
+        for module, name in (
+            (providers.groq, "_client"),
+            (providers.openai, "_client"),
+            (providers.deepgram, "_client"),
+            (refine.llm, "_openai_client"),
+        ):
+            monkeypatch.setattr(module, name, None)
+
+        # Ohne explizites timeout übernähmen die SDKs HTTP_READ_TIMEOUT (60s)
+        openai_timeout = providers.openai._get_client().timeout
+        assert openai_timeout.read == OPENAI_TIMEOUT
+        assert openai_timeout.connect == HTTP_CONNECT_TIMEOUT
+        assert refine.llm._get_openai_client().timeout.read == OPENAI_TIMEOUT
+        assert providers.groq._get_client().timeout.read == GROQ_TIMEOUT
+        deepgram = providers.deepgram._get_client()
+        assert deepgram._client_wrapper.get_timeout() == DEEPGRAM_TIMEOUT
+
+
+class TestProxy:
+    """Proxy-Variablen gelten trotz eigenem Transport."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_proxy_env(self, monkeypatch):
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+
+    def test_env_proxy_mounted(self, monkeypatch):
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        monkeypatch.setenv("NO_PROXY", "intern.example")
+        client = get_http_client()
+
+        proxied = client._transport_for_url(httpx.URL("https://api.groq.com/"))
+        assert proxied is not client._transport
+        assert isinstance(proxied, http_client._ObservedTransport)
+        assert proxied._transport._pool._keepalive_expiry == HTTP_KEEPALIVE_EXPIRY
+        assert (
+            client._transport_for_url(httpx.URL("https://intern.example/"))
+            is client._transport
+        )
+        assert (
+            client._transport_for_url(httpx.URL("http://api.groq.com/"))
+            is client._transport
+        )
+
+    def test_requests_go_through_proxy(self, http_server, monkeypatch):
+        server, url = http_server
+        monkeypatch.setenv("HTTP_PROXY", url)
+        assert get_http_client().get("http://api.example.invalid/x").text == "ok"
+        assert server.paths == ["http://api.example.invalid/x"]
+        assert http_client.stats.requests == 1
+
+    def test_no_proxy_without_env(self):
+        client = get_http_client()
+        assert (
+            client._transport_for_url(httpx.URL("https://api.groq.com/"))
+            is client._transport
+        )
+
+
+class TestSwap:
+    """Austausch nach geänderten Keys."""
+
+    def test_swap_resets_sdk_singletons(self, monkeypatch):
+        pytest.importorskip("groq")
+        import providers.groq
+
+        monkeypatch.setenv("GROQ_API_KEY", "alt")
+        monkeypatch.setattr(providers.groq, "_client", None)
+        old_sdk = providers.groq._get_client()
+        old_http = get_http_client()
+
+        monkeypatch.setenv("GROQ_API_KEY", "neu")
+        swap_http_clients(grace=0.05)
+
+        new_sdk = providers.groq._get_client()
+        assert new_sdk is not old_sdk
+        assert new_sdk.api_key == "neu"
+        assert new_sdk._client is get_http_client()
+        assert get_http_client() is not old_http
+        time.sleep(0.3)
+        assert old_http.is_closed
+        assert not get_http_client().is_closed
+
+    def test_credentials_signature_tracks_keys(self, monkeypatch):
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "a")
+        before = credentials_signature()
+        assert credentials_signature() == before
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "b")
+        assert credentials_signature() != before
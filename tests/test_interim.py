@@ -0,0 +1,172 @@
+"""Tests für den In-Process-Interim-Kanal.
+
+Enthält eine Latenz-Messung: Interim-Datei mit 150ms-Drosselung und
+200ms-Polling (bisheriger Weg) gegenüber dem Kanal mit Main-Thread-Hop
+(`pytest -s` zeigt die Zeiten).
+"""
+
+import queue
+import statistics
+import threading
+import time
+
+import pytest
+
+import utils.interim
+from utils.interim import InterimChannel
+
+UPDATES = 12
+UPDATE_INTERVAL = 0.08  # Typischer Abstand der Deepgram-Interims
+
+
+@pytest.fixture
+def interim_file(tmp_path, monkeypatch):
+    path = tmp_path / "pulsescribe.interim"
+    monkeypatch.setattr(utils.interim, "INTERIM_FILE", path)
+    return path
+
+
+class TestInterimChannel:
+    """Latest-Value-Slot, Abonnenten und Opt-in-Datei."""
+
+    def test_latest_value_and_subscribers(self):
+        channel = InterimChannel()
+        received = []
+        unsubscribe = channel.subscribe(received.append)
+
+        channel.publish("hallo")
+        channel.publish(" hallo welt ")
+        assert channel.latest().text == "hallo welt"
+        assert [u.text for u in received] == ["hallo", "hallo welt"]
+        assert received[1].seq == received[0].seq + 1
+
+        unsubscribe()
+        channel.clear()
+        assert channel.latest().text == ""
+        assert len(received) == 2
+
+    def test_failing_subscriber_does_not_block_others(self):
+        channel = InterimChannel()
+        received = []
+        channel.subscribe(lambda _u: 1 / 0)
+        channel.subscribe(received.append)
+        channel.publish("text")
+        assert [u.text for u in received] == ["text"]
+
+    def test_wait_returns_newer_update(self):
+        channel = InterimChannel()
+        seq = channel.latest().seq
+        assert channel.wait(seq, timeout=0.01) is None
+
+        threading.Timer(0.05, channel.publish, args=("später",)).start()
+        update = channel.wait(seq, timeout=2.0)
+        assert update is not None and update.text == "später"
+
+    def test_file_is_opt_in(self, interim_file, monkeypatch):
+        channel = InterimChannel()
+        monkeypatch.delenv("PULSESCRIBE_INTERIM_FILE", raising=False)
+        channel.publish("ohne datei")
+        assert not interim_file.exists()
+
+        monkeypatch.setenv("PULSESCRIBE_INTERIM_FILE", "true")
+        channel.publish("mit datei")
+        assert interim_file.read_text() == "mit datei"
+        # Gedrosselt: direkt folgendes Update landet nicht in der Datei
+        channel.publish("zu schnell")
+        assert interim_file.read_text() == "mit datei"
+        channel.clear()
+        assert not interim_file.exists()
+
+    def test_latency_summary(self):
+        channel = InterimChannel()
+        assert channel.latency_summary() is None
+        update = channel.publish("x")
+        assert channel.record_display(update) >= 0.0
+        assert "1 Updates" in channel.latency_summary()
+        channel.reset_latency()
+        assert channel.latency_summary() is None
+
+
+def _measure_file_polling(path, texts) -> list[float]:
+    """Bisheriger Weg: gedrosselt schreiben, mtime alle 200ms pollen."""
+    written_at: dict[str, float] = {}
+    latencies: list[float] = []
+    done = threading.Event()
+
+    def poll() -> None:
+        last_mtime = 0.0
+        while not done.is_set():
+            time.sleep(0.2)
+            try:
+                mtime = path.stat().st_mtime
+                if mtime > last_mtime:
+                    last_mtime = mtime
+                    text = path.read_text().strip()
+                    latencies.append(time.perf_counter() - written_at[text])
+            except FileNotFoundError:
+                pass
+
+    poller = threading.Thread(target=poll, daemon=True)
+    poller.start()
+    last_write = 0.0
+    for text in texts:
+        now = time.perf_counter()
+        if (now - last_write) * 1000 >= 150:
+            written_at[text] = now
+            path.write_text(text)
+            last_write = now
+        time.sleep(UPDATE_INTERVAL)
+    time.sleep(0.25)
+    done.set()
+    poller.join()
+    return [latency * 1000 for latency in latencies]
+
+
+def _measure_channel(texts) -> list[float]:
+    """Neuer Weg: Callback → Main-Thread-Queue → Anzeige."""
+    channel = InterimChannel()
+    main_queue: queue.Queue = queue.Queue()
+    latencies: list[float] = []
+
+    def main_loop() -> None:
+        while (block := main_queue.get()) is not None:
+            block()
+
+    main = threading.Thread(target=main_loop, daemon=True)
+    main.start()
+
+    def on_interim(update) -> None:
+        def show() -> None:
+            if channel.latest().seq == update.seq:
+                latencies.append(channel.record_display(update))
+
+        main_queue.put(show)
+
+    channel.subscribe(on_interim)
+    for text in texts:
+        channel.publish(text)
+        time.sleep(UPDATE_INTERVAL)
+    main_queue.put(None)
+    main.join()
+    return latencies
+
+
+class TestDisplayLatency:
+    """Publish → Anzeige: Kanal gegenüber Datei-Polling."""
+
+    def test_channel_beats_file_polling(self, tmp_path):
+        texts = [f"interim {i}" for i in range(UPDATES)]
+        file_ms = _measure_file_polling(tmp_path / "pulsescribe.interim", texts)
+        channel_ms = _measure_channel(texts)
+
+        print(
+            f"\nInterim-Anzeige-Latenz ({UPDATES} Updates alle "
+            f"{UPDATE_INTERVAL * 1000:.0f}ms): Datei-Polling Median "
+            f"{statistics.median(file_ms):.1f}ms ({len(file_ms)} angezeigt), "
+            f"Kanal Median {statistics.median(channel_ms):.2f}ms "
+            f"({len(channel_ms)} angezeigt)"
+        )
+        assert len(channel_ms) == UPDATES
+        assert len(file_ms) < UPDATES
+        assert statistics.median(channel_ms) < 20
+        assert statistics.median(channel_ms) < statistics.median(file_ms)
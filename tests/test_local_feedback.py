@@ -16,15 +16,12 @@ class TestLocalFeedback(unittest.TestCase):
         self.daemon = PulseScribeDaemon(mode="openai")
         # Disable timers to prevent interference
         self.daemon._stop_result_polling = MagicMock()
-        self.daemon._stop_interim_polling = MagicMock()
+        self.daemon._stop_interim_updates = MagicMock()
         self.daemon._overlay = MagicMock()  # Mock UI
 
     def test_start_recording_sets_listening_state(self):
         """Test that _start_recording sets initial state to LISTENING."""
-        with (
-            patch("pulsescribe_daemon.threading.Thread"),
-            patch("pulsescribe_daemon.INTERIM_FILE"),
-        ):
+        with patch("pulsescribe_daemon.threading.Thread"):
             self.daemon._start_recording()
 
         self.assertTrue(self.daemon._recording)
@@ -138,15 +135,20 @@ class TestLocalFeedback(unittest.TestCase):
                 sys.modules,
                 {"sounddevice": mock_sd, "soundfile": MagicMock(), "numpy": np},
             ),
-            patch("pulsescribe_daemon.get_provider"),
+            patch("pulsescribe_daemon.get_provider") as mock_get_provider,
             patch("pulsescribe_daemon.get_sound_player"),
-            patch("pulsescribe_daemon.tempfile.mkstemp", return_value=(1, "tmp")),
-            patch("pulsescribe_daemon.os.close"),
-            patch("pulsescribe_daemon.os.unlink"),
-            patch("pulsescribe_daemon.os.path.exists", return_value=True),
         ):
+            mock_get_provider.return_value.transcribe.return_value = "hallo"
             self.daemon._recording_worker()
 
+            # Upload direkt aus dem Speicher (kein Temp-WAV)
+            from audio.memory import InMemoryAudio
+
+            transcribe = mock_get_provider.return_value.transcribe
+            transcribe.assert_called_once()
+            upload = transcribe.call_args.args[0]
+            self.assertIsInstance(upload, InMemoryAudio)
+
             # Verify RMS calculation flow
             # 1. AUDIO_LEVEL message should be in queue
             # 2. TRANSCRIPT_RESULT message should be in queue
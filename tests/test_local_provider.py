@@ -3,6 +3,8 @@
 Testet insbesondere das Lightning-Backend und dessen Integration.
 """
 
+import sys
+
 import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
@@ -620,3 +622,1033 @@ class TestLightningFallback:
             assert result == "Lightning Success"
             # MLX sollte NICHT aufgerufen werden
             mock_mlx.assert_not_called()
+
+
+class TestLocalStreamingSession:
+    """Tests für Pseudo-Streaming (providers/local_stream.py)."""
+
+    SR = 16000
+
+    @staticmethod
+    def _speech(seconds: float) -> np.ndarray:
+        return np.full(int(16000 * seconds), 0.1, dtype=np.float32)
+
+    @staticmethod
+    def _silence(seconds: float) -> np.ndarray:
+        return np.zeros(int(16000 * seconds), dtype=np.float32)
+
+    def _session(self, decode, **kwargs):
+        from providers.local import LocalProvider
+        from providers.local_stream import LocalStreamingSession
+
+        provider = LocalProvider()
+        provider._decode = MagicMock(side_effect=decode)  # type: ignore[method-assign]
+        provider._build_options = MagicMock(return_value={})  # type: ignore[method-assign]
+        session = LocalStreamingSession(provider, model="tiny", **kwargs)
+        return provider, session
+
+    def test_supports_streaming_opt_in(self, monkeypatch):
+        """supports_streaming() folgt PULSESCRIBE_LOCAL_STREAMING (Default: aus)."""
+        from providers.local import LocalProvider
+
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_STREAMING", raising=False)
+        assert LocalProvider().supports_streaming() is False
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_STREAMING", "true")
+        assert LocalProvider().supports_streaming() is True
+
+    def test_commits_when_hypotheses_agree_at_pause(self):
+        """Zwei gleiche Hypothesen + Pause am Ende → Commit, finish() dekodiert nur Rest."""
+        provider, session = self._session(lambda audio, *_: "hallo welt")
+
+        session.feed(self._speech(1.5))
+        session.feed(self._silence(0.5))
+        session.step()  # erste Hypothese
+        assert session.committed_text == ""
+        session.step()  # zweite, identische Hypothese → Commit
+        assert session.committed_text == "hallo welt"
+        assert session.committed_seconds == pytest.approx(2.0)
+
+        session.feed(self._speech(1.0))
+        provider._decode.side_effect = lambda audio, *_: "und tschüss"
+        result = session.finish()
+
+        assert result == "hallo welt und tschüss"
+        # Finaler Decode bekommt nur den Rest (1.0s) + Tail-Padding (0.2s)
+        tail_audio = provider._decode.call_args[0][0]
+        assert tail_audio.shape[0] == int(self.SR * 1.2)
+
+    def test_no_commit_without_pause(self):
+        """Ohne Pause am Fensterende wird nicht committet."""
+        _provider, session = self._session(lambda audio, *_: "hallo")
+
+        session.feed(self._speech(2.0))
+        session.step()
+        session.step()
+
+        assert session.committed_text == ""
+        assert session.committed_seconds == 0.0
+
+    def test_force_commit_when_window_exceeded(self):
+        """Zu lange Fenster werden an der leisesten Stelle geschnitten."""
+        provider, session = self._session(
+            lambda audio, *_: "teil", window_s=3.0
+        )
+
+        session.feed(self._speech(2.5))
+        session.feed(self._silence(0.1))
+        session.feed(self._speech(1.0))
+        session.step()
+
+        assert session.committed_text == "teil"
+        cut_s = session.committed_seconds
+        assert 2.5 <= cut_s <= 2.6
+
+    def test_interim_callback_receives_committed_and_tentative(self):
+        """Interims enthalten committeten Text plus aktuelle Hypothese."""
+        interims: list[str] = []
+        provider, session = self._session(
+            lambda audio, *_: "eins", on_interim=interims.append
+        )
+
+        session.feed(self._speech(1.5))
+        session.feed(self._silence(0.5))
+        session.step()
+        session.step()
+        session.feed(self._speech(1.5))
+        provider._decode.side_effect = lambda audio, *_: "zwei"
+        session.step()
+
+        assert interims == ["eins", "eins zwei"]
+
+    def test_silence_only_skips_decode(self):
+        """Reine Stille wird weder während noch am Ende dekodiert."""
+        provider, session = self._session(lambda audio, *_: "halluzination")
+
+        session.feed(self._silence(3.0))
+        session.step()
+
+        assert session.finish() == ""
+        provider._decode.assert_not_called()
+
+    def test_snapshot_is_view_without_recopy(self):
+        """Jeder Schritt liest eine View auf den Puffer statt alles neu zu kopieren."""
+        _provider, session = self._session(lambda audio, *_: "")
+
+        session.feed(self._speech(1.0))
+        first = session._snapshot()
+        session.feed(self._silence(0.5).reshape(-1, 1))
+        second = session._snapshot()
+
+        assert np.shares_memory(second, session._buffer._data)
+        assert first.shape[0] == self.SR
+        assert second.shape[0] == int(self.SR * 1.5)
+        np.testing.assert_array_equal(second[: self.SR], first)
+
+    def test_worker_thread_runs_and_finish_joins(self):
+        """start() dekodiert periodisch im Hintergrund; finish() beendet den Worker."""
+        provider, session = self._session(
+            lambda audio, *_: "hallo", interval_s=0.05
+        )
+        session.feed(self._speech(1.5))
+        session.start()
+
+        import time
+
+        deadline = time.monotonic() + 2.0
+        while provider._decode.call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert session.finish() == "hallo"
+        assert provider._decode.call_count >= 2
+        assert session._thread is not None and not session._thread.is_alive()
+
+
+class TestFasterBatchedLongForm:
+    """Tests für Batched Long-Form Decoding (faster-whisper)."""
+
+    def test_split_at_silence_respects_max_chunk_and_order(self):
+        """Chunks sind ≤ max_chunk, lückenlos sortiert und schneiden in Pausen."""
+        from providers.local import _split_at_silence
+
+        sr = 16000
+        speech = np.full(sr * 8, 0.1, dtype=np.float32)
+        pause = np.zeros(sr // 2, dtype=np.float32)
+        audio = np.concatenate([speech, pause, speech, pause, speech])
+
+        clips = _split_at_silence(audio, sr, max_chunk_s=10.0)
+
+        assert len(clips) == 3
+        assert clips[0]["start"] == 0
+        assert clips[-1]["end"] == audio.shape[0]
+        for prev, cur in zip(clips, clips[1:]):
+            assert prev["end"] == cur["start"]
+        for clip in clips:
+            assert clip["end"] - clip["start"] <= sr * 10
+            # Schnitt liegt in der Pause, nicht mitten in Sprache
+            if clip["end"] < audio.shape[0]:
+                assert audio[clip["end"]] == 0.0
+
+    def test_split_at_silence_drops_silent_chunks(self):
+        """Reine Stille-Chunks werden verworfen."""
+        from providers.local import _split_at_silence
+
+        sr = 16000
+        audio = np.concatenate(
+            [
+                np.full(sr * 4, 0.1, dtype=np.float32),
+                np.zeros(sr * 12, dtype=np.float32),
+            ]
+        )
+
+        clips = _split_at_silence(audio, sr, max_chunk_s=5.0)
+
+        assert all(float(audio[c["start"] : c["end"]].max()) > 0 for c in clips)
+        assert clips[0]["start"] == 0
+
+    def test_build_options_batch_size_only_for_faster(self, monkeypatch):
+        """PULSESCRIBE_LOCAL_BATCH_SIZE landet nur bei faster-whisper in den Options."""
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BATCH_SIZE", "8")
+        with patch("providers.local.load_vocabulary", return_value={"keywords": []}):
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+            assert LocalProvider()._build_options("de")["batch_size"] == 8
+
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "whisper")
+            assert "batch_size" not in LocalProvider()._build_options("de")
+
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_BATCH_SIZE", "1")
+            assert "batch_size" not in LocalProvider()._build_options("de")
+
+    def test_transcribe_faster_uses_batched_pipeline(self, monkeypatch):
+        """Mit batch_size wird BatchedInferencePipeline mit clip_timestamps genutzt."""
+        from providers.local import LocalProvider
+
+        sr = 16000
+        audio = np.concatenate(
+            [
+                np.full(sr * 20, 0.1, dtype=np.float32),
+                np.zeros(sr, dtype=np.float32),
+                np.full(sr * 20, 0.1, dtype=np.float32),
+            ]
+        )
+
+        seg_a, seg_b = MagicMock(text=" eins"), MagicMock(text=" zwei")
+        pipeline = MagicMock()
+        pipeline.transcribe.return_value = (iter([seg_a, seg_b]), None)
+        fake_fw = MagicMock()
+        fake_fw.BatchedInferencePipeline.return_value = pipeline
+        model = MagicMock()
+
+        provider = LocalProvider()
+        provider._backend = "faster"
+        provider._device = "cpu"
+        with (
+            patch.dict("sys.modules", {"faster_whisper": fake_fw}),
+            patch.object(provider, "_get_faster_model", return_value=model),
+        ):
+            result = provider._transcribe_faster(
+                audio, "turbo", {"language": "de", "batch_size": 4}
+            )
+
+        assert result == " eins zwei"
+        model.transcribe.assert_not_called()
+        fake_fw.BatchedInferencePipeline.assert_called_once_with(model=model)
+        kwargs = pipeline.transcribe.call_args.kwargs
+        assert kwargs["batch_size"] == 4
+        assert kwargs["vad_filter"] is False
+        assert len(kwargs["clip_timestamps"]) == 2
+
+    def test_transcribe_faster_batched_short_audio_stays_sequential(self):
+        """Ein einzelner kurzer Chunk geht den normalen Pfad."""
+        from providers.local import LocalProvider
+
+        audio = np.full(16000 * 3, 0.1, dtype=np.float32)
+        model = MagicMock()
+        model.transcribe.return_value = (iter([MagicMock(text="kurz")]), None)
+
+        provider = LocalProvider()
+        provider._backend = "faster"
+        provider._device = "cpu"
+        with (
+            patch.dict("sys.modules", {"faster_whisper": MagicMock()}),
+            patch.object(provider, "_get_faster_model", return_value=model),
+        ):
+            result = provider._transcribe_faster(audio, "turbo", {"batch_size": 4})
+
+        assert result == "kurz"
+        assert "batch_size" not in model.transcribe.call_args.kwargs
+
+
+class TestReplicaPool:
+    """Tests für den Modell-Replikat-Pool (ersetzt den globalen Transcribe-Lock)."""
+
+    def test_default_single_replica(self, monkeypatch):
+        """Ohne ENV gibt es genau ein Replikat und keinen Cache-Key-Suffix."""
+        from providers.local import LocalProvider
+
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_REPLICAS", raising=False)
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        provider = LocalProvider()
+
+        assert provider.get_pool_stats()["replicas"] == 1
+        with provider._acquire_replica() as index:
+            assert index == 0
+            assert provider._replica_suffix() == ""
+        assert "replicas" not in provider.get_runtime_info()
+
+    def test_replicas_forced_to_one_on_metal_backends(self, monkeypatch):
+        """mlx/lightning ignorieren PULSESCRIBE_LOCAL_REPLICAS."""
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REPLICAS", "4")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "lightning")
+
+        assert LocalProvider().get_pool_stats()["replicas"] == 1
+
+    def test_metal_replica_warning_logged_once(self, monkeypatch, caplog):
+        """Die Ignoriert-Warnung erscheint nicht bei jeder Transkription."""
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REPLICAS", "4")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "lightning")
+        provider = LocalProvider()
+
+        with caplog.at_level("WARNING", logger="pulsescribe.providers.local"):
+            for _ in range(3):
+                with provider._acquire_replica():
+                    pass
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_REPLICAS", "2")
+            with provider._acquire_replica():
+                pass
+
+        warnings = [r for r in caplog.records if "REPLICAS" in r.getMessage()]
+        assert len(warnings) == 2
+
+    def test_cpu_threads_split_across_replicas(self, monkeypatch):
+        """Jedes Replikat bekommt seinen Anteil an PULSESCRIBE_LOCAL_CPU_THREADS."""
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REPLICAS", "4")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_CPU_THREADS", "16")
+        provider = LocalProvider()
+        provider._ensure_runtime_config()
+
+        assert provider._cpu_threads_share() == 4
+        assert provider.get_runtime_info()["replicas"] == "4"
+
+    def test_concurrent_requests_use_distinct_replicas(self, monkeypatch):
+        """Parallele Anfragen laufen gleichzeitig auf verschiedenen Replikaten."""
+        import threading
+
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_REPLICAS", "2")
+        provider = LocalProvider()
+
+        barrier = threading.Barrier(2, timeout=2.0)
+        seen: list[str] = []
+
+        def fake_faster(audio, model_name, options):
+            seen.append(provider._replica_suffix())
+            # Beide Anfragen müssen gleichzeitig hier ankommen (sonst Timeout)
+            barrier.wait()
+            return "ok"
+
+        with patch.object(provider, "_transcribe_faster", side_effect=fake_faster):
+            threads = [
+                threading.Thread(
+                    target=provider._decode, args=(np.zeros(10), "tiny", {})
+                )
+                for _ in range(2)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=3.0)
+
+        assert sorted(seen) == ["", ":r1"]
+        assert not barrier.broken
+
+    def test_pool_reports_queue_depth_and_wait(self, monkeypatch):
+        """Ist das einzige Replikat belegt, wartet die Anfrage und wird gezählt."""
+        import threading
+        import time
+
+        from providers.local import _ReplicaPool
+
+        pool = _ReplicaPool(1)
+        released = threading.Event()
+
+        def hold():
+            with pool.acquire():
+                released.wait(timeout=2.0)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        while pool.stats()["busy"] == 0:
+            time.sleep(0.005)
+
+        waiter = threading.Thread(target=lambda: pool.acquire().__enter__())
+        waiter.start()
+        deadline = time.monotonic() + 2.0
+        while pool.stats()["queue_depth"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert pool.stats()["queue_depth"] == 1
+
+        time.sleep(0.06)
+        released.set()
+        holder.join(timeout=2.0)
+        waiter.join(timeout=2.0)
+
+        stats = pool.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["requests"] == 2
+        assert stats["wait_max"] >= 0.05
+
+
+class TestModelCache:
+    """Tests für den budgetierten LRU-Modell-Cache (providers/local_cache.py)."""
+
+    MB = 1024 * 1024
+
+    @staticmethod
+    def _model(size_mb: int):
+        """Fake-PyTorch-Modell mit exakt messbarer Größe."""
+        param = MagicMock()
+        param.numel.return_value = size_mb * 1024 * 1024
+        param.element_size.return_value = 1
+        model = MagicMock()
+        model.parameters.return_value = [param]
+        return model
+
+    def test_lookup_counts_hits_and_misses(self):
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache()
+        assert cache.lookup("whisper:tiny:cpu") is None
+        cache["whisper:tiny:cpu"] = self._model(10)
+        assert cache.lookup("whisper:tiny:cpu") is not None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["resident_ram_bytes"] == 10 * self.MB
+
+    def test_ram_budget_evicts_least_recently_used(self):
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache(ram_budget_mb=25)
+        cache["whisper:a:cpu"] = self._model(10)
+        cache["whisper:b:cpu"] = self._model(10)
+        cache.lookup("whisper:a:cpu")  # a ist jetzt jünger als b
+        cache["whisper:c:cpu"] = self._model(10)
+
+        assert "whisper:a:cpu" in cache
+        assert "whisper:b:cpu" not in cache
+        assert "whisper:c:cpu" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_single_model_over_budget_is_kept(self):
+        """Das gerade geladene Modell wird nie sofort wieder verworfen."""
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache(ram_budget_mb=5)
+        cache["whisper:big:cpu"] = self._model(10)
+
+        assert "whisper:big:cpu" in cache
+
+    def test_cold_miss_reported_after_eviction(self, caplog):
+        import logging
+
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache(ram_budget_mb=15)
+        cache["whisper:a:cpu"] = self._model(10)
+        cache["whisper:b:cpu"] = self._model(10)
+
+        with caplog.at_level(logging.INFO, logger="pulsescribe.providers.local"):
+            assert cache.lookup("whisper:a:cpu") is None
+
+        assert cache.stats()["cold_misses"] == 1
+        assert "Cold Cache" in caplog.text
+
+    def test_idle_unload(self, monkeypatch):
+        import providers.local_cache as local_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(local_cache.time, "monotonic", lambda: now[0])
+        cache = local_cache.ModelCache()
+        cache.idle_unload_s = 1200.0  # ohne Sweeper-Thread
+        cache["whisper:a:cpu"] = self._model(1)
+        now[0] += 600
+        cache["whisper:b:cpu"] = self._model(1)
+        now[0] += 700
+
+        assert cache.unload_idle() == 1
+        assert "whisper:a:cpu" not in cache
+        assert "whisper:b:cpu" in cache
+
+    def test_vram_pressure_parks_ctranslate2_models(self):
+        """CUDA-faster-Modelle werden bei VRAM-Druck in den RAM geparkt und schnell zurückgeholt."""
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache(vram_budget_mb=1000)
+        # faster:tiny int8 ≈ 37 MB, large float16 ≈ 2.9 GB → Budget überschritten
+        tiny = MagicMock(spec=["model"])
+        large = MagicMock(spec=["model"])
+        cache["faster:tiny:cuda:int8:0:1"] = tiny
+        cache["faster:large-v3:cuda:float16:0:1"] = large
+
+        tiny.model.unload_model.assert_called_once_with(to_cpu=True)
+        stats = cache.stats()
+        assert stats["parked"] == 1
+        assert "faster:tiny:cuda:int8:0:1" in cache
+
+        assert cache.lookup("faster:tiny:cuda:int8:0:1") is tiny
+        tiny.model.load_model.assert_called_once()
+        assert cache.stats()["warm_reloads"] == 1
+        # Jetzt wurde das große Modell geparkt
+        large.model.unload_model.assert_called_once_with(to_cpu=True)
+
+    def test_failed_unpark_drops_entry_and_counts_miss(self):
+        """Scheitert das Zurückladen, wird der Eintrag verworfen und neu geladen."""
+        from providers.local_cache import ModelCache
+
+        cache = ModelCache(vram_budget_mb=1000)
+        tiny = MagicMock(spec=["model"])
+        tiny.model.load_model.side_effect = RuntimeError("CUDA out of memory")
+        cache["faster:tiny:cuda:int8:0:1"] = tiny
+        cache["faster:large-v3:cuda:float16:0:1"] = MagicMock(spec=["model"])
+        assert cache.stats()["parked"] == 1
+
+        assert cache.lookup("faster:tiny:cuda:int8:0:1") is None
+
+        stats = cache.stats()
+        assert "faster:tiny:cuda:int8:0:1" not in cache
+        assert (stats["hits"], stats["misses"]) == (0, 1)
+        assert stats["cold_misses"] == 1
+        assert stats["parked"] == 0
+        assert stats["warm_reloads"] == 0
+
+    def test_runtime_info_exposes_cache_stats(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        provider = LocalProvider()
+        provider._model_cache["faster:tiny:cpu:int8:0:1"] = MagicMock(spec=[])
+        provider._model_cache.lookup("faster:tiny:cpu:int8:0:1")
+
+        info = provider.get_runtime_info()
+        assert info["cache_hits"] == "1"
+        assert info["cache_misses"] == "0"
+        assert info["cache_evictions"] == "0"
+        assert int(info["cache_resident_mb"] or 0) > 0
+
+
+class TestModelTierRouting:
+    """Tests für dauerbasiertes Modell-Routing (short/en/main)."""
+
+    def _provider(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        provider = LocalProvider()
+        provider._decode = MagicMock(return_value="ok")  # type: ignore[method-assign]
+        provider._build_options = MagicMock(return_value={})  # type: ignore[method-assign]
+        return provider
+
+    def test_no_tiers_keeps_main_model(self, monkeypatch):
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_SHORT_MODEL", raising=False)
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_EN_MODEL", raising=False)
+        provider = self._provider(monkeypatch)
+
+        provider.transcribe_audio(np.zeros(16000), model="turbo", language="en")
+
+        assert provider._decode.call_args[0][1] == "turbo"
+
+    def test_short_clip_uses_short_tier(self, monkeypatch, caplog):
+        import logging
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_SHORT_MODEL", "base")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_SHORT_MAX_SECONDS", "3")
+        provider = self._provider(monkeypatch)
+
+        with caplog.at_level(logging.INFO, logger="pulsescribe.providers.local"):
+            provider.transcribe_audio(np.zeros(16000 * 2), model="turbo", language="de")
+        assert provider._decode.call_args[0][1] == "base"
+        assert "tier=short" in caplog.text
+        assert "rtf=" in caplog.text
+
+        provider.transcribe_audio(np.zeros(16000 * 5), model="turbo", language="de")
+        assert provider._decode.call_args[0][1] == "turbo"
+
+    def test_english_tier_only_for_explicit_en(self, monkeypatch):
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_SHORT_MODEL", raising=False)
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_EN_MODEL", "large-en")
+        provider = self._provider(monkeypatch)
+
+        provider.transcribe_audio(np.zeros(16000 * 10), model="turbo", language="en")
+        assert provider._decode.call_args[0][1] == "large-en"
+
+        provider.transcribe_audio(np.zeros(16000 * 10), model="turbo", language="auto")
+        assert provider._decode.call_args[0][1] == "turbo"
+
+    def test_short_tier_wins_over_english_tier(self, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_SHORT_MODEL", "tiny")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_EN_MODEL", "large-en")
+        provider = self._provider(monkeypatch)
+
+        provider.transcribe_audio(np.zeros(16000), model="turbo", language="en")
+
+        assert provider._decode.call_args[0][1] == "tiny"
+
+    def test_preload_loads_all_tiers(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_SHORT_MODEL", "base")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_EN_MODEL", "turbo")
+        provider = LocalProvider()
+
+        with patch.object(provider, "_preload_model") as mock_preload:
+            provider.preload("turbo")
+
+        # turbo ist main und en → nur einmal laden
+        assert [c.args[0] for c in mock_preload.call_args_list] == ["turbo", "base"]
+
+    def test_faster_maps_english_aliases(self):
+        from providers.local import LocalProvider
+
+        provider = LocalProvider()
+        assert provider._map_faster_model_name("large-en") == "distil-large-v3"
+        assert provider._map_faster_model_name("small-en") == "distil-small.en"
+
+
+class TestMachineProfile:
+    """Tests für Kalibrierung und persistentes Profil (providers/local_profile.py)."""
+
+    def test_word_error_rate(self):
+        from providers.local_profile import word_error_rate
+
+        assert word_error_rate("Hallo Welt.", "hallo welt") == 0.0
+        assert word_error_rate("eins zwei drei vier", "eins zwo drei vier") == 0.25
+        assert word_error_rate("", "") == 0.0
+
+    def test_profile_roundtrip_and_machine_binding(self, tmp_path):
+        from providers.local_profile import (
+            PROFILE_VERSION,
+            load_profile,
+            machine_fingerprint,
+            save_profile,
+        )
+
+        path = tmp_path / "local_profile.json"
+        profile = {
+            "version": PROFILE_VERSION,
+            "machine": machine_fingerprint(),
+            "backend": "faster",
+            "compute_type": "int8",
+        }
+        save_profile(profile, path)
+        assert load_profile(path) == profile
+
+        profile["machine"] = {**profile["machine"], "cpu_count": -1}
+        save_profile(profile, path)
+        assert load_profile(path) is None
+
+    def test_save_profile_creates_config_dir(self, tmp_path):
+        from providers.local_profile import load_profile, save_profile
+
+        path = tmp_path / "neu" / ".pulsescribe" / "local_profile.json"
+        save_profile({"version": 0}, path)
+        assert path.exists()
+        assert load_profile(path) is None
+
+    def test_calibration_env_clears_tier_models(self, monkeypatch):
+        import os
+
+        from providers.local_profile import _temp_env
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_SHORT_MODEL", "tiny")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_EN_MODEL", "small.en")
+        with _temp_env({"PULSESCRIBE_LOCAL_FAST": "true"}):
+            assert "PULSESCRIBE_LOCAL_SHORT_MODEL" not in os.environ
+            assert "PULSESCRIBE_LOCAL_EN_MODEL" not in os.environ
+        assert os.environ["PULSESCRIBE_LOCAL_SHORT_MODEL"] == "tiny"
+        assert os.environ["PULSESCRIBE_LOCAL_EN_MODEL"] == "small.en"
+
+    def test_ensure_runtime_config_applies_profile(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        for key in (
+            "PULSESCRIBE_LOCAL_COMPUTE_TYPE",
+            "PULSESCRIBE_LOCAL_CPU_THREADS",
+            "PULSESCRIBE_LOCAL_FAST",
+            "PULSESCRIBE_LOCAL_PROFILE",
+        ):
+            monkeypatch.delenv(key, raising=False)
+        profile = {
+            "backend": "faster",
+            "compute_type": "int8_float32",
+            "cpu_threads": 6,
+            "fast": False,
+        }
+        with patch("providers.local_profile.load_profile", return_value=profile):
+            provider = LocalProvider()
+            provider._ensure_runtime_config()
+            assert provider._compute_type == "int8_float32"
+            assert provider._fast_mode is False
+            assert provider._cpu_threads_share() == 6
+
+            # ENV schlägt Profil
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE", "float32")
+            provider.invalidate_runtime_config()
+            provider._ensure_runtime_config()
+            assert provider._compute_type == "float32"
+
+            # Profil für anderes Backend wird ignoriert
+            monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "whisper")
+            monkeypatch.delenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE")
+            provider.invalidate_runtime_config()
+            provider._ensure_runtime_config()
+            assert provider._compute_type is None
+
+    def test_profile_opt_out(self, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_PROFILE", "false")
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_COMPUTE_TYPE", raising=False)
+        with patch("providers.local_profile.load_profile") as mock_load:
+            LocalProvider()._ensure_runtime_config()
+        mock_load.assert_not_called()
+
+    def test_calibrate_picks_fastest_within_wer_limit(self, monkeypatch, tmp_path):
+        import providers.local_profile as lp
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setattr(
+            lp,
+            "candidate_configs",
+            lambda backend, device: [
+                {"compute_type": "float32", "cpu_threads": 8, "fast": False},
+                {"compute_type": "int8", "cpu_threads": 8, "fast": True},
+                {"compute_type": "int8", "cpu_threads": 4, "fast": True},
+            ],
+        )
+        measured = {
+            ("float32", 8): ("das ist ein test", 0.5),
+            ("int8", 8): ("das ist ein fest", 0.1),  # zu ungenau
+            ("int8", 4): ("das ist ein test", 0.2),
+        }
+
+        def fake_run(audio, model, language, config):
+            text, rtf = measured[(config["compute_type"], config["cpu_threads"])]
+            return {**config, "text": text, "rtf": rtf, "load_s": 0.0, "peak_rss_mb": 100.0}
+
+        monkeypatch.setattr(lp, "_run_config", fake_run)
+        monkeypatch.setattr(lp, "_load_reference_audio", lambda p: np.zeros(16000 * 5))
+        saved = {}
+        monkeypatch.setattr(lp, "save_profile", lambda profile: saved.update(profile))
+
+        profile = lp.calibrate(tmp_path / "ref.wav", model="tiny", max_wer=0.1)
+
+        assert profile["compute_type"] == "int8"
+        assert profile["cpu_threads"] == 4
+        assert profile["backend"] == "faster"
+        assert len(profile["results"]) == 3
+        assert saved["compute_type"] == "int8"
+
+
+class TestLocalWorker:
+    """Tests für den Out-of-Process-Worker (providers/local_worker.py)."""
+
+    @pytest.fixture
+    def worker(self, tmp_path):
+        from providers.local_worker import LocalWorker
+
+        provider = MagicMock()
+        provider.transcribe_audio.side_effect = (
+            lambda audio, model=None, language=None: f"{len(audio)}:{audio.sum():.1f}:{model}"
+        )
+        provider.transcribe.return_value = "aus Datei"
+        provider.get_runtime_info.return_value = {"backend": "faster"}
+        self.token_file = tmp_path / "local_worker.token"
+        worker = LocalWorker(provider, model="turbo", token_file=self.token_file)
+        port = worker.start(port=0)
+        yield worker, provider, port
+        worker.stop()
+
+    def _client(self, port):
+        from providers.local_worker import LocalWorkerClient
+
+        return LocalWorkerClient(port=port, token_file=self.token_file)
+
+    def test_audio_via_shared_memory(self, worker):
+        from providers.local_worker import LocalWorkerClient
+
+        _, provider, port = worker
+        client = self._client(port)
+        audio = np.full(16000, 0.5, dtype=np.float32)
+
+        assert client.transcribe_audio(audio, language="de") == "16000:8000.0:turbo"
+        received = provider.transcribe_audio.call_args.args[0]
+        assert received.dtype == np.float32
+        assert provider.transcribe_audio.call_args.kwargs["language"] == "de"
+
+    def test_connect_only_when_warm(self, worker):
+        from providers.local_worker import LocalWorkerClient, connect_worker
+
+        w, provider, port = worker
+        client = self._client(port)
+        assert connect_worker(client) is None
+
+        w.preload()
+        proxy = connect_worker(client)
+        assert proxy is not None
+        assert proxy.transcribe_audio(np.zeros(8, dtype=np.float32)) == "8:0.0:turbo"
+        assert proxy.get_runtime_info()["backend"] == "faster"
+
+    def test_worker_error_is_raised(self, worker):
+        from providers.local_worker import LocalWorkerClient, WorkerError
+
+        _, provider, port = worker
+        provider.transcribe_audio.side_effect = RuntimeError("kaputt")
+        with pytest.raises(WorkerError, match="kaputt"):
+            self._client(port).transcribe_audio(np.zeros(4))
+
+    def test_falls_back_in_process_when_worker_gone(self):
+        from providers.local_worker import LocalWorkerClient, WorkerProvider
+
+        import socket
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        # Port wieder frei → niemand lauscht
+        proxy = WorkerProvider(LocalWorkerClient(port=port))
+        with patch("providers.local.LocalProvider") as mock_cls:
+            mock_cls.return_value.transcribe_audio.return_value = "lokal"
+            assert proxy.transcribe_audio(np.zeros(4, dtype=np.float32)) == "lokal"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX-Dateirechte")
+    def test_token_file_private(self, worker, tmp_path):
+        mode = self.token_file.stat().st_mode & 0o777
+        assert mode == 0o600
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_second_server_on_same_port_fails(self, worker, tmp_path):
+        from providers.local_worker import LocalWorker
+
+        _, provider, port = worker
+        token = self.token_file.read_text(encoding="utf-8")
+        second = LocalWorker(provider, model="turbo", token_file=self.token_file)
+        with pytest.raises(OSError):
+            second.start(port=port)
+        # Token des laufenden Servers bleibt gültig
+        assert self.token_file.read_text(encoding="utf-8") == token
+        assert self._client(port).ping() is not None
+
+    def test_rejects_requests_without_token(self, worker, tmp_path):
+        from providers.local_worker import LocalWorkerClient, WorkerError
+
+        w, _, port = worker
+        w.mark_ready()
+        intruder = LocalWorkerClient(port=port, token_file=tmp_path / "fehlt")
+        assert intruder.ping() is None
+        with pytest.raises(WorkerError, match="autorisiert"):
+            intruder.transcribe_file(tmp_path / "geheim.wav")
+
+    def test_transcribe_via_worker(self, worker, tmp_path):
+        from providers.local_worker import transcribe_via_worker
+
+        w, provider, port = worker
+        client = self._client(port)
+        assert transcribe_via_worker(tmp_path / "a.wav", client=client) is None
+
+        w.mark_ready()
+        assert transcribe_via_worker(tmp_path / "a.wav", client=client) == "aus Datei"
+        assert provider.transcribe.call_args.kwargs["model"] == "turbo"
+
+    def test_other_model_not_loaded_by_worker(self, worker, tmp_path):
+        from providers.local_worker import ModelMismatchError, transcribe_via_worker
+
+        w, provider, port = worker
+        w.mark_ready()
+        client = self._client(port)
+
+        assert client.ping()["model"] == "turbo"
+        assert (
+            transcribe_via_worker(tmp_path / "a.wav", model="large-v3", client=client)
+            is None
+        )
+        with pytest.raises(ModelMismatchError, match="large-v3"):
+            client.request({"op": "preload", "model": "large-v3"})
+        with pytest.raises(ModelMismatchError):
+            client.transcribe_file(tmp_path / "a.wav", model="large-v3")
+        provider.transcribe.assert_not_called()
+        provider.preload.assert_not_called()
+
+        assert (
+            transcribe_via_worker(tmp_path / "a.wav", model="turbo", client=client)
+            == "aus Datei"
+        )
+
+    def test_worker_provider_loads_other_model_in_process(self, worker):
+        from providers.local_worker import WorkerProvider
+
+        w, provider, port = worker
+        w.mark_ready()
+        proxy = WorkerProvider(self._client(port))
+        with patch("providers.local.LocalProvider") as mock_cls:
+            mock_cls.return_value.transcribe_audio.return_value = "lokal"
+            audio = np.zeros(4, dtype=np.float32)
+            assert proxy.transcribe_audio(audio, model="large-v3") == "lokal"
+        provider.transcribe_audio.assert_not_called()
+
+    def test_share_provider_only_for_in_process_provider(self):
+        from providers.local_worker import share_provider
+
+        assert share_provider(MagicMock(), "turbo") is None
+
+    def test_connect_disabled_by_env(self, monkeypatch):
+        from providers.local_worker import connect_worker
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WORKER", "false")
+        client = MagicMock()
+        assert connect_worker(client) is None
+        client.ping.assert_not_called()
+
+
+
+class TestBucketWarmup:
+    """Tests für das Hintergrund-Warmup mit realistischen Längen."""
+
+    def _provider(self, monkeypatch, backend="faster", device="cpu"):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", backend)
+        provider = LocalProvider()
+        provider._ensure_runtime_config = MagicMock()
+        provider._backend = backend
+        provider._device = device
+        provider._build_options = MagicMock(return_value={"vad_filter": True})
+        return provider
+
+    def test_auto_only_on_gpu(self, monkeypatch):
+        from config import LOCAL_WARMUP_BUCKETS
+
+        monkeypatch.delenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", raising=False)
+        assert self._provider(monkeypatch, device="cpu")._warmup_buckets() == ()
+        assert (
+            self._provider(monkeypatch, device="cuda")._warmup_buckets()
+            == LOCAL_WARMUP_BUCKETS
+        )
+        assert (
+            self._provider(monkeypatch, backend="mlx")._warmup_buckets()
+            == LOCAL_WARMUP_BUCKETS
+        )
+
+    def test_explicit_buckets_and_off(self, monkeypatch):
+        provider = self._provider(monkeypatch)
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "15, 1,5")
+        assert provider._warmup_buckets() == (1.0, 5.0, 15.0)
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "off")
+        assert provider._warmup_buckets() == ()
+        assert provider.start_bucket_warmup() is False
+
+    def test_records_first_and_steady_latency(self, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "1,2")
+        provider = self._provider(monkeypatch)
+        provider._decode = MagicMock(return_value="")
+
+        assert provider.start_bucket_warmup("tiny", "de") is True
+        provider._warmup_thread.join(timeout=5)
+
+        assert provider._decode.call_count == 4
+        lengths = [len(c.args[0]) for c in provider._decode.call_args_list]
+        assert lengths == [16000, 16000, 32000, 32000]
+        # VAD würde das Warmup-Rauschen verwerfen
+        assert "vad_filter" not in provider._decode.call_args.args[2]
+        stats = provider.get_warmup_stats()
+        assert set(stats) == {1.0, 2.0}
+        assert set(stats[1.0]) == {"first", "steady"}
+        assert "warmup" in provider.get_runtime_info()
+
+    def test_cancel_stops_after_running_decode(self, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "1,5,15")
+        provider = self._provider(monkeypatch)
+        provider._decode = MagicMock(
+            side_effect=lambda *a, **kw: provider.cancel_warmup()
+        )
+
+        provider.start_bucket_warmup()
+        provider._warmup_thread.join(timeout=5)
+
+        assert provider._decode.call_count == 1
+        assert provider.get_warmup_stats() == {}
+
+    def test_cancel_releases_replica_after_current_segment(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from providers.local import _ReplicaPool
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "1")
+        provider = self._provider(monkeypatch)
+        provider._pool = _ReplicaPool(1)
+        decoded: list[str] = []
+
+        def segments():
+            for text in ("a", "b", "c"):
+                decoded.append(text)
+                if text == "a":
+                    provider.cancel_warmup()
+                yield SimpleNamespace(text=text)
+
+        model = MagicMock()
+        model.transcribe.side_effect = lambda *a, **kw: (segments(), None)
+        provider._get_faster_model = MagicMock(return_value=model)
+
+        provider.start_bucket_warmup("tiny", "de")
+        provider._warmup_thread.join(timeout=5)
+
+        assert decoded == ["a"]
+        assert provider.get_warmup_stats() == {}
+        assert provider._pool.stats()["busy"] == 0
+
+    def test_warmup_only_on_spare_replica(self, monkeypatch):
+        from providers.local import _ReplicaPool
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_WARMUP_BUCKETS", "1")
+        provider = self._provider(monkeypatch)
+        provider._pool = _ReplicaPool(2)
+        provider._transcribe_faster = MagicMock(return_value="")
+
+        # Ein Replikat belegt → das letzte freie bleibt echten Anfragen
+        with provider._pool.acquire():
+            provider.start_bucket_warmup("tiny", "de")
+            provider._warmup_thread.join(timeout=5)
+        provider._transcribe_faster.assert_not_called()
+
+        provider.start_bucket_warmup("tiny", "de")
+        provider._warmup_thread.join(timeout=5)
+        assert provider._transcribe_faster.call_count == 2
+
+        # Einzelnes Replikat: Warmup nur, solange es frei ist
+        single = _ReplicaPool(1)
+        with single.acquire_spare() as index:
+            assert index == 0
+        with single.acquire(), single.acquire_spare() as index:
+            assert index is None
+
+    def test_real_transcription_cancels_warmup(self, monkeypatch):
+        provider = self._provider(monkeypatch)
+        provider._decode = MagicMock(return_value="Hallo")
+        provider._log_transcription_start = MagicMock()
+
+        provider.transcribe_audio(np.zeros(1600, dtype=np.float32), model="tiny")
+
+        assert provider._warmup_cancel.is_set()
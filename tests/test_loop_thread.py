@@ -0,0 +1,142 @@
+"""Tests für den persistenten Event-Loop-Thread."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.loop_thread import LoopThread
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loop_thread():
+    thread = LoopThread("TestLoop")
+    yield thread
+    thread.close()
+
+
+class TestLoopThread:
+    """Lazy Start, Wiederverwendung und sauberes Beenden."""
+
+    def test_lazy_start(self, loop_thread):
+        assert not loop_thread.running
+        assert loop_thread.run(asyncio.sleep(0, result=42)) == 42
+        assert loop_thread.running
+
+    def test_sessions_share_one_loop(self, loop_thread):
+        async def _current():
+            return asyncio.get_running_loop(), threading.current_thread().name
+
+        first = loop_thread.run(_current())
+        second = loop_thread.run(_current())
+        assert first == second
+        assert first[1] == "TestLoop"
+
+    def test_state_survives_between_sessions(self, loop_thread):
+        """Loop-gebundene Objekte (z.B. Futures, Sockets) überleben eine Session."""
+
+        async def _create():
+            return asyncio.get_running_loop().create_future()
+
+        future = loop_thread.run(_create())
+        loop_thread.call_soon(future.set_result, "noch da")
+
+        async def _await():
+            return await future
+
+        assert loop_thread.run(_await(), timeout=1.0) == "noch da"
+
+    def test_submit_from_many_threads(self, loop_thread):
+        async def _work(i):
+            await asyncio.sleep(0.01)
+            return i
+
+        results = [None] * 8
+
+        def _client(i):
+            results[i] = loop_thread.run(_work(i))
+
+        threads = [threading.Thread(target=_client, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == list(range(8))
+
+    def test_exception_propagates(self, loop_thread):
+        async def _fail():
+            raise ValueError("kaputt")
+
+        with pytest.raises(ValueError, match="kaputt"):
+            loop_thread.run(_fail())
+
+    def test_close_cancels_pending_tasks(self):
+        loop_thread = LoopThread("TestLoop")
+        future = loop_thread.submit(asyncio.sleep(60))
+        loop_thread.close(timeout=1.0)
+
+        assert future.cancelled()
+        assert not loop_thread.running
+        # Nach close() startet der nächste Zugriff einen neuen Loop
+        assert loop_thread.run(asyncio.sleep(0, result="neu")) == "neu"
+        loop_thread.close()
+
+    def test_connections_survive_between_sessions(
+        self, loop_thread, http_server, monkeypatch
+    ):
+        """Der async HTTP-Pool bleibt im persistenten Loop warm."""
+        pytest.importorskip("httpx")
+        import utils.http_client as http_client
+
+        monkeypatch.setattr(http_client, "_async_clients", {})
+        server, url = http_server
+        sessions = 5
+
+        async def _session():
+            await http_client.get_async_http_client().get(url)
+
+        # Bisher: neuer Loop pro Aufnahme → neuer Client, neue Verbindung
+        for _ in range(sessions):
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(_session())
+            loop.close()
+        fresh_connections = server.connections
+
+        for _ in range(sessions):
+            loop_thread.run(_session())
+        persistent_connections = server.connections - fresh_connections
+
+        assert fresh_connections == sessions
+        assert persistent_connections == 1
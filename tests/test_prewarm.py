@@ -0,0 +1,146 @@
+"""Tests für Verbindungs-Pre-Warming gegen einen lokalen HTTPS-Server."""
+
+import shutil
+import ssl
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.prewarm import http_pool, keep_warm, warm_connection
+
+httpx = pytest.importorskip("httpx")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self, body: bytes = b"") -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl nicht verfügbar")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key), "-out", str(cert), "-days", "1",
+            "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+@pytest.fixture
+def https_server(certificate):
+    cert, key = certificate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.connections = 0
+    server.lock = threading.Lock()
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"https://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(certificate, **limits):
+    context = ssl.create_default_context(cafile=str(certificate[0]))
+    return httpx.Client(verify=context, limits=httpx.Limits(**limits))
+
+
+class TestWarmConnection:
+    """HEAD öffnet die Verbindung, der echte Request nutzt sie wieder."""
+
+    def test_first_request_reuses_warm_connection(self, https_server, certificate):
+        server, url = https_server
+        with _client(certificate) as http:
+            assert warm_connection(http, url, "test") is not None
+            response = http.post(url, content=b"audio")
+
+        assert response.text == "ok"
+        assert server.connections == 1
+
+    def test_cold_client_opens_new_connection(self, https_server, certificate):
+        server, url = https_server
+        with _client(certificate) as http:
+            http.post(url, content=b"audio")
+        with _client(certificate) as http:
+            http.post(url, content=b"audio")
+        assert server.connections == 2
+
+    def test_keep_warm_outlives_keepalive_expiry(self, https_server, certificate):
+        server, url = https_server
+        done = threading.Event()
+        with _client(certificate, keepalive_expiry=0.3) as http:
+            thread = keep_warm(
+                [("test", lambda: warm_connection(http, url, "test"))],
+                until=done.is_set,
+                interval=0.1,
+            )
+            time.sleep(0.8)
+            http.post(url, content=b"audio")
+            done.set()
+            thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert server.connections == 1
+
+    def test_unreachable_endpoint_returns_none(self, certificate):
+        with _client(certificate) as http:
+            assert warm_connection(http, "https://127.0.0.1:9/", "test", timeout=0.5) is None
+
+
+class TestHttpPool:
+    """SDK-Clients → httpx-Pool und Basis-URL."""
+
+    def test_openai_and_groq(self):
+        openai = pytest.importorskip("openai")
+        groq = pytest.importorskip("groq")
+        for client, host in (
+            (openai.OpenAI(api_key="x"), "api.openai.com"),
+            (groq.Groq(api_key="x"), "api.groq.com"),
+        ):
+            http, url = http_pool(client)
+            assert http is client._client
+            assert host in url
+
+    def test_deepgram(self):
+        deepgram = pytest.importorskip("deepgram")
+        http, url = http_pool(deepgram.DeepgramClient(api_key="x"))
+        assert isinstance(http, httpx.Client)
+        assert url == "https://api.deepgram.com"
+
+    def test_unknown_client(self):
+        assert http_pool(object()) is None
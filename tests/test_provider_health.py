@@ -0,0 +1,166 @@
+"""Tests für Provider-Health-Registry und Circuit Breaker."""
+
+import pytest
+
+from config import (
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_SLOW_SECONDS,
+    HEALTH_MIN_CALLS,
+)
+from providers.health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitOpenError,
+    HealthRegistry,
+    is_slow,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(tmp_path, clock):
+    return HealthRegistry(tmp_path / "health.json", clock=clock)
+
+
+def _fail(registry, mode="groq", times=CIRCUIT_FAILURE_THRESHOLD):
+    for _ in range(times):
+        registry.record_failure(mode, RuntimeError("down"))
+
+
+class TestCircuitBreaker:
+    """Tests für die Circuit-States."""
+
+    def test_consecutive_failures_open_circuit(self, registry):
+        _fail(registry, times=CIRCUIT_FAILURE_THRESHOLD - 1)
+        assert registry.allow("groq")
+        _fail(registry, times=1)
+
+        assert registry.get("groq").state == OPEN
+        assert not registry.allow("groq")
+        assert registry.allow("openai")
+        with pytest.raises(CircuitOpenError, match="groq"):
+            registry.check("groq")
+
+    def test_slow_answers_count_as_failures(self, registry):
+        assert is_slow(CIRCUIT_SLOW_SECONDS + 0.1, audio_s=0.0)
+        assert not is_slow(CIRCUIT_SLOW_SECONDS + 0.1, audio_s=30.0)
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            registry.record_success("groq", 9.0, audio_s=3.0)
+
+        health = registry.get("groq")
+        assert health.state == OPEN
+        assert len(health.latencies) == CIRCUIT_FAILURE_THRESHOLD
+
+    def test_error_rate_opens_circuit(self, registry):
+        # Abwechselnd Erfolg/Fehler: nie 3 in Folge, aber 50% Fehlerrate
+        for i in range(HEALTH_MIN_CALLS):
+            if i % 2 == 0:
+                registry.record_success("groq", 0.5)
+            else:
+                registry.record_failure("groq")
+        assert registry.get("groq").state == OPEN
+
+    def test_half_open_allows_single_probe(self, registry, clock):
+        _fail(registry)
+        clock.now += CIRCUIT_COOLDOWN
+
+        assert registry.allow("groq")
+        assert registry.get("groq").state == HALF_OPEN
+        assert not registry.allow("groq")
+
+        registry.record_success("groq", 0.5)
+        assert registry.get("groq").state == CLOSED
+        assert registry.allow("groq")
+
+    def test_failed_probe_doubles_cooldown(self, registry, clock):
+        _fail(registry)
+        clock.now += CIRCUIT_COOLDOWN
+        assert registry.allow("groq")
+        registry.record_failure("groq")
+
+        health = registry.get("groq")
+        assert health.state == OPEN
+        assert health.cooldown == CIRCUIT_COOLDOWN * 2
+        clock.now += CIRCUIT_COOLDOWN
+        assert not registry.allow("groq")
+        clock.now += CIRCUIT_COOLDOWN
+        assert registry.allow("groq")
+
+    def test_can_be_disabled(self, registry, monkeypatch):
+        monkeypatch.setenv("PULSESCRIBE_CIRCUIT_BREAKER", "false")
+        _fail(registry)
+        assert registry.allow("groq")
+
+    def test_call_records_latency_and_errors(self, registry):
+        assert registry.call("groq", lambda: "ok", audio_s=2.0) == "ok"
+        with pytest.raises(ValueError):
+            registry.call("groq", lambda: (_ for _ in ()).throw(ValueError("x")))
+
+        health = registry.get("groq")
+        assert len(health.latencies) == 1
+        assert list(health.outcomes) == [True, False]
+
+
+class TestHealthPersistence:
+    """Zustand überlebt Daemon-Neustarts."""
+
+    def test_open_circuit_survives_restart(self, tmp_path, registry, clock):
+        _fail(registry)
+        registry.record_success("openai", 1.5, audio_s=10.0)
+        registry.flush()  # Daemon-Shutdown
+
+        restarted = HealthRegistry(tmp_path / "health.json", clock=clock)
+
+        assert not restarted.allow("groq")
+        assert restarted.get("openai").latencies.percentile(50, audio_s=10.0) is None
+        assert len(restarted.get("openai").latencies) == 1
+        clock.now += CIRCUIT_COOLDOWN
+        assert restarted.allow("groq")
+
+    def test_writes_only_on_state_change_or_flush(self, tmp_path, clock):
+        path = tmp_path / "health.json"
+        registry = HealthRegistry(path, clock=clock, save_delay=60.0)
+
+        registry.record_success("groq", 1.0, audio_s=5.0)
+        _fail(registry, times=CIRCUIT_FAILURE_THRESHOLD - 1)
+        assert not path.exists()  # kein Write auf dem Request-Pfad
+
+        _fail(registry, times=1)  # Circuit öffnet → sofort geschrieben
+        assert not HealthRegistry(path, clock=clock).allow("groq")
+
+        registry.record_success("openai", 1.0)
+        assert len(HealthRegistry(path, clock=clock).get("openai").latencies) == 0
+        registry.flush()
+        assert len(HealthRegistry(path, clock=clock).get("openai").latencies) == 1
+
+    def test_pending_changes_saved_after_delay(self, tmp_path, clock):
+        import time
+
+        path = tmp_path / "health.json"
+        registry = HealthRegistry(path, clock=clock, save_delay=0.05)
+        registry.record_success("groq", 1.0)
+        registry.record_success("groq", 1.2)
+
+        deadline = time.monotonic() + 2.0
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(HealthRegistry(path, clock=clock).get("groq").latencies) == 2
+
+    def test_corrupt_file_is_ignored(self, tmp_path, clock):
+        path = tmp_path / "health.json"
+        path.write_text("{kaputt", encoding="utf-8")
+        assert HealthRegistry(path, clock=clock).allow("groq")
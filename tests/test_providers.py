@@ -99,3 +99,112 @@ class TestProviderValidation:
         from pathlib import Path
         with pytest.raises(ValueError, match="GROQ_API_KEY"):
             provider.transcribe(Path("/tmp/test.wav"))
+
+
+class TestInMemoryAudio:
+    """Provider akzeptieren InMemoryAudio statt Temp-WAV."""
+
+    @pytest.fixture
+    def memory_audio(self):
+        import numpy as np
+        from audio.memory import InMemoryAudio
+
+        samples = (np.sin(np.linspace(0, 200, 8000)) * 0.2).astype(np.float32)
+        return InMemoryAudio.from_array(samples, 16000)
+
+    def test_from_array_encodes_wav_and_roundtrips(self, memory_audio):
+        import numpy as np
+        from audio.memory import InMemoryAudio
+
+        assert memory_audio.data.startswith(b"RIFF")
+        assert memory_audio.mime_type == "audio/wav"
+
+        decoded = InMemoryAudio(memory_audio.data, 16000).to_array()
+        np.testing.assert_allclose(decoded, memory_audio.samples, atol=1e-4)
+        assert memory_audio.to_array(8000).shape == (4000,)
+
+    @pytest.mark.parametrize("mode", ["openai", "groq"])
+    def test_multipart_upload_from_memory(self, mode, memory_audio, monkeypatch):
+        from unittest.mock import MagicMock
+
+        monkeypatch.setenv(f"{mode.upper()}_API_KEY", "test")
+        client = MagicMock()
+        client.audio.transcriptions.create.return_value = "Hallo"
+        monkeypatch.setattr(f"providers.{mode}._get_client", lambda: client)
+        from providers import get_provider
+
+        assert get_provider(mode).transcribe(memory_audio, language="de") == "Hallo"
+        name, fileobj = client.audio.transcriptions.create.call_args.kwargs["file"]
+        # Default-Codec ist FLAC (verlustfrei, kleiner als WAV)
+        assert name == "audio.flac"
+        assert fileobj.getvalue().startswith(b"fLaC")
+        assert len(fileobj.getvalue()) < memory_audio.size
+
+    def test_deepgram_sends_bytes_from_memory(self, memory_audio, monkeypatch):
+        from unittest.mock import MagicMock
+
+        monkeypatch.setenv("DEEPGRAM_API_KEY", "test")
+        monkeypatch.setattr(
+            "providers.deepgram.load_vocabulary", lambda: {"keywords": []}
+        )
+        client = MagicMock()
+        monkeypatch.setattr("providers.deepgram._get_client", lambda: client)
+        from providers import get_provider
+
+        monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "wav")
+        get_provider("deepgram").transcribe(memory_audio)
+        request = client.listen.v1.media.transcribe_file.call_args.kwargs["request"]
+        assert request == memory_audio.data
+
+    def test_local_decodes_without_file(self, memory_audio, monkeypatch):
+        from unittest.mock import patch
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_PROFILE", "false")
+        provider = LocalProvider()
+        with patch.object(provider, "transcribe_audio", return_value="Lokal") as mock:
+            assert provider.transcribe(memory_audio, model="turbo") == "Lokal"
+        assert mock.call_args[0][0].shape == (8000,)
+
+
+class TestUploadCodec:
+    """Codec-Auswahl vor dem Upload."""
+
+    def test_auto_prefers_flac_and_rejects_unknown(self, monkeypatch):
+        from audio.memory import upload_codec
+
+        assert upload_codec("groq") == "flac"
+        monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "opus")
+        assert upload_codec("openai") == "opus"
+        monkeypatch.setenv("PULSESCRIBE_UPLOAD_CODEC", "mp3")
+        assert upload_codec("deepgram") == "flac"
+
+    def test_opus_shrinks_and_falls_back_to_flac(self):
+        import numpy as np
+        from audio.memory import InMemoryAudio
+
+        samples = (np.sin(np.linspace(0, 2000, 32000)) * 0.2).astype(np.float32)
+        wav = InMemoryAudio.from_array(samples, 16000)
+        opus = InMemoryAudio.from_array(samples, 16000, codec="opus")
+        assert opus.codec == "opus"
+        assert opus.name == "audio.ogg"
+        assert opus.size < wav.size // 4
+
+        # libsndfile-Opus kennt 44.1 kHz nicht → FLAC statt Fehler
+        assert InMemoryAudio.from_array(samples, 44100, codec="opus").codec == "flac"
+
+    def test_wav_file_is_transcoded_other_files_are_not(self, tmp_path):
+        import numpy as np
+        import soundfile as sf
+        from audio.memory import InMemoryAudio, prepare_upload
+
+        samples = np.zeros(1600, dtype=np.float32)
+        wav = tmp_path / "aufnahme.wav"
+        sf.write(wav, samples, 16000)
+        flac = tmp_path / "aufnahme.flac"
+        sf.write(flac, samples, 16000)
+
+        upload = prepare_upload(wav, "openai")
+        assert isinstance(upload, InMemoryAudio)
+        assert upload.codec == "flac"
+        assert prepare_upload(flac, "openai") == flac
@@ -1,6 +1,6 @@
 """Tests für Refine-Logik – Provider/Model-Auswahl und Fallbacks."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
@@ -88,7 +88,7 @@ class TestGetRefineClient:
         with patch("openai.OpenAI", mock_openai_class):
             client = _get_refine_client("openai")
 
-        mock_openai_class.assert_called_once_with()
+        mock_openai_class.assert_called_once_with(http_client=ANY, timeout=ANY)
         assert client == mock_openai_class.return_value
 
     def test_openrouter_with_api_key(self, monkeypatch):
@@ -101,6 +101,8 @@ class TestGetRefineClient:
         mock_openai_class.assert_called_once_with(
             base_url="https://openrouter.ai/api/v1",
             api_key="test-key",
+            http_client=ANY,
+            timeout=ANY,
         )
 
     def test_openrouter_missing_api_key(self, monkeypatch):
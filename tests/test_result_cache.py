@@ -0,0 +1,136 @@
+"""Tests für den content-adressierten Ergebnis-Cache."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+
+@pytest.fixture
+def wav(tmp_path):
+    """Kurze WAV-Datei mit deterministischem Inhalt."""
+    path = tmp_path / "clip.wav"
+    audio = np.sin(np.linspace(0, 100, 16000)).astype(np.float32) * 0.1
+    sf.write(path, audio, 16000)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def no_vocabulary(monkeypatch):
+    monkeypatch.setattr(
+        "utils.result_cache.load_vocabulary", lambda: {"keywords": []}
+    )
+
+
+class TestCachedTranscribe:
+    """Tests für cached_transcribe()."""
+
+    def test_hit_skips_transcription(self, wav):
+        from utils.result_cache import cached_transcribe
+
+        fn = MagicMock(return_value="Hallo Welt")
+        kwargs = dict(mode="deepgram", model="nova-3", language="de")
+
+        assert cached_transcribe(wav, fn, **kwargs) == "Hallo Welt"
+        assert cached_transcribe(wav, fn, **kwargs) == "Hallo Welt"
+        fn.assert_called_once()
+
+    def test_key_covers_mode_model_language_and_vocabulary(self, wav, monkeypatch):
+        from utils.result_cache import cached_transcribe
+
+        fn = MagicMock(return_value="Text")
+        cached_transcribe(wav, fn, mode="deepgram", model="nova-3", language="de")
+        cached_transcribe(wav, fn, mode="groq", model="nova-3", language="de")
+        cached_transcribe(wav, fn, mode="deepgram", model="nova-2", language="de")
+        cached_transcribe(wav, fn, mode="deepgram", model="nova-3", language="en")
+        assert fn.call_count == 4
+
+        monkeypatch.setattr(
+            "utils.result_cache.load_vocabulary", lambda: {"keywords": ["PulseScribe"]}
+        )
+        cached_transcribe(wav, fn, mode="deepgram", model="nova-3", language="de")
+        assert fn.call_count == 5
+
+    def test_same_pcm_under_other_name_hits(self, wav, tmp_path):
+        from utils.result_cache import cached_transcribe
+
+        copy = tmp_path / "kopie.wav"
+        copy.write_bytes(wav.read_bytes())
+        fn = MagicMock(return_value="Text")
+        cached_transcribe(wav, fn, mode="openai", model="m", language=None)
+        cached_transcribe(copy, fn, mode="openai", model="m", language=None)
+        fn.assert_called_once()
+
+    def test_no_cache_and_zero_budget_bypass(self, wav, monkeypatch):
+        from utils.result_cache import cached_transcribe
+
+        fn = MagicMock(return_value="Text")
+        cached_transcribe(wav, fn, mode="openai", model="m", language=None)
+        cached_transcribe(
+            wav, fn, mode="openai", model="m", language=None, use_cache=False
+        )
+        assert fn.call_count == 2
+
+        monkeypatch.setenv("PULSESCRIBE_RESULT_CACHE_MB", "0")
+        cached_transcribe(wav, fn, mode="openai", model="m", language=None)
+        assert fn.call_count == 3
+
+    def test_missing_file_does_not_block_transcription(self, tmp_path):
+        from utils.result_cache import cached_transcribe
+
+        fn = MagicMock(return_value="Text")
+        missing = tmp_path / "fehlt.wav"
+        assert cached_transcribe(missing, fn, mode="openai", model="m", language=None) == "Text"
+
+
+class TestResultCacheEviction:
+    """Tests für die LRU-Verdrängung."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        from utils.result_cache import ResultCache
+
+        cache = ResultCache(tmp_path / "cache", max_bytes=10**9)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, "x" * 100)
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        assert cache.get("a") == "x" * 100  # a ist jetzt am frischesten
+
+        # Einträge können sich um ein Byte unterscheiden (created_at)
+        cache._max_bytes = sum(cache._path(k).stat().st_size for k in ("a", "c"))
+        cache._evict()
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+
+class TestTranscribeIntegration:
+    """Cache vor transcribe() und LocalProvider.transcribe."""
+
+    def test_cloud_transcribe_uses_cache(self, wav):
+        from transcribe import transcribe
+
+        provider = MagicMock()
+        provider.default_model = "nova-3"
+        provider.transcribe.return_value = "Cloud"
+        with patch("providers.get_provider", return_value=provider):
+            assert transcribe(wav, mode="deepgram") == "Cloud"
+            assert transcribe(wav, mode="deepgram") == "Cloud"
+            assert transcribe(wav, mode="deepgram", use_cache=False) == "Cloud"
+        assert provider.transcribe.call_count == 2
+
+    def test_local_provider_caches_by_backend_and_model(self, wav, monkeypatch):
+        from providers.local import LocalProvider
+
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_BACKEND", "faster")
+        monkeypatch.setenv("PULSESCRIBE_LOCAL_PROFILE", "false")
+        provider = LocalProvider()
+        with patch.object(
+            provider, "_transcribe_routed", return_value="Lokal"
+        ) as mock_routed:
+            assert provider.transcribe(wav, model="turbo") == "Lokal"
+            assert provider.transcribe(wav, model="turbo") == "Lokal"
+            provider.transcribe(wav, model="small")
+        assert mock_routed.call_count == 2
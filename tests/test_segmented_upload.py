@@ -0,0 +1,179 @@
+"""Tests für den Segment-Upload während der Aufnahme."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from audio.buffer import CaptureBuffer
+from audio.energy import EnergyTracker
+from audio.memory import InMemoryAudio
+from providers.segment_upload import (
+    SegmentedUploadSession,
+    build_prompt,
+    merge_boundary,
+    stitch,
+)
+
+SR = 16000
+
+
+def _speech(seconds, level=0.2):
+    t = np.arange(int(SR * seconds)) / SR
+    return (np.sin(2 * np.pi * 220 * t) * level).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(SR * seconds), dtype=np.float32)
+
+
+def _record(capture, energy, audio, block=512):
+    for offset in range(0, audio.shape[0], block):
+        chunk = capture.append(audio[offset : offset + block].reshape(-1, 1))
+        energy.feed(chunk)
+
+
+class FakeProvider:
+    """Gibt pro Upload die Segmentdauer zurück und merkt sich die Aufrufe."""
+
+    name = "groq"
+
+    def __init__(self, texts=None, fail_on=None):
+        self.calls = []
+        self._texts = list(texts or [])
+        self._fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, model=None, language=None, prompt=None):
+        assert isinstance(audio, InMemoryAudio)
+        with self._lock:
+            index = len(self.calls)
+            self.calls.append(
+                {"duration": len(audio.to_array()) / SR, "prompt": prompt}
+            )
+        if index == self._fail_on:
+            raise RuntimeError("upload failed")
+        if self._texts:
+            return self._texts[index]
+        return f"seg{index}"
+
+
+@pytest.fixture(autouse=True)
+def _no_vocabulary(monkeypatch):
+    monkeypatch.setattr(
+        "providers.segment_upload.load_vocabulary", lambda: {"keywords": ["PulseScribe"]}
+    )
+
+
+def _session(provider, capture, energy, mode="groq", segment_s=2.0):
+    return SegmentedUploadSession(
+        provider, capture, energy, mode=mode, segment_s=segment_s, max_workers=1
+    )
+
+
+class TestBoundaryMerge:
+    """Tests für das Zusammensetzen der Segment-Texte."""
+
+    def test_removes_duplicated_boundary_words(self):
+        assert (
+            merge_boundary("Das ist ein Test.", "ein test, und weiter")
+            == "Das ist ein Test. und weiter"
+        )
+
+    def test_keeps_text_without_overlap(self):
+        assert stitch(["Hallo Welt.", " ", "Wie geht's?"]) == "Hallo Welt. Wie geht's?"
+
+    def test_prompt_combines_vocabulary_and_previous_tail(self):
+        prompt = build_prompt(["Kubernetes", "PulseScribe"], "x" * 500 + " Ende.")
+        assert prompt.startswith("Kubernetes, PulseScribe ")
+        assert prompt.endswith(" Ende.")
+        assert len(prompt) <= 600
+        assert build_prompt([], "") is None
+
+
+class TestSegmentedUploadSession:
+    """Tests für SegmentedUploadSession (ohne Watcher-Thread, via step())."""
+
+    def test_cuts_at_pauses_after_segment_length(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        provider = FakeProvider()
+        session = _session(provider, capture, energy)
+
+        # Kurze Pause nach 1s (zu früh), lange Pause nach 2.5s Sprache
+        _record(capture, energy, np.concatenate([_silence(1.0), _speech(1.0)]))
+        _record(capture, energy, np.concatenate([_silence(0.5), _speech(1.0)]))
+        session.step()
+        assert session.segments_sent == 0
+
+        _record(capture, energy, np.concatenate([_silence(0.6), _speech(1.0)]))
+        session.step()
+        assert session.segments_sent == 1
+        session.step()  # gleiche Pause wird nicht erneut geschnitten
+        assert session.segments_sent == 1
+
+        transcript = session.finish(0, len(capture))
+
+        assert transcript == "seg0 seg1"
+        # Erstes Segment beginnt kurz vor der ersten Sprache, endet mitten in der Pause
+        assert provider.calls[0]["duration"] == pytest.approx(0.25 + 2.5 + 0.3, abs=0.05)
+        assert provider.calls[1]["duration"] == pytest.approx(0.3 + 1.0, abs=0.05)
+
+    def test_no_cut_without_speech(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        provider = FakeProvider()
+        session = _session(provider, capture, energy)
+
+        _record(capture, energy, _silence(5.0))
+        session.step()
+
+        assert session.segments_sent == 0
+        assert session.finish(0, len(capture)) == "seg0"
+        assert len(provider.calls) == 1
+
+    def test_previous_segment_text_becomes_prompt(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        provider = FakeProvider(texts=["Erster Teil mit Kontext", "Kontext zweiter Teil"])
+        session = _session(provider, capture, energy)
+
+        _record(capture, energy, np.concatenate([_speech(2.5), _silence(0.6)]))
+        _record(capture, energy, _speech(1.0))
+        session.step()
+        session._futures[0].result()
+
+        transcript = session.finish(0, len(capture))
+
+        assert provider.calls[0]["prompt"] == "PulseScribe"
+        assert provider.calls[1]["prompt"] == "PulseScribe Erster Teil mit Kontext"
+        assert transcript == "Erster Teil mit Kontext zweiter Teil"
+
+    def test_deepgram_gets_no_prompt(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        provider = FakeProvider()
+        session = _session(provider, capture, energy, mode="deepgram")
+
+        _record(capture, energy, _speech(1.0))
+        session.finish(0, len(capture))
+
+        assert provider.calls[0]["prompt"] is None
+
+    def test_segment_error_propagates_from_finish(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        session = _session(FakeProvider(fail_on=0), capture, energy)
+
+        _record(capture, energy, np.concatenate([_speech(2.5), _silence(0.6)]))
+        _record(capture, energy, _speech(1.0))
+        session.step()
+        assert session.segments_sent == 1
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            session.finish(0, len(capture))
+
+    def test_finish_respects_trim_bounds(self):
+        capture, energy = CaptureBuffer(SR), EnergyTracker(SR)
+        provider = FakeProvider()
+        session = _session(provider, capture, energy)
+
+        _record(capture, energy, np.concatenate([_silence(1.0), _speech(1.0)]))
+        session.finish(SR // 2, len(capture))
+
+        assert provider.calls[0]["duration"] == pytest.approx(1.5, abs=0.01)
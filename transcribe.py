@@ -190,6 +190,7 @@ def transcribe(
     model: str | None = None,
     language: str | None = None,
     response_format: str = "text",
+    use_cache: bool = True,
 ) -> str:
     """
     Zentrale Transkriptions-Funktion – wählt API, Deepgram, Groq oder lokal.
@@ -198,8 +199,11 @@ def transcribe(
     unabhängig vom gewählten Modus.
 
     Nutzt providers.get_provider() für die eigentliche Transkription.
+    Ergebnisse werden content-adressiert gecacht (utils/result_cache.py);
+    im lokalen Modus übernimmt das LocalProvider.transcribe selbst.
     """
     from providers import get_provider
+    from utils.result_cache import cached_transcribe
 
     # Provider validieren
     if mode not in DEFAULT_MODELS:
@@ -221,21 +225,86 @@ def transcribe(
             raise TypeError(
                 f"Expected OpenAIProvider for mode='openai', got {type(provider).__name__}"
             )
-        return provider.transcribe(
+        return cached_transcribe(
             audio_path,
-            model=model,
+            lambda: provider.transcribe(
+                audio_path,
+                model=model,
+                language=language,
+                response_format=response_format,
+            ),
+            mode=mode,
+            model=model or provider.default_model,
             language=language,
-            response_format=response_format,
+            extra=response_format,
+            use_cache=use_cache,
+        )
+
+    # Lokal: Cache-Key braucht Backend und geroutetes Modell → Provider cacht selbst
+    if mode == "local":
+        return provider.transcribe(  # type: ignore[call-arg]
+            audio_path, model=model, language=language, use_cache=use_cache
         )
 
     # Andere Provider
-    return provider.transcribe(
+    return cached_transcribe(
         audio_path,
-        model=model,
+        lambda: provider.transcribe(
+            audio_path,
+            model=model,
+            language=language,
+        ),
+        mode=mode,
+        model=model or provider.default_model,
         language=language,
+        use_cache=use_cache,
     )
 
 
+def _run_calibration(audio_path: Path, model: str | None, language: str | None) -> None:
+    """Kalibriert das lokale Backend und gibt die Messergebnisse aus."""
+    from config import LOCAL_PROFILE_FILE
+    from providers.local_profile import calibrate as calibrate_local
+
+    log("⏱️  Kalibriere lokales Backend (lädt das Modell mehrfach)...")
+    try:
+        profile = calibrate_local(audio_path, model=model, language=language)
+    except Exception as e:
+        error(f"Kalibrierung fehlgeschlagen: {e}")
+        raise typer.Exit(1)
+
+    for result in profile["results"]:
+        config = ", ".join(
+            f"{key}={result[key]}"
+            for key in ("compute_type", "cpu_threads", "fast")
+            if key in result
+        )
+        print(
+            f"{config}: rtf={result['rtf']:.3f}x, wer={result['wer']:.3f}, "
+            f"peak_rss={result['peak_rss_mb']:.0f}MB"
+        )
+    log(
+        f"✓ Profil gespeichert: {LOCAL_PROFILE_FILE} "
+        f"(compute={profile.get('compute_type')}, threads={profile.get('cpu_threads')}, "
+        f"fast={profile['fast']}, RTF {profile['rtf']:.3f}x)"
+    )
+
+
+def _transcribe_via_daemon(
+    audio_path: Path, model: str | None, language: str | None, use_cache: bool = True
+) -> str | None:
+    """Fragt einen laufenden Daemon/Worker an; None → selbst laden."""
+    try:
+        from providers.local_worker import transcribe_via_worker
+
+        return transcribe_via_worker(
+            audio_path, model=model, language=language, use_cache=use_cache
+        )
+    except Exception as e:
+        logger.debug(f"Daemon-Client fehlgeschlagen: {e}")
+        return None
+
+
 @app.command()
 def main(
     audio: Annotated[
@@ -308,6 +377,27 @@ def main(
         Context | None,
         typer.Option(help="Kontext fuer LLM-Nachbearbeitung"),
     ] = None,
+    calibrate: Annotated[
+        bool,
+        typer.Option(
+            help="Lokales Backend mit dem Audio als Referenz-Clip kalibrieren "
+            "und Profil in ~/.pulsescribe/ speichern",
+        ),
+    ] = False,
+    daemon: Annotated[
+        bool,
+        typer.Option(
+            "--daemon/--no-daemon",
+            help="Lokal: warmes Modell eines laufenden Daemons/Workers nutzen",
+        ),
+    ] = True,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache/--no-cache",
+            help="Ergebnis-Cache nutzen (gleiches Audio + Modus/Modell/Sprache)",
+        ),
+    ] = True,
 ) -> None:
     """Audio transkribieren mit Whisper, Deepgram oder Groq.
 
@@ -315,6 +405,9 @@ def main(
         transcribe.py audio.mp3
         transcribe.py audio.mp3 --mode local --model large
         transcribe.py --record --copy --language de
+        transcribe.py referenz.wav --calibrate --language de
+        transcribe.py audio.wav --mode local --no-daemon
+        transcribe.py audio.mp3 --no-cache
     """
     load_environment()
     setup_logging(debug=debug)
@@ -356,15 +449,27 @@ def main(
             error(f"Datei nicht gefunden: {audio_path}")
             raise typer.Exit(1)
 
+    if calibrate:
+        _run_calibration(audio_path, model=model, language=language)
+        if temp_file and temp_file.exists():
+            temp_file.unlink()
+        return
+
     # Transkription durchführen
     try:
-        transcript = transcribe(
-            audio_path,
-            mode=mode.value,
-            model=model,
-            language=language,
-            response_format=response_format.value,
-        )
+        transcript = None
+        if mode == TranscriptionMode.local and daemon:
+            # Warmes Modell eines Daemons/Workers spart den Modell-Load
+            transcript = _transcribe_via_daemon(audio_path, model, language, cache)
+        if transcript is None:
+            transcript = transcribe(
+                audio_path,
+                mode=mode.value,
+                model=model,
+                language=language,
+                response_format=response_format.value,
+                use_cache=cache,
+            )
     except ImportError as e:
         err_str = str(e).lower()
         if "openai" in err_str:
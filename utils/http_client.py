@@ -0,0 +1,389 @@
+"""Gemeinsamer HTTP-Transport für alle Cloud-SDK-Clients.
+
+OpenAI, Groq, Deepgram und die Refine-Clients bauen sonst jeweils einen eigenen
+httpx-Client mit Default-Transport: eigener Pool, 5s Keepalive, unterschiedliche
+Timeouts. Eine Verbindung zu `api.groq.com`, die der Transkriptions-Client
+geöffnet hat, hilft dem Refine-Client so nicht.
+
+Hier entsteht pro httpx-Variante ein prozessweiter Client, den alle SDK-Clients
+als `http_client` bekommen:
+
+- Keepalive von `HTTP_KEEPALIVE_EXPIRY` Sekunden, Pool-Größen aus `config.py`
+- HTTP/2, sofern `h2` installiert ist (ALPN fällt sonst auf HTTP/1.1 zurück)
+- einheitliche Connect-/Read-/Pool-Timeouts; die SDK-Clients setzen mit
+  `sdk_timeout()` ihre bisherigen Request-Timeouts (OpenAI 600s) selbst, da sie
+  sonst den Timeout des übergebenen Clients übernehmen
+
+Neuere OpenAI-SDKs bringen einen httpx-Fork (`httpx2`) mit und akzeptieren nur
+dessen Client – `sdk_http_client()` wählt die passende Variante.
+
+Für die async-SDK-Clients (`transcribe_async`) gibt es dasselbe als
+`httpx.AsyncClient`. Dessen Verbindungen gehören zum Event-Loop, in dem sie
+geöffnet wurden – `get_async_http_client()` baut den Client deshalb neu, wenn
+er aus einem anderen Loop angefragt wird.
+
+Pool-Trefferquote und Verbindungsaufbau-Zeiten werden über die httpcore-Trace-
+Extension gemessen (`stats`). Ändern sich API-Keys oder Proxy-Einstellungen,
+tauscht `swap_http_clients()` die Clients aus: registrierte SDK-Singletons
+werden verworfen, alte Clients erst nach `HTTP_SWAP_GRACE` geschlossen, damit
+laufende Requests zu Ende kommen.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from config import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE,
+    HTTP_POOL_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_SWAP_GRACE,
+)
+
+logger = logging.getLogger("pulsescribe.http")
+
+# Werte, die beim Bau eines SDK- bzw. httpx-Clients übernommen werden
+CREDENTIAL_VARS = (
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "GROQ_API_KEY",
+    "DEEPGRAM_API_KEY",
+    "OPENROUTER_API_KEY",
+    "GEMINI_API_KEY",
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "ALL_PROXY",
+    "NO_PROXY",
+)
+
+
+@dataclass
+class PoolStats:
+    """Zähler für Pool-Treffer und Verbindungsaufbau (prozessweit)."""
+
+    requests: int = 0
+    connects: int = 0
+    connect_s: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        if not self.requests:
+            return 0.0
+        return (self.requests - self.connects) / self.requests
+
+    def summary(self) -> str:
+        avg_ms = self.connect_s / self.connects * 1000 if self.connects else 0.0
+        return (
+            f"Pool-Trefferquote {self.requests - self.connects}/{self.requests} "
+            f"({self.hit_ratio:.0%}), Verbindungsaufbau Ø {avg_ms:.0f}ms"
+        )
+
+
+stats = PoolStats()
+_stats_lock = threading.Lock()
+
+
+class _ConnectTrace:
+    """httpcore-Trace-Callback: misst TCP+TLS-Aufbau einer neuen Verbindung."""
+
+    def __init__(self, inner: Callable | None = None):
+        self._inner = inner
+        self._started: float | None = None
+        self.connect_s: float | None = None
+
+    def _observe(self, event_name: str) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self._started = time.perf_counter()
+        elif self._started is not None and event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            self.connect_s = time.perf_counter() - self._started
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        self._observe(event_name)
+        if self._inner is not None:
+            self._inner(event_name, info)
+
+
+class _AsyncConnectTrace(_ConnectTrace):
+    """Async-Variante: httpcore erwartet im async-Pfad eine Coroutine."""
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        self._observe(event_name)
+        if self._inner is not None:
+            await self._inner(event_name, info)
+
+
+class _ObservedTransport:
+    """Wrapper um einen httpx-Transport, der Pool-Treffer mitzählt."""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    def handle_request(self, request):
+        trace = _ConnectTrace(request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            _record(request.url.host, trace.connect_s)
+
+    def close(self) -> None:
+        self._transport.close()
+
+    def __enter__(self):
+        self._transport.__enter__()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._transport.__exit__(*args)
+
+
+class _ObservedAsyncTransport:
+    """Wrapper um einen async httpx-Transport, der Pool-Treffer mitzählt."""
+
+    def __init__(self, transport):
+        self._transport = transport
+
+    async def handle_async_request(self, request):
+        trace = _AsyncConnectTrace(request.extensions.get("trace"))
+        request.extensions["trace"] = trace
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            _record(request.url.host, trace.connect_s)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    async def __aenter__(self):
+        await self._transport.__aenter__()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self._transport.__aexit__(*args)
+
+
+def _record(host: str, connect_s: float | None) -> None:
+    with _stats_lock:
+        stats.requests += 1
+        if connect_s is None:
+            return
+        stats.connects += 1
+        stats.connect_s += connect_s
+        summary = stats.summary()
+    logger.debug(f"Neue Verbindung zu {host}: {connect_s * 1000:.0f}ms ({summary})")
+
+
+def http2_available() -> bool:
+    """HTTP/2 braucht das optionale `h2`-Paket."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _proxy_mounts(
+    module: Any, limits: Any, http2: bool, *, asynchronous: bool
+) -> dict[str, Any]:
+    """Proxy-Transports aus HTTP(S)_PROXY/ALL_PROXY/NO_PROXY.
+
+    Mit eigenem `transport=` liest httpx die Proxy-Variablen nicht mehr selbst
+    aus – deshalb hier dieselben Mounts wie bei einem Default-Client, nur mit
+    unseren Pool-Einstellungen und Messung.
+    """
+    try:
+        env_proxies = importlib.import_module(
+            f"{module.__name__}._utils"
+        ).get_environment_proxies()
+    except (ImportError, AttributeError) as e:
+        logger.debug(f"Proxy-Variablen nicht lesbar ({module.__name__}): {e}")
+        return {}
+
+    mounts: dict[str, Any] = {}
+    for pattern, proxy in env_proxies.items():
+        if proxy is None:
+            mounts[pattern] = None  # NO_PROXY: direkter Default-Transport
+            continue
+        try:
+            if asynchronous:
+                mounts[pattern] = _ObservedAsyncTransport(
+                    module.AsyncHTTPTransport(proxy=proxy, limits=limits, http2=http2)
+                )
+            else:
+                mounts[pattern] = _ObservedTransport(
+                    module.HTTPTransport(proxy=proxy, limits=limits, http2=http2)
+                )
+        except Exception as e:
+            logger.warning(f"Proxy {proxy} für {pattern} nicht nutzbar: {e}")
+    if mounts:
+        logger.debug(f"HTTP-Proxy-Mounts: {', '.join(sorted(mounts))}")
+    return mounts
+
+
+def build_http_client(module: Any, *, asynchronous: bool = False):
+    """Baut einen Client der httpx-Variante `module` mit gemeinsamen Einstellungen.
+
+    Args:
+        module: `httpx` oder ein API-kompatibler Fork (`httpx2`)
+        asynchronous: `AsyncClient` statt `Client`
+    """
+    limits = module.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    http2 = http2_available()
+    if asynchronous:
+        client_class = module.AsyncClient
+        transport = _ObservedAsyncTransport(
+            module.AsyncHTTPTransport(limits=limits, http2=http2)
+        )
+    else:
+        client_class = module.Client
+        transport = _ObservedTransport(module.HTTPTransport(limits=limits, http2=http2))
+    client = client_class(
+        transport=transport,
+        mounts=_proxy_mounts(module, limits, http2, asynchronous=asynchronous),
+        timeout=module.Timeout(
+            HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT, pool=HTTP_POOL_TIMEOUT
+        ),
+        follow_redirects=True,
+    )
+    logger.debug(
+        f"HTTP-Client ({client_class.__module__}.{client_class.__name__}) erstellt: "
+        f"HTTP/2 {'an' if http2 else 'aus'}, Keepalive {HTTP_KEEPALIVE_EXPIRY:.0f}s"
+    )
+    return client
+
+
+_clients: dict[str, Any] = {}
+# Async-Clients: Modulname → (Event-Loop, Client)
+_async_clients: dict[str, tuple[asyncio.AbstractEventLoop, Any]] = {}
+_clients_lock = threading.Lock()
+_swap_callbacks: list[Callable[[], None]] = []
+
+
+def get_http_client(module_name: str = "httpx"):
+    """Prozessweiter Client für die httpx-Variante `module_name` (lazy)."""
+    with _clients_lock:
+        client = _clients.get(module_name)
+        if client is None:
+            client = _clients[module_name] = build_http_client(
+                importlib.import_module(module_name)
+            )
+        return client
+
+
+def get_async_http_client(module_name: str = "httpx"):
+    """Async-Client für die httpx-Variante `module_name` im laufenden Event-Loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        entry = _async_clients.get(module_name)
+        if entry is None or entry[0] is not loop:
+            client = build_http_client(
+                importlib.import_module(module_name), asynchronous=True
+            )
+            entry = _async_clients[module_name] = (loop, client)
+        return entry[1]
+
+
+def _sdk_http_module(sdk: str) -> str:
+    """httpx-Variante, die das SDK `sdk` erwartet.
+
+    Stainless-SDKs (openai, groq) importieren ihre Variante in `_base_client`;
+    alle anderen nutzen `httpx`.
+    """
+    try:
+        base_client = importlib.import_module(f"{sdk}._base_client")
+    except ImportError:
+        return "httpx"
+    module = getattr(base_client, "httpx2", None) or getattr(base_client, "httpx")
+    return module.__name__
+
+
+def sdk_http_client(sdk: str):
+    """Gemeinsamer Client in der httpx-Variante, die das SDK `sdk` erwartet."""
+    return get_http_client(_sdk_http_module(sdk))
+
+
+def sdk_async_http_client(sdk: str):
+    """Gemeinsamer Async-Client (laufender Loop) für das SDK `sdk`."""
+    return get_async_http_client(_sdk_http_module(sdk))
+
+
+def sdk_timeout(sdk: str, seconds: float):
+    """Request-Timeout für das SDK `sdk`: `seconds` für Lesen/Schreiben/Pool.
+
+    Der Verbindungsaufbau bleibt bei `HTTP_CONNECT_TIMEOUT` (wie die SDK-Defaults).
+    """
+    module = importlib.import_module(_sdk_http_module(sdk))
+    return module.Timeout(seconds, connect=HTTP_CONNECT_TIMEOUT)
+
+
+def on_http_swap(callback: Callable[[], None]) -> None:
+    """Registriert einen Reset für SDK-Singletons, die auf dem Client aufbauen."""
+    _swap_callbacks.append(callback)
+
+
+def credentials_signature() -> tuple[str | None, ...]:
+    """Aktuelle Werte von `CREDENTIAL_VARS` (Vergleich vor/nach Settings-Reload)."""
+    return tuple(os.getenv(name) for name in CREDENTIAL_VARS)
+
+
+def swap_http_clients(grace: float = HTTP_SWAP_GRACE) -> None:
+    """Tauscht alle gemeinsamen Clients aus (z.B. nach Key-Änderung).
+
+    Neue Requests bekommen frische SDK- und HTTP-Clients. Die alten Clients
+    werden nach `grace` Sekunden geschlossen – laufende Requests halten bis
+    dahin ihre Verbindung.
+    """
+    with _clients_lock:
+        old = list(_clients.values())
+        _clients.clear()
+        # Async-Clients hängen an ihrem Loop und werden dort nicht mehr
+        # angefragt; ihre Verbindungen schließen mit dem Keepalive
+        _async_clients.clear()
+    for callback in _swap_callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.debug(f"SDK-Client-Reset fehlgeschlagen: {e}")
+    if not old:
+        return
+    logger.info(f"HTTP-Clients ausgetauscht ({len(old)} alte werden in {grace:.0f}s geschlossen)")
+
+    def _close() -> None:
+        for client in old:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    timer = threading.Timer(grace, _close)
+    timer.daemon = True
+    timer.start()
+
+
+__all__ = [
+    "CREDENTIAL_VARS",
+    "PoolStats",
+    "build_http_client",
+    "credentials_signature",
+    "get_async_http_client",
+    "get_http_client",
+    "http2_available",
+    "on_http_swap",
+    "sdk_async_http_client",
+    "sdk_http_client",
+    "sdk_timeout",
+    "stats",
+    "swap_http_clients",
+]
@@ -0,0 +1,165 @@
+"""In-Process-Kanal für Interim-Transkripte.
+
+Der Streaming-Handler hat Interims bisher in `INTERIM_FILE` geschrieben
+(gedrosselt auf 150ms), der Daemon hat mtime alle 200ms gepollt und die Datei
+neu gelesen: pro Update ein Schreiben, ein stat und ein Lesen auf der Platte
+und 150–350ms Anzeige-Verzögerung.
+
+`InterimChannel` hält nur den letzten Wert (Latest-Value-Slot) und
+benachrichtigt Abonnenten direkt beim Publish. Wer blockierend warten will,
+nutzt `wait()` (Condition). Nachzügler-Updates lassen sich über `seq`
+verwerfen – angezeigt wird immer nur der neueste Text.
+
+Die Datei bleibt als Opt-in für externe Konsumenten
+(`PULSESCRIBE_INTERIM_FILE=true`), weiterhin gedrosselt.
+
+Die Anzeige-Latenz (Publish → Overlay) wird über `record_display()` gemessen.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from config import INTERIM_FILE, INTERIM_THROTTLE_MS
+from utils.env import get_env_bool_default
+
+logger = logging.getLogger("pulsescribe.interim")
+
+
+@dataclass(frozen=True)
+class InterimUpdate:
+    """Ein Interim-Stand; leerer Text bedeutet „zurückgesetzt“."""
+
+    seq: int
+    text: str
+    published_at: float  # time.perf_counter()
+
+
+class InterimChannel:
+    """Latest-Value-Slot mit Callback- und Condition-Benachrichtigung."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._latest = InterimUpdate(0, "", 0.0)
+        self._subscribers: list[Callable[[InterimUpdate], None]] = []
+        self._last_file_write = 0.0
+        # Anzeige-Latenz seit dem letzten reset_latency()
+        self._latency_lock = threading.Lock()
+        self._latencies_ms: list[float] = []
+
+    # -------------------------------------------------------------------------
+    # Producer
+    # -------------------------------------------------------------------------
+
+    def publish(self, text: str) -> InterimUpdate:
+        """Setzt den neuen Interim-Text und benachrichtigt alle Abonnenten."""
+        text = text.strip()
+        with self._cond:
+            update = InterimUpdate(self._latest.seq + 1, text, time.perf_counter())
+            self._latest = update
+            subscribers = list(self._subscribers)
+            self._cond.notify_all()
+
+        for callback in subscribers:
+            try:
+                callback(update)
+            except Exception as e:
+                logger.debug(f"Interim-Abonnent fehlgeschlagen: {e}")
+
+        self._mirror_to_file(update)
+        return update
+
+    def clear(self) -> None:
+        """Setzt den Interim-Text zurück (Aufnahme-Start/-Ende)."""
+        self.publish("")
+
+    def _mirror_to_file(self, update: InterimUpdate) -> None:
+        """Opt-in: Interim zusätzlich für externe Konsumenten in die Datei."""
+        if not get_env_bool_default("PULSESCRIBE_INTERIM_FILE", False):
+            return
+        try:
+            if not update.text:
+                INTERIM_FILE.unlink(missing_ok=True)
+                return
+            if (update.published_at - self._last_file_write) * 1000 < INTERIM_THROTTLE_MS:
+                return
+            INTERIM_FILE.write_text(update.text)
+            self._last_file_write = update.published_at
+        except OSError as e:
+            logger.warning(f"Interim-Write fehlgeschlagen: {e}")
+
+    # -------------------------------------------------------------------------
+    # Consumer
+    # -------------------------------------------------------------------------
+
+    def latest(self) -> InterimUpdate:
+        """Aktueller Stand (nicht blockierend)."""
+        with self._cond:
+            return self._latest
+
+    def wait(self, after_seq: int, timeout: float | None = None) -> InterimUpdate | None:
+        """Blockiert bis ein Update neuer als `after_seq` vorliegt.
+
+        Returns:
+            Neuester Stand oder None bei Timeout
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._latest.seq > after_seq, timeout=timeout
+            ):
+                return None
+            return self._latest
+
+    def subscribe(
+        self, callback: Callable[[InterimUpdate], None]
+    ) -> Callable[[], None]:
+        """Registriert `callback` (läuft im Thread des Publishers).
+
+        Returns:
+            Funktion zum Abmelden
+        """
+        with self._cond:
+            self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._cond:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    # -------------------------------------------------------------------------
+    # Latenz-Messung
+    # -------------------------------------------------------------------------
+
+    def record_display(self, update: InterimUpdate) -> float:
+        """Meldet, dass `update` angezeigt wurde; gibt die Latenz in ms zurück."""
+        latency_ms = (time.perf_counter() - update.published_at) * 1000
+        with self._latency_lock:
+            self._latencies_ms.append(latency_ms)
+        return latency_ms
+
+    def latency_summary(self) -> str | None:
+        """Median/Max der Anzeige-Latenz seit dem letzten Reset (None ohne Daten)."""
+        with self._latency_lock:
+            samples = sorted(self._latencies_ms)
+        if not samples:
+            return None
+        median = samples[len(samples) // 2]
+        return (
+            f"Interim-Anzeige: {len(samples)} Updates, "
+            f"Median {median:.1f}ms, Max {samples[-1]:.1f}ms"
+        )
+
+    def reset_latency(self) -> None:
+        with self._latency_lock:
+            self._latencies_ms.clear()
+
+
+# Prozessweiter Kanal: Stream-Handler → Overlay
+interim_channel = InterimChannel()
+
+
+__all__ = ["InterimChannel", "InterimUpdate", "interim_channel"]
@@ -0,0 +1,91 @@
+"""Langlebiger asyncio-Event-Loop in einem eigenen Thread.
+
+Der Daemon hat pro Aufnahme einen Event-Loop erzeugt und wieder geschlossen.
+Alles, was an einen Loop gebunden ist (WebSockets, async HTTP-Clients,
+Keepalive-Tasks), musste so mit jeder Aufnahme neu entstehen.
+
+`LoopThread` startet den Loop beim ersten Zugriff und hält ihn bis `close()`
+am Leben. Andere Threads reichen Coroutines über `submit()`/`run()`
+(`run_coroutine_threadsafe`) ein.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Callable, Coroutine, TypeVar
+
+logger = logging.getLogger("pulsescribe.loop")
+
+T = TypeVar("T")
+
+
+class LoopThread:
+    """Event-Loop in einem Daemon-Thread (lazy gestartet, thread-safe)."""
+
+    def __init__(self, name: str = "AsyncLoop"):
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Der Event-Loop (startet den Thread beim ersten Zugriff)."""
+        with self._lock:
+            if self._loop is None:
+                t0 = time.perf_counter()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, daemon=True, name=self._name
+                )
+                self._thread.start()
+                logger.debug(
+                    f"{self._name}: Event-Loop gestartet "
+                    f"({(time.perf_counter() - t0) * 1000:.1f}ms)"
+                )
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Plant `coro` im Loop ein (aus beliebigem Thread)."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Führt `coro` im Loop aus und wartet auf das Ergebnis."""
+        return self.submit(coro).result(timeout)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Ruft `callback(*args)` im Loop-Thread auf."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Bricht offene Tasks ab und beendet den Loop-Thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _cancel_pending() -> None:
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout)
+        except Exception as e:
+            logger.debug(f"{self._name}: Tasks nicht sauber beendet: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+__all__ = ["LoopThread"]
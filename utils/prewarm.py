@@ -0,0 +1,124 @@
+"""Verbindungs-Pre-Warming für Cloud-Provider und LLM-Refine.
+
+Die SDK-Clients (OpenAI, Groq, Deepgram) öffnen ihre TLS-Verbindung erst beim
+ersten Request nach der Aufnahme – DNS, TCP und TLS kosten dann 100–400ms.
+Beim Hotkey-Down schickt der Daemon deshalb einen HEAD-Request über den
+httpx-Pool des jeweiligen SDK-Clients. Die Verbindung bleibt im Pool und wird
+vom eigentlichen Upload wiederverwendet.
+
+Der gemeinsame HTTP-Client (`utils.http_client`) schließt unbenutzte
+Pool-Verbindungen nach `HTTP_KEEPALIVE_EXPIRY`. `keep_warm()` wiederholt den
+HEAD deshalb in kürzerem Abstand, bis die Aufnahme samt Transkription und
+Refine durch ist.
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from config import PREWARM_INTERVAL, PREWARM_TIMEOUT
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger("pulsescribe.prewarm")
+
+
+def http_pool(client) -> "tuple[httpx.Client, str] | None":
+    """httpx-Client und Basis-URL eines SDK-Clients.
+
+    Unterstützt die Stainless-SDKs (OpenAI, Groq: `_client`/`base_url`) und das
+    Deepgram-SDK (`_client_wrapper`). Unbekannte Clients liefern None.
+    Geprüft wird nur auf `head()`: neuere OpenAI-SDKs bringen einen
+    httpx-Fork mit, dessen Client keine `httpx.Client`-Instanz ist.
+    """
+    http = getattr(client, "_client", None)
+    base_url = getattr(client, "base_url", None)
+    if _has_head(http) and base_url:
+        return http, str(base_url)
+
+    wrapper = getattr(client, "_client_wrapper", None)
+    if wrapper is not None:
+        http = getattr(getattr(wrapper, "httpx_client", None), "httpx_client", None)
+        environment = wrapper.get_environment() if hasattr(wrapper, "get_environment") else None
+        base_url = getattr(environment, "base", None)
+        if _has_head(http) and base_url:
+            return http, str(base_url)
+    return None
+
+
+def _has_head(http) -> bool:
+    return callable(getattr(http, "head", None))
+
+
+def warm_connection(
+    http: "httpx.Client", url: str, label: str, timeout: float = PREWARM_TIMEOUT
+) -> float | None:
+    """HEAD-Request über `http`; die Verbindung bleibt danach im Pool.
+
+    Returns:
+        Dauer in Sekunden oder None bei Fehler. Der Statuscode ist egal –
+        auch ein 401/404 lässt eine offene TLS-Verbindung zurück.
+    """
+    t0 = time.perf_counter()
+    try:
+        http.head(url, timeout=timeout)
+    except Exception as e:
+        logger.debug(f"Pre-Warm {label} fehlgeschlagen: {e}")
+        return None
+    return time.perf_counter() - t0
+
+
+def warm_client(client, label: str) -> float | None:
+    """Wärmt den Verbindungs-Pool eines SDK-Clients vor."""
+    pool = http_pool(client)
+    if pool is None:
+        logger.debug(f"Pre-Warm {label}: kein httpx-Pool gefunden")
+        return None
+    return warm_connection(*pool, label)
+
+
+def keep_warm(
+    targets: list[tuple[str, Callable[[], float | None]]],
+    until: Callable[[], bool],
+    interval: float = PREWARM_INTERVAL,
+) -> threading.Thread:
+    """Wärmt `targets` sofort vor und hält sie warm, bis `until()` True ist.
+
+    Args:
+        targets: (Label, Warm-Funktion) – z.B. `provider.prewarm`
+        until: Abbruchbedingung (z.B. Worker-Thread beendet)
+        interval: Abstand der Keepalive-HEADs (unter dem Pool-Keepalive)
+
+    Returns:
+        Gestarteter Daemon-Thread
+    """
+
+    def _run() -> None:
+        for label, warm in targets:
+            try:
+                elapsed = warm()
+            except Exception as e:
+                logger.debug(f"Pre-Warm {label} fehlgeschlagen: {e}")
+                continue
+            if elapsed is not None:
+                # Kalter HEAD ≈ Verbindungsaufbau, den der erste echte Request spart
+                logger.info(f"Pre-Warm {label}: {elapsed * 1000:.0f}ms Verbindungsaufbau vorgezogen")
+
+        while True:
+            time.sleep(interval)
+            if until():
+                break
+            for label, warm in targets:
+                try:
+                    warm()
+                except Exception:
+                    pass
+
+    thread = threading.Thread(target=_run, daemon=True, name="ConnectionPrewarm")
+    thread.start()
+    return thread
+
+
+__all__ = ["http_pool", "keep_warm", "warm_client", "warm_connection"]
@@ -0,0 +1,206 @@
+"""Content-adressierter Ergebnis-Cache für Datei-Transkriptionen.
+
+Wiederholte Läufe über dieselben Aufnahmen (z.B. mit anderem `--context`)
+transkribieren sonst jedes Mal neu – in Cloud-Modi kostenpflichtig. Der
+Schlüssel ist ein Hash über das dekodierte PCM, Modus, Modell, Sprache und
+einen Vocabulary-Fingerprint: Umbenennen oder Umkodieren derselben Aufnahme
+trifft den Cache, eine geänderte Vocabulary oder ein anderes Modell nicht.
+
+Ein Eintrag pro Datei in `~/.pulsescribe/result_cache/<hash>.json`. Hits
+aktualisieren die mtime; überschreitet der Cache `PULSESCRIBE_RESULT_CACHE_MB`
+(Default 50, 0 = aus), werden die am längsten unbenutzten Einträge gelöscht.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from config import RESULT_CACHE_DIR
+from utils.env import get_env_int
+from utils.vocabulary import load_vocabulary
+
+logger = logging.getLogger("pulsescribe.result_cache")
+
+DEFAULT_RESULT_CACHE_MB = 50
+CACHE_VERSION = 1
+_BLOCK_FRAMES = 1 << 16
+
+# PCM-Hashes pro (Pfad, Größe, mtime): CLI und Provider fragen dieselbe Datei an
+_fingerprints: dict[tuple[str, int, int], str] = {}
+_lock = threading.Lock()
+
+
+def _max_bytes() -> int:
+    value = get_env_int("PULSESCRIBE_RESULT_CACHE_MB")
+    mb = DEFAULT_RESULT_CACHE_MB if value is None else max(0, value)
+    return mb * 1024 * 1024
+
+
+def audio_fingerprint(audio_path: Path) -> str:
+    """SHA-256 über das dekodierte PCM (Fallback: Dateiinhalt).
+
+    Blockweise gelesen, damit auch lange Aufnahmen nicht komplett im RAM landen.
+    """
+    path = Path(audio_path)
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _lock:
+        cached = _fingerprints.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    try:
+        import soundfile as sf
+
+        with sf.SoundFile(str(path)) as f:
+            digest.update(f"pcm:{f.samplerate}:{f.channels}:".encode())
+            for block in f.blocks(blocksize=_BLOCK_FRAMES, dtype="float32"):
+                digest.update(block.tobytes())
+    except Exception:
+        # Format nicht dekodierbar (oder soundfile fehlt) → Bytes der Datei
+        digest = hashlib.sha256(b"raw:")
+        with path.open("rb") as raw:
+            for chunk in iter(lambda: raw.read(1 << 20), b""):
+                digest.update(chunk)
+
+    fingerprint = digest.hexdigest()
+    with _lock:
+        _fingerprints[memo_key] = fingerprint
+    return fingerprint
+
+
+def vocabulary_fingerprint() -> str:
+    keywords = load_vocabulary().get("keywords", [])
+    return hashlib.sha256(json.dumps(keywords).encode()).hexdigest()[:16]
+
+
+class ResultCache:
+    """On-Disk-Cache Transkript ↔ (PCM, Modus, Modell, Sprache, Vocabulary)."""
+
+    def __init__(self, directory: Path | None = None, max_bytes: int | None = None):
+        self.directory = directory or RESULT_CACHE_DIR
+        self._max_bytes = max_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return _max_bytes() if self._max_bytes is None else self._max_bytes
+
+    def key(
+        self,
+        audio_path: Path,
+        *,
+        mode: str,
+        model: str | None,
+        language: str | None,
+        extra: str = "",
+    ) -> str:
+        parts = [
+            f"v{CACHE_VERSION}",
+            audio_fingerprint(audio_path),
+            mode,
+            model or "",
+            (language or "").lower(),
+            vocabulary_fingerprint(),
+            extra,
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # LRU: Hit zählt als Nutzung
+        except (OSError, ValueError):
+            return None
+        text = entry.get("text")
+        return text if isinstance(text, str) else None
+
+    def put(self, key: str, text: str, **meta: str | None) -> None:
+        entry = {"text": text, "created_at": time.time(), **meta}
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Ergebnis-Cache nicht beschreibbar: {e}")
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Löscht die am längsten unbenutzten Einträge bis zum Budget."""
+        try:
+            entries = [(p.stat(), p) for p in self.directory.glob("*.json")]
+        except OSError:
+            return
+        total = sum(st.st_size for st, _ in entries)
+        budget = self.max_bytes
+        if total <= budget:
+            return
+        entries.sort(key=lambda item: item[0].st_mtime)
+        removed = 0
+        for st, path in entries:
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= st.st_size
+            removed += 1
+        logger.debug(f"Ergebnis-Cache: {removed} Einträge verdrängt")
+
+
+def cached_transcribe(
+    audio_path: Path,
+    transcribe_fn: Callable[[], str],
+    *,
+    mode: str,
+    model: str | None,
+    language: str | None,
+    extra: str = "",
+    use_cache: bool = True,
+    cache: ResultCache | None = None,
+) -> str:
+    """Liefert das gecachte Transkript oder ruft `transcribe_fn` auf und speichert.
+
+    Ein Hit überspringt Decode bzw. Upload vollständig. Fehler beim Hashen
+    deaktivieren den Cache für diesen Aufruf, statt die Transkription zu
+    verhindern.
+    """
+    cache = cache or ResultCache()
+    if not use_cache or cache.max_bytes <= 0:
+        return transcribe_fn()
+    try:
+        key = cache.key(audio_path, mode=mode, model=model, language=language, extra=extra)
+    except Exception as e:
+        logger.debug(f"Ergebnis-Cache übersprungen: {e}")
+        return transcribe_fn()
+
+    text = cache.get(key)
+    if text is not None:
+        logger.info(f"Ergebnis-Cache: Hit ({mode}, {model or 'default'}, {key[:12]})")
+        return text
+
+    text = transcribe_fn()
+    if text and text.strip():
+        cache.put(key, text, mode=mode, model=model, language=language)
+    return text
+
+
+__all__ = [
+    "ResultCache",
+    "audio_fingerprint",
+    "cached_transcribe",
+    "DEFAULT_RESULT_CACHE_MB",
+]